@@ -1,10 +1,14 @@
 using System;
 using System.Collections.Generic;
+using System.Runtime.CompilerServices;
 
 namespace AdaptationCore
 {
     public static class AdaptationEngine
     {
+        private static readonly ConditionalWeakTable<ConfigPackage, PreparedConfig> PreparedConfigs =
+            new ConditionalWeakTable<ConfigPackage, PreparedConfig>();
+
         public static AdaptationResult ComputeNext(AdaptationEvent sessionEvent, ConfigPackage config)
         {
             if (sessionEvent == null)
@@ -66,6 +70,118 @@ namespace AdaptationCore
             };
         }
 
+        /// <summary>
+        /// Returns the prepared form of <paramref name="config"/>, computed once per package instance.
+        /// </summary>
+        public static PreparedConfig Prepare(ConfigPackage config)
+        {
+            if (config == null)
+            {
+                throw new ArgumentNullException(nameof(config));
+            }
+
+            return PreparedConfigs.GetValue(config, PreparedConfig.From);
+        }
+
+        /// <summary>
+        /// Same result as <see cref="ComputeNext(AdaptationEvent, ConfigPackage)"/>, written into
+        /// <paramref name="result"/> (allocated when null). The decision, lists, entries, audit record
+        /// and intermediates of a reused result are overwritten in place; only the formatted score
+        /// string is allocated per call. The result references <paramref name="sessionEvent"/>.
+        /// </summary>
+        public static AdaptationResult ComputeNext(AdaptationEvent sessionEvent, PreparedConfig config, AdaptationResult result)
+        {
+            if (sessionEvent == null)
+            {
+                throw new ArgumentNullException(nameof(sessionEvent));
+            }
+            if (config == null)
+            {
+                throw new ArgumentNullException(nameof(config));
+            }
+
+            var timeFactor = sessionEvent.time_t * config.time_scale;
+            var score = (sessionEvent.result_z * config.result_weight) + (timeFactor * config.time_weight);
+
+            var baseAggression = config.base_aggression;
+            var baseCuriosity = config.base_curiosity;
+            var basePatience = config.base_patience;
+
+            var aggression = Clamp01(baseAggression + score);
+            var curiosity = Clamp01(baseCuriosity + timeFactor);
+            var patience = Clamp01(basePatience - score * 0.5f);
+
+            result ??= new AdaptationResult();
+            var decision = result.Decision ??= new AdaptationDecision();
+            decision.next_scene_id = sessionEvent.scene_id;
+            decision.seed = sessionEvent.seed;
+            decision.config_version = sessionEvent.config_version;
+
+            var npcParams = decision.npc_params ??= new List<NpcParam>(3);
+            SetParam(npcParams, 0, "aggression", aggression);
+            SetParam(npcParams, 1, "curiosity", curiosity);
+            SetParam(npcParams, 2, "patience", patience);
+            TrimTo(npcParams, 3);
+
+            var explanation = decision.explanation ??= new List<ExplanationEntry>(4);
+            SetEntry(explanation, 0, "adapter", "B1");
+            SetEntry(explanation, 1, "config_version", sessionEvent.config_version);
+            SetEntry(explanation, 2, "config_hash", config.version_hash);
+            SetEntry(explanation, 3, "score", score.ToString("0.000"));
+            TrimTo(explanation, 4);
+
+            var audit = result.Audit ??= new AdaptationAuditRecord();
+            audit.inputs = sessionEvent;
+            audit.output = decision;
+            audit.config_version_hash = config.version_hash;
+            audit.seed = sessionEvent.seed;
+
+            // Cleared and refilled so the enumeration order matches the allocating path.
+            var intermediates = audit.intermediates ??= new Dictionary<string, float>(5);
+            intermediates.Clear();
+            intermediates.Add("time_factor", timeFactor);
+            intermediates.Add("score", score);
+            intermediates.Add("base_aggression", baseAggression);
+            intermediates.Add("base_curiosity", baseCuriosity);
+            intermediates.Add("base_patience", basePatience);
+
+            return result;
+        }
+
+        private static void SetParam(List<NpcParam> list, int index, string name, float value)
+        {
+            if (index >= list.Count)
+            {
+                list.Add(new NpcParam { name = name, value = value });
+                return;
+            }
+
+            var entry = list[index] ??= new NpcParam();
+            entry.name = name;
+            entry.value = value;
+        }
+
+        private static void SetEntry(List<ExplanationEntry> list, int index, string name, string value)
+        {
+            if (index >= list.Count)
+            {
+                list.Add(new ExplanationEntry { name = name, value = value });
+                return;
+            }
+
+            var entry = list[index] ??= new ExplanationEntry();
+            entry.name = name;
+            entry.value = value;
+        }
+
+        private static void TrimTo<T>(List<T> list, int count)
+        {
+            if (list.Count > count)
+            {
+                list.RemoveRange(count, list.Count - count);
+            }
+        }
+
         private static float GetParam(Dictionary<string, float> map, string key, float fallback)
         {
             if (map != null && map.TryGetValue(key, out var value))
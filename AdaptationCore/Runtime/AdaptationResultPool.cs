@@ -0,0 +1,46 @@
+using System.Collections.Concurrent;
+using System.Threading;
+
+namespace AdaptationCore
+{
+    /// <summary>
+    /// Thread-safe pool of <see cref="AdaptationResult"/> buffers for the prepared ComputeNext overload.
+    /// Return a result only once nothing (a response, an audit line) still references it.
+    /// </summary>
+    public sealed class AdaptationResultPool
+    {
+        private readonly ConcurrentQueue<AdaptationResult> _items = new ConcurrentQueue<AdaptationResult>();
+        private readonly int _maxRetained;
+        private int _count;
+
+        public AdaptationResultPool(int maxRetained = 1024)
+        {
+            _maxRetained = maxRetained;
+        }
+
+        public AdaptationResult Rent()
+        {
+            if (_items.TryDequeue(out var result))
+            {
+                Interlocked.Decrement(ref _count);
+                return result;
+            }
+            return new AdaptationResult();
+        }
+
+        public void Return(AdaptationResult result)
+        {
+            if (result == null)
+            {
+                return;
+            }
+
+            if (Interlocked.Increment(ref _count) > _maxRetained)
+            {
+                Interlocked.Decrement(ref _count);
+                return;
+            }
+            _items.Enqueue(result);
+        }
+    }
+}
@@ -32,9 +32,25 @@ namespace AdaptationCore
                 throw new FileNotFoundException("Config file not found.", path);
             }
 
-            var json = File.ReadAllText(path, Encoding.UTF8);
+            return LoadFromBytes(File.ReadAllBytes(path));
+        }
+
+        public static ConfigPackage LoadFromBytes(byte[] content)
+        {
+            if (content == null)
+            {
+                throw new ArgumentNullException(nameof(content));
+            }
+
+            // Decoded the way File.ReadAllText does (BOM detection), so the hash is unchanged.
+            string json;
+            using (var reader = new StreamReader(new MemoryStream(content, false), Encoding.UTF8, true))
+            {
+                json = reader.ReadToEnd();
+            }
+
             ConfigPackage config;
-            using (var stream = File.OpenRead(path))
+            using (var stream = new MemoryStream(content, false))
             {
                 var serializer = new DataContractJsonSerializer(typeof(ConfigPackage));
                 config = (ConfigPackage)serializer.ReadObject(stream);
@@ -0,0 +1,212 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading;
+
+namespace AdaptationCore
+{
+    /// <summary>
+    /// Every config version under a root directory, loaded once and resolved by name.
+    /// Loaded packages are never mutated; a reload publishes a new instance, so callers
+    /// may hold on to a resolved package for the whole request.
+    /// </summary>
+    public sealed class ConfigRegistry : IDisposable
+    {
+        private const string ConfigFileName = "config.json";
+        private const int ReloadDelayMs = 250;
+        private const int MaxReloadAttempts = 5;
+
+        private readonly string _baseDirectory;
+        private readonly string _defaultVersion;
+        private readonly object _gate = new object();
+        private readonly Dictionary<string, int> _pending = new Dictionary<string, int>(StringComparer.OrdinalIgnoreCase);
+        private readonly FileSystemWatcher _watcher;
+        private readonly Timer _reloadTimer;
+        private Dictionary<string, ConfigPackage> _configs = new Dictionary<string, ConfigPackage>(StringComparer.OrdinalIgnoreCase);
+
+        public ConfigRegistry(string baseDirectory, string defaultVersion, bool watch = true)
+        {
+            if (string.IsNullOrWhiteSpace(baseDirectory))
+            {
+                throw new ArgumentException("Base directory is required.", nameof(baseDirectory));
+            }
+            if (!Directory.Exists(baseDirectory))
+            {
+                throw new DirectoryNotFoundException($"Config root not found: {baseDirectory}");
+            }
+
+            _baseDirectory = Path.GetFullPath(baseDirectory);
+            _defaultVersion = defaultVersion ?? string.Empty;
+
+            foreach (var directory in Directory.GetDirectories(_baseDirectory))
+            {
+                if (File.Exists(Path.Combine(directory, ConfigFileName)))
+                {
+                    _configs[Path.GetFileName(directory)] = ConfigLoader.LoadFromDirectory(directory);
+                }
+            }
+
+            if (!_configs.ContainsKey(_defaultVersion))
+            {
+                throw new FileNotFoundException(
+                    $"Default config version '{_defaultVersion}' not found under {_baseDirectory}.",
+                    Path.Combine(_baseDirectory, _defaultVersion, ConfigFileName));
+            }
+
+            if (!watch)
+            {
+                return;
+            }
+
+            _reloadTimer = new Timer(_ => ReloadPending(), null, Timeout.Infinite, Timeout.Infinite);
+            _watcher = new FileSystemWatcher(_baseDirectory, ConfigFileName)
+            {
+                IncludeSubdirectories = true,
+                NotifyFilter = NotifyFilters.LastWrite | NotifyFilters.FileName | NotifyFilters.Size | NotifyFilters.CreationTime
+            };
+            _watcher.Changed += OnConfigFileEvent;
+            _watcher.Created += OnConfigFileEvent;
+            _watcher.Renamed += OnConfigFileEvent;
+            _watcher.EnableRaisingEvents = true;
+        }
+
+        /// <summary>Raised with the version name after a changed config has been published.</summary>
+        public event Action<string, ConfigPackage> ConfigChanged;
+
+        /// <summary>Raised when a changed config cannot be loaded; the previous package stays active.</summary>
+        public event Action<string, Exception> ReloadFailed;
+
+        public string DefaultVersion => _defaultVersion;
+
+        public ConfigPackage Default => Resolve(null);
+
+        public IReadOnlyCollection<string> Versions
+        {
+            get { return Volatile.Read(ref _configs).Keys; }
+        }
+
+        public bool TryResolve(string version, out ConfigPackage config)
+        {
+            var key = string.IsNullOrWhiteSpace(version) ? _defaultVersion : version;
+            return Volatile.Read(ref _configs).TryGetValue(key, out config);
+        }
+
+        public ConfigPackage Resolve(string version)
+        {
+            if (TryResolve(version, out var config))
+            {
+                return config;
+            }
+
+            throw new KeyNotFoundException($"Config version '{version}' is not available under {_baseDirectory}.");
+        }
+
+        /// <summary>Reloads one version from disk now; returns false and keeps the old package on failure.</summary>
+        public bool Reload(string version)
+        {
+            var directory = Path.Combine(_baseDirectory, version);
+            ConfigPackage config;
+            try
+            {
+                config = ConfigLoader.LoadFromDirectory(directory);
+            }
+            catch (Exception ex)
+            {
+                ReloadFailed?.Invoke(version, ex);
+                return false;
+            }
+
+            lock (_gate)
+            {
+                var current = Volatile.Read(ref _configs);
+                if (current.TryGetValue(version, out var previous) && previous.version_hash == config.version_hash)
+                {
+                    return true;
+                }
+
+                var next = new Dictionary<string, ConfigPackage>(current, StringComparer.OrdinalIgnoreCase)
+                {
+                    [version] = config
+                };
+                Volatile.Write(ref _configs, next);
+            }
+
+            ConfigChanged?.Invoke(version, config);
+            return true;
+        }
+
+        public void Dispose()
+        {
+            _watcher?.Dispose();
+            _reloadTimer?.Dispose();
+        }
+
+        private void OnConfigFileEvent(object sender, FileSystemEventArgs e)
+        {
+            var directory = Path.GetDirectoryName(e.FullPath);
+            if (string.IsNullOrEmpty(directory)
+                || !string.Equals(Path.GetFileName(e.FullPath), ConfigFileName, StringComparison.OrdinalIgnoreCase)
+                || !string.Equals(Path.GetDirectoryName(directory), _baseDirectory, StringComparison.OrdinalIgnoreCase))
+            {
+                return;
+            }
+
+            // Editors save in several steps; collect events and reload once things settle.
+            lock (_gate)
+            {
+                _pending[Path.GetFileName(directory)] = 0;
+                _reloadTimer.Change(ReloadDelayMs, Timeout.Infinite);
+            }
+        }
+
+        private void ReloadPending()
+        {
+            KeyValuePair<string, int>[] batch;
+            lock (_gate)
+            {
+                batch = new KeyValuePair<string, int>[_pending.Count];
+                ((ICollection<KeyValuePair<string, int>>)_pending).CopyTo(batch, 0);
+                _pending.Clear();
+            }
+
+            foreach (var entry in batch)
+            {
+                if (TryReloadFile(entry.Key) || entry.Value + 1 >= MaxReloadAttempts)
+                {
+                    continue;
+                }
+
+                lock (_gate)
+                {
+                    if (!_pending.ContainsKey(entry.Key))
+                    {
+                        _pending[entry.Key] = entry.Value + 1;
+                    }
+                    _reloadTimer.Change(ReloadDelayMs, Timeout.Infinite);
+                }
+            }
+        }
+
+        private bool TryReloadFile(string version)
+        {
+            try
+            {
+                // A writer may still hold the file; retry later rather than report a failure.
+                using (File.Open(Path.Combine(_baseDirectory, version, ConfigFileName), FileMode.Open, FileAccess.Read, FileShare.Read))
+                {
+                }
+            }
+            catch (IOException)
+            {
+                return false;
+            }
+            catch (UnauthorizedAccessException)
+            {
+                return false;
+            }
+
+            Reload(version);
+            return true;
+        }
+    }
+}
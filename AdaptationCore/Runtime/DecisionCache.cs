@@ -0,0 +1,272 @@
+using System;
+using System.Collections.Generic;
+
+namespace AdaptationCore
+{
+    /// <summary>
+    /// Everything <see cref="AdaptationEngine.ComputeNext(AdaptationEvent, ConfigPackage)"/> reads from an event,
+    /// plus the resolved config version and hash. Floats compare by bit pattern, so only an identical input hits.
+    /// </summary>
+    public readonly struct DecisionCacheKey : IEquatable<DecisionCacheKey>
+    {
+        public readonly string SceneId;
+        public readonly int ResultZBits;
+        public readonly int TimeTBits;
+        public readonly int Seed;
+        public readonly string ConfigVersion;
+        public readonly string ConfigHash;
+
+        /// <summary>Call after the event's config_version has been filled in from <paramref name="config"/>.</summary>
+        public DecisionCacheKey(AdaptationEvent sessionEvent, ConfigPackage config)
+        {
+            SceneId = sessionEvent.scene_id ?? string.Empty;
+            ResultZBits = BitConverter.SingleToInt32Bits(sessionEvent.result_z);
+            TimeTBits = BitConverter.SingleToInt32Bits(sessionEvent.time_t);
+            Seed = sessionEvent.seed;
+            ConfigVersion = sessionEvent.config_version ?? string.Empty;
+            ConfigHash = config.version_hash ?? string.Empty;
+        }
+
+        public bool Equals(DecisionCacheKey other)
+        {
+            return ResultZBits == other.ResultZBits
+                && TimeTBits == other.TimeTBits
+                && Seed == other.Seed
+                && string.Equals(SceneId, other.SceneId, StringComparison.Ordinal)
+                && string.Equals(ConfigVersion, other.ConfigVersion, StringComparison.Ordinal)
+                && string.Equals(ConfigHash, other.ConfigHash, StringComparison.Ordinal);
+        }
+
+        public override bool Equals(object obj)
+        {
+            return obj is DecisionCacheKey other && Equals(other);
+        }
+
+        public override int GetHashCode()
+        {
+            return HashCode.Combine(SceneId, ResultZBits, TimeTBits, Seed, ConfigVersion, ConfigHash);
+        }
+    }
+
+    /// <summary>
+    /// One cached decision: the engine output shared by every hit, plus the host's response in its
+    /// serialized form. Nothing in it may be mutated after it has been added to a cache.
+    /// </summary>
+    public sealed class CachedDecision<TPayload>
+    {
+        public AdaptationDecision Decision;
+        public string ConfigHash;
+        public Dictionary<string, float> Intermediates;
+        public TPayload Payload;
+
+        public static CachedDecision<TPayload> From(AdaptationResult result, TPayload payload)
+        {
+            return new CachedDecision<TPayload>
+            {
+                Decision = result.Decision,
+                ConfigHash = result.Audit?.config_version_hash ?? string.Empty,
+                Intermediates = result.Audit?.intermediates,
+                Payload = payload
+            };
+        }
+
+        /// <summary>The audit record ComputeNext would have produced for <paramref name="sessionEvent"/>.</summary>
+        public AdaptationAuditRecord AuditFor(AdaptationEvent sessionEvent)
+        {
+            return new AdaptationAuditRecord
+            {
+                inputs = sessionEvent,
+                output = Decision,
+                config_version_hash = ConfigHash,
+                seed = sessionEvent.seed,
+                intermediates = Intermediates
+            };
+        }
+    }
+
+    /// <summary>
+    /// Bounded LRU of computed decisions, limited by entry count and by the payload bytes the host reports.
+    /// Keys include the config hash, so a reloaded config can never be answered from an old entry;
+    /// <see cref="Attach"/> also drops a version's entries when it is reloaded to free their memory.
+    /// A cache with <c>maxEntries</c> 0 is disabled and always misses without counting.
+    /// </summary>
+    public sealed class DecisionCache<TPayload>
+    {
+        /// <summary>Rough size of the key, the shared decision and its intermediates, added to every entry's payload size.</summary>
+        public const int EntryOverheadBytes = 1024;
+
+        private readonly object _gate = new object();
+        private readonly Dictionary<DecisionCacheKey, LinkedListNode<Entry>> _entries = new Dictionary<DecisionCacheKey, LinkedListNode<Entry>>();
+        private readonly LinkedList<Entry> _lru = new LinkedList<Entry>();
+        private readonly int _maxEntries;
+        private readonly long _maxBytes;
+        private long _bytes;
+        private long _hits;
+        private long _misses;
+        private long _evictions;
+        private long _invalidations;
+
+        public DecisionCache(int maxEntries, long maxBytes = 0)
+        {
+            _maxEntries = Math.Max(0, maxEntries);
+            _maxBytes = Math.Max(0, maxBytes);
+        }
+
+        public bool Enabled => _maxEntries > 0;
+
+        /// <summary>Subscribes to <paramref name="configs"/> so a reloaded version's entries are dropped.</summary>
+        public void Attach(ConfigRegistry configs)
+        {
+            if (configs != null)
+            {
+                configs.ConfigChanged += (version, _) => Invalidate(version);
+            }
+        }
+
+        public bool TryGet(in DecisionCacheKey key, out CachedDecision<TPayload> decision)
+        {
+            decision = null;
+            if (!Enabled)
+            {
+                return false;
+            }
+
+            lock (_gate)
+            {
+                if (!_entries.TryGetValue(key, out var node))
+                {
+                    _misses++;
+                    return false;
+                }
+
+                _lru.Remove(node);
+                _lru.AddFirst(node);
+                _hits++;
+                decision = node.Value.Decision;
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// Adds or replaces the entry for <paramref name="key"/>. <paramref name="payloadBytes"/> plus
+        /// <see cref="EntryOverheadBytes"/> counts against <c>maxBytes</c>; an entry larger than the whole budget is not kept.
+        /// </summary>
+        public void Add(in DecisionCacheKey key, CachedDecision<TPayload> decision, long payloadBytes)
+        {
+            var sizeBytes = payloadBytes + EntryOverheadBytes;
+            if (!Enabled || decision == null || (_maxBytes > 0 && sizeBytes > _maxBytes))
+            {
+                return;
+            }
+
+            lock (_gate)
+            {
+                if (_entries.TryGetValue(key, out var existing))
+                {
+                    RemoveNode(existing);
+                }
+
+                var node = _lru.AddFirst(new Entry(key, decision, sizeBytes));
+                _entries[key] = node;
+                _bytes += sizeBytes;
+
+                while (_entries.Count > _maxEntries || (_maxBytes > 0 && _bytes > _maxBytes))
+                {
+                    RemoveNode(_lru.Last);
+                    _evictions++;
+                }
+            }
+        }
+
+        /// <summary>Drops every entry computed with config version <paramref name="configVersion"/>; returns how many.</summary>
+        public int Invalidate(string configVersion)
+        {
+            lock (_gate)
+            {
+                var removed = 0;
+                var node = _lru.First;
+                while (node != null)
+                {
+                    var next = node.Next;
+                    // The registry resolves versions case-insensitively, so "V1" entries belong to "v1" too.
+                    if (string.Equals(node.Value.Key.ConfigVersion, configVersion, StringComparison.OrdinalIgnoreCase))
+                    {
+                        RemoveNode(node);
+                        removed++;
+                    }
+                    node = next;
+                }
+
+                _invalidations += removed;
+                return removed;
+            }
+        }
+
+        public void Clear()
+        {
+            lock (_gate)
+            {
+                _invalidations += _entries.Count;
+                _entries.Clear();
+                _lru.Clear();
+                _bytes = 0;
+            }
+        }
+
+        public DecisionCacheMetrics Snapshot()
+        {
+            lock (_gate)
+            {
+                var lookups = _hits + _misses;
+                return new DecisionCacheMetrics
+                {
+                    enabled = Enabled,
+                    max_entries = _maxEntries,
+                    max_bytes = _maxBytes,
+                    entries = _entries.Count,
+                    bytes = _bytes,
+                    hits = _hits,
+                    misses = _misses,
+                    hit_rate = lookups > 0 ? _hits / (double)lookups : 0.0,
+                    evictions = _evictions,
+                    invalidations = _invalidations
+                };
+            }
+        }
+
+        private void RemoveNode(LinkedListNode<Entry> node)
+        {
+            _lru.Remove(node);
+            _entries.Remove(node.Value.Key);
+            _bytes -= node.Value.SizeBytes;
+        }
+
+        private readonly struct Entry
+        {
+            public readonly DecisionCacheKey Key;
+            public readonly CachedDecision<TPayload> Decision;
+            public readonly long SizeBytes;
+
+            public Entry(DecisionCacheKey key, CachedDecision<TPayload> decision, long sizeBytes)
+            {
+                Key = key;
+                Decision = decision;
+                SizeBytes = sizeBytes;
+            }
+        }
+    }
+
+    public sealed class DecisionCacheMetrics
+    {
+        public bool enabled;
+        public int max_entries;
+        public long max_bytes;
+        public int entries;
+        public long bytes;
+        public long hits;
+        public long misses;
+        public double hit_rate;
+        public long evictions;
+        public long invalidations;
+    }
+}
@@ -0,0 +1,52 @@
+using System;
+using System.Collections.Generic;
+
+namespace AdaptationCore
+{
+    /// <summary>
+    /// The values ComputeNext reads from a <see cref="ConfigPackage"/>, resolved once.
+    /// A snapshot: later changes to the package are not seen, so prepare again after mutating it.
+    /// </summary>
+    public sealed class PreparedConfig
+    {
+        public readonly string version;
+        public readonly string version_hash;
+        public readonly float base_aggression;
+        public readonly float base_curiosity;
+        public readonly float base_patience;
+        public readonly float result_weight;
+        public readonly float time_weight;
+        public readonly float time_scale;
+
+        private PreparedConfig(ConfigPackage config)
+        {
+            version = config.version;
+            version_hash = config.version_hash;
+            base_aggression = GetParam(config.npc_base_params, "aggression", 0.2f);
+            base_curiosity = GetParam(config.npc_base_params, "curiosity", 0.3f);
+            base_patience = GetParam(config.npc_base_params, "patience", 0.6f);
+            result_weight = config.result_weight;
+            time_weight = config.time_weight;
+            time_scale = config.time_scale;
+        }
+
+        public static PreparedConfig From(ConfigPackage config)
+        {
+            if (config == null)
+            {
+                throw new ArgumentNullException(nameof(config));
+            }
+
+            return new PreparedConfig(config);
+        }
+
+        private static float GetParam(Dictionary<string, float> map, string key, float fallback)
+        {
+            if (map != null && map.TryGetValue(key, out var value))
+            {
+                return value;
+            }
+            return fallback;
+        }
+    }
+}
@@ -1,5 +1,9 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.Linq;
 using System.Text;
 using System.Text.Json;
 using System.Threading;
@@ -11,6 +15,8 @@ var port = GetEnvInt("BROKER_PORT", 5672);
 var user = GetEnv("BROKER_USER", "adaptation");
 var pass = GetEnv("BROKER_PASS", "adaptation");
 var timeoutMs = GetEnvInt("BROKER_TIMEOUT_MS", 2000);
+var loadRequests = GetEnvInt("BROKER_REQUESTS", 1);
+var loadConcurrency = Math.Max(1, GetEnvInt("BROKER_CONCURRENCY", 1));
 
 var factory = new ConnectionFactory
 {
@@ -28,6 +34,11 @@ channel.QueueDeclare(queue: "adaptation.req", durable: true, exclusive: false, a
 var replyQueue = channel.QueueDeclare(queue: string.Empty, durable: false, exclusive: true, autoDelete: true, arguments: null);
 var replyQueueName = replyQueue.QueueName;
 
+if (loadRequests > 1)
+{
+    return RunLoad(channel, replyQueueName, loadRequests, loadConcurrency, timeoutMs);
+}
+
 var correlationId = Guid.NewGuid().ToString("N");
 var tcs = new ManualResetEventSlim(false);
 string responseBody = null;
@@ -77,6 +88,98 @@ Console.WriteLine($"OK: correlation_id={correlationId}");
 Console.WriteLine($"Reply: {responseBody}");
 return 0;
 
+// Closed-loop throughput run: keeps `concurrency` requests in flight from one channel until
+// `requests` replies (or timeouts) have been seen, then prints one LOAD summary line.
+static int RunLoad(IModel channel, string replyQueueName, int requests, int concurrency, int timeoutMs)
+{
+    var options = new JsonSerializerOptions
+    {
+        IncludeFields = true,
+        PropertyNamingPolicy = null,
+        DictionaryKeyPolicy = null
+    };
+    var inflight = new SemaphoreSlim(concurrency, concurrency);
+    var pending = new ConcurrentDictionary<string, long>();
+    var latencies = new ConcurrentBag<double>();
+    var done = new CountdownEvent(requests);
+
+    var consumer = new EventingBasicConsumer(channel);
+    consumer.Received += (_, ea) =>
+    {
+        var id = ea.BasicProperties?.CorrelationId ?? string.Empty;
+        if (pending.TryRemove(id, out var started))
+        {
+            latencies.Add((Stopwatch.GetTimestamp() - started) * 1000.0 / Stopwatch.Frequency);
+            inflight.Release();
+            done.Signal();
+        }
+    };
+    channel.BasicConsume(queue: replyQueueName, autoAck: true, consumer: consumer);
+
+    var timeouts = 0;
+    var total = Stopwatch.StartNew();
+    for (var i = 0; i < requests; i++)
+    {
+        if (!inflight.Wait(Math.Max(100, timeoutMs)))
+        {
+            // Expire the oldest outstanding request so one lost reply cannot stall the run.
+            var oldest = pending.OrderBy(kv => kv.Value).FirstOrDefault();
+            if (oldest.Key != null && pending.TryRemove(oldest.Key, out _))
+            {
+                timeouts++;
+                inflight.Release();
+                done.Signal();
+            }
+            i--;
+            continue;
+        }
+
+        var request = new AdaptationEvent
+        {
+            session_id = "load_session",
+            scene_id = "check_scene",
+            result_z = (i % 200) / 100f - 1f,
+            time_t = i % 30,
+            attempts_a = 1 + i % 5,
+            seed = i,
+            config_version = "v1"
+        };
+        var correlationId = Guid.NewGuid().ToString("N");
+        var props = channel.CreateBasicProperties();
+        props.CorrelationId = correlationId;
+        props.ReplyTo = replyQueueName;
+        props.Headers = new Dictionary<string, object>
+        {
+            { "x-sent-unix-ms", DateTimeOffset.UtcNow.ToUnixTimeMilliseconds() }
+        };
+
+        pending[correlationId] = Stopwatch.GetTimestamp();
+        channel.BasicPublish(exchange: string.Empty, routingKey: "adaptation.req", basicProperties: props, body: JsonSerializer.SerializeToUtf8Bytes(request, options));
+    }
+
+    if (!done.Wait(TimeSpan.FromMilliseconds(Math.Max(100, timeoutMs))))
+    {
+        timeouts += pending.Count;
+    }
+    total.Stop();
+
+    var ordered = latencies.OrderBy(v => v).ToArray();
+    double Quantile(double q) => ordered.Length == 0 ? 0.0 : ordered[Math.Min(ordered.Length - 1, (int)Math.Floor(q * (ordered.Length - 1)))];
+    var seconds = total.Elapsed.TotalSeconds;
+    Console.WriteLine(string.Format(
+        CultureInfo.InvariantCulture,
+        "LOAD requests={0} concurrency={1} replies={2} timeouts={3} elapsed_s={4:0.000} throughput_rps={5:0.0} p50_ms={6:0.000} p99_ms={7:0.000}",
+        requests,
+        concurrency,
+        ordered.Length,
+        timeouts,
+        seconds,
+        ordered.Length / Math.Max(seconds, 1e-9),
+        Quantile(0.50),
+        Quantile(0.99)));
+    return timeouts == 0 ? 0 : 1;
+}
+
 static string GetEnv(string key, string fallback)
 {
     var value = Environment.GetEnvironmentVariable(key);
@@ -91,6 +91,32 @@ public static class DataFactory
             ConfigVersion: $"cfg-{Random.Next(1, 5)}.{Random.Next(0, 99)}");
     }
 
+    /// <summary>A decision shaped like AdaptationEngine output: three NPC params and four explanation entries.</summary>
+    public static DecisionData CreateEngineDecisionData()
+    {
+        var npcParams = new List<NpcParamData>
+        {
+            new("aggression", 0.887f),
+            new("curiosity", 0.468f),
+            new("patience", 0.256f)
+        };
+
+        var explanation = new List<ExplanationEntryData>
+        {
+            new("adapter", "B1"),
+            new("config_version", "v1"),
+            new("config_hash", "28cfa02b79fa7d224fde464fc5a017fe03fd80e289e4c7157f951451fcb02810"),
+            new("score", "0.687")
+        };
+
+        return new DecisionData(
+            NextSceneId: "SampleScene",
+            NpcParams: npcParams,
+            Explanation: explanation,
+            Seed: 1234,
+            ConfigVersion: "v1");
+    }
+
     private static NpcFeatureData CreateNpcFeature(int index)
     {
         return new NpcFeatureData(
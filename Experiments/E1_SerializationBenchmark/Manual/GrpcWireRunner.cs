@@ -0,0 +1,92 @@
+using System.Diagnostics;
+using E1_SerializationBenchmark.Data;
+using E1_SerializationBenchmark.Serializers;
+
+namespace E1_SerializationBenchmark.Manual;
+
+public sealed record GrpcWireStats(
+    string Transport,
+    int ProtoVersion,
+    int WireBytes,
+    double EncodeP50Microseconds,
+    double EncodeP99Microseconds,
+    double DecodeP50Microseconds,
+    double DecodeP99Microseconds)
+{
+    public string CsvLine()
+    {
+        return string.Join(',',
+            Transport,
+            ProtoVersion,
+            WireBytes,
+            EncodeP50Microseconds.ToString("F2"),
+            EncodeP99Microseconds.ToString("F2"),
+            DecodeP50Microseconds.ToString("F2"),
+            DecodeP99Microseconds.ToString("F2"));
+    }
+
+    public static string CsvHeader()
+    {
+        return "transport,proto_version,wire_bytes,encode_p50_us,encode_p99_us,decode_p50_us,decode_p99_us";
+    }
+}
+
+/// <summary>
+/// Compares the ComputeNext response on the wire for gRPC-Web text vs binary frames and protocol versions 1 and 2,
+/// using an engine-shaped decision. Encode is the server side (build, serialize, frame); decode is the client side.
+/// </summary>
+public static class GrpcWireRunner
+{
+    private static readonly (string Transport, bool TextMode)[] Transports = { ("web_text", true), ("web", false) };
+    private static readonly int[] ProtoVersions = { 1, 2 };
+
+    public static IReadOnlyList<GrpcWireStats> Run(int iterations = 5000)
+    {
+        var decision = DataFactory.CreateEngineDecisionData();
+        var correlationId = Guid.NewGuid().ToString("N");
+        var results = new List<GrpcWireStats>();
+
+        foreach (var (transport, textMode) in Transports)
+        {
+            foreach (var protoVersion in ProtoVersions)
+            {
+                var wire = GrpcWireConverters.Encode(decision, correlationId, protoVersion, textMode);
+                var encode = Measure(() => GrpcWireConverters.Encode(decision, correlationId, protoVersion, textMode), iterations);
+                var decode = Measure(() => GrpcWireConverters.Decode(wire, textMode), iterations);
+
+                results.Add(new GrpcWireStats(
+                    transport,
+                    protoVersion,
+                    wire.Length,
+                    EncodeP50Microseconds: ManualBenchmarkRunner.Percentile(encode, 50),
+                    EncodeP99Microseconds: ManualBenchmarkRunner.Percentile(encode, 99),
+                    DecodeP50Microseconds: ManualBenchmarkRunner.Percentile(decode, 50),
+                    DecodeP99Microseconds: ManualBenchmarkRunner.Percentile(decode, 99)));
+            }
+        }
+
+        return results;
+    }
+
+    private static double[] Measure(Func<object> action, int iterations)
+    {
+        // Warmup so JIT and first-use costs stay out of the percentiles.
+        for (var i = 0; i < 100; i++)
+        {
+            action();
+        }
+
+        var micros = new double[iterations];
+        var stopwatch = new Stopwatch();
+        for (var i = 0; i < iterations; i++)
+        {
+            stopwatch.Restart();
+            action();
+            stopwatch.Stop();
+            micros[i] = stopwatch.ElapsedTicks * 1_000_000.0 / Stopwatch.Frequency;
+        }
+
+        Array.Sort(micros);
+        return micros;
+    }
+}
@@ -70,7 +70,7 @@ public static class ManualBenchmarkRunner
         return durations;
     }
 
-    private static double Percentile(double[] sortedSamples, double percentile)
+    internal static double Percentile(double[] sortedSamples, double percentile)
     {
         if (sortedSamples.Length == 0)
         {
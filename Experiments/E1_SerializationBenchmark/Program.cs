@@ -10,8 +10,12 @@ var benchmarkSummary = BenchmarkRunner.Run<SerializationBenchmarks>();
 Console.WriteLine("Running manual percentile measurements...");
 var manualStats = ManualBenchmarkRunner.Run();
 
+Console.WriteLine("Running gRPC response wire comparison...");
+var wireStats = GrpcWireRunner.Run();
+
 var records = SummaryFactory.Create(benchmarkSummary, manualStats, SerializationFixture.Instance);
 var (csvPath, jsonPath) = SummaryReporter.Publish(records);
 
 Console.WriteLine($"Summary CSV: {csvPath}");
 Console.WriteLine($"Summary JSON: {jsonPath}");
+Console.WriteLine($"gRPC wire CSV: {SummaryReporter.PublishWire(wireStats)}");
@@ -0,0 +1,69 @@
+using System;
+using System.Buffers.Binary;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+using System.Text.Json;
+using E1_SerializationBenchmark.Data;
+using Google.Protobuf;
+using PbExplanationEntry = global::Adaptation.Experiments.ExplanationEntry;
+using PbNpcParam = global::Adaptation.Experiments.NpcParam;
+using PbWireDecision = global::Adaptation.Experiments.WireDecision;
+
+namespace E1_SerializationBenchmark.Serializers;
+
+/// <summary>
+/// Encodes a decision the way ServiceGrpc answers ComputeNext and decodes it the way the Unity GrpcClient does:
+/// one length-prefixed gRPC frame, base64-encoded for gRPC-Web text mode. Protocol version 1 carries the JSON
+/// strings next to the typed fields; version 2 carries the typed fields only.
+/// </summary>
+internal static class GrpcWireConverters
+{
+    private const int FrameHeaderBytes = 5;
+
+    public static byte[] Encode(DecisionData data, string correlationId, int protoVersion, bool textMode)
+    {
+        var message = new PbWireDecision
+        {
+            NextSceneId = data.NextSceneId,
+            Seed = data.Seed,
+            ConfigVersion = data.ConfigVersion,
+            CorrelationId = correlationId,
+            ProtoVersion = protoVersion
+        };
+
+        if (protoVersion < 2)
+        {
+            message.NpcParamsJson = JsonSerializer.Serialize(data.NpcParams.ToDictionary(p => p.Name, p => p.Value));
+            message.ExplanationJson = JsonSerializer.Serialize(data.Explanation.ToDictionary(e => e.Key, e => e.Value));
+        }
+
+        message.NpcParams.AddRange(data.NpcParams.Select(p => new PbNpcParam { Name = p.Name, Value = p.Value }));
+        message.Explanation.AddRange(data.Explanation.Select(e => new PbExplanationEntry { Key = e.Key, Value = e.Value }));
+
+        var size = message.CalculateSize();
+        var frame = new byte[FrameHeaderBytes + size];
+        BinaryPrimitives.WriteInt32BigEndian(frame.AsSpan(1, 4), size);
+        message.WriteTo(frame.AsSpan(FrameHeaderBytes));
+        return textMode ? Encoding.ASCII.GetBytes(Convert.ToBase64String(frame)) : frame;
+    }
+
+    public static DecisionData Decode(byte[] wire, bool textMode)
+    {
+        var frame = textMode ? Convert.FromBase64String(Encoding.ASCII.GetString(wire)) : wire;
+        var size = BinaryPrimitives.ReadInt32BigEndian(frame.AsSpan(1, 4));
+        var message = PbWireDecision.Parser.ParseFrom(frame, FrameHeaderBytes, size);
+
+        var typedOnly = message.ProtoVersion >= 2;
+        var npcParams = typedOnly || message.NpcParams.Count > 0
+            ? message.NpcParams.Select(p => new NpcParamData(p.Name, p.Value)).ToList()
+            : JsonSerializer.Deserialize<Dictionary<string, float>>(message.NpcParamsJson)!
+                .Select(kvp => new NpcParamData(kvp.Key, kvp.Value)).ToList();
+        var explanation = typedOnly || message.Explanation.Count > 0
+            ? message.Explanation.Select(e => new ExplanationEntryData(e.Key, e.Value)).ToList()
+            : JsonSerializer.Deserialize<Dictionary<string, string>>(message.ExplanationJson)!
+                .Select(kvp => new ExplanationEntryData(kvp.Key, kvp.Value)).ToList();
+
+        return new DecisionData(message.NextSceneId, npcParams, explanation, message.Seed, message.ConfigVersion);
+    }
+}
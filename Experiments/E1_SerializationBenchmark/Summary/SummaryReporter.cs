@@ -2,6 +2,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using System.Text.Json;
+using E1_SerializationBenchmark.Manual;
 
 namespace E1_SerializationBenchmark.Reporting;
 
@@ -27,4 +28,16 @@ internal static class SummaryReporter
 
         return (csvPath, jsonPath);
     }
+
+    public static string PublishWire(IReadOnlyList<GrpcWireStats> records)
+    {
+        var resultsDir = Path.Combine(Directory.GetCurrentDirectory(), "BenchmarkDotNet.Artifacts", "results");
+        Directory.CreateDirectory(resultsDir);
+
+        var csvPath = Path.Combine(resultsDir, "grpc_wire.csv");
+        var csvLines = new List<string> { GrpcWireStats.CsvHeader() };
+        csvLines.AddRange(records.Select(r => r.CsvLine()));
+        File.WriteAllText(csvPath, string.Join(Environment.NewLine, csvLines));
+        return csvPath;
+    }
 }
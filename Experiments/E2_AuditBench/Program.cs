@@ -35,12 +35,13 @@ internal static class Program
 
         var flushPerSession = arguments.FlushMode == FlushMode.PerSession;
         var logPath = string.Empty;
+        var firstSessionId = string.Empty;
         var totalTimes = new List<long>(arguments.Sessions);
         var computeTimes = new List<long>(arguments.Sessions);
         var auditTimes = new List<long>(arguments.Sessions);
         var payloads = new List<long>(arguments.Sessions);
 
-        using (var auditWriter = CreateAuditWriter(arguments.Mode, modeDir, flushPerSession))
+        using (var auditWriter = CreateAuditWriter(arguments.Mode, modeDir, flushPerSession, arguments.BlockRecords))
         using (var sessionMetricsStream = new StreamWriter(Path.Combine(modeDir, "session_metrics.csv"), false, Encoding.UTF8))
         {
             logPath = auditWriter.LogFilePath;
@@ -52,6 +53,11 @@ internal static class Program
             for (var i = arguments.Warmup; i < arguments.Warmup + arguments.Sessions; i++)
             {
                 var sessionEvent = generator.Generate(i);
+                if (i == arguments.Warmup)
+                {
+                    firstSessionId = sessionEvent.session_id;
+                }
+
                 var metric = MeasureSession(sessionEvent, auditWriter, arguments.Mode != "none");
                 totalTimes.Add(metric.TotalUs);
                 computeTimes.Add(metric.ComputeUs);
@@ -63,8 +69,10 @@ internal static class Program
             auditWriter.Flush();
             sessionMetricsStream.Flush();
         }
-        var replay = ReplayChecker.Check(arguments.Mode, logPath, RecomputeDecision);
-        var queries = QueryRunner.Run(arguments.Mode, logPath);
+        var replayTimer = Stopwatch.StartNew();
+        var replay = ReplayChecker.Check(arguments.Mode, logPath, RecomputeDecision, arguments.ReplayVersion);
+        replayTimer.Stop();
+        var queries = QueryRunner.Run(arguments.Mode, logPath, firstSessionId);
         var summary = new ModeSummary
         {
             Mode = arguments.Mode,
@@ -78,12 +86,20 @@ internal static class Program
             AuditP99Us = Percentiles.ComputePercentile(auditTimes, 0.99),
             BytesTotal = payloads.Sum(),
             BytesPerSessionMean = payloads.Count == 0 ? 0 : payloads.Sum() / (double)payloads.Count,
+            StorageBytes = string.IsNullOrEmpty(logPath) || !File.Exists(logPath) ? 0 : new FileInfo(logPath).Length,
+            AuditTotalUs = auditTimes.Sum(),
             ReplayMatchRatio = replay.MatchRatio,
             ReplaySessionsTotal = replay.SessionsTotal,
             ReplaySessionsMatched = replay.SessionsMatched,
+            ReplayMs = replayTimer.Elapsed.TotalMilliseconds,
+            ReplayBlocksRead = replay.BlocksRead,
+            ReplayBlocksSkipped = replay.BlocksSkipped,
             Q1Ms = queries.Q1Ms,
             Q2Ms = queries.Q2Ms,
-            Q3Ms = queries.Q3Ms
+            Q3Ms = queries.Q3Ms,
+            QueryLoadMs = queries.LoadMs,
+            QueryBlocksTotal = queries.BlocksTotal,
+            QueryBlocksRead = queries.BlocksRead
         };
 
         File.WriteAllText(Path.Combine(modeDir, "metrics.json"), JsonSerializer.Serialize(summary, ModeOptions));
@@ -168,13 +184,14 @@ internal static class Program
         yield return new ExplanationEntryData { name = "time_t", value = sessionEvent.time_t.ToString("0.000") };
     }
 
-    private static IAuditWriter CreateAuditWriter(string mode, string modeDir, bool flushPerSession)
+    private static IAuditWriter CreateAuditWriter(string mode, string modeDir, bool flushPerSession, int blockRecords)
     {
         return mode switch
         {
             "jsonl" => new JsonlAuditWriter(modeDir, flushPerSession),
             "otel" => new OtelAuditWriter(modeDir, flushPerSession),
             "prov" => new ProvAuditWriter(modeDir, flushPerSession),
+            "blocks" => new BlockAuditWriter(modeDir, flushPerSession, blockRecords),
             _ => new NullAuditWriter()
         };
     }
@@ -211,6 +228,8 @@ internal static class Program
         public int Warmup { get; init; } = 1000;
         public FlushMode FlushMode { get; init; } = FlushMode.PerSession;
         public string OutDir { get; init; } = "Experiments/E2_AuditBench/out";
+        public int BlockRecords { get; init; } = 256;
+        public string? ReplayVersion { get; init; }
 
         public static RunArguments Parse(string[] args)
         {
@@ -235,6 +254,12 @@ internal static class Program
                     case "--outdir" when i + 1 < args.Length:
                         result = result with { OutDir = args[++i] };
                         break;
+                    case "--blockRecords" when i + 1 < args.Length && int.TryParse(args[++i], out var blockRecords):
+                        result = result with { BlockRecords = blockRecords };
+                        break;
+                    case "--replayVersion" when i + 1 < args.Length:
+                        result = result with { ReplayVersion = args[++i] };
+                        break;
                 }
             }
 
@@ -268,12 +293,20 @@ internal static class Program
         public double AuditP99Us { get; init; }
         public double BytesTotal { get; init; }
         public double BytesPerSessionMean { get; init; }
+        public long StorageBytes { get; init; }
+        public long AuditTotalUs { get; init; }
         public double ReplayMatchRatio { get; init; }
         public int ReplaySessionsTotal { get; init; }
         public int ReplaySessionsMatched { get; init; }
+        public double ReplayMs { get; init; }
+        public int ReplayBlocksRead { get; init; }
+        public int ReplayBlocksSkipped { get; init; }
         public double Q1Ms { get; init; }
         public double Q2Ms { get; init; }
         public double Q3Ms { get; init; }
+        public double QueryLoadMs { get; init; }
+        public int QueryBlocksTotal { get; init; }
+        public int QueryBlocksRead { get; init; }
     }
 
     private sealed class NullAuditWriter : IAuditWriter
@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Security.Cryptography;
 using System.Text.Json;
+using Experiments.E2_AuditBench.Writers;
 
 namespace Experiments.E2_AuditBench.Replay;
 
@@ -11,12 +12,18 @@ internal sealed class ReplayResult
     public string Mode { get; init; } = string.Empty;
     public int SessionsTotal { get; init; }
     public int SessionsMatched { get; init; }
+    public int BlocksRead { get; init; }
+    public int BlocksSkipped { get; init; }
     public double MatchRatio => SessionsTotal == 0 ? 1.0 : (double)SessionsMatched / SessionsTotal;
 }
 
 internal static class ReplayChecker
 {
-    public static ReplayResult Check(string mode, string? logPath, Func<SessionEventData, DecisionData> compute)
+    /// <param name="configVersion">
+    /// Replay only records of this config version (null: all). Line modes still parse
+    /// every line to find them; block mode skips blocks whose footer lacks the version.
+    /// </param>
+    public static ReplayResult Check(string mode, string? logPath, Func<SessionEventData, DecisionData> compute, string? configVersion = null)
     {
         if (string.IsNullOrEmpty(logPath) || !File.Exists(logPath))
         {
@@ -25,7 +32,8 @@ internal static class ReplayChecker
 
         return mode switch
         {
-            "jsonl" => ReplayJsonl(mode, logPath, compute),
+            "jsonl" => ReplayJsonl(mode, logPath, compute, configVersion),
+            "blocks" => ReplayBlocks(mode, logPath, compute, configVersion),
             "otel" => ReplayOtel(mode, logPath, compute),
             "prov" => ReplayProv(mode, logPath, compute),
             _ => new ReplayResult
@@ -37,30 +45,42 @@ internal static class ReplayChecker
         };
     }
 
-    private static ReplayResult ReplayJsonl(string mode, string logPath, Func<SessionEventData, DecisionData> compute)
+    private static ReplayResult ReplayJsonl(string mode, string logPath, Func<SessionEventData, DecisionData> compute, string? configVersion)
     {
         var total = 0;
         var matched = 0;
         foreach (var line in File.ReadLines(logPath))
         {
-            if (string.IsNullOrWhiteSpace(line))
-            {
-                continue;
-            }
+            ReplayJsonlLine(line, compute, configVersion, ref total, ref matched);
+        }
 
-            var root = JsonDocument.Parse(line).RootElement;
-            var ek = JsonSerializer.Deserialize<SessionEventData>(root.GetProperty("ek").GetRawText(), JsonDefaults.Canonical);
-            var recordedDecision = JsonSerializer.Deserialize<DecisionData>(root.GetProperty("dk").GetRawText(), JsonDefaults.Canonical);
-            if (ek is null || recordedDecision is null)
+        return new ReplayResult
+        {
+            Mode = mode,
+            SessionsTotal = total,
+            SessionsMatched = matched
+        };
+    }
+
+    private static ReplayResult ReplayBlocks(string mode, string logPath, Func<SessionEventData, DecisionData> compute, string? configVersion)
+    {
+        var total = 0;
+        var matched = 0;
+        var blocksRead = 0;
+        var blocksSkipped = 0;
+        using var stream = new FileStream(logPath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite);
+        foreach (var footer in BlockAuditLog.ReadIndex(logPath))
+        {
+            if (configVersion is not null && !footer.config_versions.ContainsKey(configVersion))
             {
+                blocksSkipped++;
                 continue;
             }
 
-            total++;
-            var replayed = compute(ek);
-            if (HashDecision(replayed).Equals(HashDecision(recordedDecision), StringComparison.OrdinalIgnoreCase))
+            blocksRead++;
+            foreach (var line in BlockAuditLog.ReadLines(stream, footer))
             {
-                matched++;
+                ReplayJsonlLine(line, compute, configVersion, ref total, ref matched);
             }
         }
 
@@ -68,10 +88,40 @@ internal static class ReplayChecker
         {
             Mode = mode,
             SessionsTotal = total,
-            SessionsMatched = matched
+            SessionsMatched = matched,
+            BlocksRead = blocksRead,
+            BlocksSkipped = blocksSkipped
         };
     }
 
+    private static void ReplayJsonlLine(string line, Func<SessionEventData, DecisionData> compute, string? configVersion, ref int total, ref int matched)
+    {
+        if (string.IsNullOrWhiteSpace(line))
+        {
+            return;
+        }
+
+        var root = JsonDocument.Parse(line).RootElement;
+        var ek = JsonSerializer.Deserialize<SessionEventData>(root.GetProperty("ek").GetRawText(), JsonDefaults.Canonical);
+        var recordedDecision = JsonSerializer.Deserialize<DecisionData>(root.GetProperty("dk").GetRawText(), JsonDefaults.Canonical);
+        if (ek is null || recordedDecision is null)
+        {
+            return;
+        }
+
+        if (configVersion is not null && recordedDecision.config_version != configVersion)
+        {
+            return;
+        }
+
+        total++;
+        var replayed = compute(ek);
+        if (HashDecision(replayed).Equals(HashDecision(recordedDecision), StringComparison.OrdinalIgnoreCase))
+        {
+            matched++;
+        }
+    }
+
     private static ReplayResult ReplayOtel(string mode, string logPath, Func<SessionEventData, DecisionData> compute)
     {
         var total = 0;
@@ -5,6 +5,7 @@ using System.IO;
 using System.Linq;
 using System.Text.Json;
 using Experiments.E2_AuditBench;
+using Experiments.E2_AuditBench.Writers;
 
 namespace Experiments.E2_AuditBench.Stats;
 
@@ -13,33 +14,131 @@ internal sealed class QueryResults
     public double Q1Ms { get; init; }
     public double Q2Ms { get; init; }
     public double Q3Ms { get; init; }
+
+    /// <summary>Reading and parsing the log (line modes) or its block footers (block mode) before the queries.</summary>
+    public double LoadMs { get; init; }
+    public int BlocksTotal { get; init; }
+    public int BlocksRead { get; init; }
 }
 
 internal static class QueryRunner
 {
-    public static QueryResults Run(string mode, string? logPath)
+    /// <summary>
+    /// Runs Q1-Q3 against the log of <paramref name="mode"/>. Q1 looks up
+    /// <paramref name="sessionId"/> (the first record written) in every mode.
+    /// </summary>
+    public static QueryResults Run(string mode, string? logPath, string sessionId)
     {
         if (string.IsNullOrEmpty(logPath) || !File.Exists(logPath))
         {
             return new QueryResults();
         }
 
-        var records = LoadRecords(mode, logPath);
+        if (mode == "blocks")
+        {
+            return RunBlocks(logPath, sessionId);
+        }
+
+        List<AuditSnapshot> records = new();
+        var load = TimeQuery(() => records = LoadRecords(mode, logPath));
         if (records.Count == 0)
         {
             return new QueryResults();
         }
 
-        var q1 = TimeQuery(() => RunQuery1(records));
+        var q1 = TimeQuery(() => RunQuery1(records, sessionId));
         var q2 = TimeQuery(() => RunQuery2(records));
         var q3 = TimeQuery(() => RunQuery3(records));
-        return new QueryResults { Q1Ms = q1, Q2Ms = q2, Q3Ms = q3 };
+        return new QueryResults { Q1Ms = q1, Q2Ms = q2, Q3Ms = q3, LoadMs = load };
+    }
+
+    /// <summary>
+    /// Same three queries answered from the block footers. Q2 and Q3 need only the
+    /// footer counts; Q1 decompresses just the blocks whose session id range covers the target.
+    /// </summary>
+    private static QueryResults RunBlocks(string logPath, string sessionId)
+    {
+        List<AuditBlockFooter> index = new();
+        var load = TimeQuery(() => index = BlockAuditLog.ReadIndex(logPath));
+        if (index.Count == 0)
+        {
+            return new QueryResults();
+        }
+
+        var blocksRead = 0;
+        var q1 = TimeQuery(() => blocksRead = RunBlockQuery1(logPath, index, sessionId));
+        var q2 = TimeQuery(() => RunBlockQuery2(index));
+        var q3 = TimeQuery(() => RunBlockQuery3(index));
+        return new QueryResults { Q1Ms = q1, Q2Ms = q2, Q3Ms = q3, LoadMs = load, BlocksTotal = index.Count, BlocksRead = blocksRead };
+    }
+
+    private static int RunBlockQuery1(string logPath, List<AuditBlockFooter> index, string target)
+    {
+        var blocksRead = 0;
+        using var stream = new FileStream(logPath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite);
+        foreach (var footer in index)
+        {
+            if (!footer.MayContainSession(target))
+            {
+                continue;
+            }
+
+            blocksRead++;
+            foreach (var line in BlockAuditLog.ReadLines(stream, footer))
+            {
+                foreach (var record in ParseJsonl(line))
+                {
+                    if (record.SessionId == target)
+                    {
+                        PrintQuery1(record);
+                        return blocksRead;
+                    }
+                }
+            }
+        }
+
+        return blocksRead;
+    }
+
+    private static void RunBlockQuery2(List<AuditBlockFooter> index)
+    {
+        var counts = new Dictionary<string, int>();
+        foreach (var footer in index)
+        {
+            foreach (var (version, count) in footer.config_versions)
+            {
+                counts[version] = counts.TryGetValue(version, out var total) ? total + count : count;
+            }
+        }
+
+        Console.WriteLine("Q2: sessions per config_version");
+        foreach (var (version, count) in counts.OrderByDescending(pair => pair.Value))
+        {
+            Console.WriteLine($"  {version}: {count}");
+        }
+    }
+
+    private static void RunBlockQuery3(List<AuditBlockFooter> index)
+    {
+        const string target = "hard_scene";
+        var found = index.Sum(footer => footer.next_scenes
+            .Where(pair => string.Equals(pair.Key, target, StringComparison.OrdinalIgnoreCase))
+            .Sum(pair => pair.Value));
+        Console.WriteLine($"Q3: {found} sessions targeting {target}");
+    }
+
+    private static void RunQuery1(List<AuditSnapshot> records, string target)
+    {
+        var record = records.FirstOrDefault(r => r.SessionId == target);
+        if (record is not null)
+        {
+            PrintQuery1(record);
+        }
     }
 
-    private static void RunQuery1(List<AuditSnapshot> records)
+    private static void PrintQuery1(AuditSnapshot record)
     {
-        var record = records.First();
-        Console.WriteLine($"Q1: {record.CorrelationId} -> {record.NextSceneId}, explanation count {record.Explanation.Count}");
+        Console.WriteLine($"Q1: {record.SessionId} ({record.CorrelationId}) -> {record.NextSceneId}, explanation count {record.Explanation.Count}");
     }
 
     private static void RunQuery2(List<AuditSnapshot> records)
@@ -120,6 +219,7 @@ internal static class QueryRunner
         yield return new AuditSnapshot
         {
             CorrelationId = cid.GetString() ?? string.Empty,
+            SessionId = root.TryGetProperty("ek", out var ek) ? SessionIdOf(ek) : string.Empty,
             NextSceneId = decision.next_scene_id,
             ConfigVersion = decision.config_version,
             Explanation = decision.explanation
@@ -156,9 +256,11 @@ internal static class QueryRunner
             yield break;
         }
 
+        var ekJson = attributes.TryGetProperty("ek_json", out var ekJsonElement) ? ekJsonElement.GetString() : null;
         yield return new AuditSnapshot
         {
             CorrelationId = cidElement.GetString() ?? string.Empty,
+            SessionId = string.IsNullOrEmpty(ekJson) ? string.Empty : SessionIdOf(JsonDocument.Parse(ekJson).RootElement),
             NextSceneId = decision.next_scene_id,
             ConfigVersion = decision.config_version,
             Explanation = decision.explanation
@@ -196,18 +298,30 @@ internal static class QueryRunner
             yield break;
         }
 
+        var sessionId = root.TryGetProperty("ek_entity", out var ekEntity)
+            && ekEntity.TryGetProperty("attributes", out var ekAttributes)
+            && ekAttributes.TryGetProperty("ek", out var ek)
+            ? SessionIdOf(ek)
+            : string.Empty;
         yield return new AuditSnapshot
         {
             CorrelationId = cidElement.GetString() ?? string.Empty,
+            SessionId = sessionId,
             NextSceneId = decision.next_scene_id,
             ConfigVersion = decision.config_version,
             Explanation = decision.explanation
         };
     }
 
+    private static string SessionIdOf(JsonElement sessionEvent)
+    {
+        return sessionEvent.TryGetProperty("session_id", out var sessionId) ? sessionId.GetString() ?? string.Empty : string.Empty;
+    }
+
     private sealed class AuditSnapshot
     {
         public string CorrelationId { get; init; } = string.Empty;
+        public string SessionId { get; init; } = string.Empty;
         public string NextSceneId { get; init; } = string.Empty;
         public string ConfigVersion { get; init; } = string.Empty;
         public List<ExplanationEntryData> Explanation { get; init; } = new();
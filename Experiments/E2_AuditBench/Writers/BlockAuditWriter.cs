@@ -0,0 +1,205 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.Compression;
+using System.Text;
+using System.Text.Json;
+using Experiments.E2_AuditBench;
+
+namespace Experiments.E2_AuditBench.Writers;
+
+/// <summary>
+/// Writes the JSONL audit records in gzip blocks of a fixed number of records.
+/// Every block is followed by a footer describing it, so readers can pick blocks
+/// from the footers alone and decompress only the ones a query needs.
+/// </summary>
+/// <remarks>
+/// Layout per block: gzip member, footer JSON (UTF-8), footer length (int32 LE), <see cref="AuditBlockFooter.Magic"/> (int32 LE).
+/// Records in the open block are only on disk once the block is sealed, so
+/// per-session flushing applies to sealed blocks; <see cref="Flush"/> seals the open block.
+/// </remarks>
+internal sealed class BlockAuditWriter : IAuditWriter
+{
+    private static readonly byte[] NewLine = { (byte)'\n' };
+
+    private readonly FileStream _stream;
+    private readonly MemoryStream _block = new();
+    private readonly int _blockRecords;
+    private readonly bool _flushPerBlock;
+    private AuditBlockFooter _footer = new();
+
+    public BlockAuditWriter(string directory, bool flushPerBlock, int blockRecords)
+    {
+        Directory.CreateDirectory(directory);
+        LogFilePath = Path.Combine(directory, "audit_blocks.jsonl.gzb");
+        _stream = new FileStream(LogFilePath, FileMode.Create, FileAccess.Write, FileShare.Read);
+        _blockRecords = Math.Max(1, blockRecords);
+        _flushPerBlock = flushPerBlock;
+    }
+
+    public string? LogFilePath { get; }
+
+    public long Write(SessionEventData sessionEvent, DecisionData decision, string configHash)
+    {
+        var record = new JsonlAuditWriter.JsonAuditRecord(sessionEvent, decision, configHash);
+        var json = JsonSerializer.SerializeToUtf8Bytes(record, JsonDefaults.Canonical);
+        _block.Write(json, 0, json.Length);
+        _block.Write(NewLine, 0, NewLine.Length);
+        _footer.Add(record.correlation_id, sessionEvent.session_id, decision.config_version, decision.next_scene_id);
+
+        if (_footer.records >= _blockRecords)
+        {
+            SealBlock();
+        }
+
+        return json.Length + NewLine.Length;
+    }
+
+    public void Flush()
+    {
+        SealBlock();
+        _stream.Flush();
+    }
+
+    public void Dispose()
+    {
+        SealBlock();
+        _stream.Dispose();
+    }
+
+    private void SealBlock()
+    {
+        if (_footer.records == 0)
+        {
+            return;
+        }
+
+        _footer.offset = _stream.Position;
+        _footer.uncompressed_length = _block.Length;
+        using (var gzip = new GZipStream(_stream, CompressionLevel.Fastest, leaveOpen: true))
+        {
+            _block.Position = 0;
+            _block.CopyTo(gzip);
+        }
+
+        _footer.length = _stream.Position - _footer.offset;
+        var footerBytes = JsonSerializer.SerializeToUtf8Bytes(_footer);
+        _stream.Write(footerBytes, 0, footerBytes.Length);
+        _stream.Write(BitConverter.GetBytes(footerBytes.Length), 0, sizeof(int));
+        _stream.Write(BitConverter.GetBytes(AuditBlockFooter.Magic), 0, sizeof(int));
+        if (_flushPerBlock)
+        {
+            _stream.Flush();
+        }
+
+        _block.SetLength(0);
+        _footer = new AuditBlockFooter();
+    }
+}
+
+/// <summary>Footer of one audit block: where its gzip member is and what it holds.</summary>
+internal sealed class AuditBlockFooter
+{
+    public const int Magic = 0x4B4C4241; // "ABLK"
+
+    public long offset { get; set; }
+    public long length { get; set; }
+    public long uncompressed_length { get; set; }
+    public int records { get; set; }
+    public string min_correlation_id { get; set; } = string.Empty;
+    public string max_correlation_id { get; set; } = string.Empty;
+    public string min_session_id { get; set; } = string.Empty;
+    public string max_session_id { get; set; } = string.Empty;
+    public Dictionary<string, int> config_versions { get; set; } = new();
+    public Dictionary<string, int> next_scenes { get; set; } = new();
+
+    public void Add(string correlationId, string sessionId, string configVersion, string nextSceneId)
+    {
+        if (records == 0 || string.CompareOrdinal(correlationId, min_correlation_id) < 0)
+        {
+            min_correlation_id = correlationId;
+        }
+
+        if (records == 0 || string.CompareOrdinal(correlationId, max_correlation_id) > 0)
+        {
+            max_correlation_id = correlationId;
+        }
+
+        if (records == 0 || string.CompareOrdinal(sessionId, min_session_id) < 0)
+        {
+            min_session_id = sessionId;
+        }
+
+        if (records == 0 || string.CompareOrdinal(sessionId, max_session_id) > 0)
+        {
+            max_session_id = sessionId;
+        }
+
+        config_versions[configVersion] = config_versions.TryGetValue(configVersion, out var versions) ? versions + 1 : 1;
+        next_scenes[nextSceneId] = next_scenes.TryGetValue(nextSceneId, out var scenes) ? scenes + 1 : 1;
+        records++;
+    }
+
+    public bool MayContainSession(string sessionId)
+    {
+        return string.CompareOrdinal(sessionId, min_session_id) >= 0
+            && string.CompareOrdinal(sessionId, max_session_id) <= 0;
+    }
+}
+
+/// <summary>Reads the footers of a block audit log and decompresses selected blocks.</summary>
+internal static class BlockAuditLog
+{
+    private const int TrailerLength = 2 * sizeof(int);
+
+    /// <summary>
+    /// Walks the footers from the end of the file back to the start; only the
+    /// footers are read. A torn last block (crash mid-write) ends the walk with an error.
+    /// </summary>
+    public static List<AuditBlockFooter> ReadIndex(string path)
+    {
+        var footers = new List<AuditBlockFooter>();
+        using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite);
+        var trailer = new byte[TrailerLength];
+        var end = stream.Length;
+        while (end > 0)
+        {
+            stream.Position = end - TrailerLength;
+            stream.ReadExactly(trailer);
+            var footerLength = BitConverter.ToInt32(trailer, 0);
+            if (BitConverter.ToInt32(trailer, sizeof(int)) != AuditBlockFooter.Magic || footerLength <= 0 || footerLength > end - TrailerLength)
+            {
+                throw new InvalidDataException($"No audit block footer ends at byte {end} of {path}.");
+            }
+
+            var footerBytes = new byte[footerLength];
+            stream.Position = end - TrailerLength - footerLength;
+            stream.ReadExactly(footerBytes);
+            var footer = JsonSerializer.Deserialize<AuditBlockFooter>(footerBytes)
+                ?? throw new InvalidDataException($"Empty audit block footer at byte {stream.Position} of {path}.");
+            footers.Add(footer);
+            end = footer.offset;
+        }
+
+        footers.Reverse();
+        return footers;
+    }
+
+    /// <summary>Decompresses one block and returns its JSONL lines.</summary>
+    public static IEnumerable<string> ReadLines(FileStream stream, AuditBlockFooter footer)
+    {
+        var compressed = new byte[footer.length];
+        stream.Position = footer.offset;
+        stream.ReadExactly(compressed);
+        using var gzip = new GZipStream(new MemoryStream(compressed), CompressionMode.Decompress);
+        using var reader = new StreamReader(gzip, Encoding.UTF8);
+        string? line;
+        while ((line = reader.ReadLine()) != null)
+        {
+            if (!string.IsNullOrWhiteSpace(line))
+            {
+                yield return line;
+            }
+        }
+    }
+}
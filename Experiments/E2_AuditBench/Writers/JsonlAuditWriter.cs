@@ -47,7 +47,7 @@ internal sealed class JsonlAuditWriter : IAuditWriter
 
     public void Dispose() => _writer.Dispose();
 
-    private sealed class JsonAuditRecord
+    internal sealed class JsonAuditRecord
     {
         public JsonAuditRecord(SessionEventData sessionEvent, DecisionData decision, string configHash)
         {
@@ -32,12 +32,14 @@ internal static class Program
         {
             ("S1-CRUD", new Func<IStorageMode>(() => new SqliteProfileStore(Path.Combine(outDir, "s1_profile.db")))),
             ("S2-Event", new Func<IStorageMode>(() => new EventSourcingMode(Path.Combine(outDir, "s2_events.db")))),
-            ("S3-Hybrid", new Func<IStorageMode>(() => new HybridMode(Path.Combine(outDir, "s3_hybrid.db"), options.SnapshotEvery)))
+            ("S3-Hybrid", new Func<IStorageMode>(() => new HybridMode(Path.Combine(outDir, "s3_hybrid.db"), options.SnapshotEvery))),
+            ("S4-HybridRange", new Func<IStorageMode>(() => new RangeHybridMode(Path.Combine(outDir, "s4_hybrid_range.db"), options.BatchSize)))
         };
 
         var writeRecords = new List<WriteRecord>();
         var restoreRecords = new List<RestoreRecord>();
         var sizeRecords = new List<SizeRecord>();
+        var restoredStates = new Dictionary<(string Mode, int N), string>();
 
         foreach (var (name, factory) in modes)
         {
@@ -72,16 +74,18 @@ internal static class Program
             var sizeBytes = storage.GetStorageSizeBytes();
             sizeRecords.Add(new SizeRecord(name, options.Sessions, sizeBytes));
 
-            foreach (var target in options.RestoreTargets)
+            foreach (var upto in RestoreTargets(options))
             {
-                var upto = Math.Min(target, options.Warmup + options.Sessions);
                 var sw = Stopwatch.StartNew();
-                storage.Restore(upto);
+                var restored = storage.Restore(upto);
                 sw.Stop();
                 restoreRecords.Add(new RestoreRecord(name, upto, sw.Elapsed.TotalMilliseconds));
+                restoredStates[(name, upto)] = restored.ToJson();
             }
         }
 
+        CheckRestores(restoredStates);
+
         WriteCsv(Path.Combine(outDir, "write_times.csv"), new[] { "mode", "session_index", "write_ms" },
             writeRecords.Select(r => new[] { r.Mode, r.SessionIndex.ToString(), FormatDouble(r.WriteMs) }));
 
@@ -107,15 +111,52 @@ internal static class Program
                 FormatDouble(Percentiles.Compute(restores, 0.5)),
                 FormatDouble(Percentiles.Compute(restores, 0.95)),
                 FormatDouble(Percentiles.Compute(restores, 0.99)),
-                sizes.Bytes.ToString(CultureInfo.InvariantCulture)
+                sizes.Bytes.ToString(CultureInfo.InvariantCulture),
+                FormatDouble(writes.Sum())
             });
         }
 
         WriteCsv(Path.Combine(outDir, "summary.csv"),
-            new[] { "mode", "write_p50", "write_p95", "write_p99", "restore_p50", "restore_p95", "restore_p99", "bytes" },
+            new[] { "mode", "write_p50", "write_p95", "write_p99", "restore_p50", "restore_p95", "restore_p99", "bytes", "write_total_ms" },
             summaryRows);
     }
 
+    /// <summary>
+    /// Requested targets clamped to the stored history, plus the full history itself:
+    /// only a restore at or past the last snapshot shows what the snapshot saves.
+    /// </summary>
+    private static IEnumerable<int> RestoreTargets(RunOptions options)
+    {
+        var total = options.Warmup + options.Sessions;
+        return options.RestoreTargets.Select(target => Math.Min(target, total)).Append(total).Distinct();
+    }
+
+    /// <summary>
+    /// Snapshot-based modes must restore the same state as replaying the full event stream.
+    /// S1-CRUD keeps only the latest profile and is not compared.
+    /// </summary>
+    private static void CheckRestores(Dictionary<(string Mode, int N), string> restoredStates)
+    {
+        var mismatches = 0;
+        foreach (var ((mode, n), json) in restoredStates)
+        {
+            if (mode == "S1-CRUD" || mode == "S2-Event")
+            {
+                continue;
+            }
+
+            if (restoredStates.TryGetValue(("S2-Event", n), out var expected) && expected != json)
+            {
+                mismatches++;
+                Console.WriteLine($"Restore mismatch: {mode} N={n} differs from the S2-Event replay.");
+            }
+        }
+
+        Console.WriteLine(mismatches == 0
+            ? "Restore check: snapshot modes match the S2-Event replay at every N."
+            : $"Restore check: {mismatches} mismatches.");
+    }
+
     private static bool ShouldSnapshot(int seq, int snapshotEvery)
     {
         return snapshotEvery > 0 && seq % snapshotEvery == 0;
@@ -143,6 +184,7 @@ internal sealed record RunOptions
     public int Sessions { get; init; } = 10000;
     public int Warmup { get; init; } = 200;
     public int SnapshotEvery { get; init; } = 100;
+    public int BatchSize { get; init; } = 32;
     public string OutDir { get; init; } = "Experiments/E3_ProfileStorageBench/out";
     public int Seed { get; init; } = 54321;
     public int[] RestoreTargets { get; init; } = Program.DefaultRestoreTargets;
@@ -163,6 +205,9 @@ internal sealed record RunOptions
                 case "--snapshotEvery" when i + 1 < args.Length && int.TryParse(args[++i], out var snapshot):
                     options = options with { SnapshotEvery = snapshot };
                     break;
+                case "--batchSize" when i + 1 < args.Length && int.TryParse(args[++i], out var batchSize):
+                    options = options with { BatchSize = batchSize };
+                    break;
                 case "--outdir" when i + 1 < args.Length:
                     options = options with { OutDir = args[++i] };
                     break;
@@ -0,0 +1,96 @@
+using System.Collections.Generic;
+using System.IO;
+
+using Experiments.E3_ProfileStorageBench.Models;
+
+namespace Experiments.E3_ProfileStorageBench.Storage;
+
+/// <summary>
+/// Hybrid storage tuned for long profiles: WAL journal, events appended in
+/// transactional batches, every snapshot kept, and restore reading only the events
+/// after the nearest snapshot through the (profile_id, seq) index.
+/// Events still in the buffer are lost on a crash; at most batchSize - 1 of them,
+/// and never past a snapshot, because a snapshot flushes the buffer first.
+/// </summary>
+internal sealed class RangeHybridMode : IStorageMode
+{
+    private readonly string _dbPath;
+    private readonly SqliteEventStore _eventStore;
+    private readonly SqliteSnapshotStore _snapshotStore;
+    private readonly int _batchSize;
+    private readonly List<SessionEvent> _pending = new();
+
+    public RangeHybridMode(string dbPath, int batchSize)
+    {
+        _dbPath = dbPath;
+        _batchSize = batchSize < 1 ? 1 : batchSize;
+        _eventStore = new SqliteEventStore(dbPath, rangeIndex: true);
+        _snapshotStore = new SqliteSnapshotStore(dbPath, keepHistory: true);
+    }
+
+    public string ModeName => "S4-HybridRange";
+
+    public void Initialize()
+    {
+        _eventStore.EnableWriteAheadLog();
+        _eventStore.Initialize();
+        _snapshotStore.Initialize();
+    }
+
+    public void Persist(SessionEvent sessionEvent, ProfileState profileState, bool snapshotBoundary)
+    {
+        _pending.Add(sessionEvent);
+        if (snapshotBoundary || _pending.Count >= _batchSize)
+        {
+            Flush();
+        }
+
+        if (snapshotBoundary)
+        {
+            _snapshotStore.WriteSnapshot(profileState, sessionEvent.Seq);
+        }
+    }
+
+    public ProfileState Restore(int uptoSeq)
+    {
+        Flush();
+
+        var snapshot = _snapshotStore.ReadLatest(uptoSeq);
+        var state = snapshot is not null
+            ? ProfileState.FromJson(snapshot.SnapshotJson)
+            : ProfileState.CreateDefault();
+
+        foreach (var evt in _eventStore.ReadEventsRange(snapshot?.UptoSeq ?? 0, uptoSeq))
+        {
+            state.Apply(evt);
+        }
+
+        return state;
+    }
+
+    public long GetStorageSizeBytes()
+    {
+        Flush();
+        var walPath = _dbPath + "-wal";
+        var walBytes = File.Exists(walPath) ? new FileInfo(walPath).Length : 0;
+        return new FileInfo(_dbPath).Length + walBytes;
+    }
+
+    public void Dispose()
+    {
+        Flush();
+        _eventStore.Dispose();
+        _snapshotStore.Dispose();
+    }
+
+    private void Flush()
+    {
+        if (_pending.Count == 0)
+        {
+            return;
+        }
+
+        _eventStore.AppendBatch(_pending);
+        _pending.Clear();
+    }
+}
@@ -2,13 +2,21 @@ using System;
 using System.Collections.Generic;
 
 using Experiments.E3_ProfileStorageBench.Models;
+using Microsoft.Data.Sqlite;
 
 namespace Experiments.E3_ProfileStorageBench.Storage;
 
 internal sealed class SqliteEventStore : SqliteStorageBase
 {
-    public SqliteEventStore(string dbPath) : base(dbPath)
+    private const string ProfileId = "learner";
+    private const string InsertSql = @"INSERT INTO Events(profile_id, seq, ts, event_json, seed, config_version, content_version, rules_version)
+                            VALUES ($profile, $seq, $ts, $json, $seed, $cfg, $content, $rules);";
+
+    private readonly bool _rangeIndex;
+
+    public SqliteEventStore(string dbPath, bool rangeIndex = false) : base(dbPath)
     {
+        _rangeIndex = rangeIndex;
     }
 
     public void Initialize()
@@ -19,9 +27,8 @@ internal sealed class SqliteEventStore : SqliteStorageBase
     public void Append(SessionEvent sessionEvent)
     {
         using var cmd = Connection.CreateCommand();
-        cmd.CommandText = @"INSERT INTO Events(profile_id, seq, ts, event_json, seed, config_version, content_version, rules_version)
-                            VALUES ($profile, $seq, $ts, $json, $seed, $cfg, $content, $rules);";
-        cmd.Parameters.AddWithValue("$profile", "learner");
+        cmd.CommandText = InsertSql;
+        cmd.Parameters.AddWithValue("$profile", ProfileId);
         cmd.Parameters.AddWithValue("$seq", sessionEvent.Seq);
         cmd.Parameters.AddWithValue("$ts", DateTime.UtcNow.ToString("o"));
         cmd.Parameters.AddWithValue("$json", System.Text.Json.JsonSerializer.Serialize(sessionEvent, JsonDefaults.DefaultOptions));
@@ -32,6 +39,47 @@ internal sealed class SqliteEventStore : SqliteStorageBase
         cmd.ExecuteNonQuery();
     }
 
+    /// <summary>
+    /// Appends all events in one transaction through a single prepared insert,
+    /// so the batch costs one commit instead of one per event.
+    /// </summary>
+    public void AppendBatch(IReadOnlyList<SessionEvent> events)
+    {
+        if (events.Count == 0)
+        {
+            return;
+        }
+
+        using var transaction = Connection.BeginTransaction();
+        using var cmd = Connection.CreateCommand();
+        cmd.Transaction = transaction;
+        cmd.CommandText = InsertSql;
+        var profile = cmd.Parameters.Add("$profile", SqliteType.Text);
+        var seq = cmd.Parameters.Add("$seq", SqliteType.Integer);
+        var ts = cmd.Parameters.Add("$ts", SqliteType.Text);
+        var json = cmd.Parameters.Add("$json", SqliteType.Text);
+        var seed = cmd.Parameters.Add("$seed", SqliteType.Integer);
+        var cfg = cmd.Parameters.Add("$cfg", SqliteType.Text);
+        var content = cmd.Parameters.Add("$content", SqliteType.Text);
+        var rules = cmd.Parameters.Add("$rules", SqliteType.Text);
+        cmd.Prepare();
+
+        profile.Value = ProfileId;
+        foreach (var sessionEvent in events)
+        {
+            seq.Value = sessionEvent.Seq;
+            ts.Value = DateTime.UtcNow.ToString("o");
+            json.Value = System.Text.Json.JsonSerializer.Serialize(sessionEvent, JsonDefaults.DefaultOptions);
+            seed.Value = sessionEvent.Seed;
+            cfg.Value = sessionEvent.ConfigVersion;
+            content.Value = sessionEvent.ContentVersion;
+            rules.Value = sessionEvent.RulesVersion;
+            cmd.ExecuteNonQuery();
+        }
+
+        transaction.Commit();
+    }
+
     public List<SessionEvent> ReadEvents(int uptoSeq)
     {
         using var cmd = Connection.CreateCommand();
@@ -39,7 +87,27 @@ internal sealed class SqliteEventStore : SqliteStorageBase
                             WHERE seq <= $upto
                             ORDER BY seq ASC;";
         cmd.Parameters.AddWithValue("$upto", uptoSeq);
+        return ReadAll(cmd);
+    }
 
+    /// <summary>
+    /// Events with afterSeq &lt; seq &lt;= uptoSeq, in order. With the range index
+    /// this is a seek plus a scan of the range, independent of older history.
+    /// </summary>
+    public List<SessionEvent> ReadEventsRange(int afterSeq, int uptoSeq)
+    {
+        using var cmd = Connection.CreateCommand();
+        cmd.CommandText = @"SELECT event_json FROM Events
+                            WHERE profile_id = $profile AND seq > $after AND seq <= $upto
+                            ORDER BY seq ASC;";
+        cmd.Parameters.AddWithValue("$profile", ProfileId);
+        cmd.Parameters.AddWithValue("$after", afterSeq);
+        cmd.Parameters.AddWithValue("$upto", uptoSeq);
+        return ReadAll(cmd);
+    }
+
+    private static List<SessionEvent> ReadAll(SqliteCommand cmd)
+    {
         var list = new List<SessionEvent>();
         using var reader = cmd.ExecuteReader();
         while (reader.Read())
@@ -70,5 +138,11 @@ internal sealed class SqliteEventStore : SqliteStorageBase
                                 rules_version TEXT
                             );";
         cmd.ExecuteNonQuery();
+
+        if (_rangeIndex)
+        {
+            cmd.CommandText = "CREATE INDEX IF NOT EXISTS IX_Events_profile_seq ON Events(profile_id, seq);";
+            cmd.ExecuteNonQuery();
+        }
     }
 }
@@ -8,12 +8,20 @@ namespace Experiments.E3_ProfileStorageBench.Storage;
 internal sealed class SqliteSnapshotStore : SqliteStorageBase
 {
     private readonly string _dbPath;
+    private readonly bool _keepHistory;
 
-    public SqliteSnapshotStore(string dbPath) : base(dbPath)
+    /// <param name="keepHistory">
+    /// Keep every snapshot (keyed by profile and seq) instead of only the latest one,
+    /// so a restore to any seq starts from the nearest snapshot at or below it.
+    /// </param>
+    public SqliteSnapshotStore(string dbPath, bool keepHistory = false) : base(dbPath)
     {
         _dbPath = dbPath;
+        _keepHistory = keepHistory;
     }
 
+    private string TableName => _keepHistory ? "SnapshotHistory" : "Snapshots";
+
     public void Initialize()
     {
         EnsureInitialized();
@@ -24,9 +32,9 @@ internal sealed class SqliteSnapshotStore : SqliteStorageBase
         var json = profileState.ToJson();
         var hash = SnapshotHash(json);
         using var cmd = Connection.CreateCommand();
-        cmd.CommandText = @"INSERT INTO Snapshots(profile_id, upto_seq, snapshot_json, snapshot_hash, ts, rules_version, content_version)
+        cmd.CommandText = $@"INSERT INTO {TableName}(profile_id, upto_seq, snapshot_json, snapshot_hash, ts, rules_version, content_version)
                             VALUES ($profile, $seq, $json, $hash, $ts, $rules, $content)
-                            ON CONFLICT(profile_id) DO UPDATE SET
+                            ON CONFLICT({(_keepHistory ? "profile_id, upto_seq" : "profile_id")}) DO UPDATE SET
                                 upto_seq = $seq,
                                 snapshot_json = $json,
                                 snapshot_hash = $hash,
@@ -44,14 +52,15 @@ internal sealed class SqliteSnapshotStore : SqliteStorageBase
         cmd.ExecuteNonQuery();
     }
 
-    public SnapshotMetadata? ReadLatest(int uptoSeq)
+    public SnapshotMetadata? ReadLatest(int uptoSeq, string profileId = "learner")
     {
         using var cmd = Connection.CreateCommand();
-        cmd.CommandText = @"SELECT upto_seq, snapshot_json, snapshot_hash, rules_version, content_version
-                            FROM Snapshots
-                            WHERE upto_seq <= $upto
+        cmd.CommandText = $@"SELECT upto_seq, snapshot_json, snapshot_hash, rules_version, content_version
+                            FROM {TableName}
+                            WHERE profile_id = $profile AND upto_seq <= $upto
                             ORDER BY upto_seq DESC
                             LIMIT 1;";
+        cmd.Parameters.AddWithValue("$profile", profileId);
         cmd.Parameters.AddWithValue("$upto", uptoSeq);
 
         using var reader = cmd.ExecuteReader();
@@ -73,7 +82,18 @@ internal sealed class SqliteSnapshotStore : SqliteStorageBase
     protected override void CreateTables()
     {
         using var cmd = Connection.CreateCommand();
-        cmd.CommandText = @"CREATE TABLE IF NOT EXISTS Snapshots (
+        cmd.CommandText = _keepHistory
+            ? @"CREATE TABLE IF NOT EXISTS SnapshotHistory (
+                                profile_id TEXT,
+                                upto_seq INTEGER,
+                                snapshot_json TEXT,
+                                snapshot_hash TEXT,
+                                ts TEXT,
+                                rules_version TEXT,
+                                content_version TEXT,
+                                PRIMARY KEY (profile_id, upto_seq)
+                            ) WITHOUT ROWID;"
+            : @"CREATE TABLE IF NOT EXISTS Snapshots (
                                 profile_id TEXT PRIMARY KEY,
                                 upto_seq INTEGER,
                                 snapshot_json TEXT,
@@ -33,6 +33,17 @@ internal abstract class SqliteStorageBase : IDisposable
 
     protected abstract void CreateTables();
 
+    /// <summary>
+    /// Switches the database file to write-ahead logging. Commits then append to the
+    /// -wal file and, with synchronous=NORMAL, skip the fsync until checkpoint.
+    /// </summary>
+    public void EnableWriteAheadLog()
+    {
+        using var cmd = Connection.CreateCommand();
+        cmd.CommandText = "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;";
+        cmd.ExecuteNonQuery();
+    }
+
     public void Dispose()
     {
         Connection.Dispose();
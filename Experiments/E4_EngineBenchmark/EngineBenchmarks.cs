@@ -0,0 +1,55 @@
+using AdaptationCore;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Jobs;
+
+namespace E4_EngineBenchmark;
+
+[MemoryDiagnoser]
+[SimpleJob(RuntimeMoniker.Net80, warmupCount: 5, iterationCount: 12, launchCount: 1)]
+public class EngineBenchmarks
+{
+    private readonly EngineFixture _fixture = EngineFixture.Instance;
+    private readonly AdaptationResult _buffer = new();
+    private readonly AdaptationResultPool _pool = new();
+    private int _index;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _fixture.VerifyEquivalence();
+    }
+
+    [Benchmark(Baseline = true)]
+    public AdaptationResult Allocating()
+    {
+        return AdaptationEngine.ComputeNext(NextEvent(), _fixture.Config);
+    }
+
+    [Benchmark]
+    public AdaptationResult PreparedCallerBuffer()
+    {
+        return AdaptationEngine.ComputeNext(NextEvent(), _fixture.Prepared, _buffer);
+    }
+
+    [Benchmark]
+    public AdaptationResult PreparedPooled()
+    {
+        var result = AdaptationEngine.ComputeNext(NextEvent(), _fixture.Prepared, _pool.Rent());
+        _pool.Return(result);
+        return result;
+    }
+
+    [Benchmark]
+    public AdaptationResult PreparedPerCall()
+    {
+        return AdaptationEngine.ComputeNext(NextEvent(), AdaptationEngine.Prepare(_fixture.Config), null);
+    }
+
+    private AdaptationEvent NextEvent()
+    {
+        var events = _fixture.Events;
+        var sessionEvent = events[_index];
+        _index = _index + 1 == events.Length ? 0 : _index + 1;
+        return sessionEvent;
+    }
+}
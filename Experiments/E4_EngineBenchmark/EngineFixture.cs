@@ -0,0 +1,86 @@
+using System;
+using System.IO;
+using System.Text.Json;
+using AdaptationCore;
+
+namespace E4_EngineBenchmark;
+
+public sealed class EngineFixture
+{
+    public const int EventCount = 1024;
+
+    private static readonly Lazy<EngineFixture> InstanceLazy = new(() => new EngineFixture());
+
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        IncludeFields = true,
+        PropertyNamingPolicy = null,
+        DictionaryKeyPolicy = null
+    };
+
+    public static EngineFixture Instance => InstanceLazy.Value;
+
+    public ConfigPackage Config { get; }
+    public PreparedConfig Prepared { get; }
+    public AdaptationEvent[] Events { get; }
+
+    private EngineFixture()
+    {
+        Config = ConfigLoader.LoadByVersion(ResolveConfigRoot(), "v1");
+        Prepared = AdaptationEngine.Prepare(Config);
+
+        var random = new Random(1234);
+        var scenes = new[] { "SampleScene", "Scene_A", "Scene_B" };
+        Events = new AdaptationEvent[EventCount];
+        for (var i = 0; i < Events.Length; i++)
+        {
+            Events[i] = new AdaptationEvent
+            {
+                session_id = $"session_{i:D4}",
+                scene_id = scenes[i % scenes.Length],
+                result_z = (float)(random.NextDouble() * 4.0 - 2.0),
+                time_t = (float)(random.NextDouble() * 30.0),
+                attempts_a = random.Next(1, 6),
+                seed = random.Next(),
+                config_version = "v1"
+            };
+        }
+    }
+
+    /// <summary>
+    /// Runs every fixture event through both paths (reusing one buffer for the prepared path)
+    /// and fails if the serialized decision or audit record differ in any byte.
+    /// </summary>
+    public void VerifyEquivalence()
+    {
+        var buffer = new AdaptationResult();
+        foreach (var sessionEvent in Events)
+        {
+            var expected = AdaptationEngine.ComputeNext(sessionEvent, Config);
+            var actual = AdaptationEngine.ComputeNext(sessionEvent, Prepared, buffer);
+
+            var expectedJson = JsonSerializer.Serialize(expected, JsonOptions);
+            var actualJson = JsonSerializer.Serialize(actual, JsonOptions);
+            if (!string.Equals(expectedJson, actualJson, StringComparison.Ordinal))
+            {
+                throw new InvalidOperationException(
+                    $"Prepared ComputeNext diverged for {sessionEvent.session_id}:{Environment.NewLine}{expectedJson}{Environment.NewLine}{actualJson}");
+            }
+        }
+    }
+
+    private static string ResolveConfigRoot()
+    {
+        var dir = new DirectoryInfo(AppContext.BaseDirectory);
+        for (var i = 0; i < 8 && dir != null; i++)
+        {
+            var candidate = Path.Combine(dir.FullName, "Configs");
+            if (Directory.Exists(candidate))
+            {
+                return candidate;
+            }
+            dir = dir.Parent;
+        }
+        return Path.Combine(Directory.GetCurrentDirectory(), "Configs");
+    }
+}
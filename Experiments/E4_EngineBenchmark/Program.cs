@@ -0,0 +1,9 @@
+using BenchmarkDotNet.Running;
+using E4_EngineBenchmark;
+
+Console.WriteLine("Verifying prepared ComputeNext output against the allocating path...");
+EngineFixture.Instance.VerifyEquivalence();
+Console.WriteLine($"{EngineFixture.EventCount} events identical.");
+
+Console.WriteLine("Starting engine benchmark suite...");
+BenchmarkRunner.Run<EngineBenchmarks>(args: args);
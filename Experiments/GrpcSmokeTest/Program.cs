@@ -11,13 +11,18 @@ using Grpc.Net.Client.Web;
 var address = GetArgValue(args, "--address") ?? "http://127.0.0.1:6002";
 var timeoutMs = int.TryParse(GetArgValue(args, "--timeoutMs"), out var parsed) ? parsed : 3000;
 var configVersion = GetArgValue(args, "--configVersion") ?? "v1";
+// web_text (base64 gRPC-Web), web (binary gRPC-Web) or http2 (native gRPC; use the HTTP/2-only stream endpoint).
+var grpcMode = GetArgValue(args, "--grpcMode") ?? "web";
+var protoVersion = int.TryParse(GetArgValue(args, "--protoVersion"), out var parsedVersion) ? parsedVersion : 2;
 
 var correlationId = Guid.NewGuid().ToString("N");
 
-var handler = new GrpcWebHandler(GrpcWebMode.GrpcWebText, new HttpClientHandler())
-{
-    HttpVersion = System.Net.HttpVersion.Version11
-};
+HttpMessageHandler handler = grpcMode == "http2"
+    ? new HttpClientHandler()
+    : new GrpcWebHandler(grpcMode == "web_text" ? GrpcWebMode.GrpcWebText : GrpcWebMode.GrpcWeb, new HttpClientHandler())
+    {
+        HttpVersion = System.Net.HttpVersion.Version11
+    };
 var channel = GrpcChannel.ForAddress(address, new GrpcChannelOptions { HttpHandler = handler });
 var client = new Adaptation.AdaptationClient(channel);
 
@@ -30,7 +35,8 @@ var request = new SessionResult
     Attempts = 1,
     Seed = 1234,
     ConfigVersion = configVersion,
-    CorrelationId = correlationId
+    CorrelationId = correlationId,
+    ProtoVersion = protoVersion
 };
 
 var headers = new Metadata { { "x-correlation-id", correlationId } };
@@ -51,6 +57,8 @@ try
     Console.WriteLine($"CorrelationId: {response.CorrelationId}");
     Console.WriteLine($"NpcParams count: {response.NpcParams.Count}");
     Console.WriteLine($"Explanation count: {response.Explanation.Count}");
+    Console.WriteLine($"Proto version: {response.ProtoVersion} (requested {protoVersion}, mode {grpcMode})");
+    Console.WriteLine($"Response message bytes: {response.CalculateSize()}");
 
     var serverMs = GetTrailer(trailers, "x-server-compute-ms");
     if (!string.IsNullOrWhiteSpace(serverMs))
@@ -69,6 +77,83 @@ catch (Exception ex)
     Environment.Exit(1);
 }
 
+if (HasFlag(args, "--stream"))
+{
+    var streamAddress = GetArgValue(args, "--streamAddress") ?? "http://127.0.0.1:6004";
+    var batchSize = int.TryParse(GetArgValue(args, "--batchSize"), out var parsedBatchSize) ? Math.Max(1, parsedBatchSize) : 100;
+    var batches = int.TryParse(GetArgValue(args, "--batches"), out var parsedBatches) ? Math.Max(1, parsedBatches) : 3;
+
+    // ComputeNextStream needs real HTTP/2; gRPC-Web cannot carry a bidirectional stream.
+    using var streamChannel = GrpcChannel.ForAddress(streamAddress);
+    var streamClient = new Adaptation.AdaptationClient(streamChannel);
+    var streamDeadline = DateTime.UtcNow.AddMilliseconds(Math.Max(100, timeoutMs) * (double)batches);
+
+    try
+    {
+        using var stream = streamClient.ComputeNextStream(new CallOptions(headers: headers, deadline: streamDeadline));
+        for (var b = 0; b < batches; b++)
+        {
+            var batch = new SessionResultBatch { BatchId = $"{correlationId}-b{b}" };
+            for (var i = 0; i < batchSize; i++)
+            {
+                batch.Items.Add(new SessionResult
+                {
+                    SessionId = $"smoke_stream_{b}_{i}",
+                    SceneId = "SampleScene",
+                    ResultZ = 0.42f + i * 0.001f,
+                    TimeT = 1.23f,
+                    Attempts = 1,
+                    Seed = 1234 + i,
+                    ConfigVersion = configVersion
+                });
+            }
+
+            var sw = Stopwatch.StartNew();
+            await stream.RequestStream.WriteAsync(batch);
+            if (!await stream.ResponseStream.MoveNext(CancellationToken.None))
+            {
+                Console.Error.WriteLine("ComputeNextStream ended before replying.");
+                Environment.Exit(1);
+            }
+            sw.Stop();
+
+            var reply = stream.ResponseStream.Current;
+            var failed = reply.Results.Count(result => !result.Ok);
+            var inOrder = reply.Results.Select((result, index) => result.Index == index).All(ok => ok);
+            Console.WriteLine(
+                $"Batch {reply.BatchId}: {reply.Results.Count} results in {sw.Elapsed.TotalMilliseconds:0.000} ms " +
+                $"(server {reply.ServerComputeMs.ToString("0.000", CultureInfo.InvariantCulture)} ms, failed {failed}, in order {inOrder})");
+            foreach (var result in reply.Results.Where(result => !result.Ok).Take(3))
+            {
+                Console.WriteLine($"  item {result.Index}: {result.Error}");
+            }
+            if (reply.Results.Count != batchSize || failed > 0 || !inOrder)
+            {
+                Environment.Exit(1);
+            }
+        }
+
+        await stream.RequestStream.CompleteAsync();
+    }
+    catch (RpcException ex)
+    {
+        Console.Error.WriteLine($"gRPC stream error: {ex.StatusCode} {ex.Status.Detail}");
+        Environment.Exit(1);
+    }
+}
+
+static bool HasFlag(string[] args, string name)
+{
+    foreach (var arg in args)
+    {
+        if (string.Equals(arg, name, StringComparison.OrdinalIgnoreCase))
+        {
+            return true;
+        }
+    }
+    return false;
+}
+
 static string GetTrailer(Metadata trailers, string key)
 {
     if (trailers == null)
@@ -0,0 +1,243 @@
+"""SQLite index over every trial's audit.jsonl, shared by make_all_sessions.py and report.py.
+
+The index lives next to the trial tree (``<out>/audit_index.sqlite``) and holds one
+row per audit record: session id, warmup flag, config hash, seed, the canonical
+input key and the decision hashes. Each trial is keyed by its path relative to
+the out root and invalidated when the size or mtime of its audit.jsonl changes,
+so only new or rewritten logs are ever parsed again.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+INDEX_FILE = "audit_index.sqlite"
+AUDIT_FILE = "audit.jsonl"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trials (
+    trial_key TEXT PRIMARY KEY,
+    arch TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    invalid_lines INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    trial_key TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    session_id TEXT NOT NULL,
+    warmup INTEGER NOT NULL,
+    config_version_hash TEXT NOT NULL,
+    seed,
+    input_key TEXT NOT NULL,
+    decision_hash TEXT NOT NULL,
+    result_hash TEXT NOT NULL,
+    PRIMARY KEY (trial_key, line_no)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS records_session ON records (trial_key, session_id);
+CREATE INDEX IF NOT EXISTS records_input ON records (input_key, result_hash);
+"""
+
+
+def canonical_json(obj):
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+
+
+def compute_hash(obj):
+    payload = canonical_json(obj).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def input_key(record):
+    event = record.get("event") or record.get("inputs") or {}
+    return canonical_json(
+        {
+            "scene_id": event.get("scene_id"),
+            "result_z": event.get("result_z"),
+            "time_t": event.get("time_t"),
+            "attempts_a": event.get("attempts_a"),
+            "seed": event.get("seed"),
+            "config_version": event.get("config_version"),
+        }
+    )
+
+
+def parse_record(line_no, record):
+    """Reduce one audit record to an index row (without the trial key)."""
+    seed = (record.get("inputs") or {}).get("seed") or record.get("seed") or ""
+    output = record.get("output") or record.get("dk") or {}
+    result = record.get("decision") or record.get("output") or {}
+    return (
+        line_no,
+        str(record.get("session_id") or ""),
+        1 if record.get("warmup") is True else 0,
+        record.get("config_version_hash", "") or "",
+        seed,
+        input_key(record),
+        compute_hash(output) if output else "",
+        compute_hash(result),
+    )
+
+
+def parse_audit(path):
+    """Parse an audit.jsonl into (rows, invalid_line_count)."""
+    rows = []
+    invalid = 0
+    with open(path, "r", encoding="utf-8-sig") as fh:
+        for line_no, line in enumerate(fh):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                invalid += 1
+                continue
+            rows.append(parse_record(line_no, record))
+    return rows, invalid
+
+
+def sessions_from_rows(rows):
+    """Per-session audit metadata as used by all_sessions.csv (last record wins)."""
+    sessions = {}
+    for _, session_id, _, config_hash, seed, _, decision_hash, _ in rows:
+        if not session_id:
+            continue
+        sessions[session_id] = {
+            "config_hash": config_hash,
+            "seed": seed,
+            "decision_hash": decision_hash,
+        }
+    return sessions
+
+
+def fingerprint(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _parse_task(path):
+    return parse_audit(path)
+
+
+class AuditIndex:
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self.root = os.path.dirname(os.path.abspath(self.path))
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._conn.executescript("DROP TABLE IF EXISTS records; DROP TABLE IF EXISTS trials;")
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def key(self, trial_path):
+        return os.path.relpath(os.path.abspath(trial_path), self.root).replace(os.sep, "/")
+
+    def is_current(self, trial_key, file_fingerprint):
+        row = self._conn.execute(
+            "SELECT size, mtime_ns FROM trials WHERE trial_key = ?", (trial_key,)
+        ).fetchone()
+        return row is not None and tuple(row) == tuple(file_fingerprint)
+
+    def refresh(self, trials, jobs=1, prune=False):
+        """Bring the index up to date for ``trials`` (pairs of arch, trial path).
+
+        Stale audit logs are parsed (on a process pool when ``jobs > 1``) and
+        replaced in a single transaction. With ``prune`` every trial not listed is
+        dropped. Returns the number of audit files parsed.
+        """
+        seen = set()
+        stale = []
+        missing = []
+        for arch, trial_path in trials:
+            trial_key = self.key(trial_path)
+            seen.add(trial_key)
+            audit_path = os.path.join(trial_path, AUDIT_FILE)
+            file_fingerprint = fingerprint(audit_path)
+            if file_fingerprint is None:
+                missing.append(trial_key)
+            elif not self.is_current(trial_key, file_fingerprint):
+                stale.append((arch, trial_key, audit_path, file_fingerprint))
+
+        paths = [item[2] for item in stale]
+        if jobs > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                parsed = list(pool.map(_parse_task, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+        else:
+            parsed = [parse_audit(path) for path in paths]
+
+        with self._conn:
+            if prune:
+                known = [row[0] for row in self._conn.execute("SELECT trial_key FROM trials")]
+                missing.extend(key for key in known if key not in seen)
+            for trial_key in missing:
+                self._delete(trial_key)
+            for (arch, trial_key, _, file_fingerprint), (rows, invalid) in zip(stale, parsed):
+                self._delete(trial_key)
+                self._conn.execute(
+                    "INSERT INTO trials (trial_key, arch, size, mtime_ns, invalid_lines) VALUES (?, ?, ?, ?, ?)",
+                    (trial_key, arch, file_fingerprint[0], file_fingerprint[1], invalid),
+                )
+                self._conn.executemany(
+                    "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(trial_key,) + row for row in rows],
+                )
+        return len(stale)
+
+    def _delete(self, trial_key):
+        self._conn.execute("DELETE FROM records WHERE trial_key = ?", (trial_key,))
+        self._conn.execute("DELETE FROM trials WHERE trial_key = ?", (trial_key,))
+
+    def trial_rows(self, trial_path):
+        """Return (rows, invalid_lines) for an indexed trial whose audit.jsonl is unchanged, else None."""
+        trial_key = self.key(trial_path)
+        file_fingerprint = fingerprint(os.path.join(trial_path, AUDIT_FILE))
+        if file_fingerprint is None:
+            return None
+        trial = self._conn.execute(
+            "SELECT size, mtime_ns, invalid_lines FROM trials WHERE trial_key = ?", (trial_key,)
+        ).fetchone()
+        if trial is None or tuple(trial[:2]) != tuple(file_fingerprint):
+            return None
+        rows = self._conn.execute(
+            "SELECT line_no, session_id, warmup, config_version_hash, seed, input_key, decision_hash, result_hash "
+            "FROM records WHERE trial_key = ? ORDER BY line_no",
+            (trial_key,),
+        ).fetchall()
+        return rows, trial[2]
+
+    def reproducibility(self, arch, include_warmup):
+        """Share of distinct inputs that always produced the same decision."""
+        total, reproducible = self._conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(outputs = 1), 0) FROM (
+                SELECT r.input_key, COUNT(DISTINCT r.result_hash) AS outputs
+                FROM records r JOIN trials t ON t.trial_key = r.trial_key
+                WHERE t.arch = ? AND (? OR r.warmup = 0)
+                GROUP BY r.input_key
+            )
+            """,
+            (arch, 1 if include_warmup else 0),
+        ).fetchone()
+        if not total:
+            return 0.0
+        return reproducible / float(total)
@@ -0,0 +1,284 @@
+"""Compare the service's audit writers under concurrent load.
+
+Each variant starts the HTTP service with its own audit root and writer
+settings, drives it with loadgen.py at a fixed open-loop rate, then reads the
+service's /metrics/audit counters and checks every written audit line against
+AdaptationCore/schemas/audit.schema.json. One row per variant is written to
+audit_writer_bench.csv under the run folder.
+"""
+
+import argparse
+import csv
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+from report import percentile_sorted
+
+DEFAULT_VARIANTS = (
+    "legacy:AuditWriterMode=legacy",
+    "channel:AuditWriterMode=channel",
+    "channel_interval:AuditWriterMode=channel;AuditFlushIntervalMs=20",
+    "channel_fsync:AuditWriterMode=channel;AuditFsync=true",
+    "channel_drop:AuditWriterMode=channel;AuditFullMode=drop;AuditQueueCapacity=256",
+)
+METRIC_COLUMNS = (
+    "enqueued",
+    "written",
+    "dropped",
+    "blocked",
+    "blocked_ms",
+    "batches",
+    "max_batch",
+    "max_queue_depth",
+    "flushes",
+    "fsyncs",
+    "rotations",
+    "write_errors",
+)
+COLUMNS = (
+    "variant",
+    "settings",
+    "sent",
+    "failed",
+    "elapsed_s",
+    "throughput_rps",
+    "p50_ms",
+    "p99_ms",
+    "p999_ms",
+    "audit_files",
+    "audit_lines",
+    "invalid_lines",
+    "missing_lines",
+) + METRIC_COLUMNS
+
+
+def parse_variant(spec):
+    name, _, body = spec.partition(":")
+    options = {}
+    for pair in filter(None, body.split(";")):
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Variant option '{pair}' is not Key=Value")
+        options[key.strip()] = value.strip()
+    return name.strip(), options
+
+
+def http_json(url, timeout=2.0):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def wait_healthy(url, proc, timeout_s):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Service exited with code {proc.returncode} before becoming healthy")
+        try:
+            http_json(url + "/health", timeout=1.0)
+            return
+        except (urllib.error.URLError, OSError, ValueError):
+            time.sleep(0.2)
+    raise RuntimeError(f"Service at {url} did not become healthy within {timeout_s:.0f}s")
+
+
+def wait_drained(url, timeout_s):
+    """Poll /metrics/audit until everything enqueued is on disk; returns the last snapshot."""
+    deadline = time.monotonic() + timeout_s
+    metrics = {}
+    while time.monotonic() < deadline:
+        try:
+            metrics = http_json(url + "/metrics/audit")
+        except (urllib.error.URLError, OSError, ValueError):
+            return metrics
+        if metrics.get("queue_depth", 0) == 0 and metrics.get("written", 0) + metrics.get("write_errors", 0) >= metrics.get(
+            "enqueued", 0
+        ):
+            return metrics
+        time.sleep(0.1)
+    return metrics
+
+
+def load_schema(repo_root):
+    path = repo_root / "AdaptationCore" / "schemas" / "audit.schema.json"
+    with open(path, encoding="utf-8-sig") as fh:
+        schema = json.load(fh)
+    return set(schema["required"]), set(schema["properties"])
+
+
+def check_audit_lines(audit_root, required, allowed):
+    """Return (files, valid_lines, invalid_lines) over audit.jsonl and its rotated segments."""
+    files = sorted(Path(audit_root).glob("audit*.jsonl"))
+    valid = invalid = 0
+    for path in files:
+        with open(path, encoding="utf-8-sig") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    invalid += 1
+                    continue
+                keys = set(record) if isinstance(record, dict) else set()
+                if required <= keys and keys <= allowed and isinstance(record.get("seed"), int):
+                    valid += 1
+                else:
+                    invalid += 1
+    return len(files), valid, invalid
+
+
+def read_latencies(breakdown_path):
+    latencies = []
+    ok = 0
+    with open(breakdown_path, encoding="utf-8-sig", newline="") as fh:
+        for row in csv.DictReader(fh):
+            if row["error_code"]:
+                continue
+            ok += 1
+            latencies.append(float(row["t_total_client_ms"]))
+    latencies.sort()
+    return ok, latencies
+
+
+def run_variant(args, repo_root, run_dir, name, options, schema):
+    variant_dir = run_dir / name
+    audit_root = variant_dir / "audit"
+    audit_root.mkdir(parents=True, exist_ok=True)
+    url = f"http://127.0.0.1:{args.port}"
+
+    command = shlex.split(args.service_cmd) + [
+        "--ConfigRoot",
+        args.config_root,
+        "--ConfigVersion",
+        args.config_version,
+        "--AuditRoot",
+        str(audit_root),
+        "--urls",
+        url,
+    ]
+    for key, value in options.items():
+        command += [f"--{key}", value]
+
+    with open(variant_dir / "service.log", "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        try:
+            wait_healthy(url, proc, args.startup_timeout)
+            loadgen = [
+                sys.executable,
+                str(Path(__file__).with_name("loadgen.py")),
+                "--url",
+                url,
+                "--rate",
+                str(args.rate),
+                "--requests",
+                str(args.requests),
+                "--connections",
+                str(args.connections),
+                "--max-inflight",
+                str(args.max_inflight),
+                "--config-version",
+                args.config_version,
+                "--output",
+                str(variant_dir),
+                "--arch",
+                "loadgen",
+                "--run-ts",
+                "run",
+            ]
+            subprocess.run(loadgen, check=True)
+            metrics = wait_drained(url, args.drain_timeout)
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    trial_dir = variant_dir / "loadgen" / "run" / "trial_0000"
+    with open(trial_dir / "loadgen.json", encoding="utf-8") as fh:
+        summary = json.load(fh)
+    ok, latencies = read_latencies(trial_dir / "b2_breakdown.csv")
+    files, valid, invalid = check_audit_lines(audit_root, *schema)
+
+    row = {
+        "variant": name,
+        "settings": ";".join(f"{key}={value}" for key, value in options.items()),
+        "sent": summary["sent"],
+        "failed": summary["failed"],
+        "elapsed_s": summary["elapsed_s"],
+        "throughput_rps": f"{ok / summary['elapsed_s']:.1f}" if summary["elapsed_s"] else "",
+        "audit_files": files,
+        "audit_lines": valid,
+        "invalid_lines": invalid,
+        "missing_lines": max(0, ok - valid),
+    }
+    for column, q in (("p50_ms", 0.5), ("p99_ms", 0.99), ("p999_ms", 0.999)):
+        row[column] = f"{percentile_sorted(latencies, q):.3f}" if latencies else ""
+    for column in METRIC_COLUMNS:
+        value = metrics.get(column, "")
+        row[column] = f"{value:.3f}" if isinstance(value, float) else value
+    return row
+
+
+def main():
+    repo_root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description="Benchmark the service audit writers under concurrent load.")
+    parser.add_argument(
+        "--service-cmd",
+        required=True,
+        help='Command that starts the service, e.g. "dotnet Service/bin/Release/net8.0/Service.dll".',
+    )
+    parser.add_argument("--config-root", default=str(repo_root / "Configs"))
+    parser.add_argument("--config-version", default="v1")
+    parser.add_argument("--port", type=int, default=5091)
+    parser.add_argument(
+        "--variant",
+        action="append",
+        default=None,
+        help="NAME:Key=Value;Key=Value service settings (repeatable; default: legacy vs channel variants).",
+    )
+    parser.add_argument("--rate", type=float, default=1000.0)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--max-inflight", type=int, default=256)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    parser.add_argument("--output", default=os.path.join("Experiments", "out", "audit_writer_bench"))
+    args = parser.parse_args()
+
+    variants = [parse_variant(spec) for spec in (args.variant or DEFAULT_VARIANTS)]
+    run_dir = Path(args.output) / datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_dir.mkdir(parents=True, exist_ok=True)
+    schema = load_schema(repo_root)
+
+    rows = []
+    for name, options in variants:
+        print(f"== {name}: {options}")
+        rows.append(run_variant(args, repo_root, run_dir, name, options, schema))
+
+    out_path = run_dir / "audit_writer_bench.csv"
+    with open(out_path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    for row in rows:
+        print(
+            f"{row['variant']:<18} failed={row['failed']:<6} p99={row['p99_ms']:>9}ms "
+            f"lines={row['audit_lines']} invalid={row['invalid_lines']} missing={row['missing_lines']} "
+            f"dropped={row['dropped']} blocked={row['blocked']} batches={row['batches']}"
+        )
+    print(f"Results written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
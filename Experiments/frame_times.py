@@ -0,0 +1,144 @@
+"""Streaming per-session statistics for frame_times.csv.
+
+frame_times.csv has one row per rendered frame and can reach several GB, so it
+is read in chunks of ``chunk_rows`` lines. Each chunk is parsed with numpy,
+and only the frames of the session currently being read are kept in memory.
+Rows are written session by session, so a session is finalized as soon as
+the next one starts.
+
+SessionRunner calls the adapter synchronously on the main thread right after
+a session's last logged frame, then loads the next scene. The frames around
+session ``i``'s adapter call are therefore the last ``window`` frames of
+session ``i`` (``pre_call_frame_max_ms``) and the first ``window`` frames of
+session ``i + 1`` (``post_call_frame_max_ms``), which absorb the call and
+the scene transition.
+"""
+
+import itertools
+
+import numpy as np
+
+DEFAULT_BUDGETS_MS = (16.7, 33.3, 50.0)
+DEFAULT_WINDOW = 3
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def hitch_column(budget):
+    return "hitch_" + f"{budget:g}".replace(".", "_") + "ms"
+
+
+def frame_columns(budgets):
+    return (
+        ["frame_count", "frame_p50_ms", "frame_p99_ms", "frame_max_ms"]
+        + [hitch_column(budget) for budget in budgets]
+        + ["pre_call_frame_max_ms", "post_call_frame_max_ms"]
+    )
+
+
+def empty_frame_stats(budgets):
+    stats = {name: None for name in frame_columns(budgets)}
+    stats["frame_count"] = 0
+    for budget in budgets:
+        stats[hitch_column(budget)] = 0
+    return stats
+
+
+def parse_chunk(lines, session_col, delta_col):
+    try:
+        table = np.loadtxt(
+            lines,
+            dtype=str,
+            delimiter=",",
+            comments=None,
+            ndmin=2,
+            usecols=(session_col, delta_col),
+        )
+        return table[:, 0], table[:, 1].astype(np.float64)
+    except ValueError:
+        # Ragged or partially written rows: fall back to a tolerant per-line parse.
+        session_ids = []
+        deltas = []
+        width = max(session_col, delta_col) + 1
+        for line in lines:
+            parts = line.rstrip("\r\n").split(",")
+            if len(parts) < width:
+                continue
+            try:
+                deltas.append(float(parts[delta_col]))
+            except ValueError:
+                continue
+            session_ids.append(parts[session_col])
+        return np.asarray(session_ids, dtype=str), np.asarray(deltas, dtype=np.float64)
+
+
+def iter_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield (session_ids, delta_ms) arrays of at most ``chunk_rows`` rows each."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as handle:
+        header = [column.strip() for column in handle.readline().split(",")]
+        if "session_id" not in header or "delta_ms" not in header:
+            return
+        session_col = header.index("session_id")
+        delta_col = header.index("delta_ms")
+        while True:
+            lines = list(itertools.islice(handle, chunk_rows))
+            if not lines:
+                return
+            if not lines[-1].endswith("\n"):
+                # A live run may be mid-way through writing the last row.
+                lines.pop()
+            if lines:
+                yield parse_chunk(lines, session_col, delta_col)
+
+
+def session_stats(deltas, budgets, window):
+    stats = {
+        "frame_count": int(deltas.size),
+        "frame_p50_ms": float(np.percentile(deltas, 50)),
+        "frame_p99_ms": float(np.percentile(deltas, 99)),
+        "frame_max_ms": float(deltas.max()),
+        "pre_call_frame_max_ms": float(deltas[-window:].max()),
+        "post_call_frame_max_ms": None,
+    }
+    for budget in budgets:
+        stats[hitch_column(budget)] = int(np.count_nonzero(deltas > budget))
+    return stats
+
+
+def analyze_frame_times(path, budgets=DEFAULT_BUDGETS_MS, window=DEFAULT_WINDOW, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Return ({session_id: stats}, duplicate_session_ids) for one frame_times.csv."""
+    sessions = {}
+    head_max = {}
+    order = []
+    duplicates = set()
+    current_id = None
+    pending = []
+
+    def finalize():
+        if current_id is None or not pending:
+            return
+        deltas = np.concatenate(pending)
+        if current_id in sessions:
+            duplicates.add(current_id)
+        else:
+            order.append(current_id)
+        sessions[current_id] = session_stats(deltas, budgets, window)
+        head_max[current_id] = float(deltas[:window].max())
+
+    for session_ids, deltas in iter_chunks(path, chunk_rows):
+        if session_ids.size == 0:
+            continue
+        boundaries = np.flatnonzero(session_ids[1:] != session_ids[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [session_ids.size]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            session_id = str(session_ids[start])
+            if session_id != current_id:
+                finalize()
+                current_id = session_id
+                pending = []
+            pending.append(deltas[start:end])
+    finalize()
+
+    for previous, following in zip(order, order[1:]):
+        sessions[previous]["post_call_frame_max_ms"] = head_max[following]
+    return sessions, duplicates
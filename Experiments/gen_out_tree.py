@@ -0,0 +1,337 @@
+"""Generate a synthetic Experiments/out tree for scaling and profiling the analysis scripts.
+
+Every trial folder gets the files SessionLogWriter writes during a Unity batch run,
+with the same headers, value formatting, UTF-8 BOM and CRLF line endings:
+adapter_calls.csv, scene_transitions.csv, frame_times.csv, audit.jsonl, the
+transport breakdown of the arch (b2_breakdown.csv, r3_grpc_breakdown.csv or
+r4_broker_breakdown.csv), prewarm.csv and run_complete.txt.
+
+The values are drawn from a seeded RNG, so the same arguments always produce the
+same bytes. Latencies follow log-normal shapes with a slow first session per trial,
+like the real runs in all_sessions.csv. The audit decisions come from the
+AdaptationEngine formula, so reproducibility checks and replay_engine.py see
+consistent records.
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import random
+import struct
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# arch folder -> (adapter name in adapter_calls.csv, breakdown file or None)
+ARCH_PROFILES = {
+    "B1": ("B1", None),
+    "B2_local": ("Baseline", "b2_breakdown.csv"),
+    "B3_remote_gRPC": ("Baseline", "r3_grpc_breakdown.csv"),
+    "B4_broker_client": ("R4_remote_BrokerRPC", "r4_broker_breakdown.csv"),
+}
+DEFAULT_ARCHS = ",".join(ARCH_PROFILES)
+NEWLINE = "\r\n"
+# Batch runs reload the one scene, as in all_sessions.csv.
+SCENE = "SampleScene"
+NPC_PARAMS = ("aggression", "curiosity", "patience")
+# AdaptationEngine defaults: ConfigLoader leaves npc_base_params empty for Configs/v1.
+BASE_PARAMS = {"aggression": 0.2, "curiosity": 0.3, "patience": 0.6}
+RESULT_WEIGHT = 0.65
+TIME_WEIGHT = 0.35
+TIME_SCALE = 0.1
+FRAME_MS = 16.667
+
+ADAPTER_HEADER = "session_id,session_index,warmup,adapter,call_ms,net_ms,local_ms,decision_build_ms"
+SCENE_HEADER = "session_id,session_index,warmup,from_scene,to_scene,transition_ms"
+FRAME_HEADER = "session_id,session_index,frame_index,warmup,delta_ms"
+BREAKDOWN_HEADERS = {
+    "b2_breakdown.csv": "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_http_rtt_ms,"
+    "t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,http_status,error_code,ts_send_utc",
+    "r3_grpc_breakdown.csv": "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_grpc_rtt_ms,"
+    "t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,grpc_status,error_code,ts_send_utc,"
+    "grpc_mode,proto_version,response_bytes",
+    "r4_broker_breakdown.csv": "trial_id,session_index,warmup,correlation_id,serialize_ms,broker_roundtrip_ms,"
+    "server_compute_ms,deserialize_ms,total_ms,retries_count,timeout_flag,status,ts_send_utc",
+}
+
+PREWARM_HEADER = "trial_id,adapter,step,duration_ms,ok,detail"
+# breakdown file (None for in-process archs) -> prewarm steps after "create": (step, median ms, detail)
+PREWARM_STEPS = {
+    None: (("compute", 2.0, ""),),
+    "b2_breakdown.csv": (("health", 60.0, "http_status=200"), ("serializer", 4.0, "")),
+    "r3_grpc_breakdown.csv": (("channel", 8.0, "grpc_mode=web"), ("health", 45.0, "http_status=200"), ("serializer", 6.0, "")),
+    "r4_broker_breakdown.csv": (("health", 3.0, "consumers=1"), ("serializer", 4.0, "")),
+}
+
+# GrpcClient defaults: binary gRPC-Web, typed-only v2 decision (framed size of a 3-param, 4-entry decision).
+GRPC_MODE = "web"
+GRPC_PROTO_VERSION = 2
+GRPC_RESPONSE_BYTES = 249
+
+
+def f32(value):
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def clamp01(value):
+    return min(1.0, max(0.0, value))
+
+
+def config_hash(config_root, version):
+    """SHA-256 of Configs/<version>/config.json like ConfigLoader, or of the version name when absent."""
+    path = Path(config_root) / version / "config.json"
+    try:
+        with open(path, "r", encoding="utf-8-sig") as fh:
+            text = fh.read()
+    except FileNotFoundError:
+        text = version
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compute_next(result_z, time_t):
+    """AdaptationEngine.ComputeNext with the default config, rounded to float32 at every step."""
+    time_factor = f32(f32(time_t) * f32(TIME_SCALE))
+    score = f32(f32(f32(result_z) * f32(RESULT_WEIGHT)) + f32(time_factor * f32(TIME_WEIGHT)))
+    params = {
+        "aggression": clamp01(f32(f32(BASE_PARAMS["aggression"]) + score)),
+        "curiosity": clamp01(f32(f32(BASE_PARAMS["curiosity"]) + time_factor)),
+        "patience": clamp01(f32(f32(BASE_PARAMS["patience"]) - f32(score * 0.5))),
+    }
+    return time_factor, score, params
+
+
+def audit_line(session_id, index, warmup, timestamp, scene, result_z, time_t, seed, version, version_hash, adapter):
+    time_factor, score, params = compute_next(result_z, time_t)
+    inputs = (
+        f'{{"session_id":"{session_id}","scene_id":"{scene}","result_z":{result_z:.3f},"time_t":{time_t:.3f},'
+        f'"attempts_a":1,"seed":{seed},"config_version":"{version}"}}'
+    )
+    intermediate = (
+        f'{{"time_factor":{time_factor:.3f},"score":{score:.3f},"base_aggression":{BASE_PARAMS["aggression"]:.3f},'
+        f'"base_curiosity":{BASE_PARAMS["curiosity"]:.3f},"base_patience":{BASE_PARAMS["patience"]:.3f}}}'
+    )
+    npc = ",".join(f'"{name}":{params[name]:.3f}' for name in NPC_PARAMS)
+    output = (
+        f'{{"next_scene_id":"{scene}","npc_params":{{{npc}}},"explanation":{{"adapter":"{adapter}",'
+        f'"config_version":"{version}","config_hash":"{version_hash}","score":"{score:.3f}"}},'
+        f'"seed":{seed},"config_version":"{version}"}}'
+    )
+    return (
+        f'{{"session_id":"{session_id}","session_index":{index},"warmup":{"true" if warmup else "false"},'
+        f'"timestamp_utc":"{timestamp}","inputs":{inputs},"config_version_hash":"{version_hash}","seed":{seed},'
+        f'"intermediate":{intermediate},"output":{output}}}'
+    )
+
+
+def lognormal(rng, median, sigma):
+    return median * math.exp(rng.gauss(0.0, sigma))
+
+
+def format_utc(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%f") + "0Z"
+
+
+class TrialSpec:
+    def __init__(self, sessions, warmup, frames, seed, config_version, version_hash):
+        self.sessions = sessions
+        self.warmup = warmup
+        self.frames = frames
+        self.seed = seed
+        self.config_version = config_version
+        self.version_hash = version_hash
+
+
+def open_log(path, header):
+    fh = open(path, "w", encoding="utf-8-sig", newline="")
+    fh.write(header + NEWLINE)
+    return fh
+
+
+def write_prewarm(path, trial_id, adapter, breakdown, rng):
+    """prewarm.csv as SessionRunner writes it: adapter creation, the adapter's steps, then the total."""
+    steps = [("create", 30.0 if breakdown == "r4_broker_breakdown.csv" else 5.0, "")] + list(PREWARM_STEPS[breakdown])
+    total = 0.0
+    with open_log(path, PREWARM_HEADER) as fh:
+        for step, median, detail in steps:
+            duration = lognormal(rng, median, 0.3)
+            total += duration
+            fh.write(f'{trial_id},{adapter},{step},{duration:.3f},1,"{detail}"{NEWLINE}')
+        fh.write(f'{trial_id},{adapter},total,{total:.3f},1,""{NEWLINE}')
+
+
+def write_trial(trial_dir, arch, spec, rng, started):
+    """Write one trial folder; returns the number of bytes written."""
+    adapter, breakdown = ARCH_PROFILES[arch]
+    remote = breakdown is not None
+    trial_dir.mkdir(parents=True, exist_ok=True)
+    trial_id = trial_dir.name
+    files = {
+        "adapter": open_log(trial_dir / "adapter_calls.csv", ADAPTER_HEADER),
+        "scene": open_log(trial_dir / "scene_transitions.csv", SCENE_HEADER),
+        "frames": open_log(trial_dir / "frame_times.csv", FRAME_HEADER),
+        "audit": open(trial_dir / "audit.jsonl", "w", encoding="utf-8-sig", newline=""),
+    }
+    if remote:
+        files["breakdown"] = open_log(trial_dir / breakdown, BREAKDOWN_HEADERS[breakdown])
+    write_prewarm(trial_dir / "prewarm.csv", trial_id, adapter, breakdown, random.Random(f"{arch}/{trial_id}/{spec.seed}"))
+
+    clock = started
+    scene = SCENE
+    try:
+        for index in range(spec.warmup + spec.sessions):
+            session_id = f"session_{index:04d}"
+            warmup = index < spec.warmup
+            flag = 1 if warmup else 0
+            cold = index == 0
+
+            frame_lines = []
+            elapsed_ms = 0.0
+            for frame in range(spec.frames):
+                delta = FRAME_MS + rng.gauss(0.0, 0.8)
+                if frame < 3 and index > 0:
+                    delta += lognormal(rng, 40.0, 0.5)
+                elif rng.random() < 0.004:
+                    delta += lognormal(rng, 25.0, 0.6)
+                delta = max(1.0, delta)
+                elapsed_ms += delta
+                frame_lines.append(f"{session_id},{index},{frame},{flag},{delta:.3f}{NEWLINE}")
+            files["frames"].write("".join(frame_lines))
+
+            seed = spec.seed + index
+            # SessionRunner seeds UnityEngine.Random with the session seed before drawing result_z.
+            result_z = random.Random(seed).random()
+            time_t = elapsed_ms / 1000.0
+            clock += timedelta(milliseconds=elapsed_ms)
+
+            decision_ms = lognormal(rng, 0.02, 0.3) * (8.0 if cold else 1.0)
+            if remote:
+                serialize = lognormal(rng, 0.05, 0.3) * (20.0 if cold else 1.0)
+                server = lognormal(rng, 0.08, 0.4)
+                deserialize = lognormal(rng, 0.04, 0.3) * (20.0 if cold else 1.0)
+                transport = lognormal(rng, 1.2, 0.35) * (15.0 if cold else 1.0) + server
+                total = serialize + transport + deserialize + lognormal(rng, 0.03, 0.5)
+                call_ms = total + decision_ms
+                net_ms = transport
+                local_ms = call_ms - net_ms
+                # Keyed by arch and run too: trial names repeat across run folders.
+                trial_key = f"{arch}/{trial_dir.parent.name}/{trial_id}"
+                correlation_id = hashlib.md5(f"{trial_key}/{session_id}".encode("ascii")).hexdigest()
+                sent = format_utc(clock)
+                if breakdown == "r4_broker_breakdown.csv":
+                    row = (
+                        f'{trial_id},{index},{flag},"{correlation_id}",{serialize:.3f},{transport:.3f},{server:.3f},'
+                        f'{deserialize:.3f},{total:.3f},0,0,"OK",{sent}'
+                    )
+                elif breakdown == "b2_breakdown.csv":
+                    row = (
+                        f'{trial_id},{index},{flag},"{correlation_id}",{serialize:.3f},{transport:.3f},{server:.3f},'
+                        f'{deserialize:.3f},{total:.3f},0,0,200,"",{sent}'
+                    )
+                else:
+                    row = (
+                        f'{trial_id},{index},{flag},"{correlation_id}",{serialize:.3f},{transport:.3f},{server:.3f},'
+                        f'{deserialize:.3f},{total:.3f},0,0,"OK","",{sent},{GRPC_MODE},{GRPC_PROTO_VERSION},{GRPC_RESPONSE_BYTES}'
+                    )
+                files["breakdown"].write(row + NEWLINE)
+            else:
+                call_ms = lognormal(rng, 0.08, 0.25) * (25.0 if cold else 1.0) + decision_ms
+                net_ms = 0.0
+                local_ms = call_ms
+            files["adapter"].write(
+                f"{session_id},{index},{flag},{adapter},{call_ms:.3f},{net_ms:.3f},{local_ms:.3f},{decision_ms:.3f}{NEWLINE}"
+            )
+
+            files["audit"].write(
+                audit_line(
+                    session_id,
+                    index,
+                    warmup,
+                    format_utc(clock),
+                    scene,
+                    result_z,
+                    time_t,
+                    seed,
+                    spec.config_version,
+                    spec.version_hash,
+                    adapter,
+                )
+                + NEWLINE
+            )
+
+            transition_ms = lognormal(rng, 150.0, 0.15)
+            files["scene"].write(f"{session_id},{index},{flag},{scene},{scene},{transition_ms:.3f}{NEWLINE}")
+            clock += timedelta(milliseconds=call_ms + transition_ms)
+    finally:
+        for fh in files.values():
+            fh.close()
+
+    with open(trial_dir / "run_complete.txt", "w", encoding="utf-8") as fh:
+        fh.write("ok")
+    return sum(entry.stat().st_size for entry in trial_dir.iterdir())
+
+
+def generate(root, archs, runs, trials, sessions, warmup, frames, seed, config_root, config_version):
+    """Write <root>/<arch>/<run_ts>/trial_NNNN folders; returns (trial_count, bytes_written)."""
+    version_hash = config_hash(config_root, config_version)
+    base_time = datetime(2026, 2, 2, 12, 0, 0, tzinfo=timezone.utc)
+    trial_count = 0
+    total_bytes = 0
+    for arch_pos, arch in enumerate(archs):
+        if arch not in ARCH_PROFILES:
+            raise ValueError(f"Unknown arch '{arch}' (expected one of {DEFAULT_ARCHS})")
+        for run in range(runs):
+            run_start = base_time + timedelta(days=arch_pos, hours=run)
+            run_ts = run_start.strftime("%Y%m%d_%H%M%S")
+            for trial in range(trials):
+                rng = random.Random(f"{seed}/{arch}/{run}/{trial}")
+                spec = TrialSpec(sessions, warmup, frames, 1234, config_version, version_hash)
+                trial_dir = Path(root) / arch / run_ts / f"trial_{trial:04d}"
+                total_bytes += write_trial(trial_dir, arch, spec, rng, run_start)
+                trial_count += 1
+    return trial_count, total_bytes
+
+
+def parse_archs(value):
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Experiments/out trial tree.")
+    parser.add_argument("--output", default=os.path.join("Experiments", "out_synth"))
+    parser.add_argument("--archs", type=parse_archs, default=DEFAULT_ARCHS, help=f"Comma-separated (default: {DEFAULT_ARCHS}).")
+    parser.add_argument("--runs", type=int, default=1, help="Run folders per arch.")
+    parser.add_argument("--trials", type=int, default=10, help="Trial folders per run.")
+    parser.add_argument("--sessions", type=int, default=30, help="Measured sessions per trial.")
+    parser.add_argument("--warmup", type=int, default=5, help="Warmup sessions per trial (written first).")
+    parser.add_argument("--frames", type=int, default=600, help="frame_times.csv rows per session.")
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--config-root", default=str(Path(__file__).resolve().parent.parent / "Configs"))
+    parser.add_argument("--config-version", default="v1")
+    args = parser.parse_args()
+
+    root = Path(args.output)
+    if root.exists() and any(root.iterdir()):
+        print(f"{root} is not empty; choose another --output", file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    trial_count, total_bytes = generate(
+        root,
+        args.archs,
+        args.runs,
+        args.trials,
+        args.sessions,
+        args.warmup,
+        args.frames,
+        args.seed,
+        args.config_root,
+        args.config_version,
+    )
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {trial_count} trials ({total_bytes / 1e6:.1f} MB) to {root} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
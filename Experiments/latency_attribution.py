@@ -0,0 +1,478 @@
+"""Attribute each request's client latency to the layer that spent it.
+
+Walks the same ``out/<arch>/<run>/trial_*`` tree as report.py and reads the
+client breakdown files (b2_breakdown.csv, r3_grpc_breakdown.csv,
+r4_broker_breakdown.csv) row by row. Broker rows are merge-joined on
+correlation_id with the worker_events.csv files written by ServiceBroker:
+both sides are streamed in timestamp order (client ts_send_utc, worker
+ts_receive) and a row waits at most ``--window-s`` for its partner, so memory
+is bounded by the in-flight window rather than by the size of the logs.
+
+Stages per request (milliseconds, successful requests only):
+
+* ``serialize`` / ``deserialize`` - client-side encode and decode.
+* ``server_compute`` - the server's own compute time.
+* ``network`` - HTTP/gRPC round trip minus server compute.
+* ``broker_queue`` - broker round trip minus the time the worker held the
+  message (receive to publish) when joined, minus server compute otherwise;
+  this is RabbitMQ queueing plus both network legs.
+* ``server_publish_wait`` - worker time between compute and publish (joined).
+* ``request_queue_wait`` - the worker's queue_wait_ms (send header to
+  receive); it crosses two clocks, so it is reported but not subtracted.
+* ``client_other`` - total minus everything the client measured explicitly.
+
+One row per (arch, transport, stage) goes to latency_attribution.csv with
+count, mean, p50/p95/p99 and the stage's share of the mean total.
+"""
+
+import argparse
+import csv
+import heapq
+import os
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+
+from report import (
+    DEFAULT_SKETCH_ACCURACY,
+    REPORT_QUANTILES,
+    TRANSPORTS,
+    collect_runs,
+    fmt,
+    is_warmup_row,
+    quantile_factory,
+)
+
+WORKER_EVENTS_FILE = "worker_events.csv"
+BROKER_TRANSPORT = "R4 broker"
+RTT_STAGES = ("serialize", "network", "server_compute", "deserialize", "client_other", "total")
+BROKER_STAGES = (
+    "serialize",
+    "broker_queue",
+    "server_compute",
+    "server_publish_wait",
+    "request_queue_wait",
+    "deserialize",
+    "client_other",
+    "total",
+)
+JOINED_COLUMNS = (
+    "arch",
+    "trial_id",
+    "correlation_id",
+    "ts_send_utc",
+    "ts_receive",
+    "ts_publish",
+    "worker_id",
+) + BROKER_STAGES
+
+
+class UtcParser:
+    """Parses round-trip ("o") timestamps to epoch seconds.
+
+    Handles 0-7 fractional digits and a ``Z`` or ``+hh:mm`` suffix. Rows of one
+    log arrive in near time order, so the whole-second prefix is cached.
+    """
+
+    def __init__(self):
+        self._prefix = None
+        self._base = 0.0
+
+    def __call__(self, value):
+        value = value.strip()
+        if len(value) < 19:
+            return None
+        prefix = value[:19]
+        if prefix != self._prefix:
+            try:
+                parsed = datetime.strptime(prefix, "%Y-%m-%dT%H:%M:%S")
+            except ValueError:
+                return None
+            self._base = parsed.replace(tzinfo=timezone.utc).timestamp()
+            self._prefix = prefix
+
+        seconds = self._base
+        pos = 19
+        if pos < len(value) and value[pos] == ".":
+            end = pos + 1
+            while end < len(value) and value[end].isdigit():
+                end += 1
+            digits = value[pos + 1 : end]
+            if digits:
+                seconds += int(digits) / 10 ** len(digits)
+            pos = end
+        suffix = value[pos:]
+        if suffix and suffix != "Z":
+            try:
+                sign = -1 if suffix[0] == "-" else 1
+                hours, minutes = suffix[1:].split(":")
+                seconds -= sign * (int(hours) * 3600 + int(minutes) * 60)
+            except (ValueError, IndexError):
+                return None
+        return seconds
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_csv(path, include_warmup):
+    """Yield (column index, row) for each data row, dropping warmup rows unless asked."""
+    with open(path, "r", newline="", encoding="utf-8-sig") as handle:
+        reader = csv.reader(handle)
+        header = [column.strip() for column in next(reader, [])]
+        index = {column: pos for pos, column in enumerate(header)}
+        warmup_index = index.get("warmup")
+        for row in reader:
+            if not row:
+                continue
+            if not include_warmup and warmup_index is not None and is_warmup_row(row, warmup_index):
+                continue
+            yield index, row
+
+
+def field(index, row, column):
+    pos = index.get(column)
+    if pos is None or pos >= len(row):
+        return ""
+    return row[pos]
+
+
+class StageStats:
+    """Quantiles and running mean for every stage of one (arch, transport)."""
+
+    def __init__(self, stages, new_quantiles):
+        self.stage_names = stages
+        self.quantiles = {stage: new_quantiles() for stage in stages}
+        self.sums = defaultdict(float)
+        self.requests = 0
+        self.failed = 0
+        self.joined = 0
+
+    def add(self, stages):
+        self.requests += 1
+        for stage, value in stages.items():
+            if value is None:
+                continue
+            self.quantiles[stage].add(value)
+            self.sums[stage] += value
+
+
+def rtt_stages(transport, index, row):
+    columns = transport.stages
+    serialize = to_float(field(index, row, columns["serialize"]))
+    rtt = to_float(field(index, row, columns["transport"]))
+    server = to_float(field(index, row, columns["server_compute"]))
+    deserialize = to_float(field(index, row, columns["deserialize"]))
+    total = to_float(field(index, row, columns["total"]))
+    if None in (serialize, rtt, server, deserialize, total):
+        return None
+    return {
+        "serialize": serialize,
+        "network": max(0.0, rtt - server),
+        "server_compute": server,
+        "deserialize": deserialize,
+        "client_other": max(0.0, total - serialize - rtt - deserialize),
+        "total": total,
+    }
+
+
+def broker_stages(client, worker):
+    """Split one R4 request; ``worker`` is the joined worker_events row or None."""
+    stages = {
+        "serialize": client["serialize"],
+        "server_compute": client["server_compute"],
+        "server_publish_wait": None,
+        "request_queue_wait": None,
+        "deserialize": client["deserialize"],
+        "client_other": max(0.0, client["total"] - client["serialize"] - client["roundtrip"] - client["deserialize"]),
+        "total": client["total"],
+    }
+    held_ms = client["server_compute"]
+    if worker is not None:
+        if worker["ts_receive"] is not None and worker["ts_publish"] is not None:
+            held_ms = max(0.0, (worker["ts_publish"] - worker["ts_receive"]) * 1000.0)
+        if worker["server_compute"] is not None:
+            stages["server_compute"] = worker["server_compute"]
+        stages["server_publish_wait"] = worker["publish_wait"]
+        stages["request_queue_wait"] = worker["queue_wait"]
+    stages["broker_queue"] = max(0.0, client["roundtrip"] - held_ms)
+    return stages
+
+
+def broker_client_rows(arch, trial_path, include_warmup):
+    """Yield (ts, record) for each R4 client row of one trial, in file order."""
+    transport = next(t for t in TRANSPORTS if t.name == BROKER_TRANSPORT)
+    path = os.path.join(trial_path, transport.filename)
+    parse_ts = UtcParser()
+    for index, row in iter_csv(path, include_warmup):
+        columns = transport.stages
+        record = {
+            "arch": arch,
+            "trial_id": field(index, row, "trial_id") or os.path.basename(trial_path),
+            "correlation_id": field(index, row, "correlation_id"),
+            "ts_send_utc": field(index, row, "ts_send_utc"),
+            "ok": transport.is_ok(field(index, row, transport.status_column)),
+            "serialize": to_float(field(index, row, columns["serialize"])),
+            "roundtrip": to_float(field(index, row, columns["transport"])),
+            "server_compute": to_float(field(index, row, columns["server_compute"])),
+            "deserialize": to_float(field(index, row, columns["deserialize"])),
+            "total": to_float(field(index, row, columns["total"])),
+        }
+        if None in (record["serialize"], record["roundtrip"], record["server_compute"], record["deserialize"], record["total"]):
+            record["ok"] = False
+        yield parse_ts(record["ts_send_utc"]), record
+
+
+def worker_rows(path):
+    """Yield (ts_receive, record) for each row of one worker_events.csv."""
+    parse_receive = UtcParser()
+    parse_publish = UtcParser()
+    for index, row in iter_csv(path, include_warmup=True):
+        ts_receive = parse_receive(field(index, row, "ts_receive"))
+        record = {
+            "correlation_id": field(index, row, "correlation_id"),
+            "ts_receive_raw": field(index, row, "ts_receive"),
+            "ts_publish_raw": field(index, row, "ts_publish"),
+            "ts_receive": ts_receive,
+            "ts_publish": parse_publish(field(index, row, "ts_publish")),
+            "worker_id": field(index, row, "worker_id"),
+            "ok": field(index, row, "status").strip() == "OK",
+            "server_compute": to_float(field(index, row, "server_compute_ms")),
+            "queue_wait": to_float(field(index, row, "queue_wait_ms")),
+            "publish_wait": to_float(field(index, row, "publish_wait_ms")),
+        }
+        yield ts_receive, record
+
+
+def find_worker_logs(paths):
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for root, _, files in os.walk(path):
+            if WORKER_EVENTS_FILE in files:
+                found.append(os.path.join(root, WORKER_EVENTS_FILE))
+    return sorted(found)
+
+
+def timed(rows, source):
+    """Tag a (ts, record) stream for the merge; rows without a timestamp sort first."""
+    for sequence, (ts, record) in enumerate(rows):
+        yield (ts if ts is not None else float("-inf"), source, sequence, record)
+
+
+class MergeJoin:
+    """Symmetric hash join of two time-ordered streams with a sliding time window.
+
+    Each row is looked up among the other side's waiting rows; if its partner
+    has not arrived yet it waits, and it is evicted unmatched once the stream
+    clock has moved more than ``window_s`` past it. Logs are written at
+    completion, so input is only nearly sorted; the window absorbs that too.
+    """
+
+    CLIENT = 0
+    WORKER = 1
+
+    def __init__(self, window_s, on_match, on_client_unmatched):
+        self.window_s = window_s
+        self.on_match = on_match
+        self.on_client_unmatched = on_client_unmatched
+        self.waiting = (OrderedDict(), OrderedDict())
+        self.matched = 0
+        self.unmatched_client = 0
+        self.unmatched_worker = 0
+        self.peak_waiting = 0
+
+    def run(self, client_streams, worker_streams):
+        streams = [timed(stream, self.CLIENT) for stream in client_streams]
+        streams += [timed(stream, self.WORKER) for stream in worker_streams]
+        for ts, source, _, record in heapq.merge(*streams, key=lambda item: item[:3]):
+            self.evict(ts)
+            key = record["correlation_id"]
+            other = self.waiting[1 - source]
+            partner = other.pop(key, None) if key else None
+            if partner is not None:
+                self.matched += 1
+                client, worker = (record, partner[1]) if source == self.CLIENT else (partner[1], record)
+                self.on_match(client, worker)
+            elif key:
+                self.waiting[source][key] = (ts, record)
+                self.peak_waiting = max(self.peak_waiting, len(self.waiting[0]) + len(self.waiting[1]))
+            elif source == self.CLIENT:
+                self.unmatched_client += 1
+                self.on_client_unmatched(record)
+            else:
+                self.unmatched_worker += 1
+        self.evict(float("inf"))
+
+    def evict(self, now):
+        horizon = now - self.window_s
+        for source, waiting in enumerate(self.waiting):
+            while waiting:
+                key, (ts, record) = next(iter(waiting.items()))
+                if ts >= horizon:
+                    break
+                del waiting[key]
+                if source == self.CLIENT:
+                    self.unmatched_client += 1
+                    self.on_client_unmatched(record)
+                else:
+                    self.unmatched_worker += 1
+
+
+class Attribution:
+    def __init__(self, new_quantiles, joined_writer=None):
+        self.new_quantiles = new_quantiles
+        self.joined_writer = joined_writer
+        self.by_key = {}
+
+    def get(self, arch, transport_name, stages):
+        key = (arch, transport_name)
+        if key not in self.by_key:
+            self.by_key[key] = StageStats(stages, self.new_quantiles)
+        return self.by_key[key]
+
+    def add_rtt_trial(self, arch, transport, trial_path, include_warmup):
+        stats = self.get(arch, transport.name, RTT_STAGES)
+        path = os.path.join(trial_path, transport.filename)
+        for index, row in iter_csv(path, include_warmup):
+            stages = rtt_stages(transport, index, row)
+            if stages is None or not transport.is_ok(field(index, row, transport.status_column)):
+                stats.failed += 1
+                continue
+            stats.add(stages)
+
+    def add_broker(self, client, worker):
+        stats = self.get(client["arch"], BROKER_TRANSPORT, BROKER_STAGES)
+        if not client["ok"] or (worker is not None and not worker["ok"]):
+            stats.failed += 1
+            return
+        stages = broker_stages(client, worker)
+        stats.add(stages)
+        if worker is None:
+            return
+        stats.joined += 1
+        if self.joined_writer is not None:
+            row = {
+                "arch": client["arch"],
+                "trial_id": client["trial_id"],
+                "correlation_id": client["correlation_id"],
+                "ts_send_utc": client["ts_send_utc"],
+                "ts_receive": worker["ts_receive_raw"],
+                "ts_publish": worker["ts_publish_raw"],
+                "worker_id": worker["worker_id"],
+            }
+            row.update({stage: fmt(value) for stage, value in stages.items()})
+            self.joined_writer.writerow(row)
+
+    def rows(self):
+        for (arch, transport_name) in sorted(self.by_key):
+            stats = self.by_key[(arch, transport_name)]
+            mean_total = stats.sums["total"] / stats.quantiles["total"].count if stats.quantiles["total"].count else None
+            for stage in stats.stage_names:
+                quantiles = stats.quantiles[stage]
+                mean = stats.sums[stage] / quantiles.count if quantiles.count else None
+                row = {
+                    "arch": arch,
+                    "transport": transport_name,
+                    "stage": stage,
+                    "requests": stats.requests,
+                    "failed": stats.failed,
+                    "joined": stats.joined,
+                    "count": quantiles.count,
+                    "mean_ms": fmt(mean),
+                    "share_of_total": f"{mean / mean_total:.3f}" if mean is not None and mean_total else "",
+                }
+                for p in REPORT_QUANTILES:
+                    row[f"p{int(p * 100)}_ms"] = fmt(quantiles.quantile(p))
+                yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Attribute client latency to serialize, network/broker, compute and deserialize.")
+    parser.add_argument("--input", default=os.path.join("Experiments", "out"))
+    parser.add_argument(
+        "--server-logs",
+        action="append",
+        default=None,
+        help="worker_events.csv file or a directory searched for them (repeatable; default: Experiments/server_logs).",
+    )
+    parser.add_argument("--output", default=None, help="Default: <input>/latency_attribution.csv.")
+    parser.add_argument("--joined", default=None, help="Also write one row per joined broker request to this CSV.")
+    parser.add_argument(
+        "--window-s",
+        type=float,
+        default=60.0,
+        help="How long a row waits for its partner in stream time before it counts as unmatched.",
+    )
+    parser.add_argument("--include-warmup", action="store_true")
+    parser.add_argument("--exact", action="store_true", help="Exact percentiles instead of quantile sketches.")
+    parser.add_argument("--sketch-accuracy", type=float, default=DEFAULT_SKETCH_ACCURACY)
+    args = parser.parse_args()
+
+    server_logs = args.server_logs
+    if server_logs is None:
+        default_logs = os.path.join("Experiments", "server_logs")
+        server_logs = [default_logs] if os.path.isdir(default_logs) else []
+    worker_logs = find_worker_logs(server_logs)
+    output = args.output or os.path.join(args.input, "latency_attribution.csv")
+
+    joined_handle = open(args.joined, "w", encoding="utf-8", newline="") if args.joined else None
+    try:
+        joined_writer = None
+        if joined_handle is not None:
+            joined_writer = csv.DictWriter(joined_handle, fieldnames=JOINED_COLUMNS)
+            joined_writer.writeheader()
+        attribution = Attribution(quantile_factory(args.exact, args.sketch_accuracy), joined_writer)
+
+        runs = collect_runs(args.input)
+        broker_streams = []
+        for arch in sorted(runs):
+            for trial_path in sorted(runs[arch]):
+                for transport in TRANSPORTS:
+                    if not os.path.exists(os.path.join(trial_path, transport.filename)):
+                        continue
+                    if transport.name == BROKER_TRANSPORT:
+                        broker_streams.append(broker_client_rows(arch, trial_path, args.include_warmup))
+                    else:
+                        attribution.add_rtt_trial(arch, transport, trial_path, args.include_warmup)
+
+        join = MergeJoin(
+            args.window_s,
+            on_match=attribution.add_broker,
+            on_client_unmatched=lambda client: attribution.add_broker(client, None),
+        )
+        join.run(broker_streams, [worker_rows(path) for path in worker_logs])
+    finally:
+        if joined_handle is not None:
+            joined_handle.close()
+
+    rows = list(attribution.rows())
+    columns = ["arch", "transport", "stage", "requests", "failed", "joined", "count", "mean_ms"]
+    columns += [f"p{int(p * 100)}_ms" for p in REPORT_QUANTILES] + ["share_of_total"]
+    with open(output, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(
+        f"Broker join: {len(worker_logs)} worker logs, matched={join.matched} "
+        f"client_unmatched={join.unmatched_client} worker_unmatched={join.unmatched_worker} "
+        f"peak_waiting={join.peak_waiting}"
+    )
+    for row in rows:
+        if row["stage"] == "total":
+            continue
+        print(
+            f"{row['arch']:<10} {row['transport']:<10} {row['stage']:<20} "
+            f"p50={row['p50_ms']:>9} p99={row['p99_ms']:>9} share={row['share_of_total']}"
+        )
+    print(f"Attribution written to {output}")
+
+
+if __name__ == "__main__":
+    main()
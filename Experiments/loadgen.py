@@ -0,0 +1,359 @@
+"""Open-loop asyncio load generator for the /computeNext service.
+
+Requests are issued on a fixed schedule (constant or Poisson arrivals) that does
+not wait for earlier responses, over a pool of keep-alive HTTP/1.1 connections.
+Latency is measured from each request's *intended* send time, so time spent
+queued behind a slow server or a full connection pool is counted rather than
+hidden (no coordinated omission). Every request becomes one b2_breakdown.csv row
+under ``<output>/<arch>/<run_ts>/trial_0000/``, so report.py summarizes it like
+a Unity B2 run.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from report import percentile_sorted
+
+B2_HEADER = (
+    "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_http_rtt_ms,"
+    "t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,"
+    "http_status,error_code,ts_send_utc"
+)
+TRIAL_ID = "trial_0000"
+SCENES = ("SampleScene", "Scene_A", "Scene_B")
+
+
+class RequestTimeout(Exception):
+    pass
+
+
+def build_event(index, seed, config_version, rng):
+    return {
+        "session_id": f"load_{index:07d}",
+        "scene_id": SCENES[index % len(SCENES)],
+        "result_z": round(rng.gauss(0.0, 1.0), 3),
+        "time_t": round(rng.uniform(5.0, 60.0), 3),
+        "attempts_a": rng.randint(1, 3),
+        "seed": seed + index,
+        "config_version": config_version,
+        "profile_id": "",
+    }
+
+
+def iter_schedule(arrival, rate, count, duration_s, seed):
+    """Yield intended send offsets (seconds from start) for the arrival process."""
+    rng = random.Random(seed)
+    offset = 0.0
+    index = 0
+    while (count is None or index < count) and (duration_s is None or offset < duration_s):
+        yield offset
+        index += 1
+        if arrival == "poisson":
+            offset += rng.expovariate(rate)
+        else:
+            offset = index / rate
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    """At most ``size`` keep-alive connections; a request waits for a free one."""
+
+    def __init__(self, host, port, size):
+        self.host = host
+        self.port = port
+        self.opened = 0
+        self._idle = asyncio.LifoQueue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+
+    async def acquire(self):
+        conn = await self._idle.get()
+        if conn is None:
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            except BaseException:
+                self._idle.put_nowait(None)
+                raise
+            self.opened += 1
+            conn = Connection(reader, writer)
+        return conn
+
+    def release(self, conn, reusable=True):
+        if not reusable:
+            conn.close()
+            conn = None
+        self._idle.put_nowait(conn)
+
+    def close(self):
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            if conn is not None:
+                conn.close()
+
+
+async def send_request(conn, host_header, path, body, correlation_id):
+    request = (
+        f"POST {path} HTTP/1.1\r\n"
+        f"Host: {host_header}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"X-Correlation-Id: {correlation_id}\r\n"
+        "\r\n"
+    ).encode("latin-1")
+    conn.writer.write(request + body)
+    await conn.writer.drain()
+
+    head = await conn.reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        payload = await read_chunked(conn.reader)
+    else:
+        payload = await conn.reader.readexactly(int(headers.get("content-length") or 0))
+    return status, headers, payload
+
+
+async def read_chunked(reader):
+    parts = []
+    while True:
+        size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+        if size == 0:
+            await reader.readuntil(b"\r\n")
+            return b"".join(parts)
+        parts.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+def parse_server_ms(headers):
+    try:
+        return float(headers.get("x-server-compute-ms", "0").replace(",", "."))
+    except ValueError:
+        return 0.0
+
+
+class LoadGenerator:
+    def __init__(self, args, writer):
+        parts = urlsplit(args.url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.host_header = parts.netloc
+        self.path = parts.path.rstrip("/") + "/computeNext"
+        self.args = args
+        self.writer = writer
+        self.pool = ConnectionPool(self.host, self.port, args.connections)
+        self.inflight = asyncio.Semaphore(args.max_inflight)
+        self.rng = random.Random(args.seed)
+        self.corrected_ms = []
+        self.service_ms = []
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.mismatched_ids = 0
+
+    def write_row(self, index, correlation_id, timings, retries, timeout, status, error_code, sent_utc=None):
+        """One b2_breakdown.csv row; ``sent_utc`` is None for requests that were never sent (empty ts_send_utc)."""
+        serialize_ms, rtt_ms, server_ms, deserialize_ms, total_ms = timings
+        warmup = 1 if index < self.args.warmup else 0
+        sent = f"{sent_utc:%Y-%m-%dT%H:%M:%S.%f}Z" if sent_utc is not None else ""
+        self.writer.write(
+            f'{TRIAL_ID},{index},{warmup},"{correlation_id}",{serialize_ms:.3f},{rtt_ms:.3f},'
+            f'{server_ms:.3f},{deserialize_ms:.3f},{total_ms:.3f},{retries},{1 if timeout else 0},'
+            f'{status},"{error_code}",{sent}\n'
+        )
+
+    async def run_one(self, index, intended):
+        loop = asyncio.get_running_loop()
+        dispatched = loop.time()
+        correlation_id = uuid.uuid4().hex
+        serialize_started = time.perf_counter()
+        event = build_event(index, self.args.seed, self.args.config_version, self.rng)
+        body = json.dumps(event, separators=(",", ":")).encode("utf-8")
+        serialize_ms = (time.perf_counter() - serialize_started) * 1000.0
+
+        rtt_ms = server_ms = deserialize_ms = 0.0
+        sent_utc = datetime.now(timezone.utc)
+        status = 0
+        timeout = False
+        error_code = ""
+        attempts = max(1, self.args.retries + 1)
+        for attempt in range(1, attempts + 1):
+            conn = None
+            reusable = False
+            started = loop.time()
+            try:
+                conn = await self.pool.acquire()
+                sent = loop.time()
+                sent_utc = datetime.now(timezone.utc)
+                try:
+                    status, headers, payload = await asyncio.wait_for(
+                        send_request(conn, self.host_header, self.path, body, correlation_id),
+                        self.args.timeout_ms / 1000.0,
+                    )
+                except asyncio.TimeoutError:
+                    raise RequestTimeout() from None
+                rtt_ms = (loop.time() - sent) * 1000.0
+                reusable = headers.get("connection", "").lower() != "close"
+                server_ms = parse_server_ms(headers)
+                if headers.get("x-correlation-id", correlation_id) != correlation_id:
+                    self.mismatched_ids += 1
+                if not 200 <= status < 300:
+                    error_code = f"HTTP_{status}"
+                else:
+                    deserialize_started = time.perf_counter()
+                    json.loads(payload)
+                    deserialize_ms = (time.perf_counter() - deserialize_started) * 1000.0
+                    error_code = ""
+                    break
+            except RequestTimeout:
+                rtt_ms = (loop.time() - started) * 1000.0
+                timeout = True
+                error_code = "Timeout"
+            except (OSError, asyncio.IncompleteReadError, ValueError) as ex:
+                rtt_ms = (loop.time() - started) * 1000.0
+                error_code = type(ex).__name__
+            finally:
+                if conn is not None:
+                    self.pool.release(conn, reusable)
+            if attempt < attempts:
+                await asyncio.sleep(self.args.retry_delay_ms / 1000.0)
+
+        finished = loop.time()
+        total_ms = (finished - intended) * 1000.0
+        if error_code:
+            self.failed += 1
+        if index >= self.args.warmup:
+            self.corrected_ms.append(total_ms)
+            self.service_ms.append((finished - dispatched) * 1000.0)
+        timings = (serialize_ms, rtt_ms, server_ms, deserialize_ms, total_ms)
+        self.write_row(index, correlation_id, timings, attempt - 1, timeout, status, error_code, sent_utc)
+
+    async def run(self):
+        args = self.args
+        loop = asyncio.get_running_loop()
+        tasks = set()
+        start = loop.time()
+        schedule = iter_schedule(args.arrival, args.rate, args.requests, args.duration, args.seed)
+        for index, offset in enumerate(schedule):
+            intended = start + offset
+            delay = intended - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.inflight.locked() and args.overflow == "drop":
+                self.dropped += 1
+                self.write_row(index, "", (0.0, 0.0, 0.0, 0.0, 0.0), 0, False, 0, "Dropped")
+                continue
+            # Waiting here delays the send, never the intended time: the wait is counted as latency.
+            await self.inflight.acquire()
+            task = asyncio.create_task(self.run_one(index, intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            task.add_done_callback(lambda _: self.inflight.release())
+            self.sent += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+        self.pool.close()
+        return loop.time() - start
+
+
+def summarize(generator, elapsed):
+    print(
+        f"Sent {generator.sent} requests in {elapsed:.2f}s ({generator.sent / elapsed:.1f} req/s), "
+        f"failed {generator.failed}, dropped {generator.dropped}, connections opened {generator.pool.opened}"
+    )
+    if generator.mismatched_ids:
+        print(f"Warning: {generator.mismatched_ids} responses echoed a different X-Correlation-Id")
+    for label, values in (
+        ("Latency from intended send (corrected)", generator.corrected_ms),
+        ("Latency from actual dispatch (uncorrected)", generator.service_ms),
+    ):
+        if not values:
+            continue
+        ordered = sorted(values)
+        quantiles = ", ".join(
+            f"p{name}={percentile_sorted(ordered, q):.3f}" for name, q in (("50", 0.5), ("99", 0.99), ("99.9", 0.999))
+        )
+        print(f"{label} ms: {quantiles}, max={ordered[-1]:.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop load generator for /computeNext.")
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="Service base URL.")
+    parser.add_argument("--rate", type=float, default=100.0, help="Target arrival rate (requests/s).")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="constant")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds of arrivals to schedule.")
+    parser.add_argument("--requests", type=int, default=None, help="Number of requests to schedule.")
+    parser.add_argument("--connections", type=int, default=8, help="Keep-alive connection pool size.")
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=256,
+        help="Cap on outstanding requests (queued for a connection or in flight).",
+    )
+    parser.add_argument(
+        "--overflow",
+        choices=("queue", "drop"),
+        default="queue",
+        help="At the in-flight cap, delay the send (latency still counted) or drop the request.",
+    )
+    parser.add_argument("--timeout-ms", type=float, default=5000.0)
+    parser.add_argument("--retries", type=int, default=0)
+    parser.add_argument("--retry-delay-ms", type=float, default=50.0)
+    parser.add_argument("--warmup", type=int, default=0, help="First N requests are flagged as warmup.")
+    parser.add_argument("--config-version", default="v1")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for payloads and Poisson arrivals.")
+    parser.add_argument("--output", default=os.path.join("Experiments", "out"))
+    parser.add_argument("--arch", default="L2", help="Architecture folder name under --output.")
+    parser.add_argument("--run-ts", default=None, help="Run folder name (default: current time).")
+    args = parser.parse_args()
+
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.duration is None and args.requests is None:
+        args.duration = 10.0
+    args.connections = max(1, args.connections)
+    args.max_inflight = max(1, args.max_inflight)
+
+    run_ts = args.run_ts or datetime.now().strftime("%Y%m%d_%H%M%S")
+    trial_dir = os.path.join(args.output, args.arch, run_ts, TRIAL_ID)
+    os.makedirs(trial_dir, exist_ok=True)
+    breakdown_path = os.path.join(trial_dir, "b2_breakdown.csv")
+    with open(breakdown_path, "w", encoding="utf-8-sig", newline="") as fh:
+        fh.write(B2_HEADER + "\n")
+        generator = LoadGenerator(args, fh)
+        elapsed = asyncio.run(generator.run())
+
+    settings = dict(vars(args))
+    settings["run_ts"] = run_ts
+    settings["sent"] = generator.sent
+    settings["failed"] = generator.failed
+    settings["dropped"] = generator.dropped
+    settings["elapsed_s"] = round(elapsed, 3)
+    with open(os.path.join(trial_dir, "loadgen.json"), "w", encoding="utf-8") as fh:
+        json.dump(settings, fh, indent=2)
+
+    summarize(generator, elapsed)
+    print(f"Breakdown written to {breakdown_path}")
+
+
+if __name__ == "__main__":
+    main()
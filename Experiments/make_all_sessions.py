@@ -1,13 +1,18 @@
+import argparse
 import csv
-import hashlib
+import io
 import json
 import logging
 import os
 import sys
-from collections import defaultdict
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 WARMUP_DEFAULT = 5
+MANIFEST_VERSION = 2
+TRIAL_FILES = ("adapter_calls.csv", "scene_transitions.csv", "audit.jsonl")
+FRAME_FILE = "frame_times.csv"
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -33,18 +38,9 @@ def parse_float(value):
             return 0.0
 
 
-def canonical_json(obj):
-    return json.dumps(obj, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
-
-
-def compute_hash(obj):
-    payload = canonical_json(obj).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
-
-
 def read_adapter_calls(path, warnings):
     with open(path, newline="", encoding="utf-8-sig") as fh:
-    reader = csv.DictReader(fh)
+        reader = csv.DictReader(fh)
         has_index = "session_index" in reader.fieldnames if reader.fieldnames else False
         has_warmup = "warmup" in reader.fieldnames if reader.fieldnames else False
         has_net = "net_ms" in reader.fieldnames if reader.fieldnames else False
@@ -77,7 +73,7 @@ def read_adapter_calls(path, warnings):
                             "adapter_ms": call_ms,
                             "net_ms": net_ms,
                             "local_ms": local_ms,
-                            "decision_ms": decision_ms,
+                            "decision_build_ms": decision_ms,
                         }
                     )
                 duplicates.add(session_id)
@@ -90,7 +86,7 @@ def read_adapter_calls(path, warnings):
                     "adapter_ms": call_ms,
                     "net_ms": net_ms,
                     "local_ms": local_ms,
-                    "decision_ms": decision_ms,
+                    "decision_build_ms": decision_ms,
                 }
         for dup in duplicates:
             warnings.add(f"Multiple adapter_calls for {dup} in {path}; kept min call_ms")
@@ -142,108 +138,234 @@ def read_scene_transitions(path, warnings):
     return data
 
 
-def read_audit(path, warnings):
-    result = {}
+_AUDIT_INDEXES = {}
+
+
+def open_audit_index(path):
+    """One read connection per process; the index itself is refreshed by main()."""
+    from audit_index import AuditIndex
+
+    index = _AUDIT_INDEXES.get(path)
+    if index is None:
+        index = _AUDIT_INDEXES[path] = AuditIndex(path)
+    return index
+
+
+def read_audit(path, warnings, audit_index=None):
     if not path.exists():
         warnings.add(f"Missing audit.jsonl at {path}")
-        return result
+        return {}
 
-    with open(path, "r", encoding="utf-8-sig") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                warnings.add(f"Skipping invalid audit line in {path}")
-                continue
-            session_id = record.get("session_id")
-            if not session_id:
-                continue
-            config_hash = record.get("config_version_hash", "")
-            seed = (
-                record.get("inputs", {}).get("seed")
-                or record.get("seed")
-                or ""
-            )
-            decision = record.get("output") or record.get("dk") or {}
-            decision_hash = compute_hash(decision) if decision else ""
-            result[session_id] = {
-                "config_hash": config_hash,
-                "seed": seed,
-                "decision_hash": decision_hash,
-            }
-    return result
+    from audit_index import parse_audit, sessions_from_rows
+
+    indexed = open_audit_index(audit_index).trial_rows(path.parent) if audit_index else None
+    rows, invalid = indexed if indexed is not None else parse_audit(path)
+    if invalid:
+        warnings.add(f"Skipping invalid audit line in {path}")
+    return sessions_from_rows(rows)
 
 
 def row_session_index(row):
     return row.get("session_index", 0)
 
 
-def main():
-    root = Path("Experiments/out")
-    if not root.exists():
-        logging.error("Experiments/out directory does not exist")
-        sys.exit(1)
-
-    warnings = set()
-    records = []
-    arch_values = set()
+COLUMNS = [
+    "arch",
+    "run_ts",
+    "trial_id",
+    "session_id",
+    "session_index",
+    "warmup",
+    "adapter_name",
+    "adapter_ms",
+    "net_ms",
+    "local_ms",
+    "decision_build_ms",
+    "from_scene",
+    "to_scene",
+    "scene_ms",
+    "has_scene",
+    "has_audit",
+    "config_version_hash",
+    "seed",
+    "decision_hash",
+    "adapter_calls_path",
+    "scene_transitions_path",
+    "audit_path",
+]
+
+
+def iter_trials(root):
     for arch_dir in sorted(root.iterdir()):
         if not arch_dir.is_dir():
             continue
-        arch = arch_dir.name
         for run_dir in sorted(arch_dir.iterdir()):
             if not run_dir.is_dir():
                 continue
-            run_ts = run_dir.name
             for trial_dir in sorted(run_dir.iterdir()):
                 if not trial_dir.is_dir():
                     continue
-                trial_id = trial_dir.name
-                adapter_path = trial_dir / "adapter_calls.csv"
-                if not adapter_path.exists():
+                if not (trial_dir / "adapter_calls.csv").exists():
                     continue
-                scene_path = trial_dir / "scene_transitions.csv"
-                audit_path = trial_dir / "audit.jsonl"
-
-                adapter_rows = read_adapter_calls(adapter_path, warnings)
-                scene_rows = read_scene_transitions(scene_path, warnings)
-                audit_rows = read_audit(audit_path, warnings)
-
-                for session_id, adapter in adapter_rows.items():
-                    scene = scene_rows.get(session_id, {})
-                    has_scene = 1 if session_id in scene_rows else 0
-                    has_audit = 1 if session_id in audit_rows else 0
-                    audit_meta = audit_rows.get(session_id, {})
-
-                    record = {
-                        "arch": arch,
-                        "run_ts": run_ts,
-                        "trial_id": trial_id,
-                        "session_id": session_id,
-                        "session_index": adapter["session_index"],
-                        "warmup": adapter["warmup"],
-                    "adapter_name": adapter["adapter_name"],
-                    "adapter_ms": adapter["adapter_ms"],
-                    "net_ms": adapter.get("net_ms", 0.0),
-                    "local_ms": adapter.get("local_ms", 0.0),
-                    "decision_ms": adapter.get("decision_ms", 0.0),
-                        "from_scene": scene.get("from_scene", ""),
-                        "to_scene": scene.get("to_scene", ""),
-                        "scene_ms": scene.get("scene_ms", 0.0),
-                        "has_scene": has_scene,
-                        "has_audit": has_audit,
-                        "config_version_hash": audit_meta.get("config_hash", ""),
-                        "seed": audit_meta.get("seed", ""),
-                        "decision_hash": audit_meta.get("decision_hash", ""),
-                        "adapter_calls_path": os.path.relpath(adapter_path, "."),
-                        "scene_transitions_path": os.path.relpath(scene_path, ".") if scene_path.exists() else "",
-                        "audit_path": os.path.relpath(audit_path, ".") if audit_path.exists() else "",
-                    }
-                    records.append(record)
-                arch_values.add(arch)
+                yield arch_dir.name, run_dir.name, trial_dir
+
+
+def read_frame_stats(path, frames, warnings):
+    from frame_times import analyze_frame_times
+
+    budgets, window, chunk_rows = frames
+    if not path.exists():
+        warnings.add(f"Missing frame_times.csv at {path}")
+        return {}
+    sessions, duplicates = analyze_frame_times(path, budgets, window, chunk_rows)
+    for session_id in duplicates:
+        warnings.add(f"Non-contiguous frames for {session_id} in {path}; kept the last block")
+    return sessions
+
+
+def read_trial(arch, run_ts, trial_dir, audit_index=None, frames=None):
+    warnings = set()
+    records = []
+    trial_id = trial_dir.name
+    adapter_path = trial_dir / "adapter_calls.csv"
+    scene_path = trial_dir / "scene_transitions.csv"
+    audit_path = trial_dir / "audit.jsonl"
+
+    adapter_rows = read_adapter_calls(adapter_path, warnings)
+    scene_rows = read_scene_transitions(scene_path, warnings)
+    audit_rows = read_audit(audit_path, warnings, audit_index)
+    frame_rows = read_frame_stats(trial_dir / FRAME_FILE, frames, warnings) if frames else None
+
+    for session_id, adapter in adapter_rows.items():
+        scene = scene_rows.get(session_id, {})
+        has_scene = 1 if session_id in scene_rows else 0
+        has_audit = 1 if session_id in audit_rows else 0
+        audit_meta = audit_rows.get(session_id, {})
+
+        record = {
+            "arch": arch,
+            "run_ts": run_ts,
+            "trial_id": trial_id,
+            "session_id": session_id,
+            "session_index": adapter["session_index"],
+            "warmup": adapter["warmup"],
+            "adapter_name": adapter["adapter_name"],
+            "adapter_ms": adapter["adapter_ms"],
+            "net_ms": adapter.get("net_ms", 0.0),
+            "local_ms": adapter.get("local_ms", 0.0),
+            "decision_build_ms": adapter.get("decision_build_ms", 0.0),
+            "from_scene": scene.get("from_scene", ""),
+            "to_scene": scene.get("to_scene", ""),
+            "scene_ms": scene.get("scene_ms", 0.0),
+            "has_scene": has_scene,
+            "has_audit": has_audit,
+            "config_version_hash": audit_meta.get("config_hash", ""),
+            "seed": audit_meta.get("seed", ""),
+            "decision_hash": audit_meta.get("decision_hash", ""),
+            "adapter_calls_path": os.path.relpath(adapter_path, "."),
+            "scene_transitions_path": os.path.relpath(scene_path, ".") if scene_path.exists() else "",
+            "audit_path": os.path.relpath(audit_path, ".") if audit_path.exists() else "",
+        }
+        if frame_rows is not None:
+            from frame_times import empty_frame_stats
+
+            record.update(frame_rows.get(session_id) or empty_frame_stats(frames[0]))
+        records.append(record)
+    return records, warnings
+
+
+def _read_trial_task(task):
+    return read_trial(*task)
+
+
+def ingest(trials, jobs, audit_index=None, frames=None):
+    """Parse every trial, serially or on a process pool, in input order."""
+    tasks = [trial + (audit_index, frames) for trial in trials]
+    if jobs <= 1 or len(tasks) <= 1:
+        return [read_trial(*task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_read_trial_task, tasks, chunksize=chunksize))
+
+
+def trial_key(trial_dir):
+    return os.path.relpath(trial_dir, ".")
+
+
+def trial_fingerprint(trial_dir, frames=None):
+    """Size and mtime of the files the selected columns read; frame_times.csv only with --frames."""
+    files = {}
+    for name in TRIAL_FILES + ((FRAME_FILE,) if frames else ()):
+        try:
+            stat = (trial_dir / name).stat()
+        except FileNotFoundError:
+            files[name] = None
+            continue
+        files[name] = [stat.st_size, stat.st_mtime_ns]
+    return files
+
+
+def load_manifest(path, signature):
+    if path is None or not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        logging.warning("Ignoring unreadable manifest %s", path)
+        return {}
+    if data.get("version") != MANIFEST_VERSION or data.get("signature") != signature:
+        logging.info("Manifest %s has an old format or other options; rebuilding", path)
+        return {}
+    return data.get("trials", {})
+
+
+def save_manifest(path, signature, entries):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        payload = {"version": MANIFEST_VERSION, "signature": signature, "trials": entries}
+        json.dump(payload, fh, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def ingest_cached(trials, jobs, manifest, columns, audit_index=None, frames=None):
+    """Reuse manifest entries whose file sizes and mtimes still match; parse the rest."""
+    results = [None] * len(trials)
+    fingerprints = []
+    stale = []
+    for pos, (_, _, trial_dir) in enumerate(trials):
+        fingerprint = trial_fingerprint(trial_dir, frames)
+        fingerprints.append(fingerprint)
+        entry = manifest.get(trial_key(trial_dir))
+        if entry and entry.get("files") == fingerprint:
+            records = [dict(zip(columns, values)) for values in entry["rows"]]
+            results[pos] = (records, set(entry["warnings"]))
+        else:
+            stale.append(pos)
+
+    fresh = ingest([trials[pos] for pos in stale], jobs, audit_index, frames)
+    for pos, result in zip(stale, fresh):
+        results[pos] = result
+
+    entries = {}
+    for (_, _, trial_dir), fingerprint, (records, warnings) in zip(trials, fingerprints, results):
+        entries[trial_key(trial_dir)] = {
+            "files": fingerprint,
+            "rows": [[row[col] for col in columns] for row in records],
+            "warnings": sorted(warnings),
+        }
+    return results, entries, len(stale)
+
+
+def merge_results(results):
+    warnings = set()
+    records = []
+    arch_values = set()
+    for trial_records, trial_warnings in results:
+        records.extend(trial_records)
+        warnings.update(trial_warnings)
+        arch_values.update(row["arch"] for row in trial_records)
 
     records.sort(
         key=lambda row: (
@@ -253,41 +375,178 @@ def main():
             row["session_index"],
         )
     )
+    return records, warnings, arch_values
+
+
+def write_rows(fh, records, columns):
+    writer = csv.writer(fh)
+    writer.writerow(columns)
+    for row in records:
+        writer.writerow([row[col] for col in columns])
 
-    output_path = Path("Experiments/all_sessions.csv")
-    columns = [
-        "arch",
-        "run_ts",
-        "trial_id",
-        "session_id",
-        "session_index",
-        "warmup",
-        "adapter_name",
-        "adapter_ms",
-        "net_ms",
-        "local_ms",
-        "decision_build_ms",
-        "from_scene",
-        "to_scene",
-        "scene_ms",
-        "has_scene",
-        "has_audit",
-        "config_version_hash",
-        "seed",
-        "decision_hash",
-        "adapter_calls_path",
-        "scene_transitions_path",
-        "audit_path",
-    ]
 
+def write_csv(output_path, records, columns):
     with open(output_path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.writer(fh)
-        writer.writerow(columns)
-        for row in records:
-            writer.writerow([row[col] for col in columns])
+        write_rows(fh, records, columns)
+
+
+def csv_bytes(records, columns):
+    buffer = io.StringIO(newline="")
+    write_rows(buffer, records, columns)
+    return buffer.getvalue().encode("utf-8")
+
+
+def parse_budgets(value):
+    return tuple(float(part) for part in value.split(",") if part.strip())
+
+
+def resolve_jobs(value):
+    if value <= 0:
+        return os.cpu_count() or 1
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate experiment trials into all_sessions.csv.")
+    parser.add_argument("--input", default=os.path.join("Experiments", "out"))
+    parser.add_argument("--output", default=os.path.join("Experiments", "all_sessions.csv"))
+    parser.add_argument(
+        "--format",
+        choices=("csv", "columnar", "both"),
+        default="csv",
+        help="csv writes --output; columnar writes a dictionary-encoded .npy table (requires numpy).",
+    )
+    parser.add_argument(
+        "--columnar-output",
+        default=os.path.join("Experiments", "all_sessions.cols"),
+        help="Directory for the columnar table (see session_table.load_columnar).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for per-trial parsing (0 = one per CPU, 1 = serial).",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help="Per-trial parse cache (default: <output>.manifest.json next to the output).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the manifest; re-parse every trial.",
+    )
+    parser.add_argument(
+        "--no-audit-index",
+        action="store_true",
+        help="Parse audit.jsonl files directly instead of through <input>/audit_index.sqlite.",
+    )
+    parser.add_argument(
+        "--frames",
+        action="store_true",
+        help="Stream frame_times.csv and add per-session frame-time columns (requires numpy).",
+    )
+    parser.add_argument(
+        "--hitch-budgets",
+        type=parse_budgets,
+        default="16.7,33.3,50",
+        help="Comma-separated frame budgets in ms; one hitch_<budget>ms count column each.",
+    )
+    parser.add_argument(
+        "--frame-window",
+        type=int,
+        default=3,
+        help="Frames before/after each adapter call used for pre/post_call_frame_max_ms.",
+    )
+    parser.add_argument(
+        "--frame-chunk-rows",
+        type=int,
+        default=1_000_000,
+        help="Rows of frame_times.csv parsed per chunk (bounds memory).",
+    )
+    parser.add_argument(
+        "--compare-serial",
+        action="store_true",
+        help="Also time uncached parallel and serial ingests, verify identical output and report the speedup.",
+    )
+    args = parser.parse_args()
+
+    root = Path(args.input)
+    if not root.exists():
+        logging.error("%s directory does not exist", root)
+        sys.exit(1)
+
+    jobs = resolve_jobs(args.jobs)
+    trials = list(iter_trials(root))
+    columns = list(COLUMNS)
+    frames = None
+    if args.frames:
+        from frame_times import frame_columns
+
+        frames = (args.hitch_budgets, max(1, args.frame_window), max(1, args.frame_chunk_rows))
+        columns += frame_columns(args.hitch_budgets)
+    signature = {"columns": columns, "frame_window": frames[1] if frames else None}
+
+    started = time.perf_counter()
+    audit_index = None
+    if not args.no_audit_index:
+        from audit_index import INDEX_FILE, AuditIndex
+
+        audit_index = str(root / INDEX_FILE)
+        with AuditIndex(audit_index) as index:
+            indexed = index.refresh([(arch, trial_dir) for arch, _, trial_dir in trials], jobs)
+        print(f"Audit index {audit_index}: {indexed} audit logs (re)indexed")
+
+    if args.no_cache:
+        results = ingest(trials, jobs, audit_index, frames)
+        parsed_count = len(trials)
+    else:
+        manifest_path = Path(args.manifest) if args.manifest else Path(args.output).with_suffix(".manifest.json")
+        manifest = load_manifest(manifest_path, signature)
+        results, entries, parsed_count = ingest_cached(trials, jobs, manifest, columns, audit_index, frames)
+        save_manifest(manifest_path, signature, entries)
+    records, warnings, arch_values = merge_results(results)
+    elapsed = time.perf_counter() - started
+
+    output_path = Path(args.output)
+    if args.format in ("csv", "both"):
+        write_csv(output_path, records, columns)
+        print(f"Wrote {len(records)} rows to {output_path}")
+    if args.format in ("columnar", "both"):
+        from session_table import write_columnar
+
+        columnar_path = Path(args.columnar_output)
+        write_columnar(columnar_path, records, columns)
+        print(f"Wrote {len(records)} rows to {columnar_path}")
 
-    print(f"Wrote {len(records)} rows to {output_path}")
     print(f"Distinct arch values: {', '.join(sorted(arch_values))}")
+    print(
+        f"Ingested {len(trials)} trials in {elapsed:.3f}s "
+        f"(jobs={jobs}, parsed={parsed_count}, cached={len(trials) - parsed_count})"
+    )
+
+    if args.compare_serial:
+        # Time both paths the same way: every trial parsed, no manifest and no audit index,
+        # so cache hits and the index refresh do not inflate the speedup.
+        started = time.perf_counter()
+        ingest(trials, jobs, frames=frames)
+        parallel_elapsed = time.perf_counter() - started
+        started = time.perf_counter()
+        serial_records, serial_warnings, _ = merge_results(ingest(trials, 1, frames=frames))
+        serial_elapsed = time.perf_counter() - started
+        identical = (
+            csv_bytes(serial_records, columns) == csv_bytes(records, columns)
+            and serial_warnings == warnings
+        )
+        speedup = serial_elapsed / parallel_elapsed if parallel_elapsed > 0 else float("inf")
+        print(
+            f"Uncached ingestion: parallel {parallel_elapsed:.3f}s (jobs={jobs}), serial {serial_elapsed:.3f}s; "
+            f"speedup x{speedup:.2f}; identical output: {'yes' if identical else 'NO'}"
+        )
+        if not identical:
+            sys.exit(2)
+
     if warnings:
         print("Warnings:")
         for warning in sorted(warnings):
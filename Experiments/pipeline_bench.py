@@ -0,0 +1,281 @@
+"""Scaling benchmark for the analysis pipeline (make_all_sessions.py and report.py).
+
+For every scale a synthetic trial tree is written with gen_out_tree.py, then the
+pipeline runs on it in a fresh Python process so that each scale gets its own
+peak RSS. The run is split into the phases below and each one is timed:
+
+* walk: listing the arch/run/trial folders (iter_trials and collect_runs);
+* hash: building the audit index (JSON parse and SHA-256 of every decision);
+* parse: reading the trial CSVs (make_all_sessions ingestion and ScanEngine reads);
+* aggregate: merging the rows, feeding the quantile aggregators, reproducibility;
+* write: all_sessions.csv, summary.md and breakdown.md.
+
+One row per scale goes to pipeline_bench.csv under the run folder. With
+``--profile`` each scale also dumps ``<scale>.pstats`` and the top functions by
+cumulative time to ``<scale>.profile.txt``.
+"""
+
+import argparse
+import csv
+import cProfile
+import io
+import json
+import os
+import pstats
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import make_all_sessions
+import report
+from audit_index import INDEX_FILE, AuditIndex
+from gen_out_tree import DEFAULT_ARCHS, generate, parse_archs
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SCALES = ("5x30x600", "20x30x600", "80x30x600")
+PHASES = ("walk", "hash", "parse", "aggregate", "write")
+COLUMNS = (
+    "scale",
+    "archs",
+    "trials",
+    "sessions",
+    "frames",
+    "rows",
+    "tree_mb",
+    "generate_s",
+) + tuple(f"{phase}_s" for phase in PHASES) + ("total_s", "rows_per_s", "peak_rss_mb")
+PROFILE_TOP = 40
+
+
+def parse_scale(value):
+    """TRIALSxSESSIONSxFRAMES, e.g. 20x30x600 (trials per run, sessions per trial, frames per session)."""
+    try:
+        trials, sessions, frames = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Scale '{value}' is not TRIALSxSESSIONSxFRAMES")
+    return value, trials, sessions, frames
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process and its finished children, or None when unavailable."""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.seconds = {phase: 0.0 for phase in PHASES}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - started
+
+
+def run_pipeline(tree, work_dir, jobs, with_frames):
+    """Run make_all_sessions and report over ``tree``; returns (row count, phase seconds)."""
+
+    class TimedScanEngine(report.ScanEngine):
+        """Charges file reads to the parse phase; the rest of scan() is aggregation."""
+
+        read_seconds = 0.0
+
+        def read(self, arch, trial_path, name, path):
+            started = time.perf_counter()
+            try:
+                return super().read(arch, trial_path, name, path)
+            finally:
+                self.read_seconds += time.perf_counter() - started
+
+    timer = PhaseTimer()
+    frames = None
+    columns = list(make_all_sessions.COLUMNS)
+    if with_frames:
+        from frame_times import DEFAULT_BUDGETS_MS, DEFAULT_CHUNK_ROWS, DEFAULT_WINDOW, frame_columns
+
+        frames = (DEFAULT_BUDGETS_MS, DEFAULT_WINDOW, DEFAULT_CHUNK_ROWS)
+        columns += frame_columns(DEFAULT_BUDGETS_MS)
+
+    with timer.phase("walk"):
+        trials = list(make_all_sessions.iter_trials(Path(tree)))
+        runs = report.collect_runs(str(tree))
+
+    index_path = os.path.join(tree, INDEX_FILE)
+    with timer.phase("hash"):
+        with AuditIndex(index_path) as index:
+            index.refresh([(arch, trial_dir) for arch, _, trial_dir in trials], jobs)
+
+    with timer.phase("parse"):
+        results = make_all_sessions.ingest(trials, jobs, index_path, frames)
+
+    with timer.phase("aggregate"):
+        records, _, _ = make_all_sessions.merge_results(results)
+
+    new_quantiles = report.quantile_factory(False)
+    engine = TimedScanEngine(include_warmup=False, vectorized=True)
+    adapter_calls = engine.register(report.LatencyAggregator("adapter_calls.csv", "call_ms", new_quantiles))
+    scene_transitions = engine.register(report.LatencyAggregator("scene_transitions.csv", "transition_ms", new_quantiles))
+    service_errors = engine.register(report.CountAggregator("service_errors.csv"))
+    breakdowns = [engine.register(report.BreakdownAggregator(transport, new_quantiles)) for transport in report.TRANSPORTS]
+    started = time.perf_counter()
+    engine.scan(runs)
+    scan_seconds = time.perf_counter() - started
+    timer.seconds["parse"] += engine.read_seconds
+    timer.seconds["aggregate"] += scan_seconds - engine.read_seconds
+
+    with timer.phase("aggregate"):
+        with AuditIndex(index_path) as index:
+            reproducibility = {arch: index.reproducibility(arch, False) for arch in runs}
+
+    with timer.phase("write"):
+        make_all_sessions.write_csv(Path(work_dir) / "all_sessions.csv", records, columns)
+        report.write_summary(os.path.join(work_dir, "summary.md"), runs, adapter_calls, scene_transitions, reproducibility)
+        report.write_breakdown(str(tree), breakdowns, adapter_calls, service_errors)
+
+    return len(records), timer.seconds
+
+
+def run_worker(args):
+    """Child-process entry point: run the pipeline once and print one JSON line."""
+    if args.frames:
+        import frame_times  # noqa: F401  (imported up front so numpy's import is not timed)
+
+    profiler = cProfile.Profile() if args.profile_to else None
+    if profiler is not None:
+        profiler.enable()
+    rows, seconds = run_pipeline(args.worker_tree, args.worker_dir, args.jobs, args.frames)
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile_to)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        with open(Path(args.profile_to).with_suffix(".profile.txt"), "w", encoding="utf-8") as fh:
+            fh.write(text.getvalue())
+    print(json.dumps({"rows": rows, "seconds": seconds, "peak_rss_mb": peak_rss_mb()}))
+
+
+def tree_megabytes(tree):
+    total = 0
+    for folder, _, files in os.walk(tree):
+        total += sum(os.path.getsize(os.path.join(folder, name)) for name in files)
+    return total / 1e6
+
+
+def run_scale(args, run_dir, scale):
+    label, trials, sessions, frames = scale
+    scale_dir = run_dir / label
+    tree = scale_dir / "out"
+    scale_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    generate(tree, args.archs, args.runs, trials, sessions, args.warmup, frames, args.seed, args.config_root, args.config_version)
+    generate_s = time.perf_counter() - started
+    tree_mb = tree_megabytes(tree)
+
+    command = [sys.executable, os.path.abspath(__file__), "--worker-tree", str(tree), "--worker-dir", str(scale_dir), "--jobs", str(args.jobs)]
+    if args.frames:
+        command.append("--frames")
+    if args.profile:
+        command += ["--profile-to", str(run_dir / f"{label}.pstats")]
+    completed = subprocess.run(command, stdout=subprocess.PIPE, text=True, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    if not args.keep_trees:
+        shutil.rmtree(tree)
+
+    seconds = result["seconds"]
+    total_s = sum(seconds.values())
+    row = {
+        "scale": label,
+        "archs": len(args.archs),
+        "trials": len(args.archs) * args.runs * trials,
+        "sessions": sessions + args.warmup,
+        "frames": frames,
+        "rows": result["rows"],
+        "tree_mb": f"{tree_mb:.1f}",
+        "generate_s": f"{generate_s:.3f}",
+        "total_s": f"{total_s:.3f}",
+        "rows_per_s": f"{result['rows'] / total_s:.0f}" if total_s > 0 else "",
+        "peak_rss_mb": f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "",
+    }
+    row.update({f"{phase}_s": f"{seconds[phase]:.3f}" for phase in PHASES})
+    return row
+
+
+def main():
+    repo_root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description="Time the analysis pipeline phases on synthetic trial trees.")
+    parser.add_argument(
+        "--scale",
+        action="append",
+        type=parse_scale,
+        default=None,
+        help=f"TRIALSxSESSIONSxFRAMES per arch run (repeatable; default: {' '.join(DEFAULT_SCALES)}).",
+    )
+    parser.add_argument("--archs", type=parse_archs, default=DEFAULT_ARCHS)
+    parser.add_argument("--runs", type=int, default=1, help="Run folders per arch.")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=12345)
+    parser.add_argument("--config-root", default=str(repo_root / "Configs"))
+    parser.add_argument("--config-version", default="v1")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the parse and hash phases.")
+    parser.add_argument("--frames", action="store_true", help="Include the frame_times.csv statistics (requires numpy).")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Dump cProfile output per scale (covers the main process only; use --jobs 1 for complete profiles).",
+    )
+    parser.add_argument("--keep-trees", action="store_true", help="Keep the generated trees instead of deleting them.")
+    parser.add_argument("--output", default=os.path.join("Experiments", "out_synth", "pipeline_bench"))
+    parser.add_argument("--worker-tree", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--profile-to", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker_tree:
+        run_worker(args)
+        return
+
+    scales = args.scale or [parse_scale(value) for value in DEFAULT_SCALES]
+    run_dir = Path(args.output) / datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = []
+    for scale in scales:
+        print(f"== {scale[0]}")
+        rows.append(run_scale(args, run_dir, scale))
+
+    out_path = run_dir / "pipeline_bench.csv"
+    with open(out_path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    for row in rows:
+        phases = " ".join(f"{phase}={row[f'{phase}_s']}s" for phase in PHASES)
+        print(
+            f"{row['scale']:<12} rows={row['rows']:<8} tree={row['tree_mb']}MB {phases} "
+            f"total={row['total_s']}s peak_rss={row['peak_rss_mb'] or 'n/a'}MB"
+        )
+    print(f"Results written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+"""Vectorized NumPy reference implementation of AdaptationEngine.ComputeNext for bulk replay.
+
+Every audit record produced by AdaptationEngine (Service, ServiceGrpc, ServiceBroker and
+the Unity clients that log their decisions) is re-computed from its recorded inputs and
+compared with the recorded decision. Records are grouped by config version and computed
+a whole column at a time in float32, with the same operation order as the C# engine, so
+``time_factor``, ``score`` and the clamped ``aggression``/``curiosity``/``patience`` are
+reproduced bit for bit.
+
+Two audit layouts are understood:
+
+* service audits (``npc_params`` as a list of ``{name, value}``) keep full float32 values,
+  which must match exactly;
+* Unity ``SessionLogWriter`` audits (``npc_params`` as a map) round inputs and outputs to
+  three decimals, so replayed values may differ from the recorded ones by one thousandth.
+
+Decisions built by the Unity-local adapters (AdapterDecisions, no ``score`` explanation)
+are not produced by the engine and are skipped.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+loads = orjson.loads if orjson is not None else json.loads
+
+AUDIT_FILE = "audit.jsonl"
+UTF8_BOM = b"\xef\xbb\xbf"
+DEFAULT_CHUNK_MB = 64
+NPC_PARAMS = ("aggression", "curiosity", "patience")
+DEFAULT_BASE_PARAMS = {"aggression": 0.2, "curiosity": 0.3, "patience": 0.6}
+# .NET formats a float with 7 significant digits before applying a custom format such as "0.000".
+FLOAT_FORMAT_DIGITS = 7
+ROUNDED_TOLERANCE = 1
+MISMATCH_COLUMNS = ["audit_path", "line", "session_id", "config_version", "fields", "recorded", "replayed"]
+
+
+class EngineConfig:
+    """The ConfigPackage fields ComputeNext reads, as float32."""
+
+    def __init__(self, version, version_hash, data):
+        self.version = version
+        self.version_hash = version_hash
+        # DataContractJsonSerializer does not run field initializers, so missing weights are 0.
+        self.result_weight = np.float32(data.get("result_weight", 0.0))
+        self.time_weight = np.float32(data.get("time_weight", 0.0))
+        self.time_scale = np.float32(data.get("time_scale", 0.0))
+        base = contract_dictionary(data.get("npc_base_params"))
+        self.base = {name: np.float32(base.get(name, DEFAULT_BASE_PARAMS[name])) for name in NPC_PARAMS}
+
+
+def contract_dictionary(value):
+    """A Dictionary<string, float> as ConfigLoader's DataContractJsonSerializer reads it.
+
+    The serializer only understands the ``[{"Key": ..., "Value": ...}]`` form; a plain
+    JSON object such as the one in Configs/v1 leaves the dictionary empty, so the engine
+    uses its built-in defaults for every NPC parameter.
+    """
+    if not isinstance(value, list):
+        return {}
+    return {entry.get("Key"): entry.get("Value") for entry in value if isinstance(entry, dict)}
+
+
+def load_config(config_root, version):
+    """Load Configs/<version>/config.json and hash it like ConfigLoader (SHA-256 of the text)."""
+    path = Path(config_root) / version / "config.json"
+    with open(path, "r", encoding="utf-8-sig") as fh:
+        text = fh.read()
+    version_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    data = json.loads(text)
+    return EngineConfig(data.get("version") or version, version_hash, data)
+
+
+def compute_next(result_z, time_t, config):
+    """ComputeNext over whole columns; every intermediate is rounded to float32 like the C# code."""
+    result_z = np.asarray(result_z, dtype=np.float32)
+    time_t = np.asarray(time_t, dtype=np.float32)
+    time_factor = time_t * config.time_scale
+    score = (result_z * config.result_weight) + (time_factor * config.time_weight)
+    return {
+        "time_factor": time_factor,
+        "score": score,
+        "aggression": np.clip(config.base["aggression"] + score, np.float32(0), np.float32(1)),
+        "curiosity": np.clip(config.base["curiosity"] + time_factor, np.float32(0), np.float32(1)),
+        "patience": np.clip(config.base["patience"] - score * np.float32(0.5), np.float32(0), np.float32(1)),
+    }
+
+
+def thousandths(values):
+    """Signed thousandths that ``float.ToString("0.000")`` prints for each float32 value.
+
+    The value is first reduced to 7 significant digits, then rounded half away from
+    zero to three decimals, using integer arithmetic to avoid a second binary rounding.
+    """
+    values = np.asarray(values, dtype=np.float32).astype(np.float64)
+    magnitude = np.abs(values)
+    nonzero = magnitude > 0
+    exponent = np.zeros(values.shape, dtype=np.int64)
+    exponent[nonzero] = np.floor(np.log10(magnitude[nonzero])).astype(np.int64)
+    scale = exponent - (FLOAT_FORMAT_DIGITS - 1)
+    digits = np.rint(magnitude / np.power(10.0, scale)).astype(np.int64)
+
+    # digits * 10**scale, expressed in thousandths: shift by scale + 3 decimal places.
+    shift = scale + 3
+    result = np.zeros(values.shape, dtype=np.int64)
+    up = shift >= 0
+    result[up] = digits[up] * np.power(10, np.minimum(shift[up], 18)).astype(np.int64)
+    down = ~up & (shift > -19)
+    divisor = np.power(10, -shift[down]).astype(np.int64)
+    result[down] = (digits[down] + divisor // 2) // divisor
+    return np.where(values < 0, -result, result)
+
+
+def format_thousandths(value):
+    sign = "-" if value < 0 else ""
+    value = abs(int(value))
+    return f"{sign}{value // 1000}.{value % 1000:03d}"
+
+
+def named_values(entries):
+    """Normalize npc_params/explanation from either audit layout into a dict."""
+    if isinstance(entries, dict):
+        return entries
+    if isinstance(entries, list):
+        return {entry.get("name"): entry.get("value") for entry in entries if isinstance(entry, dict)}
+    return {}
+
+
+def json_float(value):
+    return None if np.isnan(value) else float(value)
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class AuditColumns:
+    """Engine-produced records of one audit.jsonl chunk, unpacked into parallel columns."""
+
+    def __init__(self):
+        self.line_no = []
+        self.session_id = []
+        self.version = []
+        self.result_z = []
+        self.time_t = []
+        self.exact = []
+        self.recorded = {name: [] for name in NPC_PARAMS + ("time_factor", "score", "score_text")}
+        self.config_hash = []
+        self.field_mismatches = {}
+
+    def add(self, line_no, record, default_version):
+        output = record.get("output") or {}
+        explanation = output.get("explanation")
+        npc_params = output.get("npc_params")
+        exact = isinstance(npc_params, list)
+        if exact:
+            explanation = named_values(explanation)
+            npc_params = named_values(npc_params)
+        elif not isinstance(explanation, dict) or not isinstance(npc_params, dict):
+            return False
+        score_text = explanation.get("score")
+        if score_text is None:
+            return False
+        inputs = record.get("inputs") or {}
+        intermediate = record.get("intermediate") or {}
+        recorded = self.recorded
+
+        self.line_no.append(line_no)
+        self.session_id.append(record.get("session_id") or inputs.get("session_id") or "")
+        self.version.append(inputs.get("config_version") or output.get("config_version") or default_version)
+        self.result_z.append(inputs.get("result_z"))
+        self.time_t.append(inputs.get("time_t"))
+        self.exact.append(exact)
+        recorded["aggression"].append(npc_params.get("aggression"))
+        recorded["curiosity"].append(npc_params.get("curiosity"))
+        recorded["patience"].append(npc_params.get("patience"))
+        recorded["time_factor"].append(intermediate.get("time_factor"))
+        recorded["score"].append(intermediate.get("score"))
+        recorded["score_text"].append(score_text)
+        self.config_hash.append(explanation.get("config_hash") or record.get("config_version_hash") or "")
+
+        if (
+            output.get("next_scene_id") != inputs.get("scene_id")
+            or output.get("seed") != inputs.get("seed")
+            or (output.get("config_version") or "") != (inputs.get("config_version") or "")
+        ):
+            fields = []
+            if output.get("next_scene_id") != inputs.get("scene_id"):
+                fields.append("next_scene_id")
+            if output.get("seed") != inputs.get("seed"):
+                fields.append("seed")
+            if (output.get("config_version") or "") != (inputs.get("config_version") or ""):
+                fields.append("config_version")
+            self.field_mismatches[len(self.line_no) - 1] = fields
+        return True
+
+    def floats(self, values):
+        """Convert a raw column to float64, with NaN for values that are missing or not numbers."""
+        try:
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return np.array([to_float(value) for value in values], dtype=np.float64)
+
+
+def split_file(path, chunk_bytes):
+    """Byte ranges of roughly ``chunk_bytes`` that start and end on line boundaries."""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as fh:
+        while start < size:
+            fh.seek(min(size, start + chunk_bytes))
+            fh.readline()
+            end = min(size, fh.tell()) if start + chunk_bytes < size else size
+            ranges.append((start, end))
+            start = end
+    return ranges or [(0, 0)]
+
+
+def read_audit_columns(path, default_version, start=0, end=None):
+    """Parse the lines in ``[start, end)`` of an audit.jsonl; line numbers are relative to ``start``."""
+    columns = AuditColumns()
+    skipped = 0
+    invalid = 0
+    line_count = 0
+    if end is None:
+        end = os.path.getsize(path)
+    if end <= start:
+        return columns, skipped, invalid, line_count
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        remaining = end - start
+        for line_no, line in enumerate(fh):
+            remaining -= len(line)
+            line_count += 1
+            if line_no == 0 and start == 0 and line.startswith(UTF8_BOM):
+                line = line[len(UTF8_BOM) :]
+            line = line.strip()
+            if line:
+                try:
+                    record = loads(line)
+                except ValueError:
+                    invalid += 1
+                    record = None
+                if record is not None and not columns.add(line_no, record, default_version):
+                    skipped += 1
+            if remaining <= 0:
+                break
+    return columns, skipped, invalid, line_count
+
+
+def compare(recorded, replayed, exact):
+    """Rows where the recorded value disagrees with the replayed float32 value (NaN = not recorded)."""
+    recorded = np.asarray(recorded, dtype=np.float64)
+    present = ~np.isnan(recorded)
+    bad = np.zeros(recorded.shape, dtype=bool)
+    exact_rows = present & exact
+    bad[exact_rows] = recorded[exact_rows].astype(np.float32) != replayed[exact_rows]
+    rounded_rows = present & ~exact
+    recorded_units = np.rint(recorded[rounded_rows] * 1000.0).astype(np.int64)
+    bad[rounded_rows] = np.abs(recorded_units - thousandths(replayed[rounded_rows])) > ROUNDED_TOLERANCE
+    return bad
+
+
+def replay_chunk(path, start, end, config_root, default_version):
+    """Replay one byte range of an audit.jsonl.
+
+    Returns ``(stats, mismatches, line_count)``; mismatch line numbers are relative to ``start``.
+    """
+    columns, skipped, invalid, line_count = read_audit_columns(path, default_version, start, end)
+    stats = {
+        "records": len(columns.line_no),
+        "skipped": skipped,
+        "invalid": invalid,
+        "unknown_config": 0,
+        "config_hash_differs": 0,
+        "mismatched": 0,
+    }
+    mismatches = []
+    if not columns.line_no:
+        return stats, mismatches, line_count
+
+    versions = np.asarray(columns.version, dtype=object)
+    exact = np.asarray(columns.exact, dtype=bool)
+    result_z = columns.floats(columns.result_z)
+    time_t = columns.floats(columns.time_t)
+    recorded = {name: columns.floats(values) for name, values in columns.recorded.items()}
+    for version in sorted(set(columns.version)):
+        rows = np.flatnonzero(versions == version)
+        try:
+            config = load_config(config_root, version)
+        except (OSError, ValueError):
+            stats["unknown_config"] += int(rows.size)
+            continue
+
+        replayed = compute_next(result_z[rows], time_t[rows], config)
+        bad_fields = {}
+        for name in NPC_PARAMS + ("time_factor", "score"):
+            bad_fields[name] = compare(recorded[name][rows], replayed[name], exact[rows])
+        # The explanation score is always the "0.000" text of the float32 score.
+        score_text = recorded["score_text"][rows]
+        tolerance = np.where(exact[rows], 0, ROUNDED_TOLERANCE)
+        recorded_units = np.rint(np.nan_to_num(score_text, nan=np.inf) * 1000.0)
+        bad_fields["explanation.score"] = ~(np.abs(recorded_units - thousandths(replayed["score"])) <= tolerance)
+
+        hashes = np.asarray(columns.config_hash, dtype=object)[rows]
+        stats["config_hash_differs"] += int(np.count_nonzero((hashes != "") & (hashes != config.version_hash)))
+
+        flagged = np.zeros(rows.size, dtype=bool)
+        for bad in bad_fields.values():
+            flagged |= bad
+        if columns.field_mismatches:
+            flagged |= np.isin(rows, np.fromiter(columns.field_mismatches, dtype=np.int64))
+        for pos in np.flatnonzero(flagged).tolist():
+            row = int(rows[pos])
+            fields = [name for name, bad in bad_fields.items() if bad[pos]] + columns.field_mismatches.get(row, [])
+            stats["mismatched"] += 1
+            recorded_values = {name: json_float(recorded[name][row]) for name in NPC_PARAMS + ("score", "score_text")}
+            replayed_values = {name: float(replayed[name][pos]) for name in NPC_PARAMS + ("score",)}
+            replayed_values["score_text"] = format_thousandths(thousandths(replayed["score"][pos : pos + 1])[0])
+            mismatches.append(
+                [
+                    os.fspath(path),
+                    columns.line_no[row] + 1,
+                    str(columns.session_id[row]),
+                    version,
+                    ";".join(fields),
+                    json.dumps(recorded_values, sort_keys=True),
+                    json.dumps(replayed_values, sort_keys=True),
+                ]
+            )
+    return stats, mismatches, line_count
+
+
+def _replay_task(task):
+    return replay_chunk(*task)
+
+
+def find_audit_files(paths):
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(sorted(path.rglob(AUDIT_FILE)))
+        elif path.exists():
+            files.append(path)
+    return files
+
+
+def main():
+    repo_root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description="Replay audit logs through a NumPy reference ComputeNext.")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[os.path.join("Experiments", "out")],
+        help="audit.jsonl files or directories searched recursively (default: Experiments/out).",
+    )
+    parser.add_argument("--config-root", default=str(repo_root / "Configs"))
+    parser.add_argument(
+        "--config-version",
+        default="v1",
+        help="Config version for records that carry none (the service default).",
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per CPU).")
+    parser.add_argument(
+        "--chunk-mb",
+        type=int,
+        default=DEFAULT_CHUNK_MB,
+        help="Large audit logs are split into byte ranges of this size, replayed independently.",
+    )
+    parser.add_argument("--mismatches", default=None, help="Write every mismatched record to this CSV.")
+    parser.add_argument("--show", type=int, default=10, help="Mismatches printed to the console.")
+    args = parser.parse_args()
+
+    files = find_audit_files(args.paths)
+    if not files:
+        print(f"No {AUDIT_FILE} found under: {', '.join(args.paths)}", file=sys.stderr)
+        return 1
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    started = time.perf_counter()
+    chunk_bytes = max(1, args.chunk_mb) * 1024 * 1024
+    tasks = [
+        (path, start, end, args.config_root, args.config_version)
+        for path in files
+        for start, end in split_file(path, chunk_bytes)
+    ]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_replay_task, tasks))
+    else:
+        results = [replay_chunk(*task) for task in tasks]
+    elapsed = time.perf_counter() - started
+
+    totals = {}
+    mismatches = []
+    lines_before = {}
+    for task, (stats, chunk_mismatches, line_count) in zip(tasks, results):
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+        offset = lines_before.get(task[0], 0)
+        for row in chunk_mismatches:
+            row[1] += offset
+        mismatches.extend(chunk_mismatches)
+        lines_before[task[0]] = offset + line_count
+
+    replayed = totals["records"] - totals["unknown_config"]
+    print(f"Replayed {replayed} engine records from {len(files)} audit files in {elapsed:.3f}s (jobs={jobs})")
+    print(
+        f"Matched: {replayed - len(mismatches)}, mismatched: {len(mismatches)}, "
+        f"skipped non-engine records: {totals['skipped']}, invalid lines: {totals['invalid']}"
+    )
+    if totals["unknown_config"]:
+        print(f"Warning: {totals['unknown_config']} records reference a config version missing from {args.config_root}")
+    if totals["config_hash_differs"]:
+        print(
+            f"Warning: {totals['config_hash_differs']} records were produced with a config whose hash "
+            "differs from the one on disk"
+        )
+    for row in mismatches[: max(0, args.show)]:
+        print(f"- {row[0]}:{row[1]} {row[2]} ({row[3]}): {row[4]} recorded={row[5]} replayed={row[6]}")
+
+    if args.mismatches:
+        with open(args.mismatches, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(MISMATCH_COLUMNS)
+            writer.writerows(mismatches)
+        print(f"Mismatches written to {args.mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,32 @@
 import argparse
+import csv
 import json
+import math
 import os
-from collections import defaultdict
+import time
+import warnings
+from collections import defaultdict, namedtuple
+
+from audit_index import AUDIT_FILE, INDEX_FILE, AuditIndex, parse_record
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; it enables the vectorized loader and bootstrap CIs
+    np = None
+
+DEFAULT_SKETCH_ACCURACY = 0.01
+DEFAULT_SKETCH_MAX_BINS = 2048
+REPORT_QUANTILES = (0.50, 0.95, 0.99)
+PREWARM_FILE = "prewarm.csv"
 
 
 def percentile(values, p):
     if not values:
         return None
-    values = sorted(values)
+    return percentile_sorted(sorted(values), p)
+
+
+def percentile_sorted(values, p):
     k = (len(values) - 1) * p
     f = int(k)
     c = min(f + 1, len(values) - 1)
@@ -16,33 +35,155 @@ def percentile(values, p):
     return values[f] + (values[c] - values[f]) * (k - f)
 
 
-def load_csv_values(path, column_name, include_warmup):
-    values = []
-    with open(path, "r", encoding="utf-8") as handle:
-        header = next(handle, None)
-        warmup_index = None
-        target_index = None
-        if header:
-            headers = header.strip().split(",")
-            if column_name in headers:
-                target_index = headers.index(column_name)
-            if "warmup" in headers:
-                warmup_index = headers.index("warmup")
-        for line in handle:
-            parts = line.strip().split(",")
-            if target_index is None or len(parts) <= target_index:
-                continue
-            if warmup_index is not None and not include_warmup:
-                try:
-                    if int(parts[warmup_index]) == 1:
-                        continue
-                except ValueError:
-                    pass
-            try:
-                values.append(float(parts[target_index]))
-            except ValueError:
-                continue
-    return values
+class QuantileSketch:
+    """Mergeable DDSketch-style log histogram with a bounded relative error.
+
+    Values land in buckets whose bounds grow by ``gamma = (1 + a) / (1 - a)``,
+    so any quantile is returned within relative accuracy ``a`` of a value in
+    the data. Memory is bounded by ``max_bins`` buckets; past that the lowest
+    buckets are folded together, which only degrades the smallest quantiles.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_SKETCH_ACCURACY, max_bins=DEFAULT_SKETCH_MAX_BINS):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._min_indexable = 1e-9
+        self.positive = defaultdict(int)
+        self.negative = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value):
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key):
+        return 2.0 * self.gamma ** key / (self.gamma + 1.0)
+
+    def add(self, value):
+        if value > self._min_indexable:
+            self.positive[self._key(value)] += 1
+        elif value < -self._min_indexable:
+            self.negative[self._key(-value)] += 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        if len(self.positive) > self.max_bins:
+            self._collapse()
+
+    def extend(self, values):
+        if np is not None and isinstance(values, np.ndarray):
+            self._extend_array(values)
+            return
+        for value in values:
+            self.add(value)
+
+    def _extend_array(self, values):
+        values = values[~np.isnan(values)]
+        for store, side in ((self.positive, values), (self.negative, -values)):
+            side = side[side > self._min_indexable]
+            if side.size:
+                keys, counts = np.unique(np.ceil(np.log(side) / self._log_gamma), return_counts=True)
+                for key, count in zip(keys.astype(np.int64).tolist(), counts.tolist()):
+                    store[key] += count
+        self.zero_count += int(np.count_nonzero(np.abs(values) <= self._min_indexable))
+        self.count += int(values.size)
+        if len(self.positive) > self.max_bins:
+            self._collapse()
+
+    def support(self):
+        """Return (sorted representative values, counts) for bootstrap resampling."""
+        values = [-self._value(key) for key in sorted(self.negative, reverse=True)]
+        counts = [self.negative[key] for key in sorted(self.negative, reverse=True)]
+        if self.zero_count:
+            values.append(0.0)
+            counts.append(self.zero_count)
+        for key in sorted(self.positive):
+            values.append(self._value(key))
+            counts.append(self.positive[key])
+        return np.asarray(values, dtype=np.float64), np.asarray(counts, dtype=np.int64)
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.positive.items():
+            self.positive[key] += count
+        for key, count in other.negative.items():
+            self.negative[key] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.positive) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self):
+        keys = sorted(self.positive)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.positive[target] += self.positive.pop(key)
+
+    def quantile(self, p):
+        if self.count == 0:
+            return None
+        rank = (self.count - 1) * p
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive))
+
+
+class ExactQuantiles:
+    """Keeps every value; same interface as QuantileSketch, results match percentile()."""
+
+    def __init__(self):
+        self.values = []
+        self._sorted = True
+
+    @property
+    def count(self):
+        return len(self.values)
+
+    def add(self, value):
+        self.values.append(value)
+        self._sorted = False
+
+    def extend(self, values):
+        if np is not None and isinstance(values, np.ndarray):
+            values = values[~np.isnan(values)].tolist()
+        self.values.extend(values)
+        self._sorted = False
+
+    def merge(self, other):
+        self.extend(other.values)
+
+    def support(self):
+        return np.unique(np.asarray(self.values, dtype=np.float64), return_counts=True)
+
+    def quantile(self, p):
+        if not self.values:
+            return None
+        if not self._sorted:
+            self.values.sort()
+            self._sorted = True
+        return percentile_sorted(self.values, p)
+
+
+def quantile_factory(exact, relative_accuracy=DEFAULT_SKETCH_ACCURACY):
+    if exact:
+        return ExactQuantiles
+    return lambda: QuantileSketch(relative_accuracy)
 
 
 def collect_runs(out_root):
@@ -63,65 +204,534 @@ def collect_runs(out_root):
     return runs
 
 
-def reproducibility_rate(audit_paths, include_warmup):
-    input_to_outputs = defaultdict(set)
-    for path in audit_paths:
-        if not os.path.exists(path):
-            continue
+class TrialFile:
+    """One trial file, read once and handed to every aggregator registered for it.
+
+    CSV files expose ``header`` and ``rows`` (lists of strings, warmup rows
+    already dropped unless requested); JSONL files expose ``records``.
+    """
+
+    def __init__(self, arch, trial_path, name, header=None, rows=None, records=None):
+        self.arch = arch
+        self.trial_path = trial_path
+        self.name = name
+        self.header = header or []
+        self.rows = rows if rows is not None else []
+        self.records = records or []
+        self._index = {column: pos for pos, column in enumerate(self.header)}
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    def has(self, column):
+        return column in self._index
+
+    def values(self, column):
+        pos = self._index.get(column)
+        if pos is None:
+            return []
+        return [row[pos] for row in self.rows if len(row) > pos]
+
+    def floats(self, column):
+        values = []
+        for value in self.values(column):
+            try:
+                values.append(float(value))
+            except ValueError:
+                continue
+        return values
+
+    def ints(self, column):
+        return [parse_count(value) for value in self.values(column)]
+
+
+class ArrayTrialFile(TrialFile):
+    """TrialFile backed by a 2-D numpy string array; columns convert in one call."""
+
+    @property
+    def row_count(self):
+        return self.rows.shape[0]
+
+    def values(self, column):
+        pos = self._index.get(column)
+        if pos is None or pos >= self.rows.shape[1]:
+            return np.empty(0, dtype=str)
+        return self.rows[:, pos]
+
+    def floats(self, column):
+        column_values = self.values(column)
+        try:
+            return column_values.astype(np.float64)
+        except ValueError:
+            converted = np.array([to_float(value) for value in column_values], dtype=np.float64)
+            return converted[~np.isnan(converted)]
+
+    def ints(self, column):
+        column_values = self.values(column)
+        try:
+            return column_values.astype(np.int64)
+        except ValueError:
+            return np.array([parse_count(value) for value in column_values], dtype=np.int64)
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
+
+def load_csv_array(path, include_warmup):
+    """Parse a whole CSV into (header, 2-D string array) with the warmup filter as a mask.
+
+    Returns None when the file cannot be parsed as a rectangular table, in which
+    case callers fall back to the row-by-row reader.
+    """
+    with open(path, "r", newline="", encoding="utf-8-sig") as handle:
+        header = [column.strip() for column in next(csv.reader([handle.readline()]), [])]
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                table = np.loadtxt(
+                    handle,
+                    dtype=str,
+                    delimiter=",",
+                    quotechar='"',
+                    comments=None,
+                    ndmin=2,
+                )
+        except ValueError:
+            return None
+    if table.size == 0:
+        table = np.empty((0, len(header)), dtype=str)
+    if table.shape[1] != len(header):
+        return None
+    if not include_warmup and "warmup" in header:
+        warmup = np.char.strip(table[:, header.index("warmup")])
+        table = table[warmup != "1"]
+    return header, table
+
+
+def is_warmup_row(row, warmup_index):
+    try:
+        return int(row[warmup_index]) == 1
+    except (ValueError, IndexError):
+        return False
+
+
+class ScanEngine:
+    """Walks every trial once and dispatches each file to its registered aggregators.
+
+    An aggregator declares the file names it needs in ``files`` and receives one
+    :class:`TrialFile` per trial through ``consume``.
+    """
+
+    def __init__(self, include_warmup, vectorized=False):
+        self.include_warmup = include_warmup
+        self.vectorized = vectorized and np is not None
+        self.files_read = 0
+        self.trials_scanned = 0
+        self._aggregators = defaultdict(list)
+
+    def register(self, aggregator):
+        for name in aggregator.files:
+            self._aggregators[name].append(aggregator)
+        return aggregator
+
+    def scan(self, runs):
+        for arch in sorted(runs):
+            for trial_path in sorted(runs[arch]):
+                self.trials_scanned += 1
+                for name, aggregators in self._aggregators.items():
+                    path = os.path.join(trial_path, name)
+                    if not os.path.exists(path):
+                        continue
+                    trial_file = self.read(arch, trial_path, name, path)
+                    self.files_read += 1
+                    for aggregator in aggregators:
+                        aggregator.consume(trial_file)
+
+    def read(self, arch, trial_path, name, path):
+        if name.endswith(".jsonl"):
+            return TrialFile(arch, trial_path, name, records=self.read_jsonl(path))
+
+        if self.vectorized:
+            loaded = load_csv_array(path, self.include_warmup)
+            if loaded is not None:
+                header, table = loaded
+                return ArrayTrialFile(arch, trial_path, name, header=header, rows=table)
+
+        with open(path, "r", newline="", encoding="utf-8-sig") as handle:
+            reader = csv.reader(handle)
+            header = [column.strip() for column in next(reader, [])]
+            rows = [row for row in reader if row]
+        return TrialFile(arch, trial_path, name, header=header, rows=self.drop_warmup(header, rows))
+
+    def drop_warmup(self, header, rows):
+        if self.include_warmup or "warmup" not in header:
+            return rows
+        warmup_index = header.index("warmup")
+        return [row for row in rows if not is_warmup_row(row, warmup_index)]
+
+    def read_jsonl(self, path):
         with open(path, "r", encoding="utf-8-sig") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
+            return self.parse_jsonl(handle)
+
+    def parse_jsonl(self, lines):
+        records = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
                 record = json.loads(line)
-                if not include_warmup and record.get("warmup") is True:
-                    continue
-                event = record.get("event") or record.get("inputs") or {}
-                decision = record.get("decision") or record.get("output") or {}
-                event_key = json.dumps(
-                    {
-                        "scene_id": event.get("scene_id"),
-                        "result_z": event.get("result_z"),
-                        "time_t": event.get("time_t"),
-                        "attempts_a": event.get("attempts_a"),
-                        "seed": event.get("seed"),
-                        "config_version": event.get("config_version"),
-                    },
-                    sort_keys=True,
-                )
-                decision_key = json.dumps(decision, sort_keys=True)
-                input_to_outputs[event_key].add(decision_key)
+            except json.JSONDecodeError:
+                continue
+            if not self.include_warmup and record.get("warmup") is True:
+                continue
+            records.append(record)
+        return records
+
+
+class FileRewritten(Exception):
+    """A followed file got shorter, i.e. it was replaced rather than appended to."""
+
+
+class FollowEngine(ScanEngine):
+    """ScanEngine for trials that are still being written (``--follow``).
+
+    Each file's byte offset is kept between scans, so every scan only reads what
+    was appended since the previous one and hands those rows to the aggregators.
+    Only complete lines are consumed; a line still being written is picked up by
+    the next scan. The aggregators merge partial batches like whole trials.
+    """
+
+    def __init__(self, include_warmup):
+        super().__init__(include_warmup, vectorized=False)
+        self.offsets = {}
+        self.trials = set()
+        self.rows_read = 0
+
+    def scan(self, runs):
+        """Consume everything appended since the last scan; returns the number of new rows and records."""
+        rows_before = self.rows_read
+        for arch in sorted(runs):
+            for trial_path in sorted(runs[arch]):
+                self.trials.add(trial_path)
+                for name, aggregators in self._aggregators.items():
+                    trial_file = self.read_appended(arch, trial_path, name, os.path.join(trial_path, name))
+                    if trial_file is None:
+                        continue
+                    self.files_read += 1
+                    self.rows_read += trial_file.row_count + len(trial_file.records)
+                    for aggregator in aggregators:
+                        aggregator.consume(trial_file)
+        self.trials_scanned = len(self.trials)
+        return self.rows_read - rows_before
+
+    def read_appended(self, arch, trial_path, name, path):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return None
+        offset, header = self.offsets.get(path, (0, None))
+        if size < offset:
+            raise FileRewritten(path)
+        if size == offset:
+            return None
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            chunk = handle.read(size - offset)
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return None
+        # A cut right after a newline never splits a UTF-8 sequence; the BOM only appears at offset 0.
+        lines = chunk[:end].decode("utf-8-sig" if offset == 0 else "utf-8").splitlines()
+        offset += end
+
+        if name.endswith(".jsonl"):
+            self.offsets[path] = (offset, None)
+            return TrialFile(arch, trial_path, name, records=self.parse_jsonl(lines))
+
+        rows = [row for row in csv.reader(lines) if row]
+        if header is None and rows:
+            header = [column.strip() for column in rows.pop(0)]
+        self.offsets[path] = (offset, header)
+        if not rows:
+            return None
+        return TrialFile(arch, trial_path, name, header=header, rows=self.drop_warmup(header, rows))
+
+
+class LatencyAggregator:
+    """Per-arch quantiles of one numeric column, sketched per trial and merged."""
+
+    def __init__(self, filename, column, new_quantiles):
+        self.files = (filename,)
+        self.column = column
+        self.new_quantiles = new_quantiles
+        self.by_arch = {}
+
+    def consume(self, trial_file):
+        trial = self.new_quantiles()
+        trial.extend(trial_file.floats(self.column))
+        self.get(trial_file.arch).merge(trial)
+
+    def get(self, arch):
+        if arch not in self.by_arch:
+            self.by_arch[arch] = self.new_quantiles()
+        return self.by_arch[arch]
+
 
-    if not input_to_outputs:
-        return 0.0
+def http_ok(value):
+    try:
+        return 200 <= int(value) < 300
+    except ValueError:
+        return False
 
-    reproducible = sum(1 for outputs in input_to_outputs.values() if len(outputs) == 1)
-    return reproducible / float(len(input_to_outputs))
 
+def status_ok(value):
+    return value.strip() == "OK"
 
-def summarize_arch(arch_runs, include_warmup):
-    adapter_calls = []
-    scene_transitions = []
-    audit_paths = []
 
-    for run in arch_runs:
-        adapter_csv = os.path.join(run, "adapter_calls.csv")
-        scene_csv = os.path.join(run, "scene_transitions.csv")
-        audit_paths.append(os.path.join(run, "audit.jsonl"))
-        if os.path.exists(adapter_csv):
-            adapter_calls.extend(load_csv_values(adapter_csv, "call_ms", include_warmup))
-        if os.path.exists(scene_csv):
-            scene_transitions.extend(load_csv_values(scene_csv, "transition_ms", include_warmup))
+Transport = namedtuple("Transport", ["name", "filename", "stages", "status_column", "is_ok"])
 
-    return {
-        "adapter_p50": percentile(adapter_calls, 0.50),
-        "adapter_p95": percentile(adapter_calls, 0.95),
-        "adapter_p99": percentile(adapter_calls, 0.99),
-        "scene_p50": percentile(scene_transitions, 0.50),
-        "scene_p95": percentile(scene_transitions, 0.95),
-        "scene_p99": percentile(scene_transitions, 0.99),
-        "repro": reproducibility_rate(audit_paths, include_warmup),
-    }
+BREAKDOWN_STAGES = ("serialize", "transport", "server_compute", "deserialize", "total")
+
+TRANSPORTS = (
+    Transport(
+        "B2 HTTP",
+        "b2_breakdown.csv",
+        {
+            "serialize": "t_client_serialize_ms",
+            "transport": "t_http_rtt_ms",
+            "server_compute": "t_server_compute_ms",
+            "deserialize": "t_client_deserialize_ms",
+            "total": "t_total_client_ms",
+        },
+        "http_status",
+        http_ok,
+    ),
+    Transport(
+        "R3 gRPC",
+        "r3_grpc_breakdown.csv",
+        {
+            "serialize": "t_client_serialize_ms",
+            "transport": "t_grpc_rtt_ms",
+            "server_compute": "t_server_compute_ms",
+            "deserialize": "t_client_deserialize_ms",
+            "total": "t_total_client_ms",
+        },
+        "grpc_status",
+        status_ok,
+    ),
+    Transport(
+        "R4 broker",
+        "r4_broker_breakdown.csv",
+        {
+            "serialize": "serialize_ms",
+            "transport": "broker_roundtrip_ms",
+            "server_compute": "server_compute_ms",
+            "deserialize": "deserialize_ms",
+            "total": "total_ms",
+        },
+        "status",
+        status_ok,
+    ),
+)
+
+
+class BreakdownStats:
+    def __init__(self, new_quantiles):
+        self.stages = {stage: new_quantiles() for stage in BREAKDOWN_STAGES}
+        self.response_bytes = new_quantiles()
+        self.requests = 0
+        self.failures = 0
+        self.retried = 0
+        self.retries = 0
+        self.timeouts = 0
+
+
+class BreakdownAggregator:
+    """Latency components plus failure/retry/timeout counts for one transport."""
+
+    def __init__(self, transport, new_quantiles):
+        self.transport = transport
+        self.files = (transport.filename,)
+        self.new_quantiles = new_quantiles
+        self.by_arch = {}
+
+    def consume(self, trial_file):
+        if not trial_file.row_count:
+            return
+        stats = self.by_arch.get(trial_file.arch)
+        if stats is None:
+            stats = self.by_arch[trial_file.arch] = BreakdownStats(self.new_quantiles)
+
+        for stage, column in self.transport.stages.items():
+            trial = self.new_quantiles()
+            trial.extend(trial_file.floats(column))
+            stats.stages[stage].merge(trial)
+
+        if trial_file.has("response_bytes"):
+            # Failed calls log 0 bytes; only answered requests count.
+            sizes = trial_file.floats("response_bytes")
+            if np is not None and isinstance(sizes, np.ndarray):
+                stats.response_bytes.extend(sizes[sizes > 0])
+            else:
+                stats.response_bytes.extend([value for value in sizes if value > 0])
+
+        stats.requests += trial_file.row_count
+        stats.failures += sum(
+            1 for value in trial_file.values(self.transport.status_column) if not self.transport.is_ok(str(value))
+        )
+        retries = trial_file.ints("retries_count")
+        stats.retries += int(sum(retries))
+        stats.retried += int(sum(1 for value in retries if value > 0))
+        stats.timeouts += int(sum(trial_file.ints("timeout_flag")))
+
+
+def parse_count(value):
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+class ReproducibilityAggregator:
+    """Per-arch reproducibility updated record by record from audit.jsonl (used by ``--follow``).
+
+    Same definition as :meth:`AuditIndex.reproducibility`: the share of distinct
+    inputs whose records all carry the same decision.
+    """
+
+    def __init__(self):
+        self.files = (AUDIT_FILE,)
+        self.results = defaultdict(dict)
+        self.conflicts = defaultdict(int)
+
+    def consume(self, trial_file):
+        results = self.results[trial_file.arch]
+        for record in trial_file.records:
+            row = parse_record(0, record)
+            key, result_hash = row[5], row[7]
+            seen = results.setdefault(key, result_hash)
+            if seen is not None and seen != result_hash:
+                # None marks an input that already produced two different decisions.
+                results[key] = None
+                self.conflicts[trial_file.arch] += 1
+
+    def get(self, arch):
+        total = len(self.results.get(arch, ()))
+        if not total:
+            return 0.0
+        return (total - self.conflicts[arch]) / float(total)
+
+
+class CountAggregator:
+    """Per-arch row counts of one file (e.g. service_errors.csv attempts)."""
+
+    def __init__(self, filename):
+        self.files = (filename,)
+        self.by_arch = defaultdict(int)
+
+    def consume(self, trial_file):
+        self.by_arch[trial_file.arch] += trial_file.row_count
+
+
+class PrewarmAggregator:
+    """Per-arch cost of each prewarm.csv step (one row per step, logged once per trial before session 0).
+
+    Only a handful of rows per trial, so the values are always kept exactly.
+    """
+
+    def __init__(self):
+        self.files = (PREWARM_FILE,)
+        self.by_arch = {}
+
+    def consume(self, trial_file):
+        steps = self.by_arch.setdefault(trial_file.arch, {})
+        for step, duration, ok in zip(trial_file.values("step"), trial_file.values("duration_ms"), trial_file.values("ok")):
+            stats = steps.get(step)
+            if stats is None:
+                stats = steps[step] = PrewarmStats()
+            stats.trials += 1
+            stats.failures += 0 if parse_count(ok) else 1
+            value = to_float(duration)
+            if not math.isnan(value):
+                stats.duration.add(value)
+
+
+class PrewarmStats:
+    def __init__(self):
+        self.duration = ExactQuantiles()
+        self.trials = 0
+        self.failures = 0
+
+
+def bootstrap_quantile_estimates(quantiles, ps, iterations, rng, max_cells=20_000_000):
+    """Return an (iterations x len(ps)) matrix of resampled quantiles, or None without data."""
+    values, counts = quantiles.support()
+    total = int(counts.sum())
+    if total == 0:
+        return None
+    probabilities = counts / float(total)
+    ranks = [(total - 1) * p for p in ps]
+    estimates = np.empty((iterations, len(ps)), dtype=np.float64)
+    chunk = max(1, min(iterations, max_cells // max(1, values.size)))
+    for start in range(0, iterations, chunk):
+        size = min(chunk, iterations - start)
+        cumulative = np.cumsum(rng.multinomial(total, probabilities, size=size), axis=1)
+        for column, rank in enumerate(ranks):
+            positions = np.minimum((cumulative <= rank).sum(axis=1), values.size - 1)
+            estimates[start:start + size, column] = values[positions]
+    return estimates
+
+
+def bootstrap_quantile_ci(quantiles, ps, iterations, confidence, rng, max_cells=20_000_000):
+    """Bootstrap CIs for several quantiles at once.
+
+    Resamples are drawn as a multinomial count matrix over the aggregator's
+    support (distinct values, or sketch buckets), so each chunk of resamples is
+    one (resamples x support) matrix; no per-resample Python loop is needed.
+    Returns {p: (low, high)} or None when there is no data.
+    """
+    estimates = bootstrap_quantile_estimates(quantiles, ps, iterations, rng, max_cells)
+    if estimates is None:
+        return None
+    alpha = (1.0 - confidence) / 2.0
+    low = np.quantile(estimates, alpha, axis=0)
+    high = np.quantile(estimates, 1.0 - alpha, axis=0)
+    return {p: (float(low[i]), float(high[i])) for i, p in enumerate(ps)}
+
+
+def write_confidence_intervals(out_root, metrics, iterations, confidence, seed):
+    rng = np.random.default_rng(seed)
+    md_lines = [
+        "| Arch | Metric | Quantile | Estimate | CI low | CI high |",
+        "| --- | --- | --- | --- | --- | --- |",
+    ]
+    csv_lines = ["arch,metric,quantile,estimate,ci_low,ci_high"]
+    for arch, metric, quantiles in metrics:
+        intervals = bootstrap_quantile_ci(quantiles, REPORT_QUANTILES, iterations, confidence, rng)
+        if intervals is None:
+            continue
+        for p in REPORT_QUANTILES:
+            low, high = intervals[p]
+            label = f"p{int(round(p * 100))}"
+            cells = (fmt(quantiles.quantile(p)), fmt(low), fmt(high))
+            md_lines.append(f"| {arch} | {metric} | {label} | " + " | ".join(cells) + " |")
+            csv_lines.append(f"{arch},{metric},{label}," + ",".join(cells))
+
+    ci_md = os.path.join(out_root, "summary_ci.md")
+    ci_csv = os.path.join(out_root, "summary_ci.csv")
+    header = f"Bootstrap {confidence:.0%} confidence intervals ({iterations} resamples, seed {seed})"
+    with open(ci_md, "w", encoding="utf-8") as handle:
+        handle.write("\n".join([header, ""] + md_lines))
+    with open(ci_csv, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(csv_lines))
+    print(f"Wrote {ci_md}")
+    print(f"Wrote {ci_csv}")
 
 
 def fmt(value):
@@ -130,89 +740,531 @@ def fmt(value):
     return f"{value:.3f}"
 
 
-def load_breakdown_values(paths, include_warmup):
-    columns = {
-        "t_client_serialize_ms": [],
-        "t_http_rtt_ms": [],
-        "t_server_compute_ms": [],
-        "t_client_deserialize_ms": [],
-        "t_total_client_ms": [],
-    }
-    for path in paths:
-        if not os.path.exists(path):
+def rate(numerator, denominator):
+    if not denominator:
+        return None
+    return numerator / float(denominator)
+
+
+def write_summary(output, runs, adapter_calls, scene_transitions, reproducibility, quiet=False):
+    lines = [
+        "| Arch | Adapter p50 | Adapter p95 | Adapter p99 | Scene p50 | Scene p95 | Scene p99 | Reproducibility |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+
+    for arch in sorted(runs.keys()):
+        adapter = adapter_calls.get(arch)
+        scene = scene_transitions.get(arch)
+        lines.append(
+            "| {arch} | {a50} | {a95} | {a99} | {s50} | {s95} | {s99} | {repro:.3f} |".format(
+                arch=arch,
+                a50=fmt(adapter.quantile(0.50)),
+                a95=fmt(adapter.quantile(0.95)),
+                a99=fmt(adapter.quantile(0.99)),
+                s50=fmt(scene.quantile(0.50)),
+                s95=fmt(scene.quantile(0.95)),
+                s99=fmt(scene.quantile(0.99)),
+                repro=reproducibility[arch],
+            )
+        )
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(lines))
+    if not quiet:
+        print(f"Wrote {output}")
+
+
+def write_breakdown(out_root, breakdowns, adapter_calls, service_errors, quiet=False):
+    stage_titles = " | ".join(f"{stage} p50 / p95 / p99" for stage in BREAKDOWN_STAGES)
+    md_lines = [
+        "| Arch | Transport | Requests | " + stage_titles + " |",
+        "| --- | --- | --- | " + " | ".join("---" for _ in BREAKDOWN_STAGES) + " |",
+    ]
+    rate_lines = [
+        "| Arch | Transport | Requests | Failure rate | Retry rate | Mean retries | Timeout rate | Service errors / call | Response bytes p50 |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    csv_lines = ["arch,transport,stage,count,p50,p95,p99"]
+    rates_csv_lines = ["arch,transport,requests,failure_rate,retry_rate,mean_retries,timeout_rate,service_error_rate,response_bytes_p50"]
+
+    for aggregator in breakdowns:
+        transport = aggregator.transport.name
+        for arch in sorted(aggregator.by_arch.keys()):
+            stats = aggregator.by_arch[arch]
+            cells = []
+            for stage in BREAKDOWN_STAGES:
+                quantiles = stats.stages[stage]
+                p50, p95, p99 = (quantiles.quantile(p) for p in (0.50, 0.95, 0.99))
+                cells.append(f"{fmt(p50)} / {fmt(p95)} / {fmt(p99)}")
+                csv_lines.append(
+                    f"{arch},{transport},{stage},{quantiles.count},{fmt(p50)},{fmt(p95)},{fmt(p99)}"
+                )
+            md_lines.append(f"| {arch} | {transport} | {stats.requests} | " + " | ".join(cells) + " |")
+
+            rates = (
+                rate(stats.failures, stats.requests),
+                rate(stats.retried, stats.requests),
+                rate(stats.retries, stats.requests),
+                rate(stats.timeouts, stats.requests),
+                rate(service_errors.by_arch.get(arch, 0), adapter_calls.get(arch).count),
+            )
+            response_bytes = fmt(stats.response_bytes.quantile(0.50))
+            rate_lines.append(
+                f"| {arch} | {transport} | {stats.requests} | "
+                + " | ".join(fmt(value) for value in rates)
+                + f" | {response_bytes} |"
+            )
+            rates_csv_lines.append(
+                f"{arch},{transport},{stats.requests}," + ",".join(fmt(value) for value in rates) + f",{response_bytes}"
+            )
+
+    summary_md = os.path.join(out_root, "summary_breakdown.md")
+    summary_csv = os.path.join(out_root, "summary_breakdown.csv")
+    rates_csv = os.path.join(out_root, "summary_rates.csv")
+    with open(summary_md, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(md_lines + [""] + rate_lines))
+    with open(summary_csv, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(csv_lines))
+    with open(rates_csv, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(rates_csv_lines))
+    if not quiet:
+        print(f"Wrote {summary_md}")
+        print(f"Wrote {summary_csv}")
+        print(f"Wrote {rates_csv}")
+
+
+def write_prewarm(out_root, prewarm, quiet=False):
+    """summary_prewarm.md/.csv: per arch and step, trial count, failures and duration p50 / p95 / max."""
+    if not prewarm.by_arch:
+        return
+    md_lines = [
+        "| Arch | Step | Trials | Failures | p50 | p95 | max |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    csv_lines = ["arch,step,trials,failures,p50,p95,max"]
+    for arch in sorted(prewarm.by_arch.keys()):
+        for step, stats in prewarm.by_arch[arch].items():
+            p50, p95, top = (fmt(stats.duration.quantile(p)) for p in (0.50, 0.95, 1.0))
+            md_lines.append(f"| {arch} | {step} | {stats.trials} | {stats.failures} | {p50} | {p95} | {top} |")
+            csv_lines.append(f"{arch},{step},{stats.trials},{stats.failures},{p50},{p95},{top}")
+
+    prewarm_md = os.path.join(out_root, "summary_prewarm.md")
+    prewarm_csv = os.path.join(out_root, "summary_prewarm.csv")
+    with open(prewarm_md, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(md_lines))
+    with open(prewarm_csv, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(csv_lines))
+    if not quiet:
+        print(f"Wrote {prewarm_md}")
+        print(f"Wrote {prewarm_csv}")
+
+
+COMPARE_QUANTILES = REPORT_QUANTILES
+COMPARE_COLUMNS = (
+    "metric",
+    "baseline_n",
+    "candidate_n",
+    "baseline_p50",
+    "candidate_p50",
+    "p50_change_pct",
+    "baseline_p95",
+    "candidate_p95",
+    "p95_change_pct",
+    "baseline_p99",
+    "candidate_p99",
+    "p99_change_pct",
+    "cliffs_delta",
+    "mann_whitney_u",
+    "p_value",
+    "bootstrap_ci",
+    "verdict",
+)
+SESSION_METRICS = (
+    ("adapter_ms", "adapter_call_ms"),
+    ("scene_ms", "scene_transition_ms"),
+    ("net_ms", "adapter_net_ms"),
+    ("local_ms", "adapter_local_ms"),
+    ("frame_p99_ms", "frame_p99_ms"),
+)
+
+
+def resolve_run_dir(out_root, spec):
+    """Map ``ARCH/RUN_TS``, ``ARCH/latest``, ``ARCH/previous`` or a directory path to a run folder."""
+    if os.path.isdir(spec):
+        return os.path.normpath(spec)
+    arch, _, run_ts = spec.replace("\\", "/").partition("/")
+    arch_path = os.path.join(out_root, arch)
+    if run_ts in ("latest", "previous") and os.path.isdir(arch_path):
+        run_names = sorted(name for name in os.listdir(arch_path) if os.path.isdir(os.path.join(arch_path, name)))
+        offset = 1 if run_ts == "latest" else 2
+        if len(run_names) < offset:
+            raise ValueError(f"{arch} has {len(run_names)} runs; '{spec}' does not exist")
+        run_ts = run_names[-offset]
+    run_path = os.path.join(arch_path, run_ts)
+    if not run_ts or not os.path.isdir(run_path):
+        raise ValueError(f"Run '{spec}' not found under {out_root}")
+    return run_path
+
+
+def load_run_metrics(run_path, include_warmup, vectorized):
+    """Every latency sample of one run folder, keyed by metric name."""
+    trials = sorted(
+        os.path.join(run_path, name) for name in os.listdir(run_path) if os.path.isdir(os.path.join(run_path, name))
+    )
+    label = os.path.basename(run_path)
+    engine = ScanEngine(include_warmup, vectorized=vectorized)
+    adapter_calls = engine.register(LatencyAggregator("adapter_calls.csv", "call_ms", ExactQuantiles))
+    scene_transitions = engine.register(LatencyAggregator("scene_transitions.csv", "transition_ms", ExactQuantiles))
+    breakdowns = [engine.register(BreakdownAggregator(transport, ExactQuantiles)) for transport in TRANSPORTS]
+    prewarm = engine.register(PrewarmAggregator())
+    engine.scan({label: trials})
+
+    metrics = {}
+    for name, aggregator in (("adapter_call_ms", adapter_calls), ("scene_transition_ms", scene_transitions)):
+        if label in aggregator.by_arch:
+            metrics[name] = aggregator.by_arch[label].values
+    for aggregator in breakdowns:
+        stats = aggregator.by_arch.get(label)
+        if stats is None:
             continue
-        with open(path, "r", encoding="utf-8") as handle:
-            header = next(handle, None)
-            if not header:
+        for stage in BREAKDOWN_STAGES:
+            metrics[f"{aggregator.transport.name} {stage}_ms"] = stats.stages[stage].values
+        if stats.response_bytes.count:
+            metrics[f"{aggregator.transport.name} response_bytes"] = stats.response_bytes.values
+    total = prewarm.by_arch.get(label, {}).get("total")
+    if total is not None and total.duration.count:
+        metrics["prewarm total_ms"] = total.duration.values
+    return metrics
+
+
+def load_session_metrics(path, filters, include_warmup):
+    """Latency columns of the all_sessions.csv rows matching every ``column=value`` filter."""
+    metrics = defaultdict(list)
+    with open(path, "r", newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle)
+        missing = [column for column in filters if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{path} has no column(s) {', '.join(missing)}")
+        for row in reader:
+            if any(row[column] != value for column, value in filters.items()):
                 continue
-            headers = header.strip().split(",")
-            idx = {name: headers.index(name) for name in columns.keys() if name in headers}
-            warmup_index = headers.index("warmup") if "warmup" in headers else None
-            for line in handle:
-                parts = line.strip().split(",")
-                if warmup_index is not None and not include_warmup:
-                    try:
-                        if int(parts[warmup_index]) == 1:
-                            continue
-                    except (ValueError, IndexError):
-                        pass
-                for name, values in columns.items():
-                    col_index = idx.get(name)
-                    if col_index is None or len(parts) <= col_index:
-                        continue
+            if not include_warmup and row.get("warmup") == "1":
+                continue
+            for column, metric in SESSION_METRICS:
+                if column == "scene_ms" and row.get("has_scene") == "0":
+                    continue
+                value = row.get(column)
+                if value:
                     try:
-                        values.append(float(parts[col_index]))
+                        metrics[metric].append(float(value))
                     except ValueError:
                         continue
-    return columns
+    return dict(metrics)
+
+
+def load_compare_side(spec, args):
+    """Return (label, metrics) for a run spec or an ``all_sessions.csv[@col=value,...]`` slice."""
+    path, at, query = spec.rpartition("@")
+    if not at or "=" not in query:
+        path, query = spec, ""
+    if path.lower().endswith(".csv"):
+        filters = {}
+        for pair in filter(None, query.split(",")):
+            column, sep, value = pair.partition("=")
+            if not sep:
+                raise ValueError(f"Slice filter '{pair}' is not column=value")
+            filters[column.strip()] = value.strip()
+        return spec, load_session_metrics(path, filters, args.include_warmup)
+
+    run_path = resolve_run_dir(args.input, spec)
+    label = os.path.relpath(run_path, args.input) if not os.path.isdir(spec) else spec
+    return label, load_run_metrics(run_path, args.include_warmup, args.loader != "python" and np is not None)
+
+
+def mann_whitney(baseline, candidate):
+    """Two-sided Mann-Whitney U test (normal approximation, tie-corrected).
+
+    Returns (U of the candidate, p-value, Cliff's delta). The delta is
+    P(candidate > baseline) - P(candidate < baseline): positive means slower.
+    """
+    n_base, n_cand = len(baseline), len(candidate)
+    pooled = sorted([(value, 0) for value in baseline] + [(value, 1) for value in candidate])
+    n = len(pooled)
+    rank_sum = 0.0
+    tie_term = 0.0
+    start = 0
+    while start < n:
+        end = start
+        while end + 1 < n and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        ties = end - start + 1
+        average_rank = (start + end) / 2.0 + 1.0
+        rank_sum += average_rank * sum(group for _, group in pooled[start:end + 1])
+        tie_term += ties ** 3 - ties
+        start = end + 1
+
+    u = rank_sum - n_cand * (n_cand + 1) / 2.0
+    mean = n_base * n_cand / 2.0
+    variance = n_base * n_cand / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        p_value = 1.0
+    else:
+        z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+        p_value = min(1.0, math.erfc(max(0.0, z) / math.sqrt(2.0)))
+    delta = 2.0 * u / (n_base * n_cand) - 1.0
+    return u, p_value, delta
+
+
+def change_pct(baseline, candidate):
+    if baseline is None or candidate is None:
+        return None
+    if baseline <= 0:
+        # No percentage exists for a zero baseline (e.g. stages rounded to 0.000); any move away from it is unbounded.
+        if candidate == baseline:
+            return 0.0
+        return math.inf if candidate > baseline else -math.inf
+    return (candidate - baseline) / baseline * 100.0
+
+
+def compare_metric(name, baseline, candidate, args, rng):
+    base, cand = ExactQuantiles(), ExactQuantiles()
+    base.extend(baseline)
+    cand.extend(candidate)
+    row = {"metric": name, "baseline_n": base.count, "candidate_n": cand.count}
+    changes = {}
+    shifts = {}
+    for p in COMPARE_QUANTILES:
+        label = f"p{int(round(p * 100))}"
+        base_q, cand_q = base.quantile(p), cand.quantile(p)
+        changes[p] = change_pct(base_q, cand_q)
+        shifts[p] = abs(cand_q - base_q) if base_q is not None and cand_q is not None else 0.0
+        row[f"baseline_{label}"] = fmt(base_q)
+        row[f"candidate_{label}"] = fmt(cand_q)
+        row[f"{label}_change_pct"] = fmt(changes[p])
+
+    # The rank test needs at least one value on each side, whatever --min-samples says.
+    if min(base.count, cand.count) < max(1, args.min_samples):
+        row.update(cliffs_delta="n/a", mann_whitney_u="n/a", p_value="n/a", bootstrap_ci="", verdict="insufficient")
+        return row
 
+    u, p_value, delta = mann_whitney(base.values, cand.values)
+    row["cliffs_delta"] = f"{delta:.3f}"
+    row["mann_whitney_u"] = f"{u:.1f}"
+    row["p_value"] = f"{p_value:.3g}"
 
-def write_breakdown(out_root, include_warmup):
-    runs = collect_runs(out_root)
-    b2_runs = runs.get("B2", [])
-    breakdown_paths = [os.path.join(run, "b2_breakdown.csv") for run in b2_runs]
-    values = load_breakdown_values(breakdown_paths, include_warmup)
+    # A quantile only counts once its shift is past the threshold and, with
+    # --bootstrap, its difference interval excludes zero in the same direction.
+    confirmed = {p: True for p in COMPARE_QUANTILES}
+    row["bootstrap_ci"] = ""
+    if args.bootstrap > 0:
+        base_est = bootstrap_quantile_estimates(base, COMPARE_QUANTILES, args.bootstrap, rng)
+        cand_est = bootstrap_quantile_estimates(cand, COMPARE_QUANTILES, args.bootstrap, rng)
+        alpha = (1.0 - args.confidence) / 2.0
+        difference = cand_est - base_est
+        low = np.quantile(difference, alpha, axis=0)
+        high = np.quantile(difference, 1.0 - alpha, axis=0)
+        cells = []
+        for i, p in enumerate(COMPARE_QUANTILES):
+            confirmed[p] = low[i] > 0 or high[i] < 0
+            cells.append(f"p{int(round(p * 100))}:[{low[i]:.3f};{high[i]:.3f}]")
+        row["bootstrap_ci"] = " ".join(cells)
 
-    summary = {
-        name: {
-            "p50": percentile(vals, 0.50),
-            "p95": percentile(vals, 0.95),
-            "p99": percentile(vals, 0.99),
-        }
-        for name, vals in values.items()
-    }
+    significant = p_value < args.alpha and abs(delta) >= args.min_effect
+    moved = {p: changes[p] is not None and shifts[p] > args.min_shift and confirmed[p] for p in COMPARE_QUANTILES}
+    slower = [p for p in COMPARE_QUANTILES if moved[p] and changes[p] > args.max_increase_pct]
+    faster = [p for p in COMPARE_QUANTILES if moved[p] and changes[p] < -args.max_increase_pct]
+    if significant and delta > 0 and slower:
+        row["verdict"] = "regression"
+    elif significant and delta < 0 and faster:
+        row["verdict"] = "improvement"
+    else:
+        row["verdict"] = "no_change"
+    return row
 
+
+def run_compare(args):
+    """Compare a baseline and a candidate run; returns the process exit code."""
+    baseline_spec, candidate_spec = args.compare
+    try:
+        baseline_label, baseline = load_compare_side(baseline_spec, args)
+        candidate_label, candidate = load_compare_side(candidate_spec, args)
+    except (OSError, ValueError) as ex:
+        print(f"Compare failed: {ex}")
+        return 2
+
+    names = sorted(set(baseline) & set(candidate))
+    if args.metric:
+        names = [name for name in names if any(selected in name for selected in args.metric)]
+    if not names:
+        print(f"No metric is present in both {baseline_label} and {candidate_label}")
+        return 2
+
+    rng = np.random.default_rng(args.bootstrap_seed) if np is not None else None
+    rows = [compare_metric(name, baseline[name], candidate[name], args, rng) for name in names]
+    regressions = [row for row in rows if row["verdict"] == "regression"]
+
+    output = args.compare_output or os.path.join(args.input, "compare.md")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    header = (
+        f"Baseline `{baseline_label}` vs candidate `{candidate_label}`: Mann-Whitney U (alpha {args.alpha}), "
+        f"|Cliff's delta| >= {args.min_effect}, quantile shift > {args.max_increase_pct}%"
+    )
+    if args.min_shift > 0:
+        header += f" and > {args.min_shift} absolute"
+    if args.bootstrap > 0:
+        header += f", {args.confidence:.0%} bootstrap CI of the difference ({args.bootstrap} resamples)"
     md_lines = [
-        "| Component | p50 | p95 | p99 |",
-        "| --- | --- | --- | --- |",
+        header,
+        "",
+        "| Metric | n base / cand | p50 base / cand (%) | p95 base / cand (%) | p99 base / cand (%) | Cliff's delta | p-value | Verdict |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
     ]
-    csv_lines = ["component,p50,p95,p99"]
-    for name in sorted(summary.keys()):
+    for row in rows:
+        quantile_cells = [
+            f"{row[f'baseline_{label}']} / {row[f'candidate_{label}']} ({row[f'{label}_change_pct']})"
+            for label in ("p50", "p95", "p99")
+        ]
         md_lines.append(
-            "| {component} | {p50} | {p95} | {p99} |".format(
-                component=name,
-                p50=fmt(summary[name]["p50"]),
-                p95=fmt(summary[name]["p95"]),
-                p99=fmt(summary[name]["p99"]),
-            )
+            f"| {row['metric']} | {row['baseline_n']} / {row['candidate_n']} | "
+            + " | ".join(quantile_cells)
+            + f" | {row['cliffs_delta']} | {row['p_value']} | {row['verdict']} |"
         )
-        csv_lines.append(
-            "{component},{p50},{p95},{p99}".format(
-                component=name,
-                p50=fmt(summary[name]["p50"]),
-                p95=fmt(summary[name]["p95"]),
-                p99=fmt(summary[name]["p99"]),
-            )
+    md_lines += ["", f"Verdict: {'REGRESSION' if regressions else 'PASS'} ({len(regressions)} of {len(rows)} metrics regressed)"]
+    with open(output, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(md_lines))
+    compare_csv = os.path.splitext(output)[0] + ".csv"
+    with open(compare_csv, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=COMPARE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    for row in rows:
+        print(
+            f"{row['verdict']:<12} {row['metric']:<32} p50 {row['p50_change_pct']:>8}% "
+            f"p99 {row['p99_change_pct']:>8}% delta={row['cliffs_delta']} p={row['p_value']}"
         )
+    print(f"Wrote {output}")
+    print(f"Wrote {compare_csv}")
+    return 1 if regressions else 0
 
-    summary_md = os.path.join(out_root, "summary_breakdown.md")
-    summary_csv = os.path.join(out_root, "summary_breakdown.csv")
-    with open(summary_md, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(md_lines))
-    with open(summary_csv, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(csv_lines))
-    print(f"Wrote {summary_md}")
-    print(f"Wrote {summary_csv}")
+
+def follow_runs(args, run_paths):
+    """Trial folders to follow: the given run folders (keyed by their arch folder) or the whole input tree."""
+    if not run_paths:
+        return collect_runs(args.input)
+    runs = defaultdict(list)
+    for run_path in run_paths:
+        arch = os.path.basename(os.path.dirname(os.path.abspath(run_path)))
+        for name in os.listdir(run_path):
+            trial_path = os.path.join(run_path, name)
+            if os.path.isdir(trial_path):
+                runs[arch].append(trial_path)
+    return runs
+
+
+class LiveReport:
+    """The aggregators behind ``--follow``, fed incrementally by a FollowEngine."""
+
+    def __init__(self, args):
+        new_quantiles = quantile_factory(args.exact, args.sketch_accuracy)
+        self.engine = FollowEngine(args.include_warmup)
+        self.adapter_calls = self.engine.register(LatencyAggregator("adapter_calls.csv", "call_ms", new_quantiles))
+        self.scene_transitions = self.engine.register(
+            LatencyAggregator("scene_transitions.csv", "transition_ms", new_quantiles)
+        )
+        self.service_errors = self.engine.register(CountAggregator("service_errors.csv"))
+        self.breakdowns = [self.engine.register(BreakdownAggregator(transport, new_quantiles)) for transport in TRANSPORTS]
+        self.reproducibility = self.engine.register(ReproducibilityAggregator())
+
+    def write(self, args, runs):
+        reproducibility = {arch: self.reproducibility.get(arch) for arch in runs}
+        write_summary(args.output, runs, self.adapter_calls, self.scene_transitions, reproducibility, quiet=True)
+        write_breakdown(args.input, self.breakdowns, self.adapter_calls, self.service_errors, quiet=True)
+
+    def table(self, runs):
+        lines = [
+            f"{'Arch':<20} {'Calls':>7} {'Adapter p50':>11} {'p95':>9} {'p99':>9} {'Scene p99':>9} {'Repro':>6}",
+        ]
+        for arch in sorted(runs):
+            adapter = self.adapter_calls.get(arch)
+            lines.append(
+                f"{arch:<20} {adapter.count:>7} {fmt(adapter.quantile(0.50)):>11} {fmt(adapter.quantile(0.95)):>9} "
+                f"{fmt(adapter.quantile(0.99)):>9} {fmt(self.scene_transitions.get(arch).quantile(0.99)):>9} "
+                f"{self.reproducibility.get(arch):>6.3f}"
+            )
+        for aggregator in self.breakdowns:
+            for arch in sorted(aggregator.by_arch):
+                stats = aggregator.by_arch[arch]
+                total = stats.stages["total"]
+                lines.append(
+                    f"  {arch} {aggregator.transport.name}: {stats.requests} requests, total p50 "
+                    f"{fmt(total.quantile(0.50))} / p99 {fmt(total.quantile(0.99))} ms, "
+                    f"failure rate {fmt(rate(stats.failures, stats.requests))}, "
+                    f"timeout rate {fmt(rate(stats.timeouts, stats.requests))}"
+                )
+        return lines
+
+    def over_budget(self, runs, max_p99_ms, min_samples):
+        """Archs whose adapter p99 exceeds ``max_p99_ms`` once they have ``min_samples`` calls."""
+        failing = []
+        for arch in sorted(runs):
+            adapter = self.adapter_calls.get(arch)
+            p99 = adapter.quantile(0.99)
+            if adapter.count >= min_samples and p99 is not None and p99 > max_p99_ms:
+                failing.append((arch, p99))
+        return failing
+
+
+def run_follow(args):
+    """Tail the trial files while an experiment is running; returns the process exit code."""
+    try:
+        run_paths = [resolve_run_dir(args.input, spec) for spec in args.run or ()]
+    except ValueError as ex:
+        print(f"Follow failed: {ex}")
+        return 2
+
+    live = LiveReport(args)
+    last_data = time.monotonic()
+    refreshed = False
+    print(f"Following {', '.join(run_paths) or args.input} every {args.interval:g}s (Ctrl+C to stop)")
+    try:
+        while True:
+            runs = follow_runs(args, run_paths)
+            try:
+                new_rows = live.engine.scan(runs)
+            except FileRewritten as ex:
+                # Sketches cannot forget rows, so a replaced file means starting over.
+                print(f"{ex} was rewritten; rescanning from the start")
+                live = LiveReport(args)
+                refreshed = False
+                continue
+            now = time.monotonic()
+            if new_rows or not refreshed:
+                last_data = now
+                refreshed = True
+                live.write(args, runs)
+                print("")
+                print(
+                    f"[{time.strftime('%H:%M:%S')}] {live.engine.trials_scanned} trials, "
+                    f"{live.engine.rows_read} rows (+{new_rows})"
+                )
+                for line in live.table(runs):
+                    print(line)
+
+            if args.max_p99_ms is not None:
+                failing = live.over_budget(runs, args.max_p99_ms, args.min_samples)
+                if failing:
+                    for arch, p99 in failing:
+                        print(f"{arch}: adapter p99 {fmt(p99)} ms exceeds --max-p99-ms {args.max_p99_ms:g}")
+                    return 1
+            if args.idle_exit > 0 and now - last_data >= args.idle_exit:
+                print(f"No new rows for {args.idle_exit:g}s; stopping")
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("Stopped")
+        return 0
 
 
 def main():
@@ -220,36 +1272,126 @@ def main():
     parser.add_argument("--input", default=os.path.join("Experiments", "out"))
     parser.add_argument("--output", default=os.path.join("Experiments", "out", "summary.md"))
     parser.add_argument("--include-warmup", action="store_true")
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Keep every value and compute exact percentiles instead of using quantile sketches.",
+    )
+    parser.add_argument(
+        "--sketch-accuracy",
+        type=float,
+        default=DEFAULT_SKETCH_ACCURACY,
+        help="Relative error bound of the quantile sketches (default: 0.01 = 1%%).",
+    )
+    parser.add_argument(
+        "--loader",
+        choices=("auto", "numpy", "python"),
+        default="auto",
+        help="CSV loader: numpy parses whole columns at once (default when numpy is installed).",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Write bootstrap confidence intervals for p50/p95/p99 using N resamples (requires numpy).",
+    )
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--bootstrap-seed", type=int, default=12345)
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CANDIDATE"),
+        help="Compare two runs instead of summarizing: ARCH/RUN_TS, ARCH/latest, ARCH/previous, a run folder, "
+        "or all_sessions.csv@column=value,... Exits with 1 when any metric regressed.",
+    )
+    parser.add_argument("--compare-output", default=None, help="Default: <input>/compare.md (plus compare.csv).")
+    parser.add_argument("--metric", action="append", default=None, help="Only compare metrics containing this text.")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the Mann-Whitney test.")
+    parser.add_argument(
+        "--min-effect",
+        type=float,
+        default=0.147,
+        help="Smallest |Cliff's delta| that counts (0.147 separates negligible from small).",
+    )
+    parser.add_argument(
+        "--max-increase-pct",
+        type=float,
+        default=5.0,
+        help="A regression needs p50, p95 or p99 to grow by more than this many percent.",
+    )
+    parser.add_argument(
+        "--min-shift",
+        type=float,
+        default=0.0,
+        help="A quantile shift must also exceed this absolute amount, in the metric's unit (ms; bytes for response_bytes).",
+    )
+    parser.add_argument("--min-samples", type=int, default=20)
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Tail the trial files of a running experiment and refresh the summaries every --interval seconds.",
+    )
+    parser.add_argument(
+        "--run",
+        action="append",
+        default=None,
+        metavar="SPEC",
+        help="With --follow: only follow this run (ARCH/RUN_TS, ARCH/latest or a run folder; repeatable).",
+    )
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between --follow refreshes.")
+    parser.add_argument(
+        "--idle-exit",
+        type=float,
+        default=0.0,
+        help="Stop following after this many seconds without new rows (default: 0 = never).",
+    )
+    parser.add_argument(
+        "--max-p99-ms",
+        type=float,
+        default=None,
+        help="Stop following with exit code 1 once an arch's adapter p99 exceeds this (after --min-samples calls).",
+    )
     args = parser.parse_args()
+    if np is None and (args.loader == "numpy" or args.bootstrap > 0):
+        parser.error("--loader numpy and --bootstrap require numpy")
+    if args.compare:
+        raise SystemExit(run_compare(args))
+    if args.follow:
+        raise SystemExit(run_follow(args))
+    new_quantiles = quantile_factory(args.exact, args.sketch_accuracy)
 
     runs = collect_runs(args.input)
-    lines = [
-        "| Arch | Adapter p50 | Adapter p95 | Adapter p99 | Scene p50 | Scene p95 | Scene p99 | Reproducibility |",
-        "| --- | --- | --- | --- | --- | --- | --- | --- |",
-    ]
+    engine = ScanEngine(args.include_warmup, vectorized=args.loader != "python")
+    adapter_calls = engine.register(LatencyAggregator("adapter_calls.csv", "call_ms", new_quantiles))
+    scene_transitions = engine.register(LatencyAggregator("scene_transitions.csv", "transition_ms", new_quantiles))
+    service_errors = engine.register(CountAggregator("service_errors.csv"))
+    breakdowns = [engine.register(BreakdownAggregator(transport, new_quantiles)) for transport in TRANSPORTS]
+    prewarm = engine.register(PrewarmAggregator())
+    engine.scan(runs)
+    print(f"Scanned {engine.trials_scanned} trials ({engine.files_read} files, each read once)")
 
-    for arch in sorted(runs.keys()):
-        summary = summarize_arch(runs[arch], args.include_warmup)
-        lines.append(
-            "| {arch} | {a50} | {a95} | {a99} | {s50} | {s95} | {s99} | {repro:.3f} |".format(
-                arch=arch,
-                a50=fmt(summary["adapter_p50"]),
-                a95=fmt(summary["adapter_p95"]),
-                a99=fmt(summary["adapter_p99"]),
-                s50=fmt(summary["scene_p50"]),
-                s95=fmt(summary["scene_p95"]),
-                s99=fmt(summary["scene_p99"]),
-                repro=summary["repro"],
-            )
+    with AuditIndex(os.path.join(args.input, INDEX_FILE)) as index:
+        indexed = index.refresh(
+            [(arch, trial_path) for arch in sorted(runs) for trial_path in runs[arch]],
+            prune=True,
         )
+        reproducibility = {arch: index.reproducibility(arch, args.include_warmup) for arch in runs}
+    print(f"Audit index: {indexed} audit logs (re)indexed")
 
-    os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(lines))
-
-    print(f"Wrote {args.output}")
+    write_summary(args.output, runs, adapter_calls, scene_transitions, reproducibility)
+    write_breakdown(args.input, breakdowns, adapter_calls, service_errors)
+    write_prewarm(args.input, prewarm)
 
-    write_breakdown(args.input, args.include_warmup)
+    if args.bootstrap > 0:
+        metrics = []
+        for arch in sorted(runs.keys()):
+            metrics.append((arch, "adapter_call_ms", adapter_calls.get(arch)))
+            metrics.append((arch, "scene_transition_ms", scene_transitions.get(arch)))
+        for aggregator in breakdowns:
+            for arch in sorted(aggregator.by_arch.keys()):
+                metrics.append((arch, f"{aggregator.transport.name} total_ms", aggregator.by_arch[arch].stages["total"]))
+        write_confidence_intervals(args.input, metrics, args.bootstrap, args.confidence, args.bootstrap_seed)
 
 
 if __name__ == "__main__":
@@ -2,8 +2,9 @@ param(
     [int]$Trials = 3,
     [int]$Sessions = 10,
     [int]$WarmupSessions = 5,
+    [switch]$NoPrewarm,
     [int]$Seed = 1234,
     [string]$UnityPath = $env:UNITY_PATH
 )
 
-& "$PSScriptRoot\run_common.ps1" -Arch "B1" -Trials $Trials -Sessions $Sessions -WarmupSessions $WarmupSessions -Seed $Seed -UnityPath $UnityPath
+& "$PSScriptRoot\run_common.ps1" -Arch "B1" -Trials $Trials -Sessions $Sessions -WarmupSessions $WarmupSessions -NoPrewarm:$NoPrewarm -Seed $Seed -UnityPath $UnityPath
@@ -1,3 +1,7 @@
+param(
+    [int]$BlockRecords = 256
+)
+
 $ErrorActionPreference = "Stop"
 Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass
 
@@ -5,10 +9,10 @@ $timestamp = Get-Date -Format "yyyyMMdd_HHmmss"
 $outRoot = Join-Path "Experiments/out/E2" $timestamp
 New-Item -ItemType Directory -Path $outRoot -Force | Out-Null
 
-$modes = @("none","jsonl","otel","prov")
+$modes = @("none","jsonl","otel","prov","blocks")
 foreach ($mode in $modes) {
     Write-Host ("Running mode " + $mode + "...")
-    dotnet run --project Experiments/E2_AuditBench --configuration Release -- --mode $mode --sessions 10000 --warmup 1000 --flush per_session --outdir $outRoot
+    dotnet run --project Experiments/E2_AuditBench --configuration Release -- --mode $mode --sessions 10000 --warmup 1000 --flush per_session --blockRecords $BlockRecords --outdir $outRoot
 }
 
 $metricsByMode = @{}
@@ -41,10 +45,16 @@ $summaryRows = foreach ($mode in $modes) {
         delta_total_p95_us_vs_none = [double]$entry.TotalP95Us - $baseP95
         bytes_total = [double]$entry.BytesTotal
         bytes_per_session_mean = [double]$entry.BytesPerSessionMean
+        storage_bytes = [double]$entry.StorageBytes
+        audit_total_us = [double]$entry.AuditTotalUs
         replay_match_ratio = [double]$entry.ReplayMatchRatio
         q1_ms = [double]$entry.Q1Ms
         q2_ms = [double]$entry.Q2Ms
         q3_ms = [double]$entry.Q3Ms
+        query_load_ms = [double]$entry.QueryLoadMs
+        query_blocks_read = $entry.QueryBlocksRead
+        query_blocks_total = $entry.QueryBlocksTotal
+        replay_ms = [double]$entry.ReplayMs
     }
 }
 
@@ -62,6 +72,9 @@ $replayRecords = foreach ($mode in $modes) {
         sessions_total = $entry.ReplaySessionsTotal
         sessions_matched = $entry.ReplaySessionsMatched
         match_ratio = $entry.ReplayMatchRatio
+        replay_ms = [double]$entry.ReplayMs
+        blocks_read = $entry.ReplayBlocksRead
+        blocks_skipped = $entry.ReplayBlocksSkipped
     }
 }
 
@@ -1,3 +1,10 @@
+param(
+    [int]$Sessions = 10000,
+    [int]$SnapshotEvery = 100,
+    [int]$BatchSize = 32,
+    [string]$RestoreTargets = ""
+)
+
 $ErrorActionPreference = "Stop"
 Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass
 
@@ -8,8 +15,13 @@ New-Item -ItemType Directory -Path $outRoot -Force | Out-Null
 Write-Host "Building E3 benchmark..."
 dotnet build Experiments/E3_ProfileStorageBench -c Release
 
+$benchArgs = @("--outdir", $outRoot, "--sessions", $Sessions, "--snapshotEvery", $SnapshotEvery, "--batchSize", $BatchSize)
+if ($RestoreTargets) {
+    $benchArgs += @("--restoreTargets", $RestoreTargets)
+}
+
 Write-Host "Running storage benchmark..."
-dotnet run --project Experiments/E3_ProfileStorageBench --configuration Release -- --outdir $outRoot
+dotnet run --project Experiments/E3_ProfileStorageBench --configuration Release -- @benchArgs
 
 $summaryPath = Join-Path $outRoot "summary.csv"
 Write-Host "Experiment outputs saved to $outRoot"
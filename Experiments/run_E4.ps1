@@ -0,0 +1,39 @@
+$ErrorActionPreference = 'Stop'
+
+$projectPath = "Experiments/E4_EngineBenchmark"
+$csproj = Join-Path $projectPath "E4_EngineBenchmark.csproj"
+$projectResultsFolder = Join-Path $projectPath "BenchmarkDotNet.Artifacts\results"
+$rootResultsFolder = Join-Path (Get-Location) "BenchmarkDotNet.Artifacts\results"
+$timestamp = Get-Date -Format "yyyyMMdd_HHmmss"
+$outFolder = Join-Path "Experiments/out/E4" $timestamp
+
+Write-Host "Building release binaries..."
+dotnet build $csproj -c Release
+
+Write-Host "Running engine benchmarks (Release)..."
+dotnet run --project $csproj -c Release --no-build
+
+# BenchmarkDotNet creates its artifacts folder during the run, so look it up only now.
+$resultsFolder = if (Test-Path $projectResultsFolder) {
+    $projectResultsFolder
+} elseif (Test-Path $rootResultsFolder) {
+    $rootResultsFolder
+} else {
+    throw "BenchmarkDotNet results folder not found."
+}
+
+if (Test-Path $outFolder)
+{
+    Write-Host "Cleaning previous output directory $outFolder"
+    Remove-Item $outFolder -Recurse -Force
+}
+
+New-Item -ItemType Directory -Path $outFolder -Force | Out-Null
+
+Write-Host "Copying benchmark artifacts to $outFolder"
+Copy-Item -Path (Join-Path $resultsFolder "*") -Destination $outFolder -Recurse -Force
+
+$reportCsv = Join-Path $outFolder "E4_EngineBenchmark.EngineBenchmarks-report.csv"
+
+Write-Host "Benchmark results archived to $outFolder"
+Write-Host "Report CSV (Mean ns/op, Allocated B/op): $reportCsv"
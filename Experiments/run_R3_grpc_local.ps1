@@ -2,9 +2,13 @@
     [int]$Trials = 3,
     [int]$Sessions = 10,
     [int]$WarmupSessions = 5,
+    [switch]$NoPrewarm,
     [int]$Seed = 1234,
-    [string]$GrpcUrl = "http://127.0.0.1:6002",
+    [string]$GrpcUrl = "",
     [string]$HealthUrl = "http://127.0.0.1:6003",
+    [string]$StreamUrl = "http://127.0.0.1:6004",
+    [ValidateSet("web_text", "web", "http2")][string]$GrpcMode = "web",
+    [int]$GrpcProtoVersion = 2,
     [int]$ServiceTimeoutMs = 3000,
     [int]$ServiceRetries = 1,
     [int]$ServiceRetryDelayMs = 250,
@@ -13,6 +17,20 @@
 
 $ErrorActionPreference = "Stop"
 
+# GrpcUrl serves HTTP/1.1 and HTTP/2 on one port (gRPC-Web); native gRPC needs the h2c-only StreamUrl.
+if ($GrpcMode -eq "http2") {
+    if ($GrpcUrl) {
+        throw "-GrpcMode http2 cannot use -GrpcUrl $GrpcUrl (mixed HTTP/1.1 and HTTP/2 endpoint). Leave -GrpcUrl unset and set the h2c endpoint with -StreamUrl."
+    }
+    $GrpcUrl = "http://127.0.0.1:6002"
+    $clientUrl = $StreamUrl
+} else {
+    if (-not $GrpcUrl) {
+        $GrpcUrl = "http://127.0.0.1:6002"
+    }
+    $clientUrl = $GrpcUrl
+}
+
 function Quote-Arg {
     param([string]$Arg)
     if ($Arg -match "\s") { return '"' + $Arg + '"' }
@@ -54,7 +72,8 @@ for ($i = 0; $i -lt $Trials; $i++) {
         "--ConfigVersion", "v1",
         "--AuditRoot", (Quote-Arg $trialDir),
         "--GrpcUrl", $GrpcUrl,
-        "--HealthUrl", $HealthUrl
+        "--HealthUrl", $HealthUrl,
+        "--StreamUrl", $StreamUrl
     )
 
     $serviceCmd = '"' + $dotnet + '" ' + ($serviceArgs -join ' ')
@@ -98,7 +117,7 @@ for ($i = 0; $i -lt $Trials; $i++) {
         throw "ServiceGrpc did not become ready at $healthEndpoint"
     }
 
-    & "$PSScriptRoot\run_common.ps1" -Arch "R3_grpc" -AdapterName "R3_remote_gRPC" -Trials 1 -Sessions $Sessions -WarmupSessions $WarmupSessions -Seed ($Seed + $i) -UnityPath $unityPath -ServiceGrpcUrl $GrpcUrl -ServiceTimeoutMs $ServiceTimeoutMs -ServiceRetries $ServiceRetries -ServiceRetryDelayMs $ServiceRetryDelayMs | Out-Null
+    & "$PSScriptRoot\run_common.ps1" -Arch "R3_grpc" -AdapterName "R3_remote_gRPC" -Trials 1 -Sessions $Sessions -WarmupSessions $WarmupSessions -NoPrewarm:$NoPrewarm -Seed ($Seed + $i) -UnityPath $unityPath -ServiceGrpcUrl $clientUrl -GrpcMode $GrpcMode -GrpcProtoVersion $GrpcProtoVersion -ServiceTimeoutMs $ServiceTimeoutMs -ServiceRetries $ServiceRetries -ServiceRetryDelayMs $ServiceRetryDelayMs | Out-Null
 
     if ($serviceProc -and -not $serviceProc.HasExited) {
         Stop-Process -Id $serviceProc.Id -Force
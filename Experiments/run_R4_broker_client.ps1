@@ -2,6 +2,7 @@ param(
     [int]$Trials = 5,
     [int]$Sessions = 30,
     [int]$WarmupSessions = 5,
+    [switch]$NoPrewarm,
     [int]$Seed = 1234,
     [string]$UnityPath = $env:UNITY_PATH,
     [string]${BrokerHost} = "",
@@ -52,4 +53,4 @@ if (-not $SkipCheck) {
     & "$PSScriptRoot\check_R4_broker_client.ps1" -BrokerHost ${BrokerHost} -BrokerPort ${BrokerPort}
 }
 
-& "$PSScriptRoot\run_common.ps1" -Arch "R4_broker_client" -AdapterName "R4_remote_BrokerRPC" -Trials $Trials -Sessions $Sessions -WarmupSessions $WarmupSessions -Seed $Seed -UnityPath $UnityPath | Out-Null
+& "$PSScriptRoot\run_common.ps1" -Arch "R4_broker_client" -AdapterName "R4_remote_BrokerRPC" -Trials $Trials -Sessions $Sessions -WarmupSessions $WarmupSessions -NoPrewarm:$NoPrewarm -Seed $Seed -UnityPath $UnityPath | Out-Null
@@ -0,0 +1,80 @@
+param(
+    [string]${BrokerHost} = "",
+    [int]${BrokerPort} = 5672,
+    [string]$Consumers = "1,2,4,8",
+    [int]$Prefetch = 16,
+    [int]$AckBatch = 8,
+    [int]$Requests = 20000,
+    [int]$Concurrency = 64,
+    [int]$TimeoutMs = 5000,
+    [string]$DotNetPath = $env:DOTNET_PATH
+)
+
+$ErrorActionPreference = "Stop"
+
+if (-not ${BrokerHost}) {
+    ${BrokerHost} = $env:BROKER_HOST
+}
+if (-not ${BrokerHost}) {
+    ${BrokerHost} = "127.0.0.1"
+}
+
+$dotnet = $DotNetPath
+if (-not $dotnet) {
+    $dotnetCmd = Get-Command dotnet -ErrorAction SilentlyContinue
+    if ($dotnetCmd) {
+        $dotnet = $dotnetCmd.Source
+    }
+}
+if (-not $dotnet) {
+    throw "dotnet not found. Install .NET 8 SDK or set DOTNET_PATH."
+}
+
+$repoRoot = Resolve-Path (Join-Path $PSScriptRoot "..")
+$timestamp = Get-Date -Format "yyyyMMdd_HHmmss"
+$outFolder = Join-Path $repoRoot ("Experiments\out\R4_worker_scaling\{0}" -f $timestamp)
+New-Item -ItemType Directory -Force -Path $outFolder | Out-Null
+
+$checkProject = Join-Path $repoRoot "Experiments\BrokerClientCheck\BrokerClientCheck.csproj"
+$workerProject = Join-Path $repoRoot "ServiceBroker\ServiceBroker.csproj"
+Write-Host "Building worker and load client..."
+& $dotnet build $workerProject -c Release | Out-Null
+& $dotnet build $checkProject -c Release | Out-Null
+
+$env:BROKER_HOST = ${BrokerHost}
+$env:BROKER_PORT = ${BrokerPort}
+$env:BROKER_TIMEOUT_MS = $TimeoutMs
+
+$rows = @()
+foreach ($count in ($Consumers -split "," | ForEach-Object { [int]$_.Trim() })) {
+    $logDir = Join-Path $outFolder ("consumers_{0}" -f $count)
+    Write-Host "== $count consumer(s), prefetch $Prefetch, ack batch $AckBatch"
+    & "$PSScriptRoot\start_broker_worker_server.ps1" -LogDir $logDir -DotNetPath $dotnet -Consumers $count -Prefetch $Prefetch -AckBatch $AckBatch | Out-Null
+    Start-Sleep -Seconds 3
+
+    # Short warmup so JIT and connection setup stay out of the measured run.
+    $env:BROKER_REQUESTS = [Math]::Min(1000, $Requests)
+    $env:BROKER_CONCURRENCY = $Concurrency
+    & $dotnet run --project $checkProject -c Release --no-build | Out-Null
+
+    $env:BROKER_REQUESTS = $Requests
+    $output = & $dotnet run --project $checkProject -c Release --no-build
+    & "$PSScriptRoot\stop_broker_worker_server.ps1" -PidFile (Join-Path $logDir "broker_worker.pid") | Out-Null
+
+    $load = $output | Where-Object { $_ -like "LOAD *" } | Select-Object -Last 1
+    if (-not $load) {
+        throw "Load client produced no LOAD line for $count consumer(s)."
+    }
+    Write-Host $load
+
+    $row = [ordered]@{ consumers = $count; prefetch = $Prefetch; ack_batch = $AckBatch }
+    foreach ($pair in ($load.Substring(5) -split " ")) {
+        $key, $value = $pair -split "=", 2
+        $row[$key] = $value
+    }
+    $rows += [pscustomobject]$row
+}
+
+$csvPath = Join-Path $outFolder "worker_scaling.csv"
+$rows | Export-Csv -Path $csvPath -NoTypeInformation -Encoding UTF8
+Write-Host "Scaling results: $csvPath"
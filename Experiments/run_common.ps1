@@ -4,10 +4,13 @@ param(
     [int]$Trials = 3,
     [int]$Sessions = 10,
     [int]$WarmupSessions = 5,
+    [switch]$NoPrewarm,
     [int]$Seed = 1234,
     [string]$UnityPath = $env:UNITY_PATH,
     [string]$ServiceUrl = "",
     [string]$ServiceGrpcUrl = "",
+    [ValidateSet("web_text", "web", "http2")][string]$GrpcMode = "web",
+    [int]$GrpcProtoVersion = 2,
     [int]$ServiceTimeoutMs = 3000,
     [int]$ServiceRetries = 2,
     [int]$ServiceRetryDelayMs = 250,
@@ -16,6 +19,10 @@ param(
 
 $ErrorActionPreference = "Stop"
 
+if ($ServiceGrpcUrl -and $GrpcMode -eq "http2" -and ([Uri]$ServiceGrpcUrl).Port -eq 6002) {
+    throw "-GrpcMode http2 needs the h2c ServiceGrpc StreamUrl (default http://127.0.0.1:6004); $ServiceGrpcUrl is the mixed gRPC-Web endpoint."
+}
+
 function Resolve-UnityPath {
     param([string]$Preferred)
     if ($Preferred -and (Test-Path $Preferred)) {
@@ -62,6 +69,7 @@ for ($i = 0; $i -lt $Trials; $i++) {
         "-adapter", $adapterValue,
         "-sessions", $Sessions,
         "-warmupSessions", $WarmupSessions,
+        "-prewarm", (-not $NoPrewarm).ToString().ToLowerInvariant(),
         "-seed", ($Seed + $i),
         "-outDir", $trialDir
     )
@@ -73,6 +81,8 @@ for ($i = 0; $i -lt $Trials; $i++) {
     }
     if ($ServiceGrpcUrl) {
         $args += @("-serviceGrpcUrl", $ServiceGrpcUrl)
+        $args += @("-grpcMode", $GrpcMode)
+        $args += @("-grpcProtoVersion", $GrpcProtoVersion)
     }
     if ($ServiceUrl -or $ServiceGrpcUrl) {
         $args += @("-serviceTimeoutMs", $ServiceTimeoutMs)
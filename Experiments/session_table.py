@@ -0,0 +1,160 @@
+"""Columnar, dictionary-encoded storage for the all_sessions table.
+
+The table is written as a directory holding one uncompressed ``.npy`` file
+per column plus a ``schema.json``. Repeated string columns are stored as
+``int32`` codes into a category list kept in the schema, hashes are stored as
+raw 32-byte rows, and numeric columns keep their native dtype. Because every
+column is a plain ``.npy`` file, :func:`load_columnar` can memory-map it.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+SCHEMA_FILE = "schema.json"
+SCHEMA_VERSION = 1
+HASH_BYTES = 32
+
+CATEGORICAL_COLUMNS = (
+    "arch",
+    "run_ts",
+    "trial_id",
+    "session_id",
+    "adapter_name",
+    "from_scene",
+    "to_scene",
+    "seed",
+    "adapter_calls_path",
+    "scene_transitions_path",
+    "audit_path",
+)
+HASH_COLUMNS = ("config_version_hash", "decision_hash")
+NUMERIC_COLUMNS = {
+    "session_index": "int32",
+    "warmup": "int8",
+    "adapter_ms": "float64",
+    "net_ms": "float64",
+    "local_ms": "float64",
+    "decision_build_ms": "float64",
+    "scene_ms": "float64",
+    "has_scene": "int8",
+    "has_audit": "int8",
+    "frame_count": "int32",
+    "frame_p50_ms": "float64",
+    "frame_p99_ms": "float64",
+    "frame_max_ms": "float64",
+    "pre_call_frame_max_ms": "float64",
+    "post_call_frame_max_ms": "float64",
+}
+HITCH_PREFIX = "hitch_"
+
+
+def numeric_dtype(name):
+    if name.startswith(HITCH_PREFIX):
+        return "int32"
+    return NUMERIC_COLUMNS[name]
+
+
+def column_kind(name):
+    if name in CATEGORICAL_COLUMNS:
+        return "category"
+    if name in HASH_COLUMNS:
+        return "hash"
+    if name in NUMERIC_COLUMNS or name.startswith(HITCH_PREFIX):
+        return "numeric"
+    raise ValueError(f"Unknown session column: {name}")
+
+
+def encode_categories(values):
+    lookup = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for pos, value in enumerate(values):
+        key = "" if value is None else str(value)
+        code = lookup.get(key)
+        if code is None:
+            code = len(lookup)
+            lookup[key] = code
+        codes[pos] = code
+    return codes, list(lookup.keys())
+
+
+def encode_hashes(values):
+    encoded = np.zeros((len(values), HASH_BYTES), dtype=np.uint8)
+    for pos, value in enumerate(values):
+        if not value:
+            continue
+        raw = bytes.fromhex(value)
+        if len(raw) != HASH_BYTES:
+            raise ValueError(f"Expected a {HASH_BYTES}-byte hex hash, got {value!r}")
+        encoded[pos] = np.frombuffer(raw, dtype=np.uint8)
+    return encoded
+
+
+def write_columnar(path, records, columns):
+    """Write ``records`` (dicts keyed by ``columns``) to the directory ``path``."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    schema_path = path / SCHEMA_FILE
+    if schema_path.exists():
+        schema_path.unlink()
+
+    schema = {"version": SCHEMA_VERSION, "rows": len(records), "columns": []}
+    for name in columns:
+        kind = column_kind(name)
+        values = [row[name] for row in records]
+        entry = {"name": name, "kind": kind}
+        if kind == "category":
+            data, entry["categories"] = encode_categories(values)
+        elif kind == "hash":
+            data = encode_hashes(values)
+        else:
+            dtype = numeric_dtype(name)
+            if dtype.startswith("float"):
+                values = [np.nan if value is None else value for value in values]
+            data = np.asarray(values, dtype=dtype)
+        np.save(path / f"{name}.npy", data, allow_pickle=False)
+        schema["columns"].append(entry)
+
+    # The schema is written last so a partially written table is never loadable.
+    tmp_path = path / (SCHEMA_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(schema, fh, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, schema_path)
+
+
+def load_columnar(path, mmap=True):
+    """Load a table written by :func:`write_columnar`.
+
+    Returns ``(columns, categories)``: ``columns`` maps each column name to a
+    (memory-mapped) array, with categorical columns as ``int32`` codes and hash
+    columns as ``(rows, 32)`` ``uint8`` arrays; ``categories`` maps each
+    categorical column name to its list of string values.
+    """
+    path = Path(path)
+    with open(path / SCHEMA_FILE, "r", encoding="utf-8") as fh:
+        schema = json.load(fh)
+    if schema.get("version") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported session table version in {path}: {schema.get('version')}")
+
+    mmap_mode = "r" if mmap else None
+    columns = {}
+    categories = {}
+    for entry in schema["columns"]:
+        name = entry["name"]
+        columns[name] = np.load(path / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+        if entry["kind"] == "category":
+            categories[name] = entry["categories"]
+    return columns, categories
+
+
+def decode_column(columns, categories, name):
+    """Materialize one column as a list of Python values (strings for categories and hashes)."""
+    data = columns[name]
+    if name in categories:
+        values = np.asarray(categories[name], dtype=object)
+        return values[np.asarray(data)].tolist()
+    if data.ndim == 2:
+        return [row.tobytes().hex() if row.any() else "" for row in np.asarray(data)]
+    return np.asarray(data).tolist()
@@ -0,0 +1,362 @@
+"""Minimal Python stand-in for Service/Program.cs.
+
+Serves ``GET /health``, ``POST /computeNext`` and ``POST /computeNextBatch`` over
+HTTP/1.1 keep-alive with the same contract as the .NET service: the request body
+is a ComputeNextRequest (or ``{"items": [...]}`` of them), the response body is
+the AdaptationDecision (or the per-item batch results), and the ``X-Config-Hash``,
+``X-Config-Version``, ``X-Intermediate``, ``X-Server-Compute-Ms`` and
+``X-Correlation-Id`` headers are set. The engine follows
+AdaptationEngine.ComputeNext with float32 rounding. It is meant for exercising
+loadgen.py without .NET, not for measuring the real service.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import signal
+import struct
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+DEFAULT_BASE_PARAMS = {"aggression": 0.2, "curiosity": 0.3, "patience": 0.6}
+MAX_HEADER_BYTES = 64 * 1024
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+def f32(value):
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def f32_repr(value):
+    """Shortest decimal string that round-trips to the same float32 (as System.Text.Json writes it)."""
+    if math.isinf(value) or math.isnan(value):
+        return json.dumps(value)
+    for digits in range(1, 10):
+        text = f"{value:.{digits}g}"
+        if f32(float(text)) == value:
+            return text
+    return repr(value)
+
+
+def format_float(value):
+    """``float.ToString("0.000")``: 7 significant digits first, then three decimals rounded half up."""
+    digits = Decimal(f"{value:.6e}")
+    return str(digits.quantize(Decimal("0.001"), rounding=ROUND_HALF_UP))
+
+
+def load_config(config_root, version):
+    path = os.path.join(config_root, version, "config.json")
+    with open(path, "r", encoding="utf-8-sig") as fh:
+        text = fh.read()
+    config = json.loads(text)
+    config["version_hash"] = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return config
+
+
+def compute_next(event, config):
+    """Return (decision, intermediates) for one event, mirroring AdaptationEngine.ComputeNext."""
+    # ConfigLoader's DataContractJsonSerializer only reads [{"Key", "Value"}] dictionaries;
+    # a JSON object leaves npc_base_params empty and the engine falls back to its defaults.
+    entries = config.get("npc_base_params")
+    base = {}
+    if isinstance(entries, list):
+        base = {entry.get("Key"): entry.get("Value") for entry in entries if isinstance(entry, dict)}
+    time_factor = f32(f32(event["time_t"]) * f32(config.get("time_scale", 0.0)))
+    score = f32(
+        f32(f32(event["result_z"]) * f32(config.get("result_weight", 0.0)))
+        + f32(time_factor * f32(config.get("time_weight", 0.0)))
+    )
+    base_aggression = f32(base.get("aggression", DEFAULT_BASE_PARAMS["aggression"]))
+    base_curiosity = f32(base.get("curiosity", DEFAULT_BASE_PARAMS["curiosity"]))
+    base_patience = f32(base.get("patience", DEFAULT_BASE_PARAMS["patience"]))
+
+    def clamp01(value):
+        return min(1.0, max(0.0, value))
+
+    npc_params = [
+        ("aggression", clamp01(f32(base_aggression + score))),
+        ("curiosity", clamp01(f32(base_curiosity + time_factor))),
+        ("patience", clamp01(f32(base_patience - f32(score * 0.5)))),
+    ]
+    decision = {
+        "next_scene_id": event["scene_id"],
+        "npc_params": [{"name": name, "value": value} for name, value in npc_params],
+        "explanation": [
+            {"name": "adapter", "value": "B1"},
+            {"name": "config_version", "value": event["config_version"]},
+            {"name": "config_hash", "value": config["version_hash"]},
+            {"name": "score", "value": format_float(score)},
+        ],
+        "seed": event["seed"],
+        "config_version": event["config_version"],
+    }
+    intermediates = {
+        "time_factor": time_factor,
+        "score": score,
+        "base_aggression": base_aggression,
+        "base_curiosity": base_curiosity,
+        "base_patience": base_patience,
+    }
+    return decision, intermediates
+
+
+def to_json(obj, exact_floats=()):
+    """Serialize like the service: compact, with float32 values in shortest form.
+
+    Keys listed in ``exact_floats`` hold doubles (timings) and are written as such.
+    """
+    if isinstance(obj, dict):
+        return "{" + ",".join(
+            json.dumps(key) + ":" + (json.dumps(value) if key in exact_floats else to_json(value, exact_floats))
+            for key, value in obj.items()
+        ) + "}"
+    if isinstance(obj, list):
+        return "[" + ",".join(to_json(value, exact_floats) for value in obj) + "]"
+    if isinstance(obj, float):
+        return f32_repr(obj)
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def parse_event(body, default_version):
+    return event_from_request(json.loads(body), default_version)
+
+
+def event_from_request(request, default_version):
+    if not isinstance(request, dict):
+        raise ValueError("Request body must be a JSON object.")
+    return {
+        "session_id": str(request.get("session_id") or ""),
+        "scene_id": str(request.get("scene_id") or ""),
+        "result_z": f32(float(request.get("result_z") or 0.0)),
+        "time_t": f32(float(request.get("time_t") or 0.0)),
+        "attempts_a": int(request.get("attempts_a") or 0),
+        "seed": int(request.get("seed") or 0),
+        "config_version": str(request.get("config_version") or "") or default_version,
+    }
+
+
+class StandinService:
+    def __init__(self, config, audit_root="", compute_delay_ms=0.0, max_batch_size=10000):
+        self.config = config
+        self.max_batch_size = max_batch_size
+        self.compute_delay_ms = compute_delay_ms
+        self.requests = 0
+        self._audit = None
+        if audit_root:
+            os.makedirs(audit_root, exist_ok=True)
+            # Line-buffered: each audit line is visible as soon as it is written, as in Service.
+            self._audit = open(os.path.join(audit_root, "audit.jsonl"), "a", encoding="utf-8", buffering=1)
+
+    def close(self):
+        if self._audit is not None:
+            self._audit.close()
+
+    def append_audit(self, event, decision, intermediates):
+        if self._audit is None:
+            return
+        line = {
+            "session_id": event["session_id"],
+            "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+            "inputs": event,
+            "output": decision,
+            "config_version_hash": self.config["version_hash"],
+            "seed": event["seed"],
+            "intermediate": intermediates,
+        }
+        self._audit.write(to_json(line) + "\n")
+
+    async def compute(self, body, correlation_id):
+        started = time.perf_counter()
+        headers = {"X-Correlation-Id": correlation_id}
+        try:
+            event = parse_event(body, self.config["version"])
+        except (ValueError, TypeError) as ex:
+            headers["X-Server-Compute-Ms"] = f"{(time.perf_counter() - started) * 1000.0:.3f}"
+            return 400, headers, json.dumps({"title": "Bad Request", "status": 400, "detail": str(ex)})
+        try:
+            if self.compute_delay_ms > 0:
+                # Simulated engine cost; the event loop stays free, like a thread-pool request.
+                await asyncio.sleep(self.compute_delay_ms / 1000.0)
+            decision, intermediates = compute_next(event, self.config)
+            compute_ms = (time.perf_counter() - started) * 1000.0
+            self.append_audit(event, decision, intermediates)
+        except Exception as ex:  # noqa: BLE001 - mirrors Results.Problem in Program.cs
+            headers["X-Server-Compute-Ms"] = f"{(time.perf_counter() - started) * 1000.0:.3f}"
+            return 500, headers, json.dumps({"title": "An error occurred", "status": 500, "detail": str(ex)})
+
+        headers["X-Config-Hash"] = self.config["version_hash"]
+        headers["X-Config-Version"] = event["config_version"]
+        headers["X-Intermediate"] = ";".join(f"{key}={format_float(value)}" for key, value in intermediates.items())
+        headers["X-Server-Compute-Ms"] = f"{compute_ms:.3f}"
+        return 200, headers, to_json(decision)
+
+    async def compute_batch(self, body, batch_id):
+        headers = {"X-Correlation-Id": batch_id}
+        try:
+            request = json.loads(body)
+            items = (request.get("items") or []) if isinstance(request, dict) else None
+            if not isinstance(items, list):
+                raise ValueError("Request body must be an object with an items array.")
+        except ValueError as ex:
+            return 400, headers, json.dumps({"title": "Bad Request", "status": 400, "detail": str(ex)})
+        if len(items) > self.max_batch_size:
+            detail = f"Batch of {len(items)} items exceeds MaxBatchSize {self.max_batch_size}."
+            return 413, headers, json.dumps({"title": "Payload Too Large", "status": 413, "detail": detail})
+
+        started = time.perf_counter()
+        if self.compute_delay_ms > 0:
+            await asyncio.sleep(self.compute_delay_ms / 1000.0)
+        results = []
+        for index, item in enumerate(items):
+            item_started = time.perf_counter()
+            correlation_id = item.get("correlation_id") if isinstance(item, dict) else None
+            result = {
+                "index": index,
+                "correlation_id": correlation_id or f"{batch_id}-{index}",
+                "ok": False,
+                "error": "",
+                "compute_ms": 0.0,
+                "decision": None,
+            }
+            try:
+                if item is None:
+                    raise ValueError("Batch item is null.")
+                event = event_from_request(item, self.config["version"])
+                decision, intermediates = compute_next(event, self.config)
+                result["compute_ms"] = (time.perf_counter() - item_started) * 1000.0
+                self.append_audit(event, decision, intermediates)
+                result["ok"] = True
+                result["decision"] = decision
+            except (ValueError, TypeError, AttributeError) as ex:
+                result["compute_ms"] = (time.perf_counter() - item_started) * 1000.0
+                result["error"] = str(ex)
+            results.append(result)
+        server_ms = (time.perf_counter() - started) * 1000.0
+
+        headers["X-Config-Hash"] = self.config["version_hash"]
+        headers["X-Batch-Size"] = str(len(results))
+        headers["X-Server-Compute-Ms"] = f"{server_ms:.3f}"
+        payload = {"batch_id": batch_id, "server_compute_ms": server_ms, "items": results}
+        return 200, headers, to_json(payload, exact_floats=("server_compute_ms", "compute_ms"))
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                method, path, _ = (lines[0].split(" ", 2) + ["", ""])[:3]
+                request_headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        request_headers[name.strip().lower()] = value.strip()
+                length = int(request_headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                if path == "/health" and method == "GET":
+                    status, headers, payload = 200, {}, '{"status":"ok"}'
+                elif path == "/computeNext" and method == "POST":
+                    correlation_id = request_headers.get("x-correlation-id") or uuid.uuid4().hex
+                    status, headers, payload = await self.compute(body, correlation_id)
+                elif path == "/computeNextBatch" and method == "POST":
+                    batch_id = request_headers.get("x-correlation-id") or uuid.uuid4().hex
+                    status, headers, payload = await self.compute_batch(body, batch_id)
+                elif path in ("/health", "/computeNext", "/computeNextBatch"):
+                    status, headers, payload = 405, {}, ""
+                else:
+                    status, headers, payload = 404, {}, ""
+
+                keep_alive = request_headers.get("connection", "").lower() != "close"
+                writer.write(build_response(status, headers, payload.encode("utf-8"), keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+
+
+def build_response(status, headers, payload, keep_alive):
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}"]
+    if payload:
+        content_type = "application/json; charset=utf-8" if status < 400 else "application/problem+json"
+        lines.append(f"Content-Type: {content_type}")
+    lines.append(f"Content-Length: {len(payload)}")
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+def parse_urls(urls):
+    address = urls.split(";")[0].strip()
+    address = address.split("://", 1)[-1].rstrip("/")
+    host, _, port = address.rpartition(":")
+    if host in ("", "*", "+"):
+        host = "0.0.0.0"
+    return host, int(port or 5000)
+
+
+async def serve(service, host, port):
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_HEADER_BYTES)
+    addresses = ", ".join(f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+    print(f"Stand-in service listening on {addresses} (config {service.config['version']})", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def _terminate(signum, frame):
+    # The harness stops the service with SIGTERM; shut down through the KeyboardInterrupt path.
+    raise KeyboardInterrupt
+
+
+def main():
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Python stand-in for the /computeNext service.")
+    parser.add_argument("--urls", default="http://127.0.0.1:5000", help="Listen address, as in Service/Program.cs.")
+    parser.add_argument("--config-root", default=os.path.join(repo_root, "Configs"))
+    parser.add_argument("--config-version", default="v1")
+    parser.add_argument("--audit-root", default="", help="Append audit.jsonl lines here (disabled when empty).")
+    parser.add_argument(
+        "--compute-delay-ms",
+        type=float,
+        default=0.0,
+        help="Extra simulated compute time per request, included in X-Server-Compute-Ms.",
+    )
+    parser.add_argument("--max-batch-size", type=int, default=10000, help="Largest accepted /computeNextBatch.")
+    args = parser.parse_args()
+
+    config = load_config(args.config_root, args.config_version)
+    service = StandinService(config, args.audit_root, args.compute_delay_ms, args.max_batch_size)
+    host, port = parse_urls(args.urls)
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        asyncio.run(serve(service, host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        print(f"Served {service.requests} requests")
+
+
+if __name__ == "__main__":
+    main()
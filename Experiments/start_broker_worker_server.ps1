@@ -1,6 +1,9 @@
 param(
     [string]$LogDir = "",
-    [string]$DotNetPath = $env:DOTNET_PATH
+    [string]$DotNetPath = $env:DOTNET_PATH,
+    [int]$Consumers = 1,
+    [int]$Prefetch = 1,
+    [int]$AckBatch = 1
 )
 
 $ErrorActionPreference = "Stop"
@@ -35,6 +38,9 @@ $pidFile = Join-Path $LogDir "broker_worker.pid"
 $lastPidFile = Join-Path $repoRoot "Experiments\server_logs\broker_worker.pid"
 
 $env:WORKER_LOG_DIR = $LogDir
+$env:WORKER_CONSUMERS = $Consumers
+$env:WORKER_PREFETCH = $Prefetch
+$env:WORKER_ACK_BATCH = $AckBatch
 
 $workerArgs = @(
     "run",
@@ -44,6 +50,7 @@ $workerArgs = @(
 $workerCmd = '"' + $dotnet + '" ' + ($workerArgs -join ' ')
 Write-Host "Worker project: $workerProject"
 Write-Host "Log dir: $LogDir"
+Write-Host "Consumers: $Consumers, prefetch: $Prefetch, ack batch: $AckBatch"
 Write-Host "Worker command: $workerCmd"
 
 $workerProc = Start-Process -FilePath $dotnet -ArgumentList $workerArgs -PassThru -WorkingDirectory $repoRoot -RedirectStandardOutput $workerOutLog -RedirectStandardError $workerErrLog
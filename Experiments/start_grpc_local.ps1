@@ -4,6 +4,7 @@
     [string]$AuditRoot = "",
     [string]$GrpcUrl = "http://127.0.0.1:6002",
     [string]$HealthUrl = "http://127.0.0.1:6003",
+    [string]$StreamUrl = "http://127.0.0.1:6004",
     [string]$LogDir = "",
     [string]$DotNetPath = $env:DOTNET_PATH
 )
@@ -40,6 +41,7 @@ Write-Host "Config version: $ConfigVersion"
 Write-Host "Audit root: $AuditRoot"
 Write-Host "Grpc URL: $GrpcUrl"
 Write-Host "Health URL: $HealthUrl"
+Write-Host "Stream URL: $StreamUrl"
 Write-Host "Log dir: $LogDir"
 
 $dotnet = $DotNetPath
@@ -60,7 +62,8 @@ $serviceArgs = @(
     "--ConfigRoot", (Quote-Arg $ConfigRoot),
     "--ConfigVersion", $ConfigVersion,
     "--GrpcUrl", $GrpcUrl,
-    "--HealthUrl", $HealthUrl
+    "--HealthUrl", $HealthUrl,
+    "--StreamUrl", $StreamUrl
 )
 if ($AuditRoot) {
     $serviceArgs += @("--AuditRoot", (Quote-Arg $AuditRoot))
@@ -1,15 +1,20 @@
 using System;
+using System.Buffers;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.Globalization;
 using System.IO;
 using System.Text;
 using System.Text.Json;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
 using AdaptationCore;
 using Microsoft.AspNetCore.Builder;
 using Microsoft.AspNetCore.Http;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Options;
 
 var builder = WebApplication.CreateBuilder(args);
 builder.Services.ConfigureHttpJsonOptions(options =>
@@ -22,19 +27,25 @@ builder.Services.ConfigureHttpJsonOptions(options =>
 var app = builder.Build();
 
 var settings = ServiceSettings.Load(builder.Configuration);
-var config = ConfigLoader.LoadByVersion(settings.ConfigRoot, settings.ConfigVersion);
+var configs = new ConfigRegistry(settings.ConfigRoot, settings.ConfigVersion, settings.WatchConfigs);
+configs.ConfigChanged += (version, changed) => Console.WriteLine($"Config '{version}' reloaded, hash {changed.version_hash}");
+configs.ReloadFailed += (version, ex) => Console.Error.WriteLine($"Config '{version}' reload failed, keeping previous: {ex.Message}");
 
-var auditWriter = new ServiceAuditWriter(settings.AuditRoot);
+var auditWriter = new ServiceAuditWriter(settings);
+app.Lifetime.ApplicationStopping.Register(configs.Dispose);
+
+var jsonOptions = app.Services.GetRequiredService<IOptions<Microsoft.AspNetCore.Http.Json.JsonOptions>>().Value.SerializerOptions;
+var decisions = new ServiceDecisionCache(settings, configs, jsonOptions);
 
 app.MapGet("/health", () => Results.Ok(new { status = "ok" }));
 
-app.MapPost("/computeNext", (ComputeNextRequest request, HttpRequest httpRequest, HttpResponse response) =>
+app.MapGet("/metrics/audit", () => Results.Json(auditWriter.Snapshot()));
+
+app.MapGet("/metrics/cache", () => Results.Json(decisions.Snapshot()));
+
+app.MapPost("/computeNext", async (ComputeNextRequest request, HttpRequest httpRequest, HttpResponse response) =>
 {
     var sessionEvent = request.ToEvent();
-    if (string.IsNullOrWhiteSpace(sessionEvent.config_version))
-    {
-        sessionEvent.config_version = config.version;
-    }
 
     var correlationId = httpRequest.Headers["X-Correlation-Id"].ToString();
     if (string.IsNullOrWhiteSpace(correlationId))
@@ -45,17 +56,24 @@ app.MapPost("/computeNext", (ComputeNextRequest request, HttpRequest httpRequest
     var computeTimer = Stopwatch.StartNew();
     try
     {
-        var result = AdaptationEngine.ComputeNext(sessionEvent, config);
+        var config = configs.Resolve(sessionEvent.config_version);
+        if (string.IsNullOrWhiteSpace(sessionEvent.config_version))
+        {
+            sessionEvent.config_version = config.version;
+        }
+
+        var cached = decisions.Compute(sessionEvent, config, out var hit);
         computeTimer.Stop();
-        auditWriter.Append(sessionEvent.session_id, result.Audit);
+        await auditWriter.AppendAsync(sessionEvent.session_id, cached.AuditFor(sessionEvent));
 
-        response.Headers["X-Config-Hash"] = result.Audit.config_version_hash ?? string.Empty;
+        response.Headers["X-Config-Hash"] = cached.ConfigHash;
         response.Headers["X-Config-Version"] = sessionEvent.config_version ?? string.Empty;
-        response.Headers["X-Intermediate"] = ServiceAuditWriter.FlattenIntermediates(result.Audit);
+        response.Headers["X-Intermediate"] = cached.Payload.Intermediate;
         response.Headers["X-Server-Compute-Ms"] = computeTimer.Elapsed.TotalMilliseconds.ToString("0.000", CultureInfo.InvariantCulture);
         response.Headers["X-Correlation-Id"] = correlationId;
+        response.Headers["X-Decision-Cache"] = decisions.Status(hit);
 
-        return Results.Json(result.Decision);
+        return Results.Bytes(cached.Payload.Body, "application/json; charset=utf-8");
     }
     catch (Exception ex)
     {
@@ -66,14 +84,68 @@ app.MapPost("/computeNext", (ComputeNextRequest request, HttpRequest httpRequest
     }
 });
 
+app.MapPost("/computeNextBatch", async (ComputeNextBatchRequest request, HttpRequest httpRequest, HttpResponse response) =>
+{
+    var items = request?.items ?? new List<ComputeNextRequest>();
+
+    var batchId = httpRequest.Headers["X-Correlation-Id"].ToString();
+    if (string.IsNullOrWhiteSpace(batchId))
+    {
+        batchId = Guid.NewGuid().ToString("N");
+    }
+    response.Headers["X-Correlation-Id"] = batchId;
+
+    if (items.Count > settings.MaxBatchSize)
+    {
+        return Results.Problem(
+            detail: $"Batch of {items.Count} items exceeds MaxBatchSize {settings.MaxBatchSize}.",
+            statusCode: StatusCodes.Status413PayloadTooLarge);
+    }
+
+    var batchTimer = Stopwatch.StartNew();
+    var results = new List<ComputeNextBatchItem>(items.Count);
+    for (var i = 0; i < items.Count; i++)
+    {
+        results.Add(await ComputeNextBatchItem.ComputeAsync(i, items[i], batchId, configs, decisions, auditWriter));
+    }
+    batchTimer.Stop();
+
+    var serverMs = batchTimer.Elapsed.TotalMilliseconds;
+    response.Headers["X-Config-Hash"] = configs.Default.version_hash ?? string.Empty;
+    response.Headers["X-Batch-Size"] = results.Count.ToString(CultureInfo.InvariantCulture);
+    response.Headers["X-Server-Compute-Ms"] = serverMs.ToString("0.000", CultureInfo.InvariantCulture);
+
+    return Results.Json(new ComputeNextBatchResponse
+    {
+        batch_id = batchId,
+        server_compute_ms = serverMs,
+        items = results
+    });
+});
+
 app.Run(settings.Urls);
 
+// Run returns only after Kestrel has drained in-flight requests, so their audit lines are
+// already queued; ApplicationStopping would complete the channel underneath them.
+auditWriter.Dispose();
+
 internal sealed class ServiceSettings
 {
     public string ConfigRoot { get; set; } = string.Empty;
     public string ConfigVersion { get; set; } = "v1";
+    public bool WatchConfigs { get; set; } = true;
     public string AuditRoot { get; set; } = string.Empty;
     public string Urls { get; set; } = "http://0.0.0.0:5000";
+    public int MaxBatchSize { get; set; } = 10000;
+    public string AuditWriterMode { get; set; } = "channel";
+    public int AuditQueueCapacity { get; set; } = 8192;
+    public string AuditFullMode { get; set; } = "block";
+    public int AuditMaxBatch { get; set; } = 512;
+    public int AuditFlushIntervalMs { get; set; }
+    public bool AuditFsync { get; set; }
+    public long AuditRotateBytes { get; set; }
+    public int DecisionCacheEntries { get; set; } = 4096;
+    public long DecisionCacheBytes { get; set; } = 16 * 1024 * 1024;
 
     public static ServiceSettings Load(IConfiguration config)
     {
@@ -81,8 +153,33 @@ internal sealed class ServiceSettings
         {
             ConfigRoot = config["ConfigRoot"] ?? config["configRoot"] ?? string.Empty,
             ConfigVersion = config["ConfigVersion"] ?? config["configVersion"] ?? "v1",
+            WatchConfigs = !bool.TryParse(config["WatchConfigs"] ?? config["watchConfigs"], out var watchConfigs) || watchConfigs,
             AuditRoot = config["AuditRoot"] ?? config["auditRoot"] ?? string.Empty,
-            Urls = config["urls"] ?? config["Urls"] ?? "http://0.0.0.0:5000"
+            Urls = config["urls"] ?? config["Urls"] ?? "http://0.0.0.0:5000",
+            MaxBatchSize = int.TryParse(config["MaxBatchSize"] ?? config["maxBatchSize"], out var maxBatchSize) && maxBatchSize > 0
+                ? maxBatchSize
+                : 10000,
+            AuditWriterMode = config["AuditWriterMode"] ?? config["auditWriterMode"] ?? "channel",
+            AuditQueueCapacity = int.TryParse(config["AuditQueueCapacity"] ?? config["auditQueueCapacity"], out var queueCapacity) && queueCapacity > 0
+                ? queueCapacity
+                : 8192,
+            AuditFullMode = config["AuditFullMode"] ?? config["auditFullMode"] ?? "block",
+            AuditMaxBatch = int.TryParse(config["AuditMaxBatch"] ?? config["auditMaxBatch"], out var maxBatch) && maxBatch > 0
+                ? maxBatch
+                : 512,
+            AuditFlushIntervalMs = int.TryParse(config["AuditFlushIntervalMs"] ?? config["auditFlushIntervalMs"], out var flushIntervalMs) && flushIntervalMs > 0
+                ? flushIntervalMs
+                : 0,
+            AuditFsync = bool.TryParse(config["AuditFsync"] ?? config["auditFsync"], out var fsync) && fsync,
+            AuditRotateBytes = long.TryParse(config["AuditRotateBytes"] ?? config["auditRotateBytes"], out var rotateBytes) && rotateBytes > 0
+                ? rotateBytes
+                : 0,
+            DecisionCacheEntries = int.TryParse(config["DecisionCacheEntries"] ?? config["decisionCacheEntries"], out var cacheEntries) && cacheEntries >= 0
+                ? cacheEntries
+                : 4096,
+            DecisionCacheBytes = long.TryParse(config["DecisionCacheBytes"] ?? config["decisionCacheBytes"], out var cacheBytes) && cacheBytes >= 0
+                ? cacheBytes
+                : 16 * 1024 * 1024
         };
     }
 }
@@ -97,6 +194,7 @@ internal sealed class ComputeNextRequest
     public int seed;
     public string config_version;
     public string profile_id;
+    public string correlation_id;
 
     public AdaptationEvent ToEvent()
     {
@@ -113,34 +211,226 @@ internal sealed class ComputeNextRequest
     }
 }
 
-internal sealed class ServiceAuditWriter
+internal sealed class ComputeNextBatchRequest
+{
+    public List<ComputeNextRequest> items = new List<ComputeNextRequest>();
+}
+
+internal sealed class ComputeNextBatchResponse
+{
+    public string batch_id;
+    public double server_compute_ms;
+    public List<ComputeNextBatchItem> items = new List<ComputeNextBatchItem>();
+}
+
+internal sealed class ComputeNextBatchItem
+{
+    public int index;
+    public string correlation_id;
+    public bool ok;
+    public string error;
+    public double compute_ms;
+    public AdaptationDecision decision;
+
+    public static async Task<ComputeNextBatchItem> ComputeAsync(
+        int index,
+        ComputeNextRequest request,
+        string batchId,
+        ConfigRegistry configs,
+        ServiceDecisionCache decisions,
+        ServiceAuditWriter auditWriter)
+    {
+        var item = new ComputeNextBatchItem
+        {
+            index = index,
+            correlation_id = string.IsNullOrWhiteSpace(request?.correlation_id)
+                ? batchId + "-" + index.ToString(CultureInfo.InvariantCulture)
+                : request.correlation_id,
+            error = string.Empty
+        };
+
+        var computeTimer = Stopwatch.StartNew();
+        try
+        {
+            if (request == null)
+            {
+                throw new ArgumentException("Batch item is null.");
+            }
+
+            var sessionEvent = request.ToEvent();
+            var config = configs.Resolve(sessionEvent.config_version);
+            if (string.IsNullOrWhiteSpace(sessionEvent.config_version))
+            {
+                sessionEvent.config_version = config.version;
+            }
+
+            var cached = decisions.Compute(sessionEvent, config, out _);
+            computeTimer.Stop();
+            await auditWriter.AppendAsync(sessionEvent.session_id, cached.AuditFor(sessionEvent));
+
+            item.ok = true;
+            item.decision = cached.Decision;
+        }
+        catch (Exception ex)
+        {
+            computeTimer.Stop();
+            item.ok = false;
+            item.error = ex.Message;
+        }
+
+        item.compute_ms = computeTimer.Elapsed.TotalMilliseconds;
+        return item;
+    }
+}
+
+/// <summary>
+/// Decisions by input: a hit skips the engine and the response serialization. The audit line is
+/// still written per request, since replay and reproducibility expect one record per session.
+/// </summary>
+internal sealed class ServiceDecisionCache
+{
+    private readonly DecisionCache<CachedHttpResponse> _cache;
+    private readonly JsonSerializerOptions _jsonOptions;
+
+    public ServiceDecisionCache(ServiceSettings settings, ConfigRegistry configs, JsonSerializerOptions jsonOptions)
+    {
+        _cache = new DecisionCache<CachedHttpResponse>(settings.DecisionCacheEntries, settings.DecisionCacheBytes);
+        _cache.Attach(configs);
+        _jsonOptions = jsonOptions;
+    }
+
+    public CachedDecision<CachedHttpResponse> Compute(AdaptationEvent sessionEvent, ConfigPackage config, out bool hit)
+    {
+        var key = new DecisionCacheKey(sessionEvent, config);
+        hit = _cache.TryGet(key, out var cached);
+        if (hit)
+        {
+            return cached;
+        }
+
+        var result = AdaptationEngine.ComputeNext(sessionEvent, config);
+        var payload = new CachedHttpResponse
+        {
+            Body = JsonSerializer.SerializeToUtf8Bytes(result.Decision, _jsonOptions),
+            Intermediate = ServiceAuditWriter.FlattenIntermediates(result.Audit)
+        };
+        cached = CachedDecision<CachedHttpResponse>.From(result, payload);
+        _cache.Add(key, cached, payload.Body.Length + payload.Intermediate.Length * sizeof(char));
+        return cached;
+    }
+
+    public string Status(bool hit)
+    {
+        if (!_cache.Enabled)
+        {
+            return "off";
+        }
+        return hit ? "hit" : "miss";
+    }
+
+    public DecisionCacheMetrics Snapshot()
+    {
+        return _cache.Snapshot();
+    }
+}
+
+internal sealed class CachedHttpResponse
+{
+    public byte[] Body;
+    public string Intermediate;
+}
+
+internal sealed class ServiceAuditWriter : IDisposable
 {
+    private const int DefaultQueueCapacity = 8192;
+    private const int DefaultMaxBatch = 512;
+    private static readonly byte[] NewLineBytes = Encoding.UTF8.GetBytes(Environment.NewLine);
+
+    private readonly string _auditRoot;
     private readonly string _auditPath;
     private readonly JsonSerializerOptions _jsonOptions;
+    private readonly bool _legacy;
+    private readonly bool _dropWhenFull;
+    private readonly int _batchLimit;
+    private readonly int _flushIntervalMs;
+    private readonly bool _fsync;
+    private readonly long _rotateBytes;
+    private readonly Channel<ServiceAuditLine> _channel;
+    private readonly Task _writerTask;
+    private readonly Stopwatch _sinceFlush = new Stopwatch();
+    private readonly ArrayBufferWriter<byte> _lineBuffer = new ArrayBufferWriter<byte>(4096);
+    private readonly int _queueCapacity;
+    private readonly object _lateLock = new object();
 
-    public ServiceAuditWriter(string auditRoot)
+    private FileStream _stream;
+    private readonly Utf8JsonWriter _jsonWriter;
+    private bool _dirty;
+    private long _maxQueueDepth;
+    private long _enqueued;
+    private long _written;
+    private long _dropped;
+    private long _blocked;
+    private long _blockedTicks;
+    private long _batches;
+    private long _largestBatch;
+    private long _flushes;
+    private long _fsyncs;
+    private long _rotations;
+    private long _bytesWritten;
+    private long _writeErrors;
+    private long _late;
+    private int _disposed;
+
+    public ServiceAuditWriter(ServiceSettings settings)
     {
-        if (string.IsNullOrWhiteSpace(auditRoot))
+        _auditRoot = settings.AuditRoot;
+        if (string.IsNullOrWhiteSpace(_auditRoot))
         {
             _auditPath = string.Empty;
             return;
         }
 
-        Directory.CreateDirectory(auditRoot);
-        _auditPath = Path.Combine(auditRoot, "audit.jsonl");
+        Directory.CreateDirectory(_auditRoot);
+        _auditPath = Path.Combine(_auditRoot, "audit.jsonl");
         _jsonOptions = new JsonSerializerOptions
         {
             IncludeFields = true,
             PropertyNamingPolicy = null,
             DictionaryKeyPolicy = null
         };
+
+        _legacy = string.Equals(settings.AuditWriterMode, "legacy", StringComparison.OrdinalIgnoreCase);
+        _dropWhenFull = string.Equals(settings.AuditFullMode, "drop", StringComparison.OrdinalIgnoreCase);
+        _batchLimit = settings.AuditMaxBatch > 0 ? settings.AuditMaxBatch : DefaultMaxBatch;
+        _flushIntervalMs = Math.Max(0, settings.AuditFlushIntervalMs);
+        _fsync = settings.AuditFsync;
+        _rotateBytes = Math.Max(0, settings.AuditRotateBytes);
+
+        _queueCapacity = settings.AuditQueueCapacity > 0 ? settings.AuditQueueCapacity : DefaultQueueCapacity;
+
+        if (_legacy)
+        {
+            return;
+        }
+
+        // FullMode stays Wait: the drop policy is applied in AppendAsync so rejected
+        // lines are counted instead of being discarded silently by DropWrite.
+        _channel = Channel.CreateBounded<ServiceAuditLine>(new BoundedChannelOptions(_queueCapacity)
+        {
+            SingleReader = true,
+            SingleWriter = false,
+            FullMode = BoundedChannelFullMode.Wait
+        });
+        _jsonWriter = new Utf8JsonWriter(_lineBuffer);
+        OpenStream();
+        _writerTask = Task.Run(RunWriterAsync);
     }
 
-    public void Append(string sessionId, AdaptationAuditRecord audit)
+    public ValueTask AppendAsync(string sessionId, AdaptationAuditRecord audit)
     {
         if (string.IsNullOrWhiteSpace(_auditPath) || audit == null)
         {
-            return;
+            return default;
         }
 
         var line = new ServiceAuditLine
@@ -154,8 +444,280 @@ internal sealed class ServiceAuditWriter
             intermediate = audit.intermediates
         };
 
-        var json = JsonSerializer.Serialize(line, _jsonOptions);
-        File.AppendAllText(_auditPath, json + Environment.NewLine, Encoding.UTF8);
+        if (_legacy)
+        {
+            var json = JsonSerializer.Serialize(line, _jsonOptions);
+            File.AppendAllText(_auditPath, json + Environment.NewLine, Encoding.UTF8);
+            Interlocked.Increment(ref _enqueued);
+            Interlocked.Increment(ref _written);
+            return default;
+        }
+
+        if (_channel.Writer.TryWrite(line))
+        {
+            Enqueued();
+            return default;
+        }
+
+        if (Volatile.Read(ref _disposed) != 0)
+        {
+            // The channel is completed, not full: neither backpressure nor a drop.
+            AppendAfterClose(line);
+            return default;
+        }
+
+        if (_dropWhenFull)
+        {
+            Interlocked.Increment(ref _dropped);
+            return default;
+        }
+
+        return WaitAndAppendAsync(line);
+    }
+
+    public AuditWriterMetrics Snapshot()
+    {
+        return new AuditWriterMetrics
+        {
+            mode = _legacy ? "legacy" : "channel",
+            full_mode = _dropWhenFull ? "drop" : "block",
+            queue_capacity = _queueCapacity,
+            flush_interval_ms = _flushIntervalMs,
+            fsync = _fsync,
+            rotate_bytes = _rotateBytes,
+            queue_depth = _channel?.Reader.Count ?? 0,
+            max_queue_depth = Interlocked.Read(ref _maxQueueDepth),
+            enqueued = Interlocked.Read(ref _enqueued),
+            written = Interlocked.Read(ref _written),
+            dropped = Interlocked.Read(ref _dropped),
+            blocked = Interlocked.Read(ref _blocked),
+            blocked_ms = Interlocked.Read(ref _blockedTicks) * 1000.0 / Stopwatch.Frequency,
+            batches = Interlocked.Read(ref _batches),
+            max_batch = Interlocked.Read(ref _largestBatch),
+            flushes = Interlocked.Read(ref _flushes),
+            fsyncs = Interlocked.Read(ref _fsyncs),
+            rotations = Interlocked.Read(ref _rotations),
+            bytes_written = Interlocked.Read(ref _bytesWritten),
+            write_errors = Interlocked.Read(ref _writeErrors),
+            late = Interlocked.Read(ref _late)
+        };
+    }
+
+    public void Dispose()
+    {
+        if (Interlocked.Exchange(ref _disposed, 1) != 0 || _channel == null)
+        {
+            return;
+        }
+
+        _channel.Writer.TryComplete();
+        _writerTask.GetAwaiter().GetResult();
+    }
+
+    private async ValueTask WaitAndAppendAsync(ServiceAuditLine line)
+    {
+        Interlocked.Increment(ref _blocked);
+        var waitStart = Stopwatch.GetTimestamp();
+        try
+        {
+            await _channel.Writer.WriteAsync(line).ConfigureAwait(false);
+        }
+        catch (ChannelClosedException)
+        {
+            Interlocked.Add(ref _blockedTicks, Stopwatch.GetTimestamp() - waitStart);
+            AppendAfterClose(line);
+            return;
+        }
+
+        Interlocked.Add(ref _blockedTicks, Stopwatch.GetTimestamp() - waitStart);
+        Enqueued();
+    }
+
+    private void AppendAfterClose(ServiceAuditLine line)
+    {
+        // Wait for the writer to drain and close the file, then append the line directly
+        // so it still lands after everything that was queued before shutdown.
+        _writerTask.GetAwaiter().GetResult();
+        lock (_lateLock)
+        {
+            try
+            {
+                var json = JsonSerializer.Serialize(line, _jsonOptions);
+                File.AppendAllText(_auditPath, json + Environment.NewLine, Encoding.UTF8);
+                Interlocked.Increment(ref _enqueued);
+                Interlocked.Increment(ref _written);
+                Interlocked.Increment(ref _late);
+            }
+            catch (Exception ex)
+            {
+                Interlocked.Increment(ref _writeErrors);
+                Console.Error.WriteLine($"[audit] late write failed: {ex.Message}");
+            }
+        }
+    }
+
+    private void Enqueued()
+    {
+        Interlocked.Increment(ref _enqueued);
+        long depth = _channel.Reader.Count;
+        long max;
+        while (depth > (max = Interlocked.Read(ref _maxQueueDepth)))
+        {
+            if (Interlocked.CompareExchange(ref _maxQueueDepth, depth, max) == max)
+            {
+                break;
+            }
+        }
+    }
+
+    private async Task RunWriterAsync()
+    {
+        var reader = _channel.Reader;
+        while (true)
+        {
+            var waitTask = reader.WaitToReadAsync().AsTask();
+            if (_dirty && _flushIntervalMs > 0 && !waitTask.IsCompleted)
+            {
+                var remaining = _flushIntervalMs - _sinceFlush.ElapsedMilliseconds;
+                if (remaining <= 0 || await Task.WhenAny(waitTask, Task.Delay((int)remaining)).ConfigureAwait(false) != waitTask)
+                {
+                    FlushSafe();
+                }
+            }
+
+            if (!await waitTask.ConfigureAwait(false))
+            {
+                break;
+            }
+
+            // Group commit: drain whatever is queued (up to the batch cap) before flushing once.
+            var count = 0;
+            while (count < _batchLimit && reader.TryRead(out var line))
+            {
+                WriteLineSafe(line);
+                count++;
+            }
+
+            Interlocked.Increment(ref _batches);
+            if (count > Interlocked.Read(ref _largestBatch))
+            {
+                Interlocked.Exchange(ref _largestBatch, count);
+            }
+
+            if (_flushIntervalMs == 0 || _sinceFlush.ElapsedMilliseconds >= _flushIntervalMs)
+            {
+                FlushSafe();
+            }
+
+            if (_rotateBytes > 0 && _stream != null && _stream.Length >= _rotateBytes)
+            {
+                RotateSafe();
+            }
+        }
+
+        FlushSafe();
+        _jsonWriter.Dispose();
+        _stream?.Dispose();
+        _stream = null;
+    }
+
+    private void OpenStream()
+    {
+        _stream = new FileStream(_auditPath, FileMode.Append, FileAccess.Write, FileShare.Read, 64 * 1024);
+        if (_stream.Length == 0)
+        {
+            // Same preamble File.AppendAllText(..., Encoding.UTF8) writes on a new file.
+            var preamble = Encoding.UTF8.GetPreamble();
+            _stream.Write(preamble, 0, preamble.Length);
+        }
+        _sinceFlush.Restart();
+    }
+
+    private void WriteLineSafe(ServiceAuditLine line)
+    {
+        try
+        {
+            if (_stream == null)
+            {
+                OpenStream();
+            }
+
+            // Serialize into a reused buffer: flushing a Utf8JsonWriter bound to the file
+            // would flush the FileStream per line and defeat the group commit.
+            _lineBuffer.Clear();
+            _jsonWriter.Reset(_lineBuffer);
+            JsonSerializer.Serialize(_jsonWriter, line, _jsonOptions);
+            _jsonWriter.Flush();
+            _stream.Write(_lineBuffer.WrittenSpan);
+            _stream.Write(NewLineBytes, 0, NewLineBytes.Length);
+            Interlocked.Add(ref _bytesWritten, _lineBuffer.WrittenCount + NewLineBytes.Length);
+            Interlocked.Increment(ref _written);
+            _dirty = true;
+        }
+        catch (Exception ex)
+        {
+            Interlocked.Increment(ref _writeErrors);
+            Console.Error.WriteLine($"[audit] write failed: {ex.Message}");
+        }
+    }
+
+    private void FlushSafe()
+    {
+        if (!_dirty || _stream == null)
+        {
+            return;
+        }
+
+        try
+        {
+            _stream.Flush(_fsync);
+            Interlocked.Increment(ref _flushes);
+            if (_fsync)
+            {
+                Interlocked.Increment(ref _fsyncs);
+            }
+        }
+        catch (Exception ex)
+        {
+            Interlocked.Increment(ref _writeErrors);
+            Console.Error.WriteLine($"[audit] flush failed: {ex.Message}");
+        }
+
+        _dirty = false;
+        _sinceFlush.Restart();
+    }
+
+    private void RotateSafe()
+    {
+        FlushSafe();
+        try
+        {
+            _stream.Dispose();
+            _stream = null;
+            var stamp = DateTime.UtcNow.ToString("yyyyMMdd'T'HHmmssfff", CultureInfo.InvariantCulture);
+            var rotatedPath = Path.Combine(_auditRoot, $"audit.{stamp}.jsonl");
+            for (var suffix = 1; File.Exists(rotatedPath); suffix++)
+            {
+                rotatedPath = Path.Combine(_auditRoot, $"audit.{stamp}.{suffix}.jsonl");
+            }
+            File.Move(_auditPath, rotatedPath);
+            Interlocked.Increment(ref _rotations);
+        }
+        catch (Exception ex)
+        {
+            Interlocked.Increment(ref _writeErrors);
+            Console.Error.WriteLine($"[audit] rotation failed: {ex.Message}");
+        }
+
+        try
+        {
+            OpenStream();
+        }
+        catch (Exception ex)
+        {
+            Interlocked.Increment(ref _writeErrors);
+            Console.Error.WriteLine($"[audit] reopen failed: {ex.Message}");
+        }
     }
 
     public static string FlattenIntermediates(AdaptationAuditRecord audit)
@@ -192,3 +754,28 @@ internal sealed class ServiceAuditLine
     public int seed;
     public Dictionary<string, float> intermediate;
 }
+
+internal sealed class AuditWriterMetrics
+{
+    public string mode;
+    public string full_mode;
+    public int queue_capacity;
+    public int flush_interval_ms;
+    public bool fsync;
+    public long rotate_bytes;
+    public long queue_depth;
+    public long max_queue_depth;
+    public long enqueued;
+    public long written;
+    public long dropped;
+    public long blocked;
+    public double blocked_ms;
+    public long batches;
+    public long max_batch;
+    public long flushes;
+    public long fsyncs;
+    public long rotations;
+    public long bytes_written;
+    public long write_errors;
+    public long late;
+}
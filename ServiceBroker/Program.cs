@@ -5,6 +5,9 @@ using System.Globalization;
 using System.IO;
 using System.Text;
 using System.Text.Json;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
 using AdaptationCore;
 using RabbitMQ.Client;
 using RabbitMQ.Client.Events;
@@ -18,7 +21,15 @@ Console.WriteLine($"Config root: {settings.ConfigRoot}");
 Console.WriteLine($"Config version: {settings.ConfigVersion}");
 Console.WriteLine($"Log dir: {settings.LogDirectory}");
 
-var config = ConfigLoader.LoadByVersion(settings.ConfigRoot, settings.ConfigVersion);
+using var configs = new ConfigRegistry(settings.ConfigRoot, settings.ConfigVersion, settings.WatchConfigs);
+configs.ConfigChanged += (version, changed) => Console.WriteLine($"Config '{version}' reloaded, hash {changed.version_hash}");
+configs.ReloadFailed += (version, ex) => Console.Error.WriteLine($"Config '{version}' reload failed, keeping previous: {ex.Message}");
+Console.WriteLine($"Loaded config versions: {string.Join(", ", configs.Versions)}");
+
+// One cache shared by every consumer; entries hold the serialized reply body.
+var decisionCache = new DecisionCache<byte[]>(settings.DecisionCacheEntries, settings.DecisionCacheBytes);
+decisionCache.Attach(configs);
+Console.WriteLine($"Decision cache: {settings.DecisionCacheEntries} entries, {settings.DecisionCacheBytes} bytes");
 
 using var logWriter = new WorkerLogWriter(Path.Combine(settings.LogDirectory, "worker_events.csv"));
 
@@ -32,93 +43,304 @@ var factory = new ConnectionFactory
 };
 
 using var connection = factory.CreateConnection();
-using var channel = connection.CreateModel();
 
-channel.QueueDeclare(queue: "adaptation.req", durable: true, exclusive: false, autoDelete: false, arguments: null);
-channel.BasicQos(0, 1, false);
+Console.WriteLine($"Consumers: {settings.Consumers}, prefetch: {settings.Prefetch}, ack batch: {settings.AckBatch}");
+var workers = new List<BrokerWorker>(settings.Consumers);
+for (var i = 0; i < settings.Consumers; i++)
+{
+    workers.Add(new BrokerWorker(i, connection, configs, decisionCache, logWriter, settings));
+}
+
+var quit = new System.Threading.ManualResetEvent(false);
+Console.CancelKeyPress += (_, e) =>
+{
+    e.Cancel = true;
+    quit.Set();
+};
+
+quit.WaitOne();
+
+Console.WriteLine("ServiceBroker stopping; draining in-flight replies.");
+foreach (var worker in workers)
+{
+    worker.Dispose();
+}
 
-var consumer = new EventingBasicConsumer(channel);
-consumer.Received += (_, ea) =>
+var cacheMetrics = decisionCache.Snapshot();
+Console.WriteLine(
+    $"Decision cache: {cacheMetrics.hits} hits, {cacheMetrics.misses} misses ({cacheMetrics.hit_rate:P1}), " +
+    $"{cacheMetrics.evictions} evictions, {cacheMetrics.invalidations} invalidations, {cacheMetrics.entries} entries");
+
+/// <summary>
+/// One consumer channel: deliveries are computed on the channel's dispatch thread and handed to a
+/// publisher task that sends replies as one publish batch and acks them with a single multiple-ack.
+/// Only the publisher task issues commands on the channel after consuming starts.
+/// </summary>
+internal sealed class BrokerWorker : IDisposable
 {
-    var receiveTime = DateTime.UtcNow;
-    var correlationId = ea.BasicProperties?.CorrelationId ?? string.Empty;
-    var replyTo = ea.BasicProperties?.ReplyTo ?? string.Empty;
-    var status = "OK";
+    private const string RequestQueue = "adaptation.req";
+
+    private static readonly JsonSerializerOptions JsonOptions = new JsonSerializerOptions
+    {
+        IncludeFields = true,
+        PropertyNamingPolicy = null,
+        DictionaryKeyPolicy = null
+    };
 
-    try
+    private readonly int _id;
+    private readonly IModel _channel;
+    private readonly ConfigRegistry _configs;
+    private readonly DecisionCache<byte[]> _decisionCache;
+    private readonly WorkerLogWriter _logWriter;
+    private readonly int _ackBatch;
+    private readonly int _maxDrain;
+    private readonly Channel<PendingReply> _replies;
+    private readonly Task _publisher;
+    private readonly string _consumerTag;
+    private readonly Stopwatch _uptime = Stopwatch.StartNew();
+    private long _processed;
+
+    public BrokerWorker(
+        int id,
+        IConnection connection,
+        ConfigRegistry configs,
+        DecisionCache<byte[]> decisionCache,
+        WorkerLogWriter logWriter,
+        BrokerWorkerSettings settings)
     {
-        if (string.IsNullOrWhiteSpace(replyTo))
+        _id = id;
+        _configs = configs;
+        _decisionCache = decisionCache;
+        _logWriter = logWriter;
+        _ackBatch = Math.Max(1, settings.AckBatch);
+        _maxDrain = Math.Max(_ackBatch, settings.Prefetch);
+        _replies = Channel.CreateUnbounded<PendingReply>(new UnboundedChannelOptions
         {
-            throw new InvalidOperationException("ReplyTo is missing on request.");
-        }
+            SingleReader = true,
+            SingleWriter = true
+        });
+
+        _channel = connection.CreateModel();
+        _channel.QueueDeclare(queue: RequestQueue, durable: true, exclusive: false, autoDelete: false, arguments: null);
+        _channel.BasicQos(0, (ushort)Math.Clamp(settings.Prefetch, 1, ushort.MaxValue), false);
 
-        var body = Encoding.UTF8.GetString(ea.Body.ToArray());
-        var sessionEvent = DeserializeEvent(body);
-        if (string.IsNullOrWhiteSpace(sessionEvent.config_version))
+        _publisher = Task.Run(PublishLoopAsync);
+
+        var consumer = new EventingBasicConsumer(_channel);
+        consumer.Received += OnReceived;
+        _consumerTag = _channel.BasicConsume(queue: RequestQueue, autoAck: false, consumer: consumer);
+    }
+
+    public void Dispose()
+    {
+        try
         {
-            sessionEvent.config_version = config.version;
+            _channel.BasicCancel(_consumerTag);
+        }
+        catch (Exception ex)
+        {
+            Console.Error.WriteLine($"[worker {_id}] cancel failed: {ex.Message}");
         }
 
-        var computeTimer = Stopwatch.StartNew();
-        var result = AdaptationEngine.ComputeNext(sessionEvent, config);
-        computeTimer.Stop();
-
-        var responseJson = SerializeDecision(result.Decision);
-        var responseBytes = Encoding.UTF8.GetBytes(responseJson);
+        _replies.Writer.TryComplete();
+        _publisher.GetAwaiter().GetResult();
+        _channel.Dispose();
+    }
 
-        var props = channel.CreateBasicProperties();
-        props.CorrelationId = correlationId;
-        props.Headers = new Dictionary<string, object>
+    private void OnReceived(object sender, BasicDeliverEventArgs ea)
+    {
+        var reply = new PendingReply
         {
-            { "x-server-compute-ms", computeTimer.Elapsed.TotalMilliseconds.ToString("0.000", CultureInfo.InvariantCulture) },
-            { "x-correlation-id", correlationId }
+            DeliveryTag = ea.DeliveryTag,
+            ReceiveUtc = DateTime.UtcNow,
+            CorrelationId = ea.BasicProperties?.CorrelationId ?? string.Empty,
+            ReplyTo = ea.BasicProperties?.ReplyTo ?? string.Empty,
+            QueueWaitMs = ReadQueueWaitMs(ea.BasicProperties?.Headers),
+            Status = "OK"
         };
 
-        channel.BasicPublish(exchange: string.Empty, routingKey: replyTo, basicProperties: props, body: responseBytes);
-        channel.BasicAck(ea.DeliveryTag, false);
+        try
+        {
+            if (string.IsNullOrWhiteSpace(reply.ReplyTo))
+            {
+                throw new InvalidOperationException("ReplyTo is missing on request.");
+            }
+
+            var body = Encoding.UTF8.GetString(ea.Body.Span);
+            var sessionEvent = JsonSerializer.Deserialize<AdaptationEvent>(body, JsonOptions) ?? new AdaptationEvent();
+            var config = _configs.Resolve(sessionEvent.config_version);
+            if (string.IsNullOrWhiteSpace(sessionEvent.config_version))
+            {
+                sessionEvent.config_version = config.version;
+            }
 
-        logWriter.WriteEvent(receiveTime, DateTime.UtcNow, computeTimer.Elapsed.TotalMilliseconds, correlationId, status);
-    }
-    catch (Exception ex)
-    {
-        status = "ERROR";
-        Console.Error.WriteLine($"Error handling request: {ex.GetType().Name} - {ex.Message}");
-        logWriter.WriteEvent(receiveTime, DateTime.UtcNow, 0.0, correlationId, status);
-        channel.BasicNack(ea.DeliveryTag, false, false);
+            var computeTimer = Stopwatch.StartNew();
+            var key = new DecisionCacheKey(sessionEvent, config);
+            var hit = _decisionCache.TryGet(key, out var cached);
+            if (!hit)
+            {
+                var result = AdaptationEngine.ComputeNext(sessionEvent, config);
+                cached = CachedDecision<byte[]>.From(result, JsonSerializer.SerializeToUtf8Bytes(result.Decision ?? new AdaptationDecision(), JsonOptions));
+                _decisionCache.Add(key, cached, cached.Payload.Length);
+            }
+            computeTimer.Stop();
+
+            reply.ComputeMs = computeTimer.Elapsed.TotalMilliseconds;
+            reply.Body = cached.Payload;
+            reply.DecisionCache = !_decisionCache.Enabled ? "off" : hit ? "hit" : "miss";
+        }
+        catch (Exception ex)
+        {
+            reply.Status = "ERROR";
+            Console.Error.WriteLine($"[worker {_id}] Error handling request: {ex.GetType().Name} - {ex.Message}");
+        }
+
+        reply.ReadyTimestamp = Stopwatch.GetTimestamp();
+        _replies.Writer.TryWrite(reply);
     }
-};
 
-channel.BasicConsume(queue: "adaptation.req", autoAck: false, consumer: consumer);
+    private async Task PublishLoopAsync()
+    {
+        var reader = _replies.Reader;
+        var drained = new List<PendingReply>(_maxDrain);
+        ulong lastUnacked = 0;
+        var unacked = 0;
 
-var quit = new System.Threading.ManualResetEvent(false);
-Console.CancelKeyPress += (_, e) =>
-{
-    e.Cancel = true;
-    quit.Set();
-};
+        try
+        {
+            while (await reader.WaitToReadAsync().ConfigureAwait(false))
+            {
+                drained.Clear();
+                while (drained.Count < _maxDrain && reader.TryRead(out var item))
+                {
+                    drained.Add(item);
+                }
+
+                var batch = _channel.CreateBasicPublishBatch();
+                var batched = 0;
+                foreach (var reply in drained)
+                {
+                    if (reply.Status != "OK")
+                    {
+                        continue;
+                    }
+
+                    var props = _channel.CreateBasicProperties();
+                    props.CorrelationId = reply.CorrelationId;
+                    props.Headers = new Dictionary<string, object>
+                    {
+                        { "x-server-compute-ms", reply.ComputeMs.ToString("0.000", CultureInfo.InvariantCulture) },
+                        { "x-correlation-id", reply.CorrelationId },
+                        { "x-decision-cache", reply.DecisionCache }
+                    };
+                    batch.Add(string.Empty, reply.ReplyTo, false, props, new ReadOnlyMemory<byte>(reply.Body));
+                    batched++;
+                }
+                if (batched > 0)
+                {
+                    batch.Publish();
+                }
+
+                var publishUtc = DateTime.UtcNow;
+                var publishTimestamp = Stopwatch.GetTimestamp();
+
+                // Delivery tags arrive in order on a channel, so one multiple-ack covers every
+                // reply published before it; a failed delivery first flushes the acks before it.
+                foreach (var reply in drained)
+                {
+                    if (reply.Status == "OK")
+                    {
+                        lastUnacked = reply.DeliveryTag;
+                        unacked++;
+                    }
+                    else
+                    {
+                        if (unacked > 0)
+                        {
+                            _channel.BasicAck(lastUnacked, true);
+                            unacked = 0;
+                        }
+                        _channel.BasicNack(reply.DeliveryTag, false, false);
+                    }
+                }
+                if (unacked >= _ackBatch || (unacked > 0 && !reader.TryPeek(out _)))
+                {
+                    _channel.BasicAck(lastUnacked, true);
+                    unacked = 0;
+                }
+
+                foreach (var reply in drained)
+                {
+                    var processed = Interlocked.Increment(ref _processed);
+                    var publishWaitMs = (publishTimestamp - reply.ReadyTimestamp) * 1000.0 / Stopwatch.Frequency;
+                    var workerRps = processed / Math.Max(_uptime.Elapsed.TotalSeconds, 1e-6);
+                    _logWriter.WriteEvent(
+                        reply.ReceiveUtc,
+                        publishUtc,
+                        reply.ComputeMs,
+                        reply.CorrelationId,
+                        reply.Status,
+                        _id,
+                        reply.QueueWaitMs,
+                        publishWaitMs,
+                        drained.Count,
+                        processed,
+                        workerRps,
+                        reply.DecisionCache);
+                }
+                _logWriter.Flush();
+            }
 
-quit.WaitOne();
+            if (unacked > 0)
+            {
+                _channel.BasicAck(lastUnacked, true);
+            }
+        }
+        catch (Exception ex)
+        {
+            Console.Error.WriteLine($"[worker {_id}] publisher stopped: {ex.GetType().Name} - {ex.Message}");
+        }
+    }
 
-static AdaptationEvent DeserializeEvent(string json)
-{
-    var options = new JsonSerializerOptions
+    private static double? ReadQueueWaitMs(IDictionary<string, object> headers)
     {
-        IncludeFields = true,
-        PropertyNamingPolicy = null,
-        DictionaryKeyPolicy = null
-    };
-    return JsonSerializer.Deserialize<AdaptationEvent>(json, options) ?? new AdaptationEvent();
-}
+        if (headers == null || !headers.TryGetValue("x-sent-unix-ms", out var raw) || raw == null)
+        {
+            return null;
+        }
 
-static string SerializeDecision(AdaptationDecision decision)
-{
-    var options = new JsonSerializerOptions
+        long sentMs;
+        switch (raw)
+        {
+            case long value:
+                sentMs = value;
+                break;
+            case int value:
+                sentMs = value;
+                break;
+            case byte[] bytes when long.TryParse(Encoding.UTF8.GetString(bytes), NumberStyles.Integer, CultureInfo.InvariantCulture, out var parsed):
+                sentMs = parsed;
+                break;
+            default:
+                return null;
+        }
+
+        return DateTimeOffset.UtcNow.ToUnixTimeMilliseconds() - sentMs;
+    }
+
+    private sealed class PendingReply
     {
-        IncludeFields = true,
-        PropertyNamingPolicy = null,
-        DictionaryKeyPolicy = null
-    };
-    return JsonSerializer.Serialize(decision ?? new AdaptationDecision(), options);
+        public ulong DeliveryTag;
+        public DateTime ReceiveUtc;
+        public long ReadyTimestamp;
+        public string CorrelationId;
+        public string ReplyTo;
+        public double? QueueWaitMs;
+        public double ComputeMs;
+        public string Status;
+        public byte[] Body;
+        public string DecisionCache = string.Empty;
+    }
 }
 
 internal sealed class BrokerWorkerSettings
@@ -129,7 +351,13 @@ internal sealed class BrokerWorkerSettings
     public string BrokerPass { get; set; } = "adaptation";
     public string ConfigRoot { get; set; } = string.Empty;
     public string ConfigVersion { get; set; } = "v1";
+    public bool WatchConfigs { get; set; } = true;
+    public int Consumers { get; set; } = 1;
+    public int Prefetch { get; set; } = 1;
+    public int AckBatch { get; set; } = 1;
     public string LogDirectory { get; set; } = string.Empty;
+    public int DecisionCacheEntries { get; set; } = 4096;
+    public long DecisionCacheBytes { get; set; } = 16 * 1024 * 1024;
 
     public static BrokerWorkerSettings LoadFromEnv()
     {
@@ -140,7 +368,13 @@ internal sealed class BrokerWorkerSettings
         settings.BrokerPass = GetEnv("BROKER_PASS", settings.BrokerPass);
         settings.ConfigRoot = GetEnv("CONFIG_ROOT", settings.ConfigRoot);
         settings.ConfigVersion = GetEnv("CONFIG_VERSION", settings.ConfigVersion);
+        settings.WatchConfigs = GetBoolEnv("CONFIG_WATCH", settings.WatchConfigs);
+        settings.Consumers = Math.Max(1, GetIntEnv("WORKER_CONSUMERS", settings.Consumers));
+        settings.Prefetch = Math.Max(1, GetIntEnv("WORKER_PREFETCH", settings.Prefetch));
+        settings.AckBatch = Math.Max(1, GetIntEnv("WORKER_ACK_BATCH", settings.AckBatch));
         settings.LogDirectory = GetEnv("WORKER_LOG_DIR", settings.LogDirectory);
+        settings.DecisionCacheEntries = Math.Max(0, GetIntEnv("DECISION_CACHE_ENTRIES", settings.DecisionCacheEntries));
+        settings.DecisionCacheBytes = Math.Max(0, GetLongEnv("DECISION_CACHE_BYTES", settings.DecisionCacheBytes));
 
         if (string.IsNullOrWhiteSpace(settings.ConfigRoot))
         {
@@ -172,6 +406,26 @@ internal sealed class BrokerWorkerSettings
         return fallback;
     }
 
+    private static long GetLongEnv(string key, long fallback)
+    {
+        var value = Environment.GetEnvironmentVariable(key);
+        if (long.TryParse(value, out var parsed))
+        {
+            return parsed;
+        }
+        return fallback;
+    }
+
+    private static bool GetBoolEnv(string key, bool fallback)
+    {
+        var value = Environment.GetEnvironmentVariable(key);
+        if (bool.TryParse(value, out var parsed))
+        {
+            return parsed;
+        }
+        return fallback;
+    }
+
     private static string ResolveRepoRoot()
     {
         var dir = new DirectoryInfo(AppContext.BaseDirectory);
@@ -190,29 +444,65 @@ internal sealed class BrokerWorkerSettings
 internal sealed class WorkerLogWriter : IDisposable
 {
     private readonly StreamWriter _writer;
+    private readonly object _gate = new object();
 
     public WorkerLogWriter(string path)
     {
-        _writer = new StreamWriter(path, false, Encoding.UTF8) { AutoFlush = true };
-        _writer.WriteLine("ts_receive,ts_publish,server_compute_ms,correlation_id,status");
+        _writer = new StreamWriter(path, false, Encoding.UTF8);
+        _writer.WriteLine("ts_receive,ts_publish,server_compute_ms,correlation_id,status,worker_id,queue_wait_ms,publish_wait_ms,publish_batch,worker_processed,worker_rps,decision_cache");
+        _writer.Flush();
     }
 
-    public void WriteEvent(DateTime receiveUtc, DateTime publishUtc, double serverComputeMs, string correlationId, string status)
+    public void WriteEvent(
+        DateTime receiveUtc,
+        DateTime publishUtc,
+        double serverComputeMs,
+        string correlationId,
+        string status,
+        int workerId,
+        double? queueWaitMs,
+        double publishWaitMs,
+        int publishBatch,
+        long workerProcessed,
+        double workerRps,
+        string decisionCache)
     {
-        _writer.WriteLine(string.Format(
+        var line = string.Format(
             CultureInfo.InvariantCulture,
-            "{0},{1},{2:0.000},\"{3}\",{4}",
+            "{0},{1},{2:0.000},\"{3}\",{4},{5},{6},{7:0.000},{8},{9},{10:0.0},{11}",
             receiveUtc.ToString("o", CultureInfo.InvariantCulture),
             publishUtc.ToString("o", CultureInfo.InvariantCulture),
             serverComputeMs,
             Escape(correlationId),
-            status
-        ));
+            status,
+            workerId,
+            queueWaitMs.HasValue ? queueWaitMs.Value.ToString("0.000", CultureInfo.InvariantCulture) : string.Empty,
+            publishWaitMs,
+            publishBatch,
+            workerProcessed,
+            workerRps,
+            decisionCache);
+
+        lock (_gate)
+        {
+            _writer.WriteLine(line);
+        }
+    }
+
+    public void Flush()
+    {
+        lock (_gate)
+        {
+            _writer.Flush();
+        }
     }
 
     public void Dispose()
     {
-        _writer?.Dispose();
+        lock (_gate)
+        {
+            _writer?.Dispose();
+        }
     }
 
     private static string Escape(string value)
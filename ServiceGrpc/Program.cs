@@ -8,18 +8,34 @@ using Microsoft.Extensions.Configuration;
 var builder = WebApplication.CreateBuilder(args);
 
 var settings = ServiceGrpcSettings.Load(builder.Configuration);
-var config = ConfigLoader.LoadByVersion(settings.ConfigRoot, settings.ConfigVersion);
+var configs = new ConfigRegistry(settings.ConfigRoot, settings.ConfigVersion, settings.WatchConfigs);
+configs.ConfigChanged += (version, changed) => Console.WriteLine($"Config '{version}' reloaded, hash {changed.version_hash}");
+configs.ReloadFailed += (version, ex) => Console.Error.WriteLine($"Config '{version}' reload failed, keeping previous: {ex.Message}");
 var auditWriter = new ServiceAuditWriter(settings.AuditRoot);
+var decisionCache = new DecisionCache<CachedGrpcResponse>(settings.DecisionCacheEntries, settings.DecisionCacheBytes);
+decisionCache.Attach(configs);
 
+builder.Services.ConfigureHttpJsonOptions(options =>
+{
+    options.SerializerOptions.IncludeFields = true;
+    options.SerializerOptions.PropertyNamingPolicy = null;
+});
 builder.Services.AddGrpc();
 builder.Services.AddSingleton(settings);
-builder.Services.AddSingleton(config);
+builder.Services.AddSingleton(configs);
 builder.Services.AddSingleton(auditWriter);
+builder.Services.AddSingleton(decisionCache);
 
 builder.WebHost.ConfigureKestrel(options =>
 {
     ConfigureEndpoint(options, settings.GrpcUrl, HttpProtocols.Http1AndHttp2);
     ConfigureEndpoint(options, settings.HealthUrl, HttpProtocols.Http1);
+    if (!string.IsNullOrWhiteSpace(settings.StreamUrl))
+    {
+        // Cleartext HTTP/2 only: a mixed Http1AndHttp2 endpoint without TLS falls back to HTTP/1.1,
+        // which gRPC-Web cannot stream over, so ComputeNextStream clients use this endpoint.
+        ConfigureEndpoint(options, settings.StreamUrl, HttpProtocols.Http2);
+    }
 });
 
 var app = builder.Build();
@@ -27,13 +43,16 @@ var app = builder.Build();
 app.UseGrpcWeb();
 app.MapGrpcService<ServiceGrpc.AdaptationGrpcService>().EnableGrpcWeb();
 app.MapGet("/health", () => Results.Ok(new { status = "ok" }));
+app.MapGet("/metrics/cache", () => Results.Json(decisionCache.Snapshot()));
 
 Console.WriteLine($"ServiceGrpc starting.");
 Console.WriteLine($"Config root: {settings.ConfigRoot}");
-Console.WriteLine($"Config version: {settings.ConfigVersion}");
+Console.WriteLine($"Config version: {settings.ConfigVersion} (loaded: {string.Join(", ", configs.Versions)})");
 Console.WriteLine($"Audit root: {settings.AuditRoot}");
 Console.WriteLine($"gRPC URL: {settings.GrpcUrl}");
 Console.WriteLine($"Health URL: {settings.HealthUrl}");
+Console.WriteLine($"Stream URL: {settings.StreamUrl}");
+Console.WriteLine($"Decision cache: {settings.DecisionCacheEntries} entries, {settings.DecisionCacheBytes} bytes");
 
 app.Run();
 
@@ -7,9 +7,13 @@ namespace ServiceGrpc
     {
         public string ConfigRoot { get; set; } = string.Empty;
         public string ConfigVersion { get; set; } = "v1";
+        public bool WatchConfigs { get; set; } = true;
         public string AuditRoot { get; set; } = string.Empty;
         public string GrpcUrl { get; set; } = "http://0.0.0.0:6002";
         public string HealthUrl { get; set; } = "http://0.0.0.0:6003";
+        public string StreamUrl { get; set; } = "http://0.0.0.0:6004";
+        public int DecisionCacheEntries { get; set; } = 4096;
+        public long DecisionCacheBytes { get; set; } = 16 * 1024 * 1024;
 
         public static ServiceGrpcSettings Load(IConfiguration config)
         {
@@ -17,9 +21,17 @@ namespace ServiceGrpc
             {
                 ConfigRoot = config["ConfigRoot"] ?? config["configRoot"] ?? string.Empty,
                 ConfigVersion = config["ConfigVersion"] ?? config["configVersion"] ?? "v1",
+                WatchConfigs = !bool.TryParse(config["WatchConfigs"] ?? config["watchConfigs"], out var watchConfigs) || watchConfigs,
                 AuditRoot = config["AuditRoot"] ?? config["auditRoot"] ?? string.Empty,
                 GrpcUrl = config["GrpcUrl"] ?? config["grpcUrl"] ?? "http://0.0.0.0:6002",
-                HealthUrl = config["HealthUrl"] ?? config["healthUrl"] ?? "http://0.0.0.0:6003"
+                HealthUrl = config["HealthUrl"] ?? config["healthUrl"] ?? "http://0.0.0.0:6003",
+                StreamUrl = config["StreamUrl"] ?? config["streamUrl"] ?? "http://0.0.0.0:6004",
+                DecisionCacheEntries = int.TryParse(config["DecisionCacheEntries"] ?? config["decisionCacheEntries"], out var cacheEntries) && cacheEntries >= 0
+                    ? cacheEntries
+                    : 4096,
+                DecisionCacheBytes = long.TryParse(config["DecisionCacheBytes"] ?? config["decisionCacheBytes"], out var cacheBytes) && cacheBytes >= 0
+                    ? cacheBytes
+                    : 16 * 1024 * 1024
             };
         }
     }
@@ -12,22 +12,118 @@ namespace ServiceGrpc
 {
     public sealed class AdaptationGrpcService : Adaptation.AdaptationBase
     {
+        /// <summary>Newest AdaptationDecision layout this server writes (see adaptation.proto).</summary>
+        public const int LatestProtoVersion = 2;
+
         private static readonly JsonSerializerOptions JsonOptions = new JsonSerializerOptions
         {
             PropertyNamingPolicy = null,
             DictionaryKeyPolicy = null
         };
 
-        private readonly ConfigPackage _config;
+        private readonly ConfigRegistry _configs;
         private readonly ServiceAuditWriter _auditWriter;
+        private readonly DecisionCache<CachedGrpcResponse> _decisionCache;
 
-        public AdaptationGrpcService(ConfigPackage config, ServiceAuditWriter auditWriter)
+        public AdaptationGrpcService(ConfigRegistry configs, ServiceAuditWriter auditWriter, DecisionCache<CachedGrpcResponse> decisionCache)
         {
-            _config = config ?? throw new ArgumentNullException(nameof(config));
+            _configs = configs ?? throw new ArgumentNullException(nameof(configs));
             _auditWriter = auditWriter ?? throw new ArgumentNullException(nameof(auditWriter));
+            _decisionCache = decisionCache ?? throw new ArgumentNullException(nameof(decisionCache));
         }
 
         public override Task<AdaptationGrpc.AdaptationDecision> ComputeNext(SessionResult request, ServerCallContext context)
+        {
+            var sessionEvent = ToEvent(request);
+            var correlationId = ResolveCorrelationId(request, context);
+
+            var computeTimer = Stopwatch.StartNew();
+            try
+            {
+                var config = ResolveConfig(sessionEvent);
+                var protoVersion = NegotiateProtoVersion(request.ProtoVersion);
+                var cached = Compute(sessionEvent, config, protoVersion, out var hit);
+                computeTimer.Stop();
+
+                _auditWriter.Append(sessionEvent.session_id, cached.AuditFor(sessionEvent));
+
+                var response = ResponseFor(cached, sessionEvent, correlationId, protoVersion);
+                WriteTrailers(context, correlationId, computeTimer.Elapsed.TotalMilliseconds, cached);
+                context.ResponseTrailers.Add("x-decision-cache", CacheStatus(hit));
+                return Task.FromResult(response);
+            }
+            catch (Exception ex)
+            {
+                computeTimer.Stop();
+                WriteTrailers(context, correlationId, computeTimer.Elapsed.TotalMilliseconds, null);
+                throw new RpcException(new Status(StatusCode.Internal, ex.Message));
+            }
+        }
+
+        public override async Task ComputeNextStream(
+            IAsyncStreamReader<SessionResultBatch> requestStream,
+            IServerStreamWriter<AdaptationDecisionBatch> responseStream,
+            ServerCallContext context)
+        {
+            while (await requestStream.MoveNext(context.CancellationToken))
+            {
+                var batch = requestStream.Current;
+                var batchId = string.IsNullOrWhiteSpace(batch.BatchId) ? Guid.NewGuid().ToString("N") : batch.BatchId;
+                var reply = new AdaptationDecisionBatch
+                {
+                    BatchId = batchId,
+                    ConfigHash = _configs.Default.version_hash ?? string.Empty
+                };
+
+                var batchTimer = Stopwatch.StartNew();
+                for (var i = 0; i < batch.Items.Count; i++)
+                {
+                    reply.Results.Add(ComputeItem(i, batch.Items[i], batchId));
+                }
+                batchTimer.Stop();
+                reply.ServerComputeMs = batchTimer.Elapsed.TotalMilliseconds;
+
+                await responseStream.WriteAsync(reply);
+            }
+        }
+
+        private DecisionResult ComputeItem(int index, SessionResult item, string batchId)
+        {
+            var correlationId = string.IsNullOrWhiteSpace(item.CorrelationId)
+                ? batchId + "-" + index.ToString(CultureInfo.InvariantCulture)
+                : item.CorrelationId;
+            var result = new DecisionResult
+            {
+                Index = index,
+                CorrelationId = correlationId
+            };
+
+            var computeTimer = Stopwatch.StartNew();
+            try
+            {
+                var sessionEvent = ToEvent(item);
+                var config = ResolveConfig(sessionEvent);
+                var protoVersion = NegotiateProtoVersion(item.ProtoVersion);
+                var cached = Compute(sessionEvent, config, protoVersion, out _);
+                computeTimer.Stop();
+
+                _auditWriter.Append(sessionEvent.session_id, cached.AuditFor(sessionEvent));
+
+                result.Decision = ResponseFor(cached, sessionEvent, correlationId, protoVersion);
+                result.Ok = true;
+            }
+            catch (Exception ex)
+            {
+                computeTimer.Stop();
+                result.Ok = false;
+                result.Error = ex.Message ?? string.Empty;
+            }
+
+            result.ComputeMs = computeTimer.Elapsed.TotalMilliseconds;
+            return result;
+        }
+
+        private AdaptationEvent ToEvent(SessionResult request)
         {
             var sessionEvent = new AdaptationEvent
             {
@@ -40,36 +136,84 @@ namespace ServiceGrpc
                 config_version = request.ConfigVersion ?? string.Empty
             };
 
+            return sessionEvent;
+        }
+
+        private ConfigPackage ResolveConfig(AdaptationEvent sessionEvent)
+        {
+            var config = _configs.Resolve(sessionEvent.config_version);
             if (string.IsNullOrWhiteSpace(sessionEvent.config_version))
             {
-                sessionEvent.config_version = _config.version;
+                sessionEvent.config_version = config.version;
             }
 
-            var correlationId = ResolveCorrelationId(request, context);
+            return config;
+        }
 
-            var computeTimer = Stopwatch.StartNew();
-            try
+        private CachedDecision<CachedGrpcResponse> Compute(AdaptationEvent sessionEvent, ConfigPackage config, int protoVersion, out bool hit)
+        {
+            var key = new DecisionCacheKey(sessionEvent, config);
+            hit = _decisionCache.TryGet(key, out var cached);
+            if (hit)
             {
-                var result = AdaptationEngine.ComputeNext(sessionEvent, _config);
-                computeTimer.Stop();
+                return cached;
+            }
 
-                _auditWriter.Append(sessionEvent.session_id, result.Audit);
+            var result = AdaptationEngine.ComputeNext(sessionEvent, config);
+            cached = CachedDecision<CachedGrpcResponse>.From(result, new CachedGrpcResponse
+            {
+                Intermediate = ServiceAuditWriter.FlattenIntermediates(result.Audit)
+            });
+            // Responses for other proto versions are built on their first hit; the size counts the first one only.
+            var template = Template(cached, sessionEvent, protoVersion);
+            _decisionCache.Add(key, cached, template.CalculateSize() + cached.Payload.Intermediate.Length * sizeof(char));
+            return cached;
+        }
 
-                var response = BuildResponse(result.Decision, correlationId);
-                response.ConfigVersion = sessionEvent.config_version ?? string.Empty;
+        /// <summary>A clone of the cached response for <paramref name="protoVersion"/> carrying this call's correlation id.</summary>
+        private static AdaptationGrpc.AdaptationDecision ResponseFor(
+            CachedDecision<CachedGrpcResponse> cached,
+            AdaptationEvent sessionEvent,
+            string correlationId,
+            int protoVersion)
+        {
+            var response = Template(cached, sessionEvent, protoVersion).Clone();
+            response.CorrelationId = correlationId ?? string.Empty;
+            return response;
+        }
 
-                WriteTrailers(context, correlationId, computeTimer.Elapsed.TotalMilliseconds, result.Audit);
-                return Task.FromResult(response);
+        private static AdaptationGrpc.AdaptationDecision Template(CachedDecision<CachedGrpcResponse> cached, AdaptationEvent sessionEvent, int protoVersion)
+        {
+            var template = cached.Payload.ByVersion[protoVersion];
+            if (template == null)
+            {
+                // Racing builders produce equal messages, so whichever write lands is fine.
+                template = BuildResponse(cached.Decision, string.Empty, protoVersion);
+                template.ConfigVersion = sessionEvent.config_version ?? string.Empty;
+                cached.Payload.ByVersion[protoVersion] = template;
             }
-            catch (Exception ex)
+
+            return template;
+        }
+
+        private string CacheStatus(bool hit)
+        {
+            if (!_decisionCache.Enabled)
             {
-                computeTimer.Stop();
-                WriteTrailers(context, correlationId, computeTimer.Elapsed.TotalMilliseconds, null);
-                throw new RpcException(new Status(StatusCode.Internal, ex.Message));
+                return "off";
             }
+            return hit ? "hit" : "miss";
         }
 
-        private static AdaptationGrpc.AdaptationDecision BuildResponse(AdaptationCore.AdaptationDecision decision, string correlationId)
+        /// <summary>
+        /// Clients that predate negotiation send 0 and get version 1, which still carries the JSON strings they parse.
+        /// </summary>
+        private static int NegotiateProtoVersion(int requested)
+        {
+            return Math.Clamp(requested, 1, LatestProtoVersion);
+        }
+
+        private static AdaptationGrpc.AdaptationDecision BuildResponse(AdaptationCore.AdaptationDecision decision, string correlationId, int protoVersion)
         {
             var response = new AdaptationGrpc.AdaptationDecision
             {
@@ -77,10 +221,15 @@ namespace ServiceGrpc
                 Seed = decision?.seed ?? 0,
                 ConfigVersion = decision?.config_version ?? string.Empty,
                 CorrelationId = correlationId ?? string.Empty,
-                NpcParamsJson = BuildNpcParamsJson(decision),
-                ExplanationJson = BuildExplanationJson(decision)
+                ProtoVersion = protoVersion
             };
 
+            if (protoVersion < 2)
+            {
+                response.NpcParamsJson = BuildNpcParamsJson(decision);
+                response.ExplanationJson = BuildExplanationJson(decision);
+            }
+
             if (decision?.npc_params != null)
             {
                 foreach (var param in decision.npc_params)
@@ -177,16 +326,26 @@ namespace ServiceGrpc
             return Guid.NewGuid().ToString("N");
         }
 
-        private static void WriteTrailers(ServerCallContext context, string correlationId, double computeMs, AdaptationAuditRecord audit)
+        private static void WriteTrailers(ServerCallContext context, string correlationId, double computeMs, CachedDecision<CachedGrpcResponse> cached)
         {
             context.ResponseTrailers.Add("x-server-compute-ms", computeMs.ToString("0.000", CultureInfo.InvariantCulture));
             context.ResponseTrailers.Add("x-correlation-id", correlationId ?? string.Empty);
 
-            if (audit != null)
+            if (cached != null)
             {
-                context.ResponseTrailers.Add("x-config-hash", audit.config_version_hash ?? string.Empty);
-                context.ResponseTrailers.Add("x-intermediate", ServiceAuditWriter.FlattenIntermediates(audit));
+                context.ResponseTrailers.Add("x-config-hash", cached.ConfigHash ?? string.Empty);
+                context.ResponseTrailers.Add("x-intermediate", cached.Payload.Intermediate);
             }
         }
     }
+
+    /// <summary>
+    /// Per-input response state kept in the decision cache: the built response for each negotiated
+    /// proto version (index = version) and the flattened intermediates trailer.
+    /// </summary>
+    public sealed class CachedGrpcResponse
+    {
+        public readonly AdaptationGrpc.AdaptationDecision[] ByVersion = new AdaptationGrpc.AdaptationDecision[AdaptationGrpcService.LatestProtoVersion + 1];
+        public string Intermediate;
+    }
 }
@@ -35,6 +35,43 @@ namespace AdaptationUnity.Adapters
             }
         }
 
+        /// <summary>
+        /// Runs before session 0. Remote adapters open their connection and do a health round trip
+        /// (<see cref="IAdapterPrewarm"/>); local adapters compute one decision for the probe event and drop it,
+        /// which loads the serializer and engine code paths.
+        /// </summary>
+        public static void Prewarm(IAdaptationAdapter adapter, AdaptationEvent probeEvent, PrewarmRecorder recorder)
+        {
+            if (adapter == null || recorder == null)
+            {
+                return;
+            }
+
+            if (adapter is IAdapterPrewarm prewarm)
+            {
+                prewarm.Prewarm(probeEvent, recorder);
+                return;
+            }
+
+            recorder.Step("compute", () =>
+            {
+                if (adapter is IAdaptationAdapterWithAudit withAudit)
+                {
+                    withAudit.ComputeNext(probeEvent, out _);
+                }
+                else
+                {
+                    adapter.ComputeNext(probeEvent);
+                }
+
+                // Drop the probe's timing so session 0 does not report it.
+                if (adapter is IAdapterTiming timing)
+                {
+                    timing.TryGetLastTiming(out _, out _, out _);
+                }
+            });
+        }
+
         private static IAdaptationAdapter AttachLogger(IAdaptationAdapter adapter, AdaptationUnity.Logging.SessionLogWriter logWriter)
         {
             if (adapter is IAdapterWithLogger withLogger && logWriter != null)
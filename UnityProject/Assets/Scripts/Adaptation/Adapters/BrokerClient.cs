@@ -63,16 +63,24 @@ namespace AdaptationUnity.Adapters
 
             Exception lastError = null;
             var maxAttempts = 2;
+            var lastCorrelationId = string.Empty;
+            var sentUtc = DateTime.UtcNow;
 
             for (var attempt = 1; attempt <= maxAttempts; attempt++)
             {
                 var correlationId = Guid.NewGuid().ToString("N");
+                lastCorrelationId = correlationId;
                 var pending = new PendingResponse();
                 _pending[correlationId] = pending;
 
                 var props = _channel.CreateBasicProperties();
                 props.CorrelationId = correlationId;
                 props.ReplyTo = _replyQueueName;
+                sentUtc = DateTime.UtcNow;
+                props.Headers = new Dictionary<string, object>
+                {
+                    { "x-sent-unix-ms", new DateTimeOffset(sentUtc).ToUnixTimeMilliseconds() }
+                };
 
                 var timer = Stopwatch.StartNew();
                 try
@@ -104,6 +112,9 @@ namespace AdaptationUnity.Adapters
                     totalTimer.Stop();
                     status = "OK";
                     _logWriter?.LogR4BrokerBreakdown(
+                        _sessionIndex,
+                        _warmup,
+                        correlationId,
                         serializeTimer.Elapsed.TotalMilliseconds,
                         brokerMs,
                         serverMs,
@@ -111,7 +122,8 @@ namespace AdaptationUnity.Adapters
                         totalTimer.Elapsed.TotalMilliseconds,
                         retriesCount,
                         timeoutFlag,
-                        status
+                        status,
+                        sentUtc
                     );
                     return decision;
                 }
@@ -152,6 +164,9 @@ namespace AdaptationUnity.Adapters
 
             totalTimer.Stop();
             _logWriter?.LogR4BrokerBreakdown(
+                _sessionIndex,
+                _warmup,
+                lastCorrelationId,
                 serializeTimer.Elapsed.TotalMilliseconds,
                 brokerMs,
                 serverMs,
@@ -159,12 +174,33 @@ namespace AdaptationUnity.Adapters
                 totalTimer.Elapsed.TotalMilliseconds,
                 Math.Max(0, retriesCount),
                 timeoutFlag,
-                status
+                status,
+                sentUtc
             );
 
             throw lastError ?? new Exception("Broker RPC failed.");
         }
 
+        /// <summary>
+        /// The connection is opened by the constructor. This confirms the request queue with a passive declare
+        /// (one broker round trip, reporting its consumer count) and runs the JSON paths once; nothing is published.
+        /// </summary>
+        public void Prewarm(AdaptationEvent probeEvent, PrewarmRecorder recorder)
+        {
+            recorder.Step("health", () =>
+            {
+                var queue = _channel.QueueDeclarePassive("adaptation.req");
+                return "consumers=" + queue.ConsumerCount.ToString(CultureInfo.InvariantCulture);
+            });
+
+            recorder.Step("serializer", () =>
+            {
+                Encoding.UTF8.GetBytes(JsonUtility.ToJson(probeEvent));
+                var decisionJson = JsonUtility.ToJson(AdapterDecisions.BuildDecision(probeEvent, "R4", "prewarm"));
+                JsonUtility.FromJson<AdaptationDecision>(decisionJson);
+            });
+        }
+
         private void Connect()
         {
             var factory = new ConnectionFactory
@@ -3,7 +3,7 @@ using AdaptationUnity.Logging;
 
 namespace AdaptationUnity.Adapters
 {
-    public sealed class EngineAdapterR3Grpc : IAdaptationAdapterWithAudit, IAdapterWithLogger, IAdapterSessionContext, IAdapterTiming
+    public sealed class EngineAdapterR3Grpc : IAdaptationAdapterWithAudit, IAdapterWithLogger, IAdapterSessionContext, IAdapterTiming, IAdapterPrewarm
     {
         public string AdapterName => "R3_remote_gRPC";
 
@@ -34,6 +34,11 @@ namespace AdaptationUnity.Adapters
             _client.SetSessionContext(sessionId, sessionIndex, warmup);
         }
 
+        public void Prewarm(AdaptationEvent probeEvent, PrewarmRecorder recorder)
+        {
+            _client.Prewarm(probeEvent, recorder);
+        }
+
         public bool TryGetLastTiming(out double netMs, out double localMs, out double decisionMs)
         {
             if (_client is IAdapterTiming timing)
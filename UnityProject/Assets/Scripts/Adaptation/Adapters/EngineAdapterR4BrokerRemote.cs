@@ -3,7 +3,7 @@ using AdaptationUnity.Logging;
 
 namespace AdaptationUnity.Adapters
 {
-    public sealed class EngineAdapterR4BrokerRemote : IAdaptationAdapterWithAudit, IAdapterWithLogger, IAdapterSessionContext
+    public sealed class EngineAdapterR4BrokerRemote : IAdaptationAdapterWithAudit, IAdapterWithLogger, IAdapterSessionContext, IAdapterPrewarm
     {
         public string AdapterName => "R4_remote_BrokerRPC";
 
@@ -33,5 +33,10 @@ namespace AdaptationUnity.Adapters
         {
             _client.SetSessionContext(sessionId, sessionIndex, warmup);
         }
+
+        public void Prewarm(AdaptationEvent probeEvent, PrewarmRecorder recorder)
+        {
+            _client.Prewarm(probeEvent, recorder);
+        }
     }
 }
@@ -6,6 +6,7 @@ using System.Net.Http;
 using System.Threading;
 using AdaptationCore;
 using AdaptationUnity.Logging;
+using Google.Protobuf;
 using Grpc.Core;
 using Grpc.Net.Client;
 using Grpc.Net.Client.Web;
@@ -14,10 +15,21 @@ namespace AdaptationUnity.Adapters
 {
     public sealed class GrpcClient : IAdapterTiming
     {
+        /// <summary>gRPC-Web with base64 text frames (the original transport).</summary>
+        public const string ModeWebText = "web_text";
+        /// <summary>gRPC-Web with binary frames over HTTP/1.1.</summary>
+        public const string ModeWeb = "web";
+        /// <summary>Native gRPC over cleartext HTTP/2; needs a runtime with HTTP/2 support and an HTTP/2-only endpoint.</summary>
+        public const string ModeHttp2 = "http2";
+
+        private const int GrpcFrameHeaderBytes = 5;
+
         private static readonly object ChannelLock = new object();
         private static GrpcChannel SharedChannel;
         private static AdaptationGrpc.Adaptation.AdaptationClient SharedClient;
         private static string SharedAddress;
+        private static string SharedMode;
+        private static HttpMessageHandler SharedHttpHandler;
 
         private readonly RunConfig _config;
         private SessionLogWriter _logWriter;
@@ -52,8 +64,9 @@ namespace AdaptationUnity.Adapters
             var correlationId = Guid.NewGuid().ToString("N");
 
             var serializeTimer = Stopwatch.StartNew();
-            var request = BuildRequest(sessionEvent, correlationId);
+            var request = BuildRequest(sessionEvent, correlationId, _config.GrpcProtoVersion);
             serializeTimer.Stop();
+            var mode = NormalizeMode(_config.GrpcMode);
 
             var totalTimer = Stopwatch.StartNew();
             var grpcMs = 0.0;
@@ -66,6 +79,7 @@ namespace AdaptationUnity.Adapters
 
             var attempts = Math.Max(1, _config.ServiceRetries + 1);
             Exception lastError = null;
+            var sentUtc = DateTime.UtcNow;
 
             for (var attempt = 1; attempt <= attempts; attempt++)
             {
@@ -75,10 +89,11 @@ namespace AdaptationUnity.Adapters
                 };
 
                 var deadline = DateTime.UtcNow.AddMilliseconds(Math.Max(100, _config.ServiceTimeoutMs));
+                sentUtc = DateTime.UtcNow;
                 var timer = Stopwatch.StartNew();
                 try
                 {
-                    var client = GetClient(_config.ServiceGrpcUrl);
+                    var client = GetClient(_config.ServiceGrpcUrl, mode);
                     var call = client.ComputeNextAsync(request, new CallOptions(headers: headers, deadline: deadline));
                     var response = call.ResponseAsync.GetAwaiter().GetResult();
                     timer.Stop();
@@ -121,7 +136,11 @@ namespace AdaptationUnity.Adapters
                         retriesCount,
                         timeoutFlag,
                         grpcStatus,
-                        errorCode
+                        errorCode,
+                        sentUtc,
+                        mode,
+                        response.ProtoVersion,
+                        WireBytes(response.CalculateSize(), mode)
                     );
                     return decision;
                 }
@@ -176,12 +195,69 @@ namespace AdaptationUnity.Adapters
                 Math.Max(0, retriesCount),
                 timeoutFlag,
                 grpcStatus,
-                errorCode
+                errorCode,
+                sentUtc,
+                mode,
+                0,
+                0
             );
             throw lastError ?? new Exception("gRPC call failed.");
         }
 
-        private static AdaptationGrpc.SessionResult BuildRequest(AdaptationEvent sessionEvent, string correlationId)
+        /// <summary>
+        /// Creates the shared channel and opens its connection with a GET /health on the gRPC address,
+        /// sent through the channel's own HTTP handler so the pooled connection is the one the calls reuse.
+        /// Then runs the protobuf encode and decode paths once locally; no ComputeNext call is made.
+        /// </summary>
+        public void Prewarm(AdaptationEvent probeEvent, PrewarmRecorder recorder)
+        {
+            var mode = NormalizeMode(_config.GrpcMode);
+            recorder.Step("channel", () =>
+            {
+                GetChannel(_config.ServiceGrpcUrl, mode);
+                return "grpc_mode=" + mode;
+            });
+
+            recorder.Step("health", () =>
+            {
+                HttpMessageHandler httpHandler;
+                lock (ChannelLock)
+                {
+                    httpHandler = SharedHttpHandler;
+                }
+
+                var url = _config.ServiceGrpcUrl?.TrimEnd('/') + "/health";
+                using var invoker = new HttpMessageInvoker(httpHandler, disposeHandler: false);
+                using var request = new HttpRequestMessage(HttpMethod.Get, url)
+                {
+                    Version = mode == ModeHttp2 ? System.Net.HttpVersion.Version20 : System.Net.HttpVersion.Version11
+                };
+                using var cts = new CancellationTokenSource(TimeSpan.FromMilliseconds(Math.Max(100, _config.ServiceTimeoutMs)));
+                using var response = invoker.SendAsync(request, cts.Token).GetAwaiter().GetResult();
+                response.Content.ReadAsStringAsync().GetAwaiter().GetResult();
+                response.EnsureSuccessStatusCode();
+                return "http_status=" + ((int)response.StatusCode).ToString(CultureInfo.InvariantCulture);
+            });
+
+            recorder.Step("serializer", () =>
+            {
+                BuildRequest(probeEvent, string.Empty, _config.GrpcProtoVersion).ToByteArray();
+                var sample = new AdaptationGrpc.AdaptationDecision
+                {
+                    NextSceneId = probeEvent.scene_id ?? string.Empty,
+                    Seed = probeEvent.seed,
+                    ConfigVersion = probeEvent.config_version ?? string.Empty,
+                    ProtoVersion = _config.GrpcProtoVersion
+                };
+                sample.NpcParams.Add(new AdaptationGrpc.NpcParam { Name = "prewarm", Value = 0f });
+                sample.Explanation.Add(new AdaptationGrpc.ExplanationEntry { Name = "prewarm", Value = "prewarm" });
+                var parsed = AdaptationGrpc.AdaptationDecision.Parser.ParseFrom(sample.ToByteArray());
+                var decision = BuildDecision(parsed, probeEvent);
+                BuildAudit(probeEvent, decision, new Metadata { { "x-intermediate", "prewarm=0" } });
+            });
+        }
+
+        private static AdaptationGrpc.SessionResult BuildRequest(AdaptationEvent sessionEvent, string correlationId, int protoVersion)
         {
             return new AdaptationGrpc.SessionResult
             {
@@ -192,7 +268,8 @@ namespace AdaptationUnity.Adapters
                 Attempts = sessionEvent.attempts_a,
                 Seed = sessionEvent.seed,
                 ConfigVersion = sessionEvent.config_version ?? string.Empty,
-                CorrelationId = correlationId ?? string.Empty
+                CorrelationId = correlationId ?? string.Empty,
+                ProtoVersion = protoVersion
             };
         }
 
@@ -205,7 +282,9 @@ namespace AdaptationUnity.Adapters
                 config_version = response.ConfigVersion
             };
 
-            if (response.NpcParams != null && response.NpcParams.Count > 0)
+            // Version 2 responses carry no JSON strings, so the typed fields are authoritative even when empty.
+            var typedOnly = response.ProtoVersion >= 2;
+            if (typedOnly || (response.NpcParams != null && response.NpcParams.Count > 0))
             {
                 foreach (var param in response.NpcParams)
                 {
@@ -229,7 +308,7 @@ namespace AdaptationUnity.Adapters
                 }
             }
 
-            if (response.Explanation != null && response.Explanation.Count > 0)
+            if (typedOnly || (response.Explanation != null && response.Explanation.Count > 0))
             {
                 foreach (var entry in response.Explanation)
                 {
@@ -307,19 +386,32 @@ namespace AdaptationUnity.Adapters
             return string.Empty;
         }
 
-        private static Grpc.Net.Client.GrpcChannel GetChannel(string address)
+        private static Grpc.Net.Client.GrpcChannel GetChannel(string address, string mode)
         {
             lock (ChannelLock)
             {
-                if (SharedChannel != null && string.Equals(SharedAddress, address, StringComparison.OrdinalIgnoreCase))
+                if (SharedChannel != null
+                    && string.Equals(SharedAddress, address, StringComparison.OrdinalIgnoreCase)
+                    && string.Equals(SharedMode, mode, StringComparison.Ordinal))
                 {
                     return SharedChannel;
                 }
 
-                var handler = new GrpcWebHandler(GrpcWebMode.GrpcWebText, new HttpClientHandler())
+                HttpMessageHandler handler;
+                var httpHandler = new HttpClientHandler();
+                if (mode == ModeHttp2)
                 {
-                    HttpVersion = System.Net.HttpVersion.Version11
-                };
+                    handler = httpHandler;
+                }
+                else
+                {
+                    var webMode = mode == ModeWebText ? GrpcWebMode.GrpcWebText : GrpcWebMode.GrpcWeb;
+                    handler = new GrpcWebHandler(webMode, httpHandler)
+                    {
+                        HttpVersion = System.Net.HttpVersion.Version11
+                    };
+                }
+
                 var channel = Grpc.Net.Client.GrpcChannel.ForAddress(address, new GrpcChannelOptions
                 {
                     HttpHandler = handler
@@ -327,17 +419,32 @@ namespace AdaptationUnity.Adapters
 
                 SharedChannel = channel;
                 SharedAddress = address;
+                SharedMode = mode;
+                SharedHttpHandler = httpHandler;
                 SharedClient = new AdaptationGrpc.Adaptation.AdaptationClient(channel);
                 return channel;
             }
         }
 
-        private static AdaptationGrpc.Adaptation.AdaptationClient GetClient(string address)
+        private static AdaptationGrpc.Adaptation.AdaptationClient GetClient(string address, string mode)
         {
-            GetChannel(address);
+            GetChannel(address, mode);
             return SharedClient;
         }
 
+        private static string NormalizeMode(string mode)
+        {
+            var value = (mode ?? string.Empty).Trim().ToLowerInvariant();
+            return value == ModeWebText || value == ModeHttp2 ? value : ModeWeb;
+        }
+
+        /// <summary>Response message bytes on the wire: one gRPC frame, base64-encoded in text mode (trailers excluded).</summary>
+        private static int WireBytes(int messageBytes, string mode)
+        {
+            var framed = messageBytes + GrpcFrameHeaderBytes;
+            return mode == ModeWebText ? (framed + 2) / 3 * 4 : framed;
+        }
+
         private static Dictionary<string, float> ParseFloatMap(string json)
         {
             var map = new Dictionary<string, float>();
@@ -0,0 +1,9 @@
+using AdaptationCore;
+
+namespace AdaptationUnity.Adapters
+{
+    public interface IAdapterPrewarm
+    {
+        void Prewarm(AdaptationEvent probeEvent, PrewarmRecorder recorder);
+    }
+}
@@ -0,0 +1,61 @@
+using System;
+using System.Diagnostics;
+using AdaptationUnity.Logging;
+
+namespace AdaptationUnity.Adapters
+{
+    /// <summary>
+    /// Times the prewarm steps run before session 0 and writes one prewarm.csv row per step.
+    /// A failing step is logged with its error and does not stop the steps after it.
+    /// </summary>
+    public sealed class PrewarmRecorder
+    {
+        private readonly SessionLogWriter _logWriter;
+        private readonly string _adapterName;
+
+        public PrewarmRecorder(SessionLogWriter logWriter, string adapterName)
+        {
+            _logWriter = logWriter;
+            _adapterName = adapterName ?? string.Empty;
+        }
+
+        public double TotalMs { get; private set; }
+        public bool Ok { get; private set; } = true;
+
+        public bool Step(string step, Action action)
+        {
+            return Step(step, () =>
+            {
+                action();
+                return string.Empty;
+            });
+        }
+
+        /// <summary>Runs <paramref name="action"/> and logs its duration; the returned string goes to the detail column.</summary>
+        public bool Step(string step, Func<string> action)
+        {
+            var timer = Stopwatch.StartNew();
+            try
+            {
+                var detail = action();
+                timer.Stop();
+                Record(step, timer.Elapsed.TotalMilliseconds, true, detail);
+                return true;
+            }
+            catch (Exception ex)
+            {
+                timer.Stop();
+                var error = (ex.GetType().Name + ": " + ex.Message).Replace('\r', ' ').Replace('\n', ' ');
+                Record(step, timer.Elapsed.TotalMilliseconds, false, error);
+                return false;
+            }
+        }
+
+        public void Record(string step, double durationMs, bool ok, string detail)
+        {
+            TotalMs += durationMs;
+            Ok &= ok;
+            _logWriter?.LogPrewarm(_adapterName, step, durationMs, ok, detail);
+        }
+    }
+}
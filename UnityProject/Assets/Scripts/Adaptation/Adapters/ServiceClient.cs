@@ -63,12 +63,14 @@ namespace AdaptationUnity.Adapters
 
             var attempts = Math.Max(1, _config.ServiceRetries + 1);
             Exception lastError = null;
+            var sentUtc = DateTime.UtcNow;
             for (var attempt = 1; attempt <= attempts; attempt++)
             {
                 var content = new StringContent(payload, Encoding.UTF8, "application/json");
                 using var request = new HttpRequestMessage(HttpMethod.Post, url) { Content = content };
                 request.Headers.Add("X-Correlation-Id", correlationId);
 
+                sentUtc = DateTime.UtcNow;
                 var timer = Stopwatch.StartNew();
                 try
                 {
@@ -110,7 +112,8 @@ namespace AdaptationUnity.Adapters
                         retriesCount,
                         timeoutFlag,
                         httpStatus,
-                        errorCode
+                        errorCode,
+                        sentUtc
                     );
                     return decision;
                 }
@@ -150,11 +153,38 @@ namespace AdaptationUnity.Adapters
                 Math.Max(0, retriesCount),
                 timeoutFlag,
                 httpStatus,
-                errorCode
+                errorCode,
+                sentUtc
             );
             throw lastError ?? new Exception("Service call failed.");
         }
 
+        /// <summary>
+        /// Opens the shared client's connection with a /health round trip and runs the local serialize and
+        /// parse paths once, without sending a decision request.
+        /// </summary>
+        public void Prewarm(AdaptationEvent probeEvent, PrewarmRecorder recorder)
+        {
+            recorder.Step("health", () =>
+            {
+                var url = _config.ServiceUrl?.TrimEnd('/') + "/health";
+                using var cts = new CancellationTokenSource(TimeSpan.FromMilliseconds(Math.Max(100, _config.ServiceTimeoutMs)));
+                using var response = _httpClient.GetAsync(url, cts.Token).GetAwaiter().GetResult();
+                response.Content.ReadAsStringAsync().GetAwaiter().GetResult();
+                response.EnsureSuccessStatusCode();
+                return "http_status=" + ((int)response.StatusCode).ToString(CultureInfo.InvariantCulture);
+            });
+
+            recorder.Step("serializer", () =>
+            {
+                var payload = BuildPayload(probeEvent, _config.ProfileId);
+                using var content = new StringContent(payload, Encoding.UTF8, "application/json");
+                var decisionJson = JsonUtility.ToJson(AdapterDecisions.BuildDecision(probeEvent, "B2", "prewarm"));
+                JsonUtility.FromJson<AdaptationDecision>(decisionJson);
+                ParseIntermediates("prewarm=0");
+            });
+        }
+
         private void StoreTiming(double netMs, double localMs, double decisionMs)
         {
             _lastNetMs = netMs;
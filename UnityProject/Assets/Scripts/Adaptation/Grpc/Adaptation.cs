@@ -24,28 +24,43 @@ namespace AdaptationGrpc {
     static AdaptationReflection() {
       byte[] descriptorData = global::System.Convert.FromBase64String(
           string.Concat(
-            "ChZwcm90by9hZGFwdGF0aW9uLnByb3RvEgphZGFwdGF0aW9uIqcBCg1TZXNz",
+            "ChZwcm90by9hZGFwdGF0aW9uLnByb3RvEgphZGFwdGF0aW9uIr4BCg1TZXNz",
             "aW9uUmVzdWx0EhIKCnNlc3Npb25faWQYASABKAkSEAoIc2NlbmVfaWQYAiAB",
             "KAkSEAoIcmVzdWx0X3oYAyABKAISDgoGdGltZV90GAQgASgCEhAKCGF0dGVt",
             "cHRzGAUgASgFEgwKBHNlZWQYBiABKAUSFgoOY29uZmlnX3ZlcnNpb24YByAB",
-            "KAkSFgoOY29ycmVsYXRpb25faWQYCCABKAkiJwoITnBjUGFyYW0SDAoEbmFt",
-            "ZRgBIAEoCRINCgV2YWx1ZRgCIAEoAiIvChBFeHBsYW5hdGlvbkVudHJ5EgwK",
-            "BG5hbWUYASABKAkSDQoFdmFsdWUYAiABKAki+QEKEkFkYXB0YXRpb25EZWNp",
-            "c2lvbhIVCg1uZXh0X3NjZW5lX2lkGAEgASgJEhcKD25wY19wYXJhbXNfanNv",
-            "bhgCIAEoCRIYChBleHBsYW5hdGlvbl9qc29uGAMgASgJEgwKBHNlZWQYBCAB",
-            "KAUSFgoOY29uZmlnX3ZlcnNpb24YBSABKAkSFgoOY29ycmVsYXRpb25faWQY",
-            "BiABKAkSKAoKbnBjX3BhcmFtcxgKIAMoCzIULmFkYXB0YXRpb24uTnBjUGFy",
-            "YW0SMQoLZXhwbGFuYXRpb24YCyADKAsyHC5hZGFwdGF0aW9uLkV4cGxhbmF0",
-            "aW9uRW50cnkyVgoKQWRhcHRhdGlvbhJICgtDb21wdXRlTmV4dBIZLmFkYXB0",
-            "YXRpb24uU2Vzc2lvblJlc3VsdBoeLmFkYXB0YXRpb24uQWRhcHRhdGlvbkRl",
-            "Y2lzaW9uQhGqAg5BZGFwdGF0aW9uR3JwY2IGcHJvdG8z"));
+            "KAkSFgoOY29ycmVsYXRpb25faWQYCCABKAkSFQoNcHJvdG9fdmVyc2lvbhgJ",
+            "IAEoBSInCghOcGNQYXJhbRIMCgRuYW1lGAEgASgJEg0KBXZhbHVlGAIgASgC",
+            "Ii8KEEV4cGxhbmF0aW9uRW50cnkSDAoEbmFtZRgBIAEoCRINCgV2YWx1ZRgC",
+            "IAEoCSKQAgoSQWRhcHRhdGlvbkRlY2lzaW9uEhUKDW5leHRfc2NlbmVfaWQY",
+            "ASABKAkSFwoPbnBjX3BhcmFtc19qc29uGAIgASgJEhgKEGV4cGxhbmF0aW9u",
+            "X2pzb24YAyABKAkSDAoEc2VlZBgEIAEoBRIWCg5jb25maWdfdmVyc2lvbhgF",
+            "IAEoCRIWCg5jb3JyZWxhdGlvbl9pZBgGIAEoCRIoCgpucGNfcGFyYW1zGAog",
+            "AygLMhQuYWRhcHRhdGlvbi5OcGNQYXJhbRIxCgtleHBsYW5hdGlvbhgLIAMo",
+            "CzIcLmFkYXB0YXRpb24uRXhwbGFuYXRpb25FbnRyeRIVCg1wcm90b192ZXJz",
+            "aW9uGAwgASgFIlAKElNlc3Npb25SZXN1bHRCYXRjaBIQCghiYXRjaF9pZBgB",
+            "IAEoCRIoCgVpdGVtcxgCIAMoCzIZLmFkYXB0YXRpb24uU2Vzc2lvblJlc3Vs",
+            "dCKYAQoORGVjaXNpb25SZXN1bHQSDQoFaW5kZXgYASABKAUSFgoOY29ycmVs",
+            "YXRpb25faWQYAiABKAkSCgoCb2sYAyABKAgSDQoFZXJyb3IYBCABKAkSEgoK",
+            "Y29tcHV0ZV9tcxgFIAEoARIwCghkZWNpc2lvbhgGIAEoCzIeLmFkYXB0YXRp",
+            "b24uQWRhcHRhdGlvbkRlY2lzaW9uIogBChdBZGFwdGF0aW9uRGVjaXNpb25C",
+            "YXRjaBIQCghiYXRjaF9pZBgBIAEoCRIrCgdyZXN1bHRzGAIgAygLMhouYWRh",
+            "cHRhdGlvbi5EZWNpc2lvblJlc3VsdBIZChFzZXJ2ZXJfY29tcHV0ZV9tcxgD",
+            "IAEoARITCgtjb25maWdfaGFzaBgEIAEoCTK0AQoKQWRhcHRhdGlvbhJICgtD",
+            "b21wdXRlTmV4dBIZLmFkYXB0YXRpb24uU2Vzc2lvblJlc3VsdBoeLmFkYXB0",
+            "YXRpb24uQWRhcHRhdGlvbkRlY2lzaW9uElwKEUNvbXB1dGVOZXh0U3RyZWFt",
+            "Eh4uYWRhcHRhdGlvbi5TZXNzaW9uUmVzdWx0QmF0Y2gaIy5hZGFwdGF0aW9u",
+            "LkFkYXB0YXRpb25EZWNpc2lvbkJhdGNoKAEwAUIRqgIOQWRhcHRhdGlvbkdy",
+            "cGNiBnByb3RvMw=="));
       descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
           new pbr::FileDescriptor[] { },
           new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
-            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.SessionResult), global::AdaptationGrpc.SessionResult.Parser, new[]{ "SessionId", "SceneId", "ResultZ", "TimeT", "Attempts", "Seed", "ConfigVersion", "CorrelationId" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.SessionResult), global::AdaptationGrpc.SessionResult.Parser, new[]{ "SessionId", "SceneId", "ResultZ", "TimeT", "Attempts", "Seed", "ConfigVersion", "CorrelationId", "ProtoVersion" }, null, null, null, null),
             new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.NpcParam), global::AdaptationGrpc.NpcParam.Parser, new[]{ "Name", "Value" }, null, null, null, null),
             new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.ExplanationEntry), global::AdaptationGrpc.ExplanationEntry.Parser, new[]{ "Name", "Value" }, null, null, null, null),
-            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.AdaptationDecision), global::AdaptationGrpc.AdaptationDecision.Parser, new[]{ "NextSceneId", "NpcParamsJson", "ExplanationJson", "Seed", "ConfigVersion", "CorrelationId", "NpcParams", "Explanation" }, null, null, null, null)
+            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.AdaptationDecision), global::AdaptationGrpc.AdaptationDecision.Parser, new[]{ "NextSceneId", "NpcParamsJson", "ExplanationJson", "Seed", "ConfigVersion", "CorrelationId", "NpcParams", "Explanation", "ProtoVersion" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.SessionResultBatch), global::AdaptationGrpc.SessionResultBatch.Parser, new[]{ "BatchId", "Items" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.DecisionResult), global::AdaptationGrpc.DecisionResult.Parser, new[]{ "Index", "CorrelationId", "Ok", "Error", "ComputeMs", "Decision" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::AdaptationGrpc.AdaptationDecisionBatch), global::AdaptationGrpc.AdaptationDecisionBatch.Parser, new[]{ "BatchId", "Results", "ServerComputeMs", "ConfigHash" }, null, null, null, null)
           }));
     }
     #endregion
@@ -95,6 +110,7 @@ namespace AdaptationGrpc {
       seed_ = other.seed_;
       configVersion_ = other.configVersion_;
       correlationId_ = other.correlationId_;
+      protoVersion_ = other.protoVersion_;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
@@ -200,6 +216,21 @@ namespace AdaptationGrpc {
       }
     }
 
+    /// <summary>Field number for the "proto_version" field.</summary>
+    public const int ProtoVersionFieldNumber = 9;
+    private int protoVersion_;
+    /// <summary>
+    /// Highest AdaptationDecision layout the client understands (0 = legacy, see AdaptationDecision).
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int ProtoVersion {
+      get { return protoVersion_; }
+      set {
+        protoVersion_ = value;
+      }
+    }
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override bool Equals(object other) {
@@ -223,6 +254,7 @@ namespace AdaptationGrpc {
       if (Seed != other.Seed) return false;
       if (ConfigVersion != other.ConfigVersion) return false;
       if (CorrelationId != other.CorrelationId) return false;
+      if (ProtoVersion != other.ProtoVersion) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -238,6 +270,7 @@ namespace AdaptationGrpc {
       if (Seed != 0) hash ^= Seed.GetHashCode();
       if (ConfigVersion.Length != 0) hash ^= ConfigVersion.GetHashCode();
       if (CorrelationId.Length != 0) hash ^= CorrelationId.GetHashCode();
+      if (ProtoVersion != 0) hash ^= ProtoVersion.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -288,6 +321,10 @@ namespace AdaptationGrpc {
         output.WriteRawTag(66);
         output.WriteString(CorrelationId);
       }
+      if (ProtoVersion != 0) {
+        output.WriteRawTag(72);
+        output.WriteInt32(ProtoVersion);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -330,6 +367,10 @@ namespace AdaptationGrpc {
         output.WriteRawTag(66);
         output.WriteString(CorrelationId);
       }
+      if (ProtoVersion != 0) {
+        output.WriteRawTag(72);
+        output.WriteInt32(ProtoVersion);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
       }
@@ -364,6 +405,9 @@ namespace AdaptationGrpc {
       if (CorrelationId.Length != 0) {
         size += 1 + pb::CodedOutputStream.ComputeStringSize(CorrelationId);
       }
+      if (ProtoVersion != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(ProtoVersion);
+      }
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -400,6 +444,9 @@ namespace AdaptationGrpc {
       if (other.CorrelationId.Length != 0) {
         CorrelationId = other.CorrelationId;
       }
+      if (other.ProtoVersion != 0) {
+        ProtoVersion = other.ProtoVersion;
+      }
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -447,6 +494,10 @@ namespace AdaptationGrpc {
             CorrelationId = input.ReadString();
             break;
           }
+          case 72: {
+            ProtoVersion = input.ReadInt32();
+            break;
+          }
         }
       }
     #endif
@@ -494,6 +545,10 @@ namespace AdaptationGrpc {
             CorrelationId = input.ReadString();
             break;
           }
+          case 72: {
+            ProtoVersion = input.ReadInt32();
+            break;
+          }
         }
       }
     }
@@ -955,6 +1010,10 @@ namespace AdaptationGrpc {
 
   }
 
+  /// <summary>
+  /// Version 1 fills both the *_json strings and the typed repeated fields.
+  /// Version 2 leaves the *_json strings empty; clients read npc_params and explanation only.
+  /// </summary>
   [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
   public sealed partial class AdaptationDecision : pb::IMessage<AdaptationDecision>
   #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
@@ -998,6 +1057,7 @@ namespace AdaptationGrpc {
       correlationId_ = other.correlationId_;
       npcParams_ = other.npcParams_.Clone();
       explanation_ = other.explanation_.Clone();
+      protoVersion_ = other.protoVersion_;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
@@ -1101,6 +1161,21 @@ namespace AdaptationGrpc {
       get { return explanation_; }
     }
 
+    /// <summary>Field number for the "proto_version" field.</summary>
+    public const int ProtoVersionFieldNumber = 12;
+    private int protoVersion_;
+    /// <summary>
+    /// Layout the server used for this response; 0 from servers that predate negotiation.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int ProtoVersion {
+      get { return protoVersion_; }
+      set {
+        protoVersion_ = value;
+      }
+    }
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override bool Equals(object other) {
@@ -1124,6 +1199,7 @@ namespace AdaptationGrpc {
       if (CorrelationId != other.CorrelationId) return false;
       if(!npcParams_.Equals(other.npcParams_)) return false;
       if(!explanation_.Equals(other.explanation_)) return false;
+      if (ProtoVersion != other.ProtoVersion) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -1139,6 +1215,7 @@ namespace AdaptationGrpc {
       if (CorrelationId.Length != 0) hash ^= CorrelationId.GetHashCode();
       hash ^= npcParams_.GetHashCode();
       hash ^= explanation_.GetHashCode();
+      if (ProtoVersion != 0) hash ^= ProtoVersion.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -1183,6 +1260,10 @@ namespace AdaptationGrpc {
       }
       npcParams_.WriteTo(output, _repeated_npcParams_codec);
       explanation_.WriteTo(output, _repeated_explanation_codec);
+      if (ProtoVersion != 0) {
+        output.WriteRawTag(96);
+        output.WriteInt32(ProtoVersion);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -1219,6 +1300,10 @@ namespace AdaptationGrpc {
       }
       npcParams_.WriteTo(ref output, _repeated_npcParams_codec);
       explanation_.WriteTo(ref output, _repeated_explanation_codec);
+      if (ProtoVersion != 0) {
+        output.WriteRawTag(96);
+        output.WriteInt32(ProtoVersion);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
       }
@@ -1249,6 +1334,9 @@ namespace AdaptationGrpc {
       }
       size += npcParams_.CalculateSize(_repeated_npcParams_codec);
       size += explanation_.CalculateSize(_repeated_explanation_codec);
+      if (ProtoVersion != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(ProtoVersion);
+      }
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -1281,6 +1369,9 @@ namespace AdaptationGrpc {
       }
       npcParams_.Add(other.npcParams_);
       explanation_.Add(other.explanation_);
+      if (other.ProtoVersion != 0) {
+        ProtoVersion = other.ProtoVersion;
+      }
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -1328,6 +1419,10 @@ namespace AdaptationGrpc {
             explanation_.AddEntriesFrom(input, _repeated_explanation_codec);
             break;
           }
+          case 96: {
+            ProtoVersion = input.ReadInt32();
+            break;
+          }
         }
       }
     #endif
@@ -1375,6 +1470,900 @@ namespace AdaptationGrpc {
             explanation_.AddEntriesFrom(ref input, _repeated_explanation_codec);
             break;
           }
+          case 96: {
+            ProtoVersion = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class SessionResultBatch : pb::IMessage<SessionResultBatch>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<SessionResultBatch> _parser = new pb::MessageParser<SessionResultBatch>(() => new SessionResultBatch());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<SessionResultBatch> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::AdaptationGrpc.AdaptationReflection.Descriptor.MessageTypes[4]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public SessionResultBatch() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public SessionResultBatch(SessionResultBatch other) : this() {
+      batchId_ = other.batchId_;
+      items_ = other.items_.Clone();
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public SessionResultBatch Clone() {
+      return new SessionResultBatch(this);
+    }
+
+    /// <summary>Field number for the "batch_id" field.</summary>
+    public const int BatchIdFieldNumber = 1;
+    private string batchId_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string BatchId {
+      get { return batchId_; }
+      set {
+        batchId_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "items" field.</summary>
+    public const int ItemsFieldNumber = 2;
+    private static readonly pb::FieldCodec<global::AdaptationGrpc.SessionResult> _repeated_items_codec
+        = pb::FieldCodec.ForMessage(18, global::AdaptationGrpc.SessionResult.Parser);
+    private readonly pbc::RepeatedField<global::AdaptationGrpc.SessionResult> items_ = new pbc::RepeatedField<global::AdaptationGrpc.SessionResult>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<global::AdaptationGrpc.SessionResult> Items {
+      get { return items_; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as SessionResultBatch);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(SessionResultBatch other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (BatchId != other.BatchId) return false;
+      if(!items_.Equals(other.items_)) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (BatchId.Length != 0) hash ^= BatchId.GetHashCode();
+      hash ^= items_.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (BatchId.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(BatchId);
+      }
+      items_.WriteTo(output, _repeated_items_codec);
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (BatchId.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(BatchId);
+      }
+      items_.WriteTo(ref output, _repeated_items_codec);
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (BatchId.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(BatchId);
+      }
+      size += items_.CalculateSize(_repeated_items_codec);
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(SessionResultBatch other) {
+      if (other == null) {
+        return;
+      }
+      if (other.BatchId.Length != 0) {
+        BatchId = other.BatchId;
+      }
+      items_.Add(other.items_);
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            BatchId = input.ReadString();
+            break;
+          }
+          case 18: {
+            items_.AddEntriesFrom(input, _repeated_items_codec);
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            BatchId = input.ReadString();
+            break;
+          }
+          case 18: {
+            items_.AddEntriesFrom(ref input, _repeated_items_codec);
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class DecisionResult : pb::IMessage<DecisionResult>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<DecisionResult> _parser = new pb::MessageParser<DecisionResult>(() => new DecisionResult());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<DecisionResult> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::AdaptationGrpc.AdaptationReflection.Descriptor.MessageTypes[5]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public DecisionResult() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public DecisionResult(DecisionResult other) : this() {
+      index_ = other.index_;
+      correlationId_ = other.correlationId_;
+      ok_ = other.ok_;
+      error_ = other.error_;
+      computeMs_ = other.computeMs_;
+      decision_ = other.decision_ != null ? other.decision_.Clone() : null;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public DecisionResult Clone() {
+      return new DecisionResult(this);
+    }
+
+    /// <summary>Field number for the "index" field.</summary>
+    public const int IndexFieldNumber = 1;
+    private int index_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int Index {
+      get { return index_; }
+      set {
+        index_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "correlation_id" field.</summary>
+    public const int CorrelationIdFieldNumber = 2;
+    private string correlationId_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string CorrelationId {
+      get { return correlationId_; }
+      set {
+        correlationId_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "ok" field.</summary>
+    public const int OkFieldNumber = 3;
+    private bool ok_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Ok {
+      get { return ok_; }
+      set {
+        ok_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "error" field.</summary>
+    public const int ErrorFieldNumber = 4;
+    private string error_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string Error {
+      get { return error_; }
+      set {
+        error_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "compute_ms" field.</summary>
+    public const int ComputeMsFieldNumber = 5;
+    private double computeMs_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public double ComputeMs {
+      get { return computeMs_; }
+      set {
+        computeMs_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "decision" field.</summary>
+    public const int DecisionFieldNumber = 6;
+    private global::AdaptationGrpc.AdaptationDecision decision_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::AdaptationGrpc.AdaptationDecision Decision {
+      get { return decision_; }
+      set {
+        decision_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as DecisionResult);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(DecisionResult other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Index != other.Index) return false;
+      if (CorrelationId != other.CorrelationId) return false;
+      if (Ok != other.Ok) return false;
+      if (Error != other.Error) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.Equals(ComputeMs, other.ComputeMs)) return false;
+      if (!object.Equals(Decision, other.Decision)) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Index != 0) hash ^= Index.GetHashCode();
+      if (CorrelationId.Length != 0) hash ^= CorrelationId.GetHashCode();
+      if (Ok != false) hash ^= Ok.GetHashCode();
+      if (Error.Length != 0) hash ^= Error.GetHashCode();
+      if (ComputeMs != 0D) hash ^= pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.GetHashCode(ComputeMs);
+      if (decision_ != null) hash ^= Decision.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (Index != 0) {
+        output.WriteRawTag(8);
+        output.WriteInt32(Index);
+      }
+      if (CorrelationId.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteString(CorrelationId);
+      }
+      if (Ok != false) {
+        output.WriteRawTag(24);
+        output.WriteBool(Ok);
+      }
+      if (Error.Length != 0) {
+        output.WriteRawTag(34);
+        output.WriteString(Error);
+      }
+      if (ComputeMs != 0D) {
+        output.WriteRawTag(41);
+        output.WriteDouble(ComputeMs);
+      }
+      if (decision_ != null) {
+        output.WriteRawTag(50);
+        output.WriteMessage(Decision);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (Index != 0) {
+        output.WriteRawTag(8);
+        output.WriteInt32(Index);
+      }
+      if (CorrelationId.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteString(CorrelationId);
+      }
+      if (Ok != false) {
+        output.WriteRawTag(24);
+        output.WriteBool(Ok);
+      }
+      if (Error.Length != 0) {
+        output.WriteRawTag(34);
+        output.WriteString(Error);
+      }
+      if (ComputeMs != 0D) {
+        output.WriteRawTag(41);
+        output.WriteDouble(ComputeMs);
+      }
+      if (decision_ != null) {
+        output.WriteRawTag(50);
+        output.WriteMessage(Decision);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (Index != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(Index);
+      }
+      if (CorrelationId.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(CorrelationId);
+      }
+      if (Ok != false) {
+        size += 1 + 1;
+      }
+      if (Error.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(Error);
+      }
+      if (ComputeMs != 0D) {
+        size += 1 + 8;
+      }
+      if (decision_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Decision);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(DecisionResult other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Index != 0) {
+        Index = other.Index;
+      }
+      if (other.CorrelationId.Length != 0) {
+        CorrelationId = other.CorrelationId;
+      }
+      if (other.Ok != false) {
+        Ok = other.Ok;
+      }
+      if (other.Error.Length != 0) {
+        Error = other.Error;
+      }
+      if (other.ComputeMs != 0D) {
+        ComputeMs = other.ComputeMs;
+      }
+      if (other.decision_ != null) {
+        if (decision_ == null) {
+          Decision = new global::AdaptationGrpc.AdaptationDecision();
+        }
+        Decision.MergeFrom(other.Decision);
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 8: {
+            Index = input.ReadInt32();
+            break;
+          }
+          case 18: {
+            CorrelationId = input.ReadString();
+            break;
+          }
+          case 24: {
+            Ok = input.ReadBool();
+            break;
+          }
+          case 34: {
+            Error = input.ReadString();
+            break;
+          }
+          case 41: {
+            ComputeMs = input.ReadDouble();
+            break;
+          }
+          case 50: {
+            if (decision_ == null) {
+              Decision = new global::AdaptationGrpc.AdaptationDecision();
+            }
+            input.ReadMessage(Decision);
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 8: {
+            Index = input.ReadInt32();
+            break;
+          }
+          case 18: {
+            CorrelationId = input.ReadString();
+            break;
+          }
+          case 24: {
+            Ok = input.ReadBool();
+            break;
+          }
+          case 34: {
+            Error = input.ReadString();
+            break;
+          }
+          case 41: {
+            ComputeMs = input.ReadDouble();
+            break;
+          }
+          case 50: {
+            if (decision_ == null) {
+              Decision = new global::AdaptationGrpc.AdaptationDecision();
+            }
+            input.ReadMessage(Decision);
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class AdaptationDecisionBatch : pb::IMessage<AdaptationDecisionBatch>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<AdaptationDecisionBatch> _parser = new pb::MessageParser<AdaptationDecisionBatch>(() => new AdaptationDecisionBatch());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<AdaptationDecisionBatch> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::AdaptationGrpc.AdaptationReflection.Descriptor.MessageTypes[6]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public AdaptationDecisionBatch() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public AdaptationDecisionBatch(AdaptationDecisionBatch other) : this() {
+      batchId_ = other.batchId_;
+      results_ = other.results_.Clone();
+      serverComputeMs_ = other.serverComputeMs_;
+      configHash_ = other.configHash_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public AdaptationDecisionBatch Clone() {
+      return new AdaptationDecisionBatch(this);
+    }
+
+    /// <summary>Field number for the "batch_id" field.</summary>
+    public const int BatchIdFieldNumber = 1;
+    private string batchId_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string BatchId {
+      get { return batchId_; }
+      set {
+        batchId_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "results" field.</summary>
+    public const int ResultsFieldNumber = 2;
+    private static readonly pb::FieldCodec<global::AdaptationGrpc.DecisionResult> _repeated_results_codec
+        = pb::FieldCodec.ForMessage(18, global::AdaptationGrpc.DecisionResult.Parser);
+    private readonly pbc::RepeatedField<global::AdaptationGrpc.DecisionResult> results_ = new pbc::RepeatedField<global::AdaptationGrpc.DecisionResult>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<global::AdaptationGrpc.DecisionResult> Results {
+      get { return results_; }
+    }
+
+    /// <summary>Field number for the "server_compute_ms" field.</summary>
+    public const int ServerComputeMsFieldNumber = 3;
+    private double serverComputeMs_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public double ServerComputeMs {
+      get { return serverComputeMs_; }
+      set {
+        serverComputeMs_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "config_hash" field.</summary>
+    public const int ConfigHashFieldNumber = 4;
+    private string configHash_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string ConfigHash {
+      get { return configHash_; }
+      set {
+        configHash_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as AdaptationDecisionBatch);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(AdaptationDecisionBatch other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (BatchId != other.BatchId) return false;
+      if(!results_.Equals(other.results_)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.Equals(ServerComputeMs, other.ServerComputeMs)) return false;
+      if (ConfigHash != other.ConfigHash) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (BatchId.Length != 0) hash ^= BatchId.GetHashCode();
+      hash ^= results_.GetHashCode();
+      if (ServerComputeMs != 0D) hash ^= pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.GetHashCode(ServerComputeMs);
+      if (ConfigHash.Length != 0) hash ^= ConfigHash.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (BatchId.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(BatchId);
+      }
+      results_.WriteTo(output, _repeated_results_codec);
+      if (ServerComputeMs != 0D) {
+        output.WriteRawTag(25);
+        output.WriteDouble(ServerComputeMs);
+      }
+      if (ConfigHash.Length != 0) {
+        output.WriteRawTag(34);
+        output.WriteString(ConfigHash);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (BatchId.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(BatchId);
+      }
+      results_.WriteTo(ref output, _repeated_results_codec);
+      if (ServerComputeMs != 0D) {
+        output.WriteRawTag(25);
+        output.WriteDouble(ServerComputeMs);
+      }
+      if (ConfigHash.Length != 0) {
+        output.WriteRawTag(34);
+        output.WriteString(ConfigHash);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (BatchId.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(BatchId);
+      }
+      size += results_.CalculateSize(_repeated_results_codec);
+      if (ServerComputeMs != 0D) {
+        size += 1 + 8;
+      }
+      if (ConfigHash.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(ConfigHash);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(AdaptationDecisionBatch other) {
+      if (other == null) {
+        return;
+      }
+      if (other.BatchId.Length != 0) {
+        BatchId = other.BatchId;
+      }
+      results_.Add(other.results_);
+      if (other.ServerComputeMs != 0D) {
+        ServerComputeMs = other.ServerComputeMs;
+      }
+      if (other.ConfigHash.Length != 0) {
+        ConfigHash = other.ConfigHash;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            BatchId = input.ReadString();
+            break;
+          }
+          case 18: {
+            results_.AddEntriesFrom(input, _repeated_results_codec);
+            break;
+          }
+          case 25: {
+            ServerComputeMs = input.ReadDouble();
+            break;
+          }
+          case 34: {
+            ConfigHash = input.ReadString();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            BatchId = input.ReadString();
+            break;
+          }
+          case 18: {
+            results_.AddEntriesFrom(ref input, _repeated_results_codec);
+            break;
+          }
+          case 25: {
+            ServerComputeMs = input.ReadDouble();
+            break;
+          }
+          case 34: {
+            ConfigHash = input.ReadString();
+            break;
+          }
         }
       }
     }
@@ -16,6 +16,7 @@ namespace AdaptationUnity.Logging
         private StreamWriter _b2BreakdownWriter;
         private StreamWriter _r3GrpcBreakdownWriter;
         private StreamWriter _r4BrokerBreakdownWriter;
+        private StreamWriter _prewarmWriter;
         private readonly object _b2BreakdownLock = new object();
         private readonly object _r3GrpcBreakdownLock = new object();
         private readonly object _r4BrokerBreakdownLock = new object();
@@ -32,16 +33,17 @@ namespace AdaptationUnity.Logging
             _serviceErrorWriter = CreateWriter(Path.Combine(outputDir, "service_errors.csv"), "session_id,session_index,warmup,attempt,error,call_ms");
             _b2BreakdownWriter = CreateWriter(
                 Path.Combine(outputDir, "b2_breakdown.csv"),
-                "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_http_rtt_ms,t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,http_status,error_code"
+                "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_http_rtt_ms,t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,http_status,error_code,ts_send_utc"
             );
             _r3GrpcBreakdownWriter = CreateWriter(
                 Path.Combine(outputDir, "r3_grpc_breakdown.csv"),
-                "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_grpc_rtt_ms,t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,grpc_status,error_code"
+                "trial_id,session_index,warmup,correlation_id,t_client_serialize_ms,t_grpc_rtt_ms,t_server_compute_ms,t_client_deserialize_ms,t_total_client_ms,retries_count,timeout_flag,grpc_status,error_code,ts_send_utc,grpc_mode,proto_version,response_bytes"
             );
             _r4BrokerBreakdownWriter = CreateWriter(
                 Path.Combine(outputDir, "r4_broker_breakdown.csv"),
-                "serialize_ms,broker_roundtrip_ms,server_compute_ms,deserialize_ms,total_ms,retries_count,timeout_flag,status"
+                "trial_id,session_index,warmup,correlation_id,serialize_ms,broker_roundtrip_ms,server_compute_ms,deserialize_ms,total_ms,retries_count,timeout_flag,status,ts_send_utc"
             );
+            _prewarmWriter = CreateWriter(Path.Combine(outputDir, "prewarm.csv"), "trial_id,adapter,step,duration_ms,ok,detail");
             _auditWriter = new StreamWriter(Path.Combine(outputDir, "audit.jsonl"), false, Encoding.UTF8)
             {
                 AutoFlush = true
@@ -89,6 +91,16 @@ namespace AdaptationUnity.Logging
             _serviceErrorWriter.WriteLine(string.Format(CultureInfo.InvariantCulture, "{0},{1},{2},{3},\"{4}\",{5:0.000}", sessionId, sessionIndex, warmup ? 1 : 0, attempt, Escape(error), durationMs));
         }
 
+        public void LogPrewarm(string adapterName, string step, double durationMs, bool ok, string detail)
+        {
+            if (_prewarmWriter == null)
+            {
+                return;
+            }
+
+            _prewarmWriter.WriteLine(string.Format(CultureInfo.InvariantCulture, "{0},{1},{2},{3:0.000},{4},\"{5}\"", Escape(_trialId), adapterName, step, durationMs, ok ? 1 : 0, Escape(detail)));
+        }
+
         public void LogAudit(string sessionId, int sessionIndex, bool warmup, AdaptationEvent sessionEvent, AdaptationDecision decision, AdaptationAuditRecord auditRecord)
         {
             if (_auditWriter == null)
@@ -119,6 +131,7 @@ namespace AdaptationUnity.Logging
             _b2BreakdownWriter?.Dispose();
             _r3GrpcBreakdownWriter?.Dispose();
             _r4BrokerBreakdownWriter?.Dispose();
+            _prewarmWriter?.Dispose();
             _auditWriter?.Dispose();
         }
 
@@ -134,7 +147,8 @@ namespace AdaptationUnity.Logging
             int retriesCount,
             bool timeout,
             int httpStatus,
-            string errorCode)
+            string errorCode,
+            DateTime sentUtc)
         {
             if (_b2BreakdownWriter == null)
             {
@@ -145,7 +159,7 @@ namespace AdaptationUnity.Logging
             {
                 _b2BreakdownWriter.WriteLine(string.Format(
                     CultureInfo.InvariantCulture,
-                    "{0},{1},{2},\"{3}\",{4:0.000},{5:0.000},{6:0.000},{7:0.000},{8:0.000},{9},{10},{11},\"{12}\"",
+                    "{0},{1},{2},\"{3}\",{4:0.000},{5:0.000},{6:0.000},{7:0.000},{8:0.000},{9},{10},{11},\"{12}\",{13}",
                     Escape(_trialId),
                     sessionIndex,
                     warmup ? 1 : 0,
@@ -158,7 +172,8 @@ namespace AdaptationUnity.Logging
                     retriesCount,
                     timeout ? 1 : 0,
                     httpStatus,
-                    Escape(errorCode)
+                    Escape(errorCode),
+                    FormatUtc(sentUtc)
                 ));
             }
         }
@@ -175,7 +190,11 @@ namespace AdaptationUnity.Logging
             int retriesCount,
             bool timeout,
             string grpcStatus,
-            string errorCode)
+            string errorCode,
+            DateTime sentUtc,
+            string grpcMode,
+            int protoVersion,
+            int responseBytes)
         {
             if (_r3GrpcBreakdownWriter == null)
             {
@@ -186,7 +205,7 @@ namespace AdaptationUnity.Logging
             {
                 _r3GrpcBreakdownWriter.WriteLine(string.Format(
                     CultureInfo.InvariantCulture,
-                    "{0},{1},{2},\"{3}\",{4:0.000},{5:0.000},{6:0.000},{7:0.000},{8:0.000},{9},{10},\"{11}\",\"{12}\"",
+                    "{0},{1},{2},\"{3}\",{4:0.000},{5:0.000},{6:0.000},{7:0.000},{8:0.000},{9},{10},\"{11}\",\"{12}\",{13},{14},{15},{16}",
                     Escape(_trialId),
                     sessionIndex,
                     warmup ? 1 : 0,
@@ -199,12 +218,19 @@ namespace AdaptationUnity.Logging
                     retriesCount,
                     timeout ? 1 : 0,
                     Escape(grpcStatus),
-                    Escape(errorCode)
+                    Escape(errorCode),
+                    FormatUtc(sentUtc),
+                    Escape(grpcMode),
+                    protoVersion,
+                    responseBytes
                 ));
             }
         }
 
         public void LogR4BrokerBreakdown(
+            int sessionIndex,
+            bool warmup,
+            string correlationId,
             double serializeMs,
             double brokerMs,
             double serverMs,
@@ -212,7 +238,8 @@ namespace AdaptationUnity.Logging
             double totalMs,
             int retriesCount,
             bool timeout,
-            string status)
+            string status,
+            DateTime sentUtc)
         {
             if (_r4BrokerBreakdownWriter == null)
             {
@@ -223,7 +250,11 @@ namespace AdaptationUnity.Logging
             {
                 _r4BrokerBreakdownWriter.WriteLine(string.Format(
                     CultureInfo.InvariantCulture,
-                    "{0:0.000},{1:0.000},{2:0.000},{3:0.000},{4:0.000},{5},{6},\"{7}\"",
+                    "{0},{1},{2},\"{3}\",{4:0.000},{5:0.000},{6:0.000},{7:0.000},{8:0.000},{9},{10},\"{11}\",{12}",
+                    Escape(_trialId),
+                    sessionIndex,
+                    warmup ? 1 : 0,
+                    Escape(correlationId),
                     serializeMs,
                     brokerMs,
                     serverMs,
@@ -231,11 +262,18 @@ namespace AdaptationUnity.Logging
                     totalMs,
                     retriesCount,
                     timeout ? 1 : 0,
-                    Escape(status)
+                    Escape(status),
+                    FormatUtc(sentUtc)
                 ));
             }
         }
 
+        private static string FormatUtc(DateTime value)
+        {
+            // Round-trip format with a Z suffix so client and server logs sort and join on one clock notation.
+            return value.ToUniversalTime().ToString("o", CultureInfo.InvariantCulture);
+        }
+
         private static StreamWriter CreateWriter(string path, string header)
         {
             var writer = new StreamWriter(path, false, Encoding.UTF8)
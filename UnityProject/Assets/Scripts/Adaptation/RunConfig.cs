@@ -11,6 +11,7 @@ namespace AdaptationUnity
         public string AdapterName = "Baseline";
         public int Sessions = 5;
         public int WarmupSessions = 5;
+        public bool Prewarm = true;
         public int Seed = 1234;
         public string ConfigVersion = "v1";
         public string OutputDirectory = string.Empty;
@@ -20,6 +21,8 @@ namespace AdaptationUnity
         public List<string> SceneSequence = new List<string>();
         public string ServiceUrl = "http://localhost:5000";
         public string ServiceGrpcUrl = "http://127.0.0.1:6002";
+        public string GrpcMode = "web";
+        public int GrpcProtoVersion = 2;
         public int ServiceTimeoutMs = 3000;
         public int ServiceRetries = 2;
         public int ServiceRetryDelayMs = 250;
@@ -48,6 +51,10 @@ namespace AdaptationUnity
                 {
                     cfg.WarmupSessions = ParseInt(args[++i], cfg.WarmupSessions);
                 }
+                else if (arg.Equals("-prewarm", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
+                {
+                    cfg.Prewarm = ParseBool(args[++i], cfg.Prewarm);
+                }
                 else if (arg.Equals("-seed", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
                 {
                     cfg.Seed = ParseInt(args[++i], cfg.Seed);
@@ -84,6 +91,14 @@ namespace AdaptationUnity
                 {
                     cfg.ServiceGrpcUrl = args[++i];
                 }
+                else if (arg.Equals("-grpcMode", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
+                {
+                    cfg.GrpcMode = args[++i];
+                }
+                else if (arg.Equals("-grpcProtoVersion", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
+                {
+                    cfg.GrpcProtoVersion = ParseInt(args[++i], cfg.GrpcProtoVersion);
+                }
                 else if (arg.Equals("-serviceTimeoutMs", StringComparison.OrdinalIgnoreCase) && i + 1 < args.Length)
                 {
                     cfg.ServiceTimeoutMs = ParseInt(args[++i], cfg.ServiceTimeoutMs);
@@ -114,6 +129,19 @@ namespace AdaptationUnity
             return fallback;
         }
 
+        private static bool ParseBool(string value, bool fallback)
+        {
+            if (bool.TryParse(value, out var parsed))
+            {
+                return parsed;
+            }
+            if (int.TryParse(value, NumberStyles.Integer, CultureInfo.InvariantCulture, out var number))
+            {
+                return number != 0;
+            }
+            return fallback;
+        }
+
         private static float ParseFloat(string value, float fallback)
         {
             if (float.TryParse(value, NumberStyles.Float, CultureInfo.InvariantCulture, out var parsed))
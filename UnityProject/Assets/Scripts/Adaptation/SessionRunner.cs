@@ -17,6 +17,7 @@ namespace AdaptationUnity
     {
         private static SessionRunner _instance;
 
+        private static readonly ProfilerMarker PrewarmMarker = new ProfilerMarker("Prewarm");
         private static readonly ProfilerMarker BuildEventMarker = new ProfilerMarker("BuildEvent");
         private static readonly ProfilerMarker AdapterCallMarker = new ProfilerMarker("AdapterCall");
         private static readonly ProfilerMarker ApplyDecisionMarker = new ProfilerMarker("ApplyDecision");
@@ -27,6 +28,7 @@ namespace AdaptationUnity
         private DummyNpcController _npcController;
         private RunConfig _config;
         private string _outputDirectory;
+        private double _adapterCreateMs;
 
         private int _sessionIndex;
         private bool _isWarmup;
@@ -54,12 +56,17 @@ namespace AdaptationUnity
             _logWriter = new SessionLogWriter();
             _outputDirectory = ResolveOutputDirectory();
             _logWriter.Initialize(_outputDirectory);
+            var createTimer = Stopwatch.StartNew();
             _adapter = AdapterFactory.Create(_config.AdapterName, _logWriter);
+            createTimer.Stop();
+            _adapterCreateMs = createTimer.Elapsed.TotalMilliseconds;
             StartCoroutine(RunSessions());
         }
 
         private IEnumerator RunSessions()
         {
+            RunPrewarm();
+
             var totalSessions = Mathf.Max(0, _config.WarmupSessions) + Mathf.Max(0, _config.Sessions);
             for (_sessionIndex = 0; _sessionIndex < totalSessions; _sessionIndex++)
             {
@@ -76,6 +83,36 @@ namespace AdaptationUnity
             }
         }
 
+        /// <summary>
+        /// Pays the adapter's one-time costs before session 0 and logs them to prewarm.csv: adapter creation
+        /// (config load, broker connection), then the adapter's prewarm steps unless -prewarm false.
+        /// </summary>
+        private void RunPrewarm()
+        {
+            var recorder = new PrewarmRecorder(_logWriter, _adapter.AdapterName);
+            recorder.Record("create", _adapterCreateMs, true, string.Empty);
+
+            if (_config.Prewarm)
+            {
+                using (PrewarmMarker.Auto())
+                {
+                    var probeEvent = new AdaptationEvent
+                    {
+                        session_id = "prewarm",
+                        scene_id = SceneManager.GetActiveScene().name,
+                        result_z = 0.5f,
+                        time_t = 0f,
+                        attempts_a = _config.Attempts,
+                        seed = _config.Seed,
+                        config_version = _config.ConfigVersion
+                    };
+                    AdapterFactory.Prewarm(_adapter, probeEvent, recorder);
+                }
+            }
+
+            _logWriter.LogPrewarm(_adapter.AdapterName, "total", recorder.TotalMs, recorder.Ok, _config.Prewarm ? string.Empty : "prewarm disabled");
+        }
+
         private IEnumerator RunSingleSession(int index)
         {
             _currentSessionId = $"session_{index:0000}";
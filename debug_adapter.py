@@ -1,9 +1,10 @@
 ﻿import csv
+import sys
 from pathlib import Path
 from Experiments.make_all_sessions import parse_int, parse_warmup, parse_float, infer_index
 
 def read_adapter_calls(path):
-    with open(path, newline="", encoding="utf-8") as fh:
+    with open(path, newline="", encoding="utf-8-sig") as fh:
         reader=csv.DictReader(fh)
         has_index="session_index" in reader.fieldnames if reader.fieldnames else False
         rows={}
@@ -39,7 +40,7 @@ def read_adapter_calls(path):
                 }
     return rows
 
-path=Path('Experiments/out/B1/20260202_163146/trial_0000/adapter_calls.csv')
+path=Path(sys.argv[1] if len(sys.argv) > 1 else 'Experiments/out/B1/20260202_163146/trial_0000/adapter_calls.csv')
 rows=read_adapter_calls(path)
 print(len(rows))
 print(list(rows.values())[:3])
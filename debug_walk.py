@@ -1,5 +1,6 @@
-﻿from pathlib import Path
-root=Path('Experiments/out')
+﻿import sys
+from pathlib import Path
+root=Path(sys.argv[1] if len(sys.argv) > 1 else 'Experiments/out')
 for arch_dir in sorted(root.iterdir()):
     if not arch_dir.is_dir():
         continue